@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Goodput of submodules.file_transfer under simulated frame loss.
+
+Sends a file through the real Transfer (satellite side) and Reassembler (ground side) over a link that drops each
+downlinked frame, end frames included, and each uplinked NACK with the same probability. Link time is counted from
+the characters put on the air at the link's raw rate, plus one round trip for every end frame and every NACK.
+Goodput is file bytes over link time; it is compared with the raw rate and with resending the whole file every
+round, which is what repeating a fire-and-forget dump amounts to.
+
+$ python -m benchmarks.file_transfer [file KiB] [runs]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+
+from submodules.file_transfer.transfer import Reassembler, Transfer, chunk_size, decode_end
+
+LINKS = {  # name: (MTU in characters, raw rate in characters per second, round trip in seconds)
+    "aprs": (170, 1200 / 8, 2.0),
+    "iridium": (340, 340 / 20, 40.0),
+}
+LOSSES = (0.0, 0.05, 0.1, 0.2, 0.3)
+
+
+def simulate(path: str, link: str, loss: float, rng: random.Random, selective: bool = True) -> (float, int):
+    """
+    :return: (link seconds until the ground holds the whole file, rounds)
+    """
+    mtu, rate, rtt = LINKS[link]
+    transfer = Transfer(1, path, link, chunk_size(mtu))
+    ground = Reassembler()
+    seconds = 0.0
+    while not transfer.done:
+        while True:
+            frame = transfer.next_frame()
+            if frame is None:
+                break
+            transfer.pop()
+            seconds += len(frame) / rate
+            if rng.random() >= loss:
+                ground.receive(frame)
+        end = transfer.end_frame()
+        seconds += len(end) / rate + rtt
+        if rng.random() < loss:  # end frame lost: the satellite repeats it after end_interval
+            continue
+        if rng.random() < loss:  # NACK lost on the uplink
+            continue
+        total = decode_end(end)[1]
+        base, bitmap = ground.nack(1, total)
+        if selective or base == total:
+            transfer.apply_nack(base, bitmap)
+        else:
+            transfer.apply_nack(0, b"\xff" * -(-total // 8))
+    with open(path, "rb") as f:
+        assert ground.data(1) == f.read()
+    return seconds, transfer.rounds
+
+
+def main() -> None:
+    size = int(float(sys.argv[1]) * 1024) if len(sys.argv) > 1 else 16 * 1024
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rng = random.Random(39)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "payload.bin")
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+        for link, (mtu, rate, rtt) in LINKS.items():
+            print(f"{link}: {size} bytes in {chunk_size(mtu)} byte chunks, raw {rate:.1f} B/s, round trip {rtt:g} s")
+            print(f"{'loss':>6} {'goodput':>12} {'of raw':>7} {'rounds':>7} {'full resend':>12} {'of raw':>7}")
+            for loss in LOSSES:
+                selective = [simulate(path, link, loss, rng) for _ in range(runs)]
+                full = [simulate(path, link, loss, rng, selective=False) for _ in range(runs)]
+                goodput = size / statistics.median(seconds for seconds, _ in selective)
+                baseline = size / statistics.median(seconds for seconds, _ in full)
+                rounds = statistics.median(r for _, r in selective)
+                print(f"{loss * 100:5.0f}% {goodput:8.1f} B/s {goodput / rate * 100:6.1f}% {rounds:7g} "
+                      f"{baseline:8.1f} B/s {baseline / rate * 100:6.1f}%")
+            print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Overhead of helpers.profiler.SamplingProfiler at a given sampling rate.
+
+Runs a CPU bound worker next to a handful of idle threads, shaped like the flight software's ThreadHandler
+threads, with and without the profiler, and compares the worker's throughput. Throughput is noisy on a shared
+machine, so the CPU time of the sampling thread itself is reported too. The cost of a span is measured separately,
+per call, since spans wrap serial and I2C transactions that take milliseconds.
+
+$ python -m benchmarks.profiler [rate] [seconds]
+"""
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from helpers.profiler import SamplingProfiler, span
+
+
+def idle(stop: threading.Event) -> None:
+    while not stop.is_set():
+        time.sleep(0.05)
+
+
+def work(depth: int = 12) -> int:
+    if depth:
+        return work(depth - 1) + 1
+    return sum(range(200))
+
+
+def run(seconds: float, profiler: SamplingProfiler = None) -> float:
+    stop = threading.Event()
+    threads = [threading.Thread(target=idle, args=(stop,), name=f"idle-{i}") for i in range(8)]
+    for thread in threads:
+        thread.start()
+    if profiler is not None:
+        profiler.start()
+    iterations = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        work()
+        iterations += 1
+    elapsed = time.perf_counter() - start
+    if profiler is not None:
+        profiler.stop()
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return iterations / elapsed
+
+
+def span_cost(count: int = 200000) -> float:
+    """
+    :return: nanoseconds added by one `with span(...)` block
+    """
+    start = time.perf_counter_ns()
+    for _ in range(count):
+        pass
+    empty = time.perf_counter_ns() - start
+    start = time.perf_counter_ns()
+    for _ in range(count):
+        with span("cost"):
+            pass
+    return (time.perf_counter_ns() - start - empty) / count
+
+
+def main() -> None:
+    rate = float(sys.argv[1]) if len(sys.argv) > 1 else 25
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    run(0.5)  # warm up
+    baselines, profiled, overheads = [], [], []
+    with tempfile.TemporaryDirectory() as directory:
+        for _ in range(3):  # alternate so that drift in machine load hits both alike
+            baselines.append(run(seconds))
+            profiler = SamplingProfiler(directory, rate=rate)
+            profiled.append(run(seconds, profiler))
+            overheads.append(profiler.overhead())
+        disabled = span_cost()
+        profiler = SamplingProfiler(directory, rate=1)
+        profiler.start()
+        enabled = span_cost()
+        profiler.stop()
+    baseline, sampled = statistics.median(baselines), statistics.median(profiled)
+    print(f"baseline  {baseline:10.0f} iterations/s (median of 3)")
+    print(f"profiled  {sampled:10.0f} iterations/s at {rate:g} Hz (median of 3)")
+    print(f"overhead  {(1 - sampled / baseline) * 100:6.2f}% throughput, "
+          f"sampler CPU {statistics.median(overheads) * 100:.2f}% of wall time")
+    print(f"span      {disabled:6.0f} ns without a profiler, {enabled:.0f} ns with one")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Serial read latency of a radio port read in the flight process and through a helpers.serialworker process, idle
+and with CPU bound threads competing for the GIL, and how long a killed worker takes to serve the port again.
+
+A writer process sends a line stamped with time.monotonic_ns() to a pseudo terminal every PERIOD seconds; the port
+is the other end of the pseudo terminal, read line by line as APRS.listen reads it. Latency is the time from the
+write to readline() returning. Restart time is measured from SIGKILL to the new worker having set up the port, and
+to the first line written after the kill reaching the reader.
+
+$ python -m benchmarks.radio_workers [seconds per run] [load threads]
+"""
+import multiprocessing
+import os
+import signal
+import statistics
+import sys
+import threading
+import time
+
+from helpers.serialworker import WorkerSerial
+
+PERIOD = 0.02
+CONFIG = {"enabled": True, "ring_capacity": 65536, "start_timeout": 10, "restart_delay": 0, "max_restart_delay": 60}
+
+
+def writer(master: int, stop) -> None:
+    while not stop.is_set():
+        os.write(master, f"{time.monotonic_ns()}\n".encode("ascii"))
+        time.sleep(PERIOD)
+
+
+def burn(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+def latencies(serial, seconds: float, load: int) -> list:
+    """
+    :return: Milliseconds from write to readline() for every line read within seconds, with load busy threads
+    """
+    stop = threading.Event()
+    threads = [threading.Thread(target=burn, args=(stop,), daemon=True) for _ in range(load)]
+    for thread in threads:
+        thread.start()
+    results = []
+    serial.reset_input_buffer()
+    serial.readline()  # may be partial
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        line = serial.readline()
+        if line.endswith(b"\n"):
+            results.append((time.monotonic_ns() - int(line)) / 1e6)
+    stop.set()
+    return results
+
+
+def report(label: str, results: list) -> None:
+    ordered = sorted(results)
+    print(f"{label:36} p50 {statistics.median(ordered):7.2f} ms  p99 {ordered[int(len(ordered) * 0.99)]:7.2f} ms  "
+          f"max {ordered[-1]:7.2f} ms  ({len(ordered)} lines)")
+
+
+def restart(serial: WorkerSerial) -> (float, float):
+    """
+    Kills the worker
+    :return: (seconds until the new worker is ready, seconds until a line written after the kill is read)
+    """
+    ready = serial.ready
+    killed = time.monotonic()
+    os.kill(serial.process.pid, signal.SIGKILL)
+    while serial.ready is ready:
+        time.sleep(0.0005)
+    serial.ready.wait()
+    up = time.monotonic() - killed
+    while True:
+        line = serial.readline()
+        if line.endswith(b"\n") and int(line) / 1e9 > killed:
+            return up, time.monotonic() - killed
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    load = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    from serial import Serial
+    master, slave = os.openpty()
+    port = os.ttyname(slave)
+    stop = multiprocessing.Event()
+    sender = multiprocessing.Process(target=writer, args=(master, stop), daemon=True)
+    sender.start()
+    try:
+        inline = Serial(port, baudrate=19200)
+        report("in process, idle", latencies(inline, seconds, 0))
+        report(f"in process, {load} busy threads", latencies(inline, seconds, load))
+        inline.close()
+        for method in ("forkserver", "spawn"):
+            worker = WorkerSerial("bench", port, dict(CONFIG, start_method=method), baudrate=19200)
+            report(f"worker ({method}), idle", latencies(worker, seconds, 0))
+            report(f"worker ({method}), {load} busy threads", latencies(worker, seconds, load))
+            ready, first = zip(*(restart(worker) for _ in range(5)))
+            print(f"{f'worker ({method}), restart':36} ready {statistics.median(ready) * 1e3:7.1f} ms  "
+                  f"first line {statistics.median(first) * 1e3:7.1f} ms  (median of 5)")
+            worker.stop()
+    finally:
+        stop.set()
+        sender.join()
+
+
+if __name__ == '__main__':
+    main()
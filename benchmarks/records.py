@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Memory and throughput of buffering telemetry records.
+
+Compares helpers.log.Log/helpers.error.Error against the previous __dict__ based records, which
+formatted their string on every str() call.
+
+$ python -m benchmarks.records [count]
+"""
+import sys
+import time
+import tracemalloc
+
+from collections import deque
+from datetime import datetime
+
+from helpers.error import Error
+from helpers.log import Log
+
+
+class DictLog:
+    def __init__(self, sys_name='CORE', lvl='INFO', ts=None, msg=None):
+        self.system = sys_name
+        self.level = lvl
+        self.timestamp = ts or datetime.utcnow()
+        self.message = msg
+        self.header = 'LOG&'
+
+    def __str__(self):
+        return "{0}:{1}:{2}:{3}:{4}".format(self.header, self.system, self.level,
+                                            self.timestamp.strftime("%Y/%m/%d@%H%M%S"), self.message)
+
+
+class DictError:
+    def __init__(self, sys_name='CORE', ts=None, msg=None):
+        self.system = sys_name
+        self.timestamp = ts or datetime.utcnow()
+        self.message = msg
+        self.header = 'ERR!'
+
+    def __str__(self):
+        return "{0}:{1}:{2}:{3}".format(self.header, self.system,
+                                        self.timestamp.strftime("%Y/%m/%d@%H.%M.%S"), self.message)
+
+
+def run(log_cls, err_cls, count: int) -> dict:
+    messages = [f"Pin {i % 8} (aprs) is already ON." for i in range(count)]
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    buffer = deque()
+    for i, msg in enumerate(messages):
+        buffer.append(err_cls(sys_name="eps", msg=msg) if i % 4 == 0 else log_cls(sys_name="eps", msg=msg))
+    build = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+
+    # Telemetry.dump converts every record at least twice: once to probe the packet size, once to pack it
+    start = time.perf_counter()
+    for record in buffer:
+        str(record)
+        str(record)
+    dump = time.perf_counter() - start
+    return {"build": build, "dump": dump, "memory": memory}
+
+
+def main(count: int = 100000) -> None:
+    for name, log_cls, err_cls in (("dict", DictLog, DictError), ("slotted", Log, Error)):
+        result = run(log_cls, err_cls, count)
+        print(f"{name:8} {count} records: {result['memory'] / count:6.1f} B/record "
+              f"({result['memory'] / 2 ** 20:.1f} MiB), build {count / result['build'] / 1000:6.0f} k/s, "
+              f"2x str {count / result['dump'] / 1000:6.0f} k/s")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Round trip check and achieved bits per sample of helpers.tscodec.
+
+Uses a simulated week of EPS housekeeping at 20 s, or recorded housekeeping saved with
+numpy.savez(path, times=..., analog=..., flags=...).
+
+$ python -m benchmarks.tscodec [recording.npz]
+"""
+import sys
+import time
+
+import numpy as np
+
+from helpers import tscodec
+
+
+def simulate(samples: int = 30240, period: float = 20.0, seed: int = 0) -> (np.ndarray, np.ndarray, np.ndarray):
+    """
+    Simulated raw EPS registers: orbit periodic BCR voltage and currents, a slowly discharging battery bus,
+    a constant board status, some missed reads and occasional timing jitter; PDM states switch a few times a day.
+    """
+    rng = np.random.default_rng(seed)
+    t = 1.6e9 + period * np.arange(samples) + (rng.random(samples) < 0.01) * rng.integers(1, 3, samples)
+    orbit = np.sin(2 * np.pi * np.arange(samples) * period / 5580)
+    sunlit = orbit > -0.3
+    analog = np.vstack([
+        np.where(sunlit, 180 + rng.integers(-1, 2, samples), 5),
+        np.where(sunlit, 90 + np.round(20 * orbit) + rng.integers(-2, 3, samples), 0),
+        np.where(sunlit, 88 + np.round(20 * orbit) + rng.integers(-2, 3, samples), 0),
+        np.round(200 + 10 * orbit + rng.integers(-1, 2, samples)),
+        np.full(samples, 3.0),
+    ]).astype(np.float64)
+    analog[:, rng.random(samples) < 0.001] = np.nan
+    flags = np.zeros((8, samples), dtype=bool)
+    flags[[3, 4]] = True
+    flags[5] = (np.arange(samples) // 1000) % 5 == 0
+    flags[6] = sunlit & (orbit > 0.5)
+    return t, analog, flags
+
+
+def report(name: str, times: np.ndarray, analog: np.ndarray, flags: np.ndarray) -> None:
+    start = time.perf_counter()
+    data = tscodec.encode(times, analog, flags)
+    encode = time.perf_counter() - start
+    start = time.perf_counter()
+    decoded = tscodec.decode(data)
+    decode = time.perf_counter() - start
+
+    assert np.array_equal(decoded[0], np.round(times)), "timestamps changed in round trip"
+    assert np.allclose(decoded[1], np.round(analog), equal_nan=True), "analog values changed in round trip"
+    assert np.array_equal(decoded[2], flags), "flags changed in round trip"
+
+    values = len(times) * (analog.shape[0] + flags.shape[0])
+    text = sum(len(f"{t:.0f}") + sum(len(f"{v:g}") + 1 for v in analog[:, i]) + flags.shape[0] + 1
+               for i, t in enumerate(times))
+    print(f"{name}: {len(times)} samples, {len(data)} B ({len(data) * 8 / values:.2f} bits/value, "
+          f"{len(data) * 8 / len(times):.1f} bits/sample vs {text * 8 / len(times):.0f} as CSV text), "
+          f"encode {encode * 1000:.1f} ms, decode {decode * 1000:.1f} ms")
+
+
+def main(path: str = None) -> None:
+    report("simulated week", *simulate())
+    if path:
+        recording = np.load(path)
+        report(path, recording["times"], recording["analog"], recording["flags"])
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,282 @@
+import math
+import threading
+import time
+
+from collections import OrderedDict, deque
+
+from helpers.error import Error
+from helpers.log import Log
+from core.config import ConfigPatch
+from core.transitions import Transition
+
+BLOCK = "block"  # publishers wait for room, up to the subscription's timeout, then the message is dropped
+DROP_OLDEST = "drop_oldest"  # the oldest queued message is dropped to make room
+COALESCE = "coalesce"  # a queued message with the same key is replaced in place; otherwise as drop_oldest
+POLICIES = (BLOCK, DROP_OLDEST, COALESCE)
+
+
+class Topic:
+    """
+    A named message type. Messages published on a topic must be instances of its type and pass its check.
+    """
+    __slots__ = ("name", "type", "check")
+
+    def __init__(self, name: str, type: type, check: callable = None):
+        self.name = name
+        self.type = type
+        self.check = check
+
+    def accepts(self, message) -> bool:
+        return isinstance(message, self.type) and (self.check is None or self.check(message))
+
+    def __repr__(self) -> str:
+        return f"Topic({self.name})"
+
+
+class Command(str):
+    """
+    Command text tagged with the link it was uplinked on, so replies can go back the same way. Plain strings
+    remain valid commands; their link is None.
+    """
+
+    def __new__(cls, text: str, link: str = None):
+        command = str.__new__(cls, text)
+        command.link = link
+        return command
+
+
+COMMANDS = Topic("commands", str, lambda message: message[0:4] == 'CMD$' and message[-1:] == ';')
+LOGS = Topic("logs", Log)
+ERRORS = Topic("errors", Error)
+HOUSEKEEPING = Topic("housekeeping", dict)  # {"time": UNIX seconds, channel: value, ...}
+MODES = Topic("modes", Transition)
+ANOMALIES = Topic("anomalies", Error)  # diagnostic records of confirmed EPS anomalies, each calling for emergency mode
+CONFIG = Topic("config", ConfigPatch)  # configuration patches for core to apply
+TOPICS = {topic.name: topic for topic in (COMMANDS, LOGS, ERRORS, HOUSEKEEPING, MODES, ANOMALIES, CONFIG)}
+
+
+class Subscription:
+    """
+    Bounded queue of one subscriber to one topic. Messages are shared with every other subscriber, not copied,
+    and must not be modified.
+    """
+
+    def __init__(self, topic: Topic, name: str, maxsize: int, policy: str, key: callable = None,
+                 timeout: float = None):
+        """
+        :param topic: Topic subscribed to
+        :param name: Subscriber name, for metrics
+        :param maxsize: Messages queued at most
+        :param policy: What a publish does when the queue is full: BLOCK, DROP_OLDEST or COALESCE
+        :param key: COALESCE only: messages with equal keys replace each other; all messages do when None
+        :param timeout: BLOCK only: seconds a publisher waits for room; forever when None
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy {policy}")
+        self.topic = topic
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key or (lambda message: None)
+        self.timeout = timeout
+        self.queue = OrderedDict() if policy == COALESCE else deque()
+        self.condition = threading.Condition()
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+
+    def put(self, message) -> bool:
+        """
+        Queues a message according to the backpressure policy
+        :return: False if the message was dropped
+        """
+        with self.condition:
+            if self.policy == COALESCE:
+                key = self.key(message)
+                if key in self.queue:
+                    self.queue[key] = message
+                    self.coalesced += 1
+                    return True
+                if len(self.queue) >= self.maxsize:
+                    self.queue.popitem(last=False)
+                    self.dropped += 1
+                self.queue[key] = message
+            else:
+                if len(self.queue) >= self.maxsize:
+                    if self.policy == DROP_OLDEST:
+                        self.queue.popleft()
+                        self.dropped += 1
+                    elif not self.condition.wait_for(lambda: len(self.queue) < self.maxsize, self.timeout):
+                        self.dropped += 1
+                        return False
+                self.queue.append(message)
+            self.max_depth = max(self.max_depth, len(self.queue))
+            self.condition.notify_all()
+            return True
+
+    def get(self, timeout: float = None):
+        """
+        :param timeout: Seconds to wait for a message; forever when None, not at all when 0
+        :return: The oldest queued message, or None if none arrived in time
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: len(self.queue) > 0, timeout):
+                return None
+            if self.policy == COALESCE:
+                _, message = self.queue.popitem(last=False)
+            else:
+                message = self.queue.popleft()
+            self.delivered += 1
+            self.condition.notify_all()
+            return message
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def snapshot(self) -> list:
+        """
+        :return: The queued messages, oldest first, without removing them
+        """
+        with self.condition:
+            return list(self.queue.values() if self.policy == COALESCE else self.queue)
+
+    def metrics(self) -> dict:
+        return {"depth": len(self.queue), "max_depth": self.max_depth, "delivered": self.delivered,
+                "dropped": self.dropped, "coalesced": self.coalesced}
+
+
+class TopicStats:
+    """
+    Publish count and an exponentially decaying estimate of the publish rate of one topic
+    """
+    __slots__ = ("published", "rejected", "rate", "last", "window", "lock")
+
+    def __init__(self, window: float):
+        self.lock = threading.Lock()
+        self.published = 0
+        self.rejected = 0  # publishes that no subscriber accepted
+        self.rate = 0.0
+        self.last = None
+        self.window = window
+
+    def add(self, now: float, queued: bool) -> None:
+        with self.lock:
+            self.published += 1
+            self.rejected += not queued
+            if self.last is not None:
+                self.rate *= math.exp(-(now - self.last) / self.window)
+            self.rate += 1 / self.window
+            self.last = now
+
+    def current_rate(self, now: float) -> float:
+        """
+        :return: Messages per second, decayed to now
+        """
+        if self.last is None:
+            return 0.0
+        return self.rate * math.exp(-(now - self.last) / self.window)
+
+
+class Bus:
+    """
+    In-process publish/subscribe bus between submodules. A publish hands the same message object to every
+    subscription of its topic; each subscription applies its own backpressure policy, so a slow subscriber only
+    delays publishers if it asked for BLOCK.
+    """
+
+    def __init__(self, config: dict = None):
+        """
+        :param config: config['bus']
+        """
+        config = config or {}
+        self.window = config.get('rate_window', 60)
+        self.overrides = config.get('subscriptions') or {}  # "<subscriber>.<topic>" -> subscription settings
+        self.subscriptions = {name: () for name in TOPICS}  # replaced, never mutated, so publish needs no lock
+        self.stats = {name: TopicStats(self.window) for name in TOPICS}
+        self.lock = threading.Lock()
+
+    def subscribe(self, topic: Topic, name: str, maxsize: int = 100, policy: str = DROP_OLDEST,
+                  key: callable = None, timeout: float = None) -> Subscription:
+        """
+        Subscribes to a topic; subscribing again under the same name returns the existing subscription.
+        config['bus']['subscriptions']['<name>.<topic>'] may override maxsize, policy and timeout.
+        :return: Subscription to get messages from
+        """
+        with self.lock:
+            for subscription in self.subscriptions[topic.name]:
+                if subscription.name == name:
+                    return subscription
+            settings = dict(maxsize=maxsize, policy=policy, timeout=timeout)
+            settings.update(self.overrides.get(f"{name}.{topic.name}") or {})
+            subscription = Subscription(topic, name, key=key, **settings)
+            self.subscriptions[topic.name] = self.subscriptions[topic.name] + (subscription,)
+            return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self.lock:
+            self.subscriptions[subscription.topic.name] = tuple(
+                s for s in self.subscriptions[subscription.topic.name] if s is not subscription)
+
+    def publish(self, topic: Topic, message) -> bool:
+        """
+        Fans a message out to every subscription of a topic
+        :raises TypeError: if the topic does not accept the message
+        :return: True if at least one subscription queued it
+        """
+        if not topic.accepts(message):
+            raise TypeError(f"{type(message).__name__} {message!r:.40} is not a valid {topic.name} message")
+        queued = False
+        for subscription in self.subscriptions[topic.name]:
+            queued = subscription.put(message) or queued
+        self.stats[topic.name].add(time.monotonic(), queued)
+        return queued
+
+    def has_subscribers(self, topic: Topic) -> bool:
+        return len(self.subscriptions[topic.name]) > 0
+
+    def metrics(self) -> dict:
+        """
+        :return: {topic: {"published", "rejected", "rate", "subscribers": {name: Subscription.metrics()}}}
+        """
+        now = time.monotonic()
+        return {
+            name: {
+                "published": self.stats[name].published,
+                "rejected": self.stats[name].rejected,
+                "rate": self.stats[name].current_rate(now),
+                "subscribers": {s.name: s.metrics() for s in self.subscriptions[name]},
+            }
+            for name in TOPICS
+        }
+
+    def collect(self) -> list:
+        """
+        helpers.metrics collector
+        :return: [(name, kind, help, labels, value)] of every topic and subscription
+        """
+        samples = []
+        for topic, m in self.metrics().items():
+            samples.append(("pfs_bus_published_total", "counter", "Messages published", {"topic": topic},
+                            m["published"]))
+            samples.append(("pfs_bus_rejected_total", "counter", "Messages no subscriber queued", {"topic": topic},
+                            m["rejected"]))
+            for subscriber, s in m["subscribers"].items():
+                labels = {"topic": topic, "subscriber": subscriber}
+                samples.append(("pfs_bus_queue_depth", "gauge", "Messages queued per subscription", labels,
+                                s["depth"]))
+                samples.append(("pfs_bus_dropped_total", "counter", "Messages dropped per subscription", labels,
+                                s["dropped"]))
+        return samples
+
+    def report(self) -> str:
+        """
+        :return: One line per topic with its rate and the depth of every subscription
+        """
+        lines = []
+        for name, topic in self.metrics().items():
+            subscribers = ", ".join(f"{subscriber} {m['depth']}/{m['max_depth']} dropped {m['dropped']}"
+                                    for subscriber, m in topic["subscribers"].items())
+            lines.append(f"{name}: {topic['published']} published, {topic['rate'] * 60:.1f}/min"
+                         f"{'; ' + subscribers if subscribers else ''}")
+        return "\n".join(lines)
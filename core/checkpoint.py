@@ -0,0 +1,98 @@
+import json
+import os
+import time
+
+from threading import Lock
+
+from helpers.persist import atomic_write, load_json
+
+
+class Checkpointer:
+    """
+    Stores runtime state for warm restarts. The checkpoint is a directory with one compact JSON file per section:
+    "core" for Core itself, and one per submodule that implements get_checkpoint(). A section is only rewritten
+    when its contents changed, and each file is replaced atomically, so a crash or power cut mid-save leaves every
+    section either old or new. The time of the checkpoint is kept in a file of its own, rewritten with any section
+    or every max_age / 4 seconds, so that an idle checkpoint does not wear the flash every interval.
+
+    Sections are collected one after another, each under its own submodule's locks, not as one snapshot: a
+    checkpoint can hold a command's effect in one section and not yet in another. Every section must restore on
+    its own.
+    """
+
+    def __init__(self, config: dict, logger=None):
+        """
+        :param config: config['core']['checkpoint']
+        :param logger: Logger to report saves and loads to
+        """
+        self.directory = config['directory']
+        self.interval = config['interval']
+        self.max_age = config['max_age']
+        self.logger = logger
+        self.written = dict()  # section -> JSON text last written, to skip unchanged sections
+        self.saved = None  # time of the checkpoint last saved or loaded
+        self.lock = Lock()  # one save at a time, so that an older state never replaces a newer one
+
+    @property
+    def time_path(self) -> str:
+        return os.path.join(self.directory, "time")
+
+    def path(self, section: str) -> str:
+        return os.path.join(self.directory, f"{section}.json")
+
+    def load(self) -> dict:
+        """
+        :return: {section: state} of the last checkpoint, empty if there is none, it has no core section or it is
+        older than max_age seconds
+        """
+        if not os.path.isdir(self.directory):
+            return {}
+        sections = dict()
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                state = load_json(os.path.join(self.directory, name))
+                if state is not None:
+                    sections[name[:-len(".json")]] = state
+        saved = load_json(self.time_path)
+        if "core" not in sections or not isinstance(saved, (int, float)) or \
+                not 0 <= time.time() - saved <= self.max_age:
+            if sections and self.logger is not None:
+                self.logger.info("Ignoring stale or incomplete checkpoint")
+            return {}
+        for section, state in sections.items():
+            self.written[section] = json.dumps(state, separators=(",", ":"))
+        self.saved = saved
+        return sections
+
+    def save(self, collect: callable) -> int:
+        """
+        Collects the sections and writes those whose state changed since they were last written or loaded, then the
+        time of the checkpoint if any section was written or it is older than max_age / 4 seconds. Collection and
+        writing happen under one lock, so concurrent saves write in the order they collected.
+        :param collect: Returns {section: JSON-serializable state}
+        :return: Bytes written
+        """
+        with self.lock:
+            return self.write(collect())
+
+    def write(self, sections: dict) -> int:
+        """
+        Must be called with lock held
+        :param sections: {section: JSON-serializable state}
+        :return: Bytes written
+        """
+        written = 0
+        for section, state in sections.items():
+            text = json.dumps(state, separators=(",", ":"))
+            if self.written.get(section) == text:
+                continue
+            atomic_write(self.path(section), text.encode("utf-8"))
+            self.written[section] = text
+            written += len(text)
+        now = time.time()
+        if written or self.saved is None or not 0 <= now - self.saved < self.max_age / 4:
+            text = json.dumps(now)
+            atomic_write(self.time_path, text.encode("utf-8"))
+            self.saved = now
+            written += len(text)
+        return written
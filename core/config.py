@@ -0,0 +1,267 @@
+"""
+Configuration snapshots, their validation, and the sources of hot reloads: uplinked patches and a watcher of the
+config files.
+
+A snapshot is the parsed YAML with every mapping and list frozen; core swaps in a new snapshot as a whole, so a
+reader sees either the old configuration or the new one, never a mix. The default config doubles as the schema:
+a setting it has must keep its type, and the settings in CONSTRAINTS their bounds.
+"""
+import ctypes
+import os
+import struct
+import threading
+import time
+
+from yaml import safe_dump, safe_load
+
+from helpers.persist import atomic_write
+
+DEFAULT_PATH = 'config/config_default.yml'
+CUSTOM_PATH = 'config/config_custom.yml'
+
+CONSTRAINTS = {  # dotted path -> (check, requirement)
+    "core.dump_interval": (lambda value: value > 0, "positive"),
+    "core.pass_dump_interval": (lambda value: value > 0, "positive"),
+    "core.sleep_interval": (lambda value: value >= 0, "not negative"),
+    "telemetry.buffer_size": (lambda value: value > 0, "positive"),
+    "telemetry.max_packet_size": (lambda value: value > 32, "above 32"),
+    "aprs.message_spacing": (lambda value: value >= 0, "not negative"),
+}
+
+
+class ConfigError(ValueError):
+    """
+    Raised for a configuration that fails validation
+    """
+
+
+class FrozenDict(dict):
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Configuration snapshots are immutable")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _immutable
+
+
+class FrozenList(list):
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Configuration snapshots are immutable")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = append = clear = extend = insert = pop = remove = \
+        reverse = sort = _immutable
+
+
+def freeze(value):
+    """
+    :return: An immutable deep copy of parsed YAML
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """
+    :return: A mutable deep copy of a snapshot, as plain dicts and lists
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+def read(path: str) -> dict:
+    with open(path) as f:
+        return safe_load(f)
+
+
+def load() -> dict:
+    """
+    :return: config_custom.yml if it exists, config_default.yml otherwise, as a snapshot
+    """
+    return freeze(read(CUSTOM_PATH if os.path.exists(CUSTOM_PATH) else DEFAULT_PATH))
+
+
+def compatible(value, expected) -> bool:
+    if expected is None or value is None:
+        return True
+    if isinstance(expected, bool) or isinstance(value, bool):
+        return isinstance(value, bool) and isinstance(expected, bool)
+    if isinstance(expected, (int, float)):
+        return isinstance(value, (int, float))
+    return isinstance(value, type(expected))
+
+
+def problems(config, schema, path: str = "") -> list:
+    """
+    :return: Where config differs in type from schema, for the settings both have
+    """
+    found = []
+    for key, expected in schema.items():
+        if key not in config:
+            continue
+        name = f"{path}{key}"
+        if not compatible(config[key], expected):
+            found.append(f"{name} must be a {type(expected).__name__}")
+        elif isinstance(expected, dict) and isinstance(config[key], dict):
+            found += problems(config[key], expected, name + ".")
+    return found
+
+
+def validate(config: dict, schema: dict) -> None:
+    """
+    :param schema: The default config
+    :raise ConfigError: listing every problem found
+    """
+    if not isinstance(config, dict) or not isinstance(config.get('core'), dict) or \
+            not isinstance(config['core'].get('modules'), dict):
+        raise ConfigError("core.modules is missing")
+    found = problems(config, schema)
+    for stage, modules in config['core']['modules'].items():
+        for module in modules or ():
+            if not isinstance(config.get(module), dict) or not isinstance(config[module].get('depends_on'), list):
+                found.append(f"{module}, in stage {stage}, needs a section with depends_on")
+    for name, (check, requirement) in CONSTRAINTS.items():
+        value = get(config, name)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and not check(value):
+            found.append(f"{name} must be {requirement}")
+    if found:
+        raise ConfigError("; ".join(found))
+
+
+def get(config: dict, path: str):
+    """
+    :return: The setting at a dotted path, None if it is missing
+    """
+    for key in path.split("."):
+        if not isinstance(config, dict) or key not in config:
+            return None
+        config = config[key]
+    return config
+
+
+def patched(config: dict, changes: dict) -> dict:
+    """
+    :param changes: {dotted path of an existing setting: new value}
+    :return: A new snapshot with changes applied to config
+    :raise ConfigError: for a path that does not exist
+    """
+    result = thaw(config)
+    for path, value in changes.items():
+        *parents, key = path.split(".")
+        section = result
+        for parent in parents:
+            section = section.get(parent) if isinstance(section, dict) else None
+        if not isinstance(section, dict) or key not in section:
+            raise ConfigError(f"{path} is not a setting")
+        section[key] = value
+    return freeze(result)
+
+
+def changes(old, new, path: str = "") -> list:
+    """
+    :return: Dotted paths of the settings that differ between two configurations, sorted
+    """
+    if not (isinstance(old, dict) and isinstance(new, dict)):
+        return [path[:-1]] if old != new else []
+    found = []
+    for key in sorted(set(old) | set(new), key=str):
+        if old.get(key) != new.get(key):
+            found += changes(old.get(key), new.get(key), f"{path}{key}.")
+    return found
+
+
+def save(config: dict, path: str = CUSTOM_PATH) -> None:
+    """
+    Writes a snapshot as the custom config, so that it also applies after a restart
+    """
+    atomic_write(path, safe_dump(thaw(config), default_flow_style=False, sort_keys=False).encode("utf-8"))
+
+
+class ConfigPatch:
+    """
+    Settings to change, published on core.bus.CONFIG and answered by core once applied or rejected
+    """
+
+    def __init__(self, changes: dict, source: str):
+        """
+        :param changes: {dotted path: new value}
+        :param source: What requested it, for the log, e.g. "uplink"
+        """
+        self.changes = changes
+        self.source = source
+        self.error = None
+        self.done = threading.Event()
+
+    def answer(self, error: str = None) -> None:
+        self.error = error
+        self.done.set()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        :return: True once applied
+        :raise ConfigError: if core rejected it
+        :raise TimeoutError: if core did not answer within timeout seconds
+        """
+        if not self.done.wait(timeout):
+            raise TimeoutError("Configuration patch not answered")
+        if self.error is not None:
+            raise ConfigError(self.error)
+        return True
+
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len, followed by len bytes of name
+
+
+class ConfigWatcher:
+    """
+    Waits for the config files to be written or replaced: through inotify on the config directory, which sees
+    editors that save by renaming too, or by polling modification times where inotify is unavailable
+    """
+
+    def __init__(self, paths: tuple = (CUSTOM_PATH, DEFAULT_PATH), poll_interval: float = 5):
+        self.paths = paths
+        self.names = {os.path.basename(path) for path in paths}
+        self.poll_interval = poll_interval
+        self.fd = None
+        self.mtimes = self.stat()
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_CLOEXEC)
+            if fd >= 0:
+                directories = {os.path.dirname(os.path.abspath(path)) for path in paths}
+                if all(libc.inotify_add_watch(fd, directory.encode(), IN_CLOSE_WRITE | IN_MOVED_TO) >= 0
+                       for directory in directories):
+                    self.fd = fd
+                else:
+                    os.close(fd)
+        except (OSError, AttributeError):  # no libc with inotify
+            self.fd = None
+
+    def stat(self) -> dict:
+        return {path: os.path.getmtime(path) if os.path.exists(path) else None for path in self.paths}
+
+    def wait(self, settle: float = 0.5) -> None:
+        """
+        Blocks until a config file changed, then for settle seconds more so that a burst of writes is one change
+        """
+        if self.fd is not None:
+            while True:
+                data = os.read(self.fd, 4096)
+                offset, names = 0, set()
+                while offset < len(data):
+                    _, _, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+                    offset += INOTIFY_EVENT.size
+                    names.add(data[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace"))
+                    offset += length
+                if names & self.names:
+                    break
+        else:
+            while self.stat() == self.mtimes:
+                time.sleep(self.poll_interval)
+        time.sleep(settle)
+        self.mtimes = self.stat()
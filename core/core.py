@@ -1,70 +1,152 @@
 import logging
 import os
+import sys
 import time
 
 from functools import partial
-from threading import Timer
-from yaml import safe_load
+from threading import Lock
 
+from helpers import metrics
+from helpers.error import Error
+from helpers.log import Log
 from helpers.mode import Mode
 from helpers.power import Power
+from helpers.profiler import SamplingProfiler
 from helpers.threadhandler import ThreadHandler
-from core.processes import power_watchdog, is_first_boot
-
-from submodules.antenna_deployer import AntennaDeployer
-from submodules.command_ingest import CommandIngest
-from submodules.eps import EPS
-from submodules.radios.aprs import APRS
-from submodules.radios.iridium import Iridium
-from submodules.telemetry import Telemetry
+from core.bus import ANOMALIES, CONFIG, DROP_OLDEST, MODES, Bus
+from core.checkpoint import Checkpointer
+from core.config import DEFAULT_PATH, ConfigError, ConfigWatcher, changes, freeze, load, read, validate
+from core.memory import MemoryGovernor
+from core.processes import power_watchdog, telemetry_scheduler, energy_planner, anomaly_watchdog, checkpoint_writer, \
+    memory_watchdog, config_patcher, config_watcher, is_first_boot
+from core.registry import Registry
+from core.transitions import TransitionEngine
 
 
 class Core:
 
-    def __init__(self):
-        if os.path.exists('config/config_custom.yml'):
-            with open('config/config_custom.yml') as f:
-                self.config = safe_load(f)
-        else:
-            with open('config/config_default.yml') as f:
-                self.config = safe_load(f)
+    def __init__(self, import_profile: bool = False, profile: bool = False):
+        """
+        Reads the configuration. Submodules are imported and instantiated lazily in start(),
+        stage by stage, and only if they are listed in config['core']['modules'] and enabled.
+        :param import_profile: Report import time and RSS delta of every submodule
+        :param profile: Run the sampling profiler configured in config['profiler'] and time spans
+        """
+        self.boot_time = time.monotonic()
+        self.config = load()  # immutable snapshot; reconfigure() swaps in a new one
+        self.schema = read(DEFAULT_PATH)
+        self.config_lock = Lock()
+        self.started_stages = []
 
         self.logger = logging.getLogger("core")
         self.state = Mode.LOW_POWER
-        self.submodules = {
-            "antenna_deployer": AntennaDeployer(config=self.config),
-            "aprs": APRS(config=self.config),
-            "command_ingest": CommandIngest(config=self.config),
-            "eps": EPS(config=self.config),
-            "iridium": Iridium(config=self.config),
-            "telemetry": Telemetry(config=self.config),
+        self.registry = Registry(profile=import_profile)
+        self.submodules = dict()
+        self.processes = dict()
+        self.bus = Bus(self.config.get('bus'))
+        metrics.add_collector(self.bus.collect)
+        self.transition_counts = {
+            (mode, complete): metrics.counter("pfs_mode_transitions_total", "Mode transitions",
+                                              {"mode": mode.name.lower(), "complete": str(complete).lower()})
+            for mode in Mode for complete in (True, False)
         }
+        self.metrics_server = None
+        if 'metrics' in self.config:
+            self.metrics_server = metrics.MetricsServer(self.config['metrics']['socket'], logger=self.logger)
+        self.first_dump_time = None
+        self.transitions = TransitionEngine(self.config, logger=self.logger)
+        self.transition_lock = Lock()
+        self.energy_hold = None  # set by the energy planner while it keeps core in low power
+        self.emergency_hold = None  # wall clock time until which an EPS anomaly keeps core in emergency mode
+        self.checkpointer = None
+        if 'checkpoint' in self.config['core']:
+            self.checkpointer = Checkpointer(self.config['core']['checkpoint'], logger=self.logger)
+        self.restored = dict()  # sections of the checkpoint a warm start restores, empty on a cold start
+        self.memory = None
+        if 'memory' in self.config:  # before any submodule is imported, so tracemalloc sees their allocations
+            self.memory = MemoryGovernor(self.config['memory'], logger=self.logger)
+        self.steps = dict()  # one-time startup step -> wall clock time it completed
+        self.profiler = None
+        if profile:
+            self.profiler = SamplingProfiler(**self.config['profiler'])
+            self.profiler.start()
+
+    def is_enabled(self, submodule: str) -> bool:
+        """
+        Returns False if the submodule's config section sets enabled: false
+        :param submodule: name of submodule
+        """
+        return (self.config.get(submodule) or {}).get('enabled', True)
+
+    def load_stage(self, stage: str) -> list:
+        """
+        Imports and instantiates every enabled submodule listed in a stage of config['core']['modules']
+        and rewires the dependencies of all loaded submodules
+        :param stage: stage name ("A", "B" or "C")
+        :return: names of the submodules loaded for this stage
+        """
+        loaded = []
+        for submodule in self.config['core']['modules'].get(stage) or []:
+            if submodule in self.submodules:
+                continue
+            if not self.is_enabled(submodule):
+                self.logger.info(f"Skipping disabled submodule {submodule}")
+                continue
+            self.submodules[submodule] = self.registry.resolve(submodule)(config=self.config)
+            loaded.append(submodule)
         self.populate_dependencies()
-        self.processes = {
-            "power_monitor": ThreadHandler(
-                target=partial(power_watchdog, core=self, eps=self.submodules['eps']),
-                name="power_monitor",
-                parent_logger=self.logger
-            ),
-            "telemetry_dump": Timer(
-                interval=self.config['core']['dump_interval'],
-                function=partial(self.submodules["telemetry"].dump)
-            )
-        }
+        for submodule in loaded:
+            if submodule in self.restored and hasattr(self.submodules[submodule], 'restore_checkpoint'):
+                try:
+                    self.submodules[submodule].restore_checkpoint(self.restored[submodule])
+                except Exception as e:  # a bad checkpoint must not stop the boot
+                    self.logger.error(f"Could not restore {submodule} from checkpoint: {e}")
+        return loaded
+
+    def start_stage(self, stage: str) -> None:
+        """
+        Loads the submodules of a stage and runs their start()
+        :param stage: stage name ("A", "B" or "C")
+        """
+        start = time.perf_counter()
+        if stage not in self.started_stages:
+            self.started_stages.append(stage)
+        for submodule in self.load_stage(stage):
+            if hasattr(self.submodules[submodule], 'start'):
+                self.submodules[submodule].start()
+        if self.registry.profile:
+            self.logger.info(f"Stage {stage} started in {(time.perf_counter() - start) * 1000:.1f} ms, "
+                             f"{time.monotonic() - self.boot_time:.2f} s after boot")
 
     def populate_dependencies(self) -> None:
         """
         Iterates through configuration data dictionary and sets each submodule's self.modules dictionary
-        with a dictionary that contains references to all the other submodules listed in the first 
-        submodule's depends_on key
+        with a dictionary that contains references to all the other loaded submodules listed in the first
+        submodule's depends_on key, and hands every submodule the bus
         """
         for submodule in self.submodules:
+            if hasattr(self.submodules[submodule], 'set_bus'):
+                self.submodules[submodule].set_bus(self.bus)
             if hasattr(self.submodules[submodule], 'set_modules'):
                 self.submodules[submodule].set_modules({
                     dependency: self.submodules[dependency]
                     for dependency in self.config[submodule]['depends_on']
+                    if dependency in self.submodules
                 })
 
+    def dump_telemetry(self) -> bool:
+        """
+        Dumps telemetry and records the time from boot to the first beacon sent
+        :return: True if anything was sent
+        """
+        sent = self.submodules["telemetry"].dump()
+        self.logger.debug("Bus:\n" + self.bus.report())
+        if sent and self.first_dump_time is None:
+            self.first_dump_time = time.monotonic() - self.boot_time
+            self.logger.info(f"First telemetry beacon {self.first_dump_time:.2f} s after boot "
+                             f"({'warm' if self.restored else 'cold'} start)")
+        return sent
+
     def get_config(self) -> dict:
         """Returns the configuration data from config_*.yml as a list"""
         return self.config
@@ -72,41 +154,49 @@ class Core:
     def get_state(self) -> Mode:
         return self.state
 
+    def transition(self, mode: Mode, reason: str = '') -> None:
+        """
+        Moves core and every submodule into a Mode. Submodule handlers run concurrently, each bounded by
+        its transition_timeout; core.state only changes once every handler has finished or timed out.
+        :param mode: Mode to enter
+        :param reason: Reason for entering the mode.
+        """
+        with self.transition_lock:
+            self.logger.warning(
+                f"Entering {mode.name.lower().replace('_', ' ')} mode{'  Reason: ' if reason else ''}{reason}")
+            transition = self.transitions.run(mode, self.submodules, reason)
+            self.state = mode
+            self.transition_counts[mode, transition.complete].inc()
+            self.bus.publish(MODES, transition)
+            if transition.complete:
+                self.logger.info(f"Transition {transition}")
+            else:
+                self.logger.error(f"Incomplete transition {transition}")
+            if 'telemetry' in self.submodules:
+                self.submodules['telemetry'].enqueue(
+                    (Log if transition.complete else Error)(sys_name="core", msg=f"MODE {transition}"))
+            self.save_checkpoint()
+
     def enter_normal_mode(self, reason: str = '') -> None:
         """
         Enter normal power mode.
         :param reason: Reason for entering normal mode.
         """
-        self.logger.warning(
-            f"Entering normal mode{'  Reason: ' if reason else ''}{reason if reason else ''}")
-        self.state = Mode.NORMAL
-        for submodule in self.submodules:
-            if hasattr(self.submodules[submodule], 'enter_normal_mode'):
-                self.submodules[submodule].enter_normal_mode()
+        self.transition(Mode.NORMAL, reason)
 
     def enter_low_power_mode(self, reason: str = '') -> None:
         """
         Enter low power mode.
         :param reason: Reason for entering low power mode.
         """
-        self.logger.warning(
-            f"Entering low power mode{'  Reason: ' if reason else ''}{reason if reason else ''}")
-        self.state = Mode.LOW_POWER
-        for submodule in self.submodules:
-            if hasattr(self.submodules[submodule], 'enter_low_power_mode'):
-                self.submodules[submodule].enter_low_power_mode()
+        self.transition(Mode.LOW_POWER, reason)
 
     def enter_emergency_mode(self, reason: str = '') -> None:
         """
-        Enter emergency power mode.
+        Enter emergency power mode. Submodules are shed in the order given by core.emergency_shed_order.
         :param reason: Reason for entering emergency power mode.
         """
-        self.logger.warning(
-            f"Entering emergency mode{'  Reason: ' if reason else ''}{reason if reason else ''}")
-        self.state = Mode.EMERGENCY
-        for submodule in self.submodules:
-            if hasattr(self.submodules[submodule], 'enter_emergency_mode'):
-                self.submodules[submodule].enter_emergency_mode()
+        self.transition(Mode.EMERGENCY, reason)
 
     def request(self, module_name: str):
         """
@@ -115,28 +205,226 @@ class Core:
         """
         return self.submodules[module_name] if module_name in self.submodules.keys() else False
 
+    def reconfigure(self, config: dict, source: str) -> list:
+        """
+        Validates a configuration and swaps it in for the running one as a whole. Every submodule is handed the new
+        snapshot, and those whose section changed are told through reconfigure() to re-derive what they cache.
+        Submodules added to a stage that has started are loaded and started; removed ones keep running until the
+        next restart. The result and the time it took are logged to telemetry.
+        :param config: The new configuration
+        :param source: What it came from, e.g. "file" or "uplink"
+        :return: Dotted paths of the settings that changed
+        :raise ConfigError: if the configuration is invalid, which keeps the running one
+        """
+        start = time.perf_counter()
+        with self.config_lock:
+            snapshot = freeze(config)
+            try:
+                validate(snapshot, self.schema)
+            except ConfigError as e:
+                self.logger.error(f"Rejected configuration from {source}: {e}")
+                if 'telemetry' in self.submodules:
+                    self.submodules['telemetry'].enqueue(
+                        Error(sys_name="core", msg=f"CONFIG {source} rejected: {e}"))
+                raise
+            changed = changes(self.config, snapshot)
+            if not changed:
+                return changed
+            sections = {path.split(".")[0] for path in changed}
+            self.config = snapshot
+            self.transitions.config = snapshot
+            if self.checkpointer is not None and 'checkpoint' in snapshot['core']:
+                self.checkpointer.interval = snapshot['core']['checkpoint']['interval']
+                self.checkpointer.max_age = snapshot['core']['checkpoint']['max_age']
+            if self.memory is not None and 'memory' in sections and 'memory' in snapshot:
+                self.memory.configure(snapshot['memory'])
+            for name, submodule in list(self.submodules.items()):
+                submodule.config = snapshot
+                if name in sections and hasattr(submodule, 'reconfigure'):
+                    try:
+                        submodule.reconfigure([path for path in changed if path.split(".")[0] == name])
+                    except Exception as e:
+                        self.logger.error(f"Could not reconfigure {name}: {e}")
+            self.populate_dependencies()
+            for stage in self.started_stages:
+                self.start_stage(stage)
+        elapsed = (time.perf_counter() - start) * 1000
+        self.logger.info(f"Configuration from {source} applied in {elapsed:.1f} ms: {', '.join(changed)}")
+        if 'telemetry' in self.submodules:
+            self.submodules['telemetry'].enqueue(
+                Log(sys_name="core", msg=f"CONFIG {source} {elapsed:.1f}ms {','.join(changed)}"))
+        return changed
+
+    def get_checkpoint(self) -> dict:
+        """
+        :return: Core's section of the checkpoint
+        """
+        return {
+            "state": self.state.name,
+            "steps": self.steps,
+            "emergency_hold": self.emergency_hold,
+            "first_dump_time": self.first_dump_time,
+        }
+
+    def save_checkpoint(self) -> None:
+        """
+        Saves the state of core and of every submodule that implements get_checkpoint(); unchanged sections are
+        not rewritten. Saves from different threads are serialized by the checkpointer.
+        """
+        if self.checkpointer is None:
+            return
+        try:
+            start = time.perf_counter()
+            written = self.checkpointer.save(self.collect_checkpoint)
+            self.logger.debug(f"Checkpoint: {written} bytes in {(time.perf_counter() - start) * 1000:.1f} ms")
+        except OSError as e:
+            self.logger.error(f"Could not save checkpoint: {e}")
+
+    def collect_checkpoint(self) -> dict:
+        """
+        :return: {section: state} of core and of every submodule that implements get_checkpoint()
+        """
+        sections = {"core": self.get_checkpoint()}
+        for name, submodule in list(self.submodules.items()):
+            if hasattr(submodule, 'get_checkpoint'):
+                try:
+                    sections[name] = submodule.get_checkpoint()
+                except Exception as e:
+                    self.logger.error(f"Could not checkpoint {name}: {e}")
+        return sections
+
+    def restore_checkpoint(self) -> None:
+        """
+        Loads the last checkpoint, if it is recent enough, for a warm start. Submodule sections are handed to
+        their restore_checkpoint() as each stage loads them.
+        """
+        if self.checkpointer is None:
+            return
+        self.restored = self.checkpointer.load()
+        if self.restored:
+            self.steps = dict(self.restored["core"].get("steps") or {})
+            self.emergency_hold = self.restored["core"].get("emergency_hold")
+            self.logger.info(f"Warm start from checkpoint of {', '.join(sorted(self.restored))}, "
+                             f"saved {time.time() - self.checkpointer.saved:.0f} s ago")
+
+    def shed_memory(self) -> None:
+        """
+        Asks every submodule that implements shed_memory() to release what it can, such as buffered telemetry
+        """
+        for name, submodule in list(self.submodules.items()):
+            if hasattr(submodule, 'shed_memory'):
+                try:
+                    released = submodule.shed_memory()
+                    self.logger.info(f"Shed memory of {name}: {released}")
+                except Exception as e:
+                    self.logger.error(f"Could not shed memory of {name}: {e}")
+
+    def restart(self, reason: str) -> None:
+        """
+        Checkpoints and replaces the pFS process with a fresh one running the same command, which warm starts from
+        the checkpoint. Memory the old process leaked or fragmented is returned to the OS.
+        :param reason: Reason for restarting
+        """
+        self.logger.critical(f"Restarting pFS. Reason: {reason}")
+        self.save_checkpoint()
+        logging.shutdown()
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+
+    def complete_step(self, step: str) -> None:
+        """
+        Records a one-time startup step as done, so warm starts skip it, and checkpoints right away
+        :param step: name of the step
+        """
+        self.steps[step] = time.time()
+        self.save_checkpoint()
+
     def start(self) -> None:
         """
-        Runs the startup process for core
+        Runs the startup process for core. After a crash or reboot within core.checkpoint.max_age of the last
+        checkpoint, the saved state is restored and completed one-time steps are skipped.
         """
-        for submodule in self.config['core']['modules']['A']:
-            if hasattr(self.submodules[submodule], 'start'):
-                self.submodules[submodule].start()
+        if self.metrics_server is not None:
+            try:
+                self.metrics_server.start()
+            except OSError as e:
+                self.logger.error(f"Could not serve metrics on {self.metrics_server.path}: {e}")
+        self.restore_checkpoint()
+        self.start_stage('A')
 
-        if is_first_boot():
-            time.sleep(self.config['core']['sleep_interval'])
+        if 'first_boot_sleep' not in self.steps:
+            if is_first_boot():
+                time.sleep(self.config['core']['sleep_interval'])
+            self.complete_step('first_boot_sleep')
 
-        for submodule in self.config['core']['modules']['B']:
-            if hasattr(self.submodules[submodule], 'start'):
-                self.submodules[submodule].start()
-        
-        while self.submodules['eps'].get_battery_bus_volts() < Power.STARTUP.value:
-            time.sleep(1)
-        self.mode = Mode.NORMAL
+        self.start_stage('B')
 
-        for submodule in self.config['core']['modules']['C']:
-            if hasattr(self.submodules[submodule], 'start'):
-                self.submodules[submodule].start()
+        if 'eps' in self.submodules:
+            while self.submodules['eps'].get_battery_volts() < Power.STARTUP.value:
+                time.sleep(1)
+        self.state = Mode.NORMAL
+
+        self.start_stage('C')
+
+        restored_state = Mode.__members__.get((self.restored.get("core") or {}).get("state"), Mode.NORMAL)
+        if restored_state != Mode.NORMAL:
+            self.transition(restored_state, "Restored from checkpoint")
+
+        if self.registry.profile:
+            self.logger.info("Import profile:\n" + self.registry.report())
+
+        if 'eps' in self.submodules:
+            self.processes["power_monitor"] = ThreadHandler(
+                target=partial(power_watchdog, core=self, eps=self.submodules['eps']),
+                name="power_monitor",
+                parent_logger=self.logger
+            )
+        if 'anomaly' in self.config.get('eps', {}) and 'eps' in self.submodules:
+            self.processes["anomaly_watchdog"] = ThreadHandler(
+                target=partial(anomaly_watchdog, core=self,
+                               anomalies=self.bus.subscribe(ANOMALIES, "core", maxsize=16, policy=DROP_OLDEST)),
+                name="anomaly_watchdog",
+                parent_logger=self.logger
+            )
+        if 'energy' in self.config and 'eps' in self.submodules and 'orbit' in self.submodules:
+            self.processes["energy_planner"] = ThreadHandler(
+                target=partial(energy_planner, core=self, eps=self.submodules['eps'], orbit=self.submodules['orbit']),
+                name="energy_planner",
+                parent_logger=self.logger
+            )
+        if 'telemetry' in self.submodules:
+            self.processes["telemetry_dump"] = ThreadHandler(
+                target=partial(telemetry_scheduler, core=self),
+                name="telemetry_dump",
+                parent_logger=self.logger
+            )
+
+        self.processes["config_patcher"] = ThreadHandler(
+            target=partial(config_patcher, core=self, patches=self.bus.subscribe(CONFIG, "core", maxsize=4)),
+            name="config_patcher",
+            parent_logger=self.logger
+        )
+        reload = self.config['core'].get('reload') or {}
+        if reload.get('watch'):
+            watcher = ConfigWatcher(poll_interval=reload['poll_interval'])
+            self.processes["config_watcher"] = ThreadHandler(
+                target=partial(config_watcher, core=self, watcher=watcher),
+                name="config_watcher",
+                parent_logger=self.logger
+            )
+
+        if self.memory is not None:
+            self.processes["memory_governor"] = ThreadHandler(
+                target=partial(memory_watchdog, core=self, governor=self.memory),
+                name="memory_governor",
+                parent_logger=self.logger
+            )
+
+        if self.checkpointer is not None:
+            self.processes["checkpoint"] = ThreadHandler(
+                target=partial(checkpoint_writer, core=self),
+                name="checkpoint",
+                parent_logger=self.logger
+            )
 
         for process in self.processes:
             self.processes[process].start()
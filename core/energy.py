@@ -0,0 +1,187 @@
+import numpy as np
+
+
+class BatteryModel:
+    """
+    Linear battery bus model: dV/dt = charge * sunlit - base - sum(load[device] * device_on), clipped at max_volts.
+    Rates are in volts per second.
+    """
+
+    def __init__(self, charge: float, base: float, loads: dict, max_volts: float):
+        """
+        :param charge: Voltage gain per second in sunlight
+        :param base: Voltage loss per second of the always-on load
+        :param loads: device name -> additional voltage loss per second while the device's PDM is on
+        :param max_volts: Voltage the charge regulator holds the battery at
+        """
+        self.charge = charge
+        self.base = base
+        self.loads = dict(loads)
+        self.max_volts = max_volts
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'BatteryModel':
+        """
+        :param config: config['energy']['model']
+        """
+        return cls(config['charge'], config['base'], config.get('loads') or {}, config['max_volts'])
+
+    @classmethod
+    def fit(cls, times: np.ndarray, volts: np.ndarray, sunlit: np.ndarray, states: dict, max_volts: float,
+            prior: 'BatteryModel' = None) -> 'BatteryModel':
+        """
+        Least squares fit of the model to housekeeping. Intervals that start at the charge regulator limit are
+        left out because the voltage cannot rise there. Coefficients that come out negative, or devices that
+        never changed state, keep the prior's value.
+        :param times: sample times in seconds
+        :param volts: battery bus voltage per sample
+        :param sunlit: boolean per sample
+        :param states: device name -> boolean PDM state per sample
+        :param max_volts: charge regulator limit
+        :param prior: model supplying fallback coefficients
+        :return: fitted BatteryModel
+        """
+        devices = list(states)
+        dt = np.diff(times)
+        rate = np.diff(volts) / dt
+        usable = np.isfinite(rate) & (dt > 0) & (volts[:-1] < max_volts - 0.01)
+        columns = [sunlit[:-1].astype(np.float64), -np.ones(len(dt))]
+        columns += [-np.asarray(states[device][:-1], dtype=np.float64) for device in devices]
+        a = np.column_stack(columns)[usable]
+        coefficients = np.linalg.lstsq(a, rate[usable], rcond=None)[0] if usable.sum() > a.shape[1] else None
+
+        prior = prior or cls(0.0, 0.0, {}, max_volts)
+        if coefficients is None:
+            return cls(prior.charge, prior.base, prior.loads, max_volts)
+        informative = a.std(axis=0) > 0
+        informative[1] = True  # the constant column never varies
+
+        def pick(i, fallback):
+            return float(coefficients[i]) if informative[i] and coefficients[i] >= 0 else fallback
+
+        loads = dict(prior.loads)
+        loads.update({device: pick(2 + i, prior.loads.get(device, 0.0)) for i, device in enumerate(devices)})
+        return cls(pick(0, prior.charge), pick(1, prior.base), loads, max_volts)
+
+    def simulate(self, volts: float, times: np.ndarray, sunlit: np.ndarray, schedule: dict) -> np.ndarray:
+        """
+        Predicts the battery bus voltage at each time
+        :param volts: voltage at times[0]
+        :param times: sample times in seconds
+        :param sunlit: boolean per sample
+        :param schedule: device name -> boolean PDM state per sample
+        :return: predicted voltage per sample
+        """
+        rate = self.charge * sunlit[:-1] - self.base
+        for device, on in schedule.items():
+            rate = rate - self.loads.get(device, 0.0) * on[:-1]
+        steps = rate * np.diff(times)
+        if not (steps > 0).any() or volts + steps.clip(min=0).sum() < self.max_volts:
+            return np.r_[volts, volts + np.cumsum(steps)]
+        # Clipping at the regulator limit makes the recurrence non linear; fall back to a scalar loop
+        predicted = np.empty(len(times))
+        predicted[0] = volts
+        for i, step in enumerate(steps):
+            predicted[i + 1] = min(self.max_volts, predicted[i] + step)
+        return predicted
+
+
+class Plan:
+    """
+    Output of EnergyPlanner.plan: PDM schedule, predicted voltage and whether to enter low power now.
+    """
+    __slots__ = ("times", "sunlit", "schedule", "volts", "low_power", "shed")
+
+    def __init__(self, times, sunlit, schedule, volts, low_power, shed):
+        self.times = times
+        self.sunlit = sunlit
+        self.schedule = schedule
+        self.volts = volts
+        self.low_power = low_power
+        self.shed = shed  # list of (device, start, end) on-windows removed to respect the floor
+
+    def wanted(self, device: str, at: float = None) -> bool:
+        """
+        :param device: device name
+        :param at: UNIX seconds; defaults to the start of the plan
+        :return: Whether device's PDM should be on at that time
+        """
+        index = 0 if at is None else max(0, int(np.searchsorted(self.times, at, side='right')) - 1)
+        return bool(self.schedule[device][min(index, len(self.times) - 1)])
+
+    def __str__(self) -> str:
+        return "min {0:.2f} V, {1}, shed {2}".format(
+            float(self.volts.min()), "LOW_POWER" if self.low_power else "NORMAL",
+            ", ".join(f"{device}@{start:.0f}" for device, start, _ in self.shed) or "nothing")
+
+
+class EnergyPlanner:
+    """
+    Decides ahead of time when to power radio PDMs and when to enter low power so that the predicted battery bus
+    voltage stays above config['energy']['floor'] + margin.
+    """
+
+    def __init__(self, config: dict, model: BatteryModel):
+        """
+        :param config: config['energy']
+        :param model: battery model used for predictions
+        """
+        self.config = config
+        self.model = model
+
+    def windows(self, times: np.ndarray, sunlit: np.ndarray, passes: list) -> dict:
+        """
+        Builds the wanted on-state of each device from its policy in config['energy']['devices']:
+        "passes" (on during ground station passes), "sunlit", "always" or "never"
+        :return: device name -> boolean array
+        """
+        schedule = dict()
+        for device, policy in self.config['devices'].items():
+            if policy == 'passes':
+                on = np.zeros(len(times), dtype=bool)
+                for p in passes:
+                    on |= (times >= p.aos) & (times <= p.los)
+            elif policy == 'sunlit':
+                on = sunlit.copy()
+            else:
+                on = np.full(len(times), policy == 'always')
+            schedule[device] = on
+        return schedule
+
+    def plan(self, now: float, volts: float, times: np.ndarray, sunlit: np.ndarray, passes: list,
+             normal_volts: float) -> Plan:
+        """
+        Greedily removes device on-windows, lowest priority (first listed in config['energy']['devices']) and latest
+        first among the windows before the first predicted floor violation, until the prediction stays above the floor.
+        Low power is recommended if the voltage is predicted to fall below normal_volts within low_power_lookahead.
+        :param now: UNIX seconds, equal to times[0]
+        :param volts: current battery bus voltage
+        :param times: planning grid in UNIX seconds
+        :param sunlit: boolean per grid point
+        :param passes: upcoming ground station passes
+        :param normal_volts: threshold below which the satellite should be in low power
+        :return: Plan
+        """
+        floor = self.config['floor'] + self.config['margin']
+        schedule = self.windows(times, sunlit, passes)
+        priority = list(self.config['devices'])
+        shed = []
+        predicted = self.model.simulate(volts, times, sunlit, schedule)
+        while (predicted < floor).any():
+            violation = int(np.argmax(predicted < floor))
+            candidates = []
+            for rank, device in enumerate(priority):
+                edges = np.flatnonzero(np.diff(np.r_[False, schedule[device], False].astype(np.int8)))
+                for start, end in zip(edges[0::2], edges[1::2]):
+                    if start < violation:
+                        candidates.append((rank, -start, device, start, end))
+            if not candidates:
+                break
+            _, _, device, start, end = min(candidates)
+            schedule[device][start:end] = False
+            shed.append((device, float(times[start]), float(times[end - 1])))
+            predicted = self.model.simulate(volts, times, sunlit, schedule)
+
+        lookahead = times <= now + self.config['low_power_lookahead']
+        low_power = bool((predicted[lookahead] < normal_volts).any())
+        return Plan(times, sunlit, schedule, predicted, low_power, shed)
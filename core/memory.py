@@ -0,0 +1,156 @@
+import os
+import resource
+import tracemalloc
+
+from helpers import metrics
+
+OK = 0
+SOFT = 1
+HARD = 2
+LEVELS = ("ok", "soft", "hard")
+MIB = 1 << 20
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss() -> int:
+    """
+    :return: Resident set size of this process in bytes; the peak RSS where /proc is unavailable
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def subsystem(filename: str) -> str:
+    """
+    Attributes a source file to the pFS subsystem it belongs to
+    :return: submodule name (radio name for submodules/radios), "core", "helpers", or "other" outside pFS
+    """
+    path = os.path.relpath(filename, ROOT)
+    parts = path.split(os.sep)
+    if parts[0] == "submodules" and len(parts) > 2:
+        return os.path.splitext(parts[2])[0] if parts[1] == "radios" and parts[2] != "__init__.py" else parts[1]
+    if parts[0] in ("core", "helpers"):
+        return parts[0]
+    return "other"
+
+
+def source(filename: str) -> str:
+    """
+    :return: filename relative to pFS, or just its name outside pFS, to keep summaries short
+    """
+    path = os.path.relpath(filename, ROOT)
+    return os.path.basename(filename) if path.startswith(os.pardir) else path
+
+
+class MemoryGovernor:
+    """
+    Tracks the RSS of pFS and, with tracemalloc tracing one frame per allocation, the Python heap of each subsystem,
+    and grades them against soft and hard budgets. Snapshots are only taken every memory.interval seconds, so the
+    cost between checks is tracemalloc's per allocation bookkeeping, which slows allocation heavy Python code about
+    four times. Tracing therefore runs all the time only with memory.trace; with memory.trace_on_soft it starts when
+    RSS first crosses the soft budget, so that later checks can tell which subsystem grows, and stops once memory is
+    back within budget.
+    """
+
+    def __init__(self, config: dict, logger=None):
+        """
+        :param config: config['memory']
+        :param logger: Logger to report crossings to
+        """
+        self.configure(config)
+        self.logger = logger
+        self.level = OK
+        self.on_demand = False  # whether tracing was started by a soft crossing rather than memory.trace
+        self.heap = dict()  # subsystem -> bytes at the last check
+        self.baseline = None  # snapshot the next allocation diff is taken against
+        self.rss_gauge = metrics.gauge("pfs_memory_rss_bytes", "Resident set size", fn=rss)
+        metrics.add_collector(self.collect)
+
+    def configure(self, config: dict) -> None:
+        """
+        Sets the interval and budgets; tracing is only started or kept, never stopped
+        :param config: config['memory']
+        """
+        self.interval = config['interval']
+        self.soft = config['soft_rss'] * MIB
+        self.hard = config['hard_rss'] * MIB
+        self.budgets = {name: mib * MIB for name, mib in (config.get('subsystems') or {}).items()}
+        self.top = config.get('top', 3)
+        self.trace_on_soft = config.get('trace_on_soft', True)
+        if config.get('trace', False) and not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+            self.on_demand = False
+
+    def snapshot(self):
+        """
+        :return: tracemalloc snapshot without tracemalloc's own and the import system's allocations, None when not
+        tracing
+        """
+        if not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+
+    def check(self) -> (int, str):
+        """
+        Measures memory and grades it: HARD over hard_rss, SOFT over soft_rss or a subsystem budget, OK otherwise
+        With trace_on_soft, starts tracing on a crossing and stops tracing it started once back to OK
+        :return: (level, summary of the crossing if the level rose since the last check, else None)
+        """
+        current = rss()
+        snapshot = self.snapshot()
+        if snapshot is not None:
+            heap = dict()
+            for stat in snapshot.statistics("filename"):
+                name = subsystem(stat.traceback[0].filename)
+                heap[name] = heap.get(name, 0) + stat.size
+            self.heap = heap
+        over = [name for name, budget in self.budgets.items() if self.heap.get(name, 0) > budget]
+        level = HARD if current > self.hard else SOFT if current > self.soft or over else OK
+        summary = None
+        if level > self.level:
+            summary = self.summary(current, level, over, snapshot)
+            if self.logger is not None:
+                self.logger.warning(summary)
+        if level != self.level or self.baseline is None:
+            self.baseline = snapshot
+        self.level = level
+        if level > OK and self.trace_on_soft and not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+            self.on_demand = True
+        elif level == OK and self.on_demand:
+            tracemalloc.stop()
+            self.on_demand = False
+            self.heap, self.baseline = dict(), None
+        return level, summary
+
+    def summary(self, current: int, level: int, over: list, snapshot) -> str:
+        """
+        :return: One line: level, RSS, the subsystems over budget, and the top allocation growth since the baseline
+        e.g. "MEM soft rss 151.2M over telemetry; +2150K submodules/telemetry/__init__.py:271 x1830, +12K deque.py:8 x3"
+        """
+        text = f"MEM {LEVELS[level]} rss {current / MIB:.1f}M"
+        if over:
+            text += " over " + ",".join(over)
+        if snapshot is not None and self.baseline is not None:
+            growth = [stat for stat in snapshot.compare_to(self.baseline, "lineno") if stat.size_diff > 0]
+            text += "; " + ", ".join(
+                f"+{stat.size_diff >> 10}K {source(stat.traceback[0].filename)}:{stat.traceback[0].lineno} "
+                f"x{stat.count_diff}" for stat in growth[:self.top])
+        return text
+
+    def collect(self) -> list:
+        """
+        helpers.metrics collector
+        """
+        return [("pfs_memory_heap_bytes", "gauge", "Python heap allocated per subsystem, as of the last check",
+                 {"subsystem": name}, size) for name, size in self.heap.items()] + \
+               [("pfs_memory_level", "gauge", "0 within budget, 1 over the soft budget, 2 over the hard budget", {},
+                 self.level)]
+
@@ -1,20 +1,209 @@
 import subprocess
+import time
 
+from yaml import YAMLError
+
+from core.config import ConfigError, load, patched, save
+from core.memory import HARD, SOFT
+from helpers.error import Error
 from helpers.power import Power
 from helpers.mode import Mode
 
 
 def power_watchdog(core, eps) -> None:
     """
-    Constantly monitors eps power levels and switches Modes accordingly
+    Constantly monitors eps power levels and switches Modes accordingly.
+    Does not return to normal mode while the energy planner holds low power, and leaves emergency mode alone until
+    the anomaly hold has expired.
     """
     while True:
-        if eps.get_battery_bus_volts() >= Power.NORMAL.value and core.state != Mode.NORMAL:
+        if core.emergency_hold is not None and time.time() < core.emergency_hold:
+            time.sleep(1)
+            continue
+        volts = eps.get_battery_volts()
+        if volts >= Power.NORMAL.value and core.state != Mode.NORMAL and not core.energy_hold:
             core.enter_normal_mode(
-                f'Battery level at sufficient state: {eps.get_battery_bus_volts()}')
-        elif eps.get_battery_bus_volts() < Power.NORMAL.value and core.state != Mode.LOW_POWER:
+                f'Battery level at sufficient state: {volts}')
+        elif volts < Power.NORMAL.value and core.state != Mode.LOW_POWER:
             core.enter_low_power_mode(
-                f'Battery level at critical state: {eps.get_battery_bus_volts()}')
+                f'Battery level at critical state: {volts}')
+
+
+def telemetry_scheduler(core) -> None:
+    """
+    Dumps telemetry every core.pass_dump_interval seconds while a ground station is in view, as predicted by the
+    orbit submodule. Falls back to dumping every core.dump_interval seconds without an orbit or a TLE.
+    Waits for a pass at most core.dump_interval seconds at a time and predicts again, so that an uplinked TLE
+    takes effect before the pass predicted from the old one. After a warm start, dumps once immediately.
+    """
+    if core.restored:  # warm start: report right away instead of after a dump interval
+        core.dump_telemetry()
+    while True:
+        orbit = core.submodules.get('orbit')
+        upcoming = orbit.next_pass() if orbit is not None else None
+        if upcoming is None:
+            time.sleep(core.config['core']['dump_interval'])
+            core.dump_telemetry()
+            continue
+
+        if upcoming.aos > time.time():
+            time.sleep(min(core.config['core']['dump_interval'], upcoming.aos - time.time()))
+            continue
+        while time.time() < upcoming.los:
+            core.dump_telemetry()
+            time.sleep(min(core.config['core']['pass_dump_interval'], max(0.0, upcoming.los - time.time())))
+
+
+def switch_device(core, eps, device: str, on: bool) -> None:
+    """
+    Powers a device's PDM on or off. A loaded submodule of the same name is put into low power before its PDM is
+    switched off, and back into normal mode after it is switched on if core is in normal mode. A PDM shed in
+    emergency mode is the planner's again once switched, so that EPS does not switch it back on in normal mode.
+    """
+    submodule = core.submodules.get(device)
+    if device in eps.shed:
+        eps.shed.remove(device)
+    if on:
+        eps.pin_on(device)
+        if submodule is not None and core.state == Mode.NORMAL:
+            submodule.enter_normal_mode()
+    else:
+        if submodule is not None and core.state == Mode.NORMAL:
+            submodule.enter_low_power_mode()
+        eps.pin_off(device)
+
+
+def energy_planner(core, eps, orbit) -> None:
+    """
+    Every energy.interval seconds: refits the battery model to recent housekeeping, converted to volts with
+    eps.calibration, predicts the battery bus voltage over energy.horizon from the eclipse and pass predictions and
+    enters low power ahead of a predicted drop below Power.NORMAL. In between, the planned PDM schedule is followed
+    every energy.step seconds, except in emergency mode, whose PDMs EPS owns; after it, the schedule is applied anew.
+    """
+    import numpy as np  # only with orbit and eps loaded, so that core imports before any stage without numpy
+    from core.energy import BatteryModel, EnergyPlanner
+
+    config = core.config['energy']
+    prior = BatteryModel.from_config(config['model'])
+    channels = eps.housekeeping.index
+    powered = {device: True for device in config['devices']}
+    while True:
+        now = time.time()
+        times, values = eps.housekeeping.ordered(now - config['fit_window'], now)
+        volts = eps.calibrate('battery_bus_volts', values[channels['battery_bus_volts']].astype(np.float64))
+        model = prior
+        if len(times) >= config['min_fit_samples']:
+            model = BatteryModel.fit(
+                times, volts, orbit.sunlit(times),
+                {device: values[channels[f"pdm_{device}"]] > 0 for device in config['devices']},
+                max_volts=prior.max_volts, prior=prior)
+
+        valid = np.flatnonzero(np.isfinite(volts))
+        current = float(volts[valid[-1]]) if len(valid) else eps.get_battery_volts()
+        grid = now + np.arange(0, config['horizon'], config['step'], dtype=np.float64)
+        plan = EnergyPlanner(config, model).plan(now, current, grid, orbit.sunlit(grid), orbit.get_passes(now),
+                                                 Power.NORMAL.value)
+
+        if plan.low_power:
+            core.energy_hold = str(plan)
+            if core.state == Mode.NORMAL:
+                core.enter_low_power_mode(f"Energy plan: {plan}")
+        else:
+            core.energy_hold = None
+
+        while time.time() < now + config['interval']:
+            for device in config['devices']:
+                if core.state == Mode.EMERGENCY:  # EPS sheds and restores the PDMs; switch them again afterwards
+                    powered[device] = None
+                    continue
+                wanted = plan.wanted(device, time.time())
+                if wanted != powered[device]:
+                    switch_device(core, eps, device, wanted)
+                    powered[device] = wanted
+            time.sleep(config['step'])
+
+
+def anomaly_watchdog(core, anomalies) -> None:
+    """
+    Enters emergency mode as soon as EPS confirms an anomaly, and holds it for eps.anomaly.hold seconds after the
+    latest one
+    :param anomalies: core's subscription to core.bus.ANOMALIES
+    """
+    while True:
+        record = anomalies.get()
+        core.emergency_hold = time.time() + core.config['eps']['anomaly']['hold']
+        if core.state != Mode.EMERGENCY:
+            core.enter_emergency_mode(record.message)
+
+
+def checkpoint_writer(core) -> None:
+    """
+    Saves a checkpoint every core.checkpoint.interval seconds
+    """
+    while True:
+        time.sleep(core.checkpointer.interval)
+        core.save_checkpoint()
+
+
+def memory_watchdog(core, governor) -> None:
+    """
+    Checks memory every memory.interval seconds. Over the soft budget, submodules shed what they buffer on every
+    check; over the hard budget, core checkpoints and restarts, unless it has run for less than memory.min_uptime
+    seconds, which would make the restart loop. Each rise in level sends the governor's allocation diff as an error.
+    """
+    while True:
+        time.sleep(governor.interval)
+        level, summary = governor.check()
+        if summary is not None and 'telemetry' in core.submodules:
+            core.submodules['telemetry'].enqueue(Error(sys_name="core", msg=summary))
+        if level >= SOFT:
+            core.shed_memory()
+        if level == HARD:
+            if time.monotonic() - core.boot_time >= core.config['memory']['min_uptime']:
+                core.restart(summary or "Over the hard memory budget")
+            elif summary is not None:
+                core.logger.error("Over the hard memory budget too soon after boot to restart")
+
+
+def config_patcher(core, patches) -> None:
+    """
+    Applies configuration patches, answering each with whether it was applied. With core.reload.persist_patches,
+    the patched configuration is written to config_custom.yml.
+    :param patches: core's subscription to core.bus.CONFIG
+    """
+    while True:
+        patch = patches.get()
+        try:
+            config = patched(core.config, patch.changes)
+        except ConfigError as e:
+            core.logger.error(f"Rejected configuration patch from {patch.source}: {e}")
+            patch.answer(str(e))
+            continue
+        try:
+            core.reconfigure(config, patch.source)
+        except ConfigError as e:  # reported by core.reconfigure
+            patch.answer(str(e))
+            continue
+        if (core.config['core'].get('reload') or {}).get('persist_patches'):
+            try:
+                save(core.config)
+            except OSError as e:
+                core.logger.error(f"Could not persist configuration patch: {e}")
+        patch.answer()
+
+
+def config_watcher(core, watcher) -> None:
+    """
+    Reloads the configuration whenever a config file is written
+    """
+    while True:
+        watcher.wait()
+        try:
+            core.reconfigure(load(), "file")
+        except (OSError, YAMLError) as e:
+            core.logger.error(f"Could not read configuration: {e}")
+        except ConfigError:
+            pass  # reported by core.reconfigure
 
 
 def is_first_boot() -> bool:
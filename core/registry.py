@@ -0,0 +1,92 @@
+import importlib
+import logging
+import os
+import resource
+import time
+
+logger = logging.getLogger("registry")
+
+# Maps a submodule name, as used in config['core']['modules'], to "<python module>:<class name>".
+# Submodules are only imported once the stage that lists them starts.
+REGISTRY = {
+    "antenna_deployer": "submodules.antenna_deployer:AntennaDeployer",
+    "aprs": "submodules.radios.aprs:APRS",
+    "command_ingest": "submodules.command_ingest:CommandIngest",
+    "eps": "submodules.eps:EPS",
+    "file_transfer": "submodules.file_transfer:FileTransfer",
+    "iridium": "submodules.radios.iridium:Iridium",
+    "orbit": "submodules.orbit:Orbit",
+    "telemetry": "submodules.telemetry:Telemetry",
+}
+
+
+def get_rss() -> int:
+    """
+    Returns the current resident set size of this process in bytes.
+    Falls back to the peak RSS where /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class ImportRecord:
+    """
+    Time and memory cost of importing a single submodule.
+    """
+    __slots__ = ("name", "seconds", "rss_delta")
+
+    def __init__(self, name: str, seconds: float, rss_delta: int):
+        self.name = name
+        self.seconds = seconds
+        self.rss_delta = rss_delta
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.seconds * 1000:.1f} ms, {self.rss_delta / 1024:+.0f} KiB RSS"
+
+
+class Registry:
+    """
+    Resolves submodule classes lazily from their registered import path
+    """
+
+    def __init__(self, entries: dict = None, profile: bool = False):
+        """
+        :param entries: name -> "module:Class" mapping; defaults to REGISTRY
+        :param profile: Record import time and RSS delta of every submodule import
+        """
+        self.entries = dict(REGISTRY if entries is None else entries)
+        self.profile = profile
+        self.imports = []
+
+    def resolve(self, name: str):
+        """
+        Imports and returns the class registered under name
+        :param name: submodule name
+        :return: the submodule class
+        """
+        if name not in self.entries:
+            raise KeyError(f"[registry]:[{name}] is not a registered submodule")
+        module_path, class_name = self.entries[name].split(":")
+        if not self.profile:
+            return getattr(importlib.import_module(module_path), class_name)
+
+        rss_before = get_rss()
+        start = time.perf_counter()
+        cls = getattr(importlib.import_module(module_path), class_name)
+        record = ImportRecord(name, time.perf_counter() - start, get_rss() - rss_before)
+        self.imports.append(record)
+        logger.info(f"Imported {record}")
+        return cls
+
+    def report(self) -> str:
+        """
+        :return: Human readable summary of every profiled import, most expensive first
+        """
+        records = sorted(self.imports, key=lambda r: r.seconds, reverse=True)
+        total = sum(r.seconds for r in records)
+        lines = [str(r) for r in records]
+        lines.append(f"total: {total * 1000:.1f} ms, RSS now {get_rss() / 1024:.0f} KiB")
+        return "\n".join(lines)
@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+
+from collections import deque
+
+from helpers.mode import Mode
+
+HANDLERS = {
+    Mode.NORMAL: "enter_normal_mode",
+    Mode.LOW_POWER: "enter_low_power_mode",
+    Mode.EMERGENCY: "enter_emergency_mode",
+}
+
+
+class HandlerResult:
+    """
+    Outcome of a single submodule's mode handler.
+    """
+    __slots__ = ("name", "ok", "seconds", "error", "late")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.ok = False
+        self.seconds = None  # None while the handler is still running, or if it missed its deadline
+        self.error = None
+        self.late = False  # set when the deadline passes first; the outcome is then final
+
+    def __str__(self) -> str:
+        if self.seconds is None:
+            return f"{self.name}=TIMEOUT"
+        return f"{self.name}={'OK' if self.ok else 'ERR'}/{self.seconds * 1000:.0f}ms"
+
+
+class Transition:
+    """
+    Record of a mode transition across all submodules.
+    """
+    __slots__ = ("mode", "reason", "started", "seconds", "results")
+
+    def __init__(self, mode: Mode, reason: str):
+        self.mode = mode
+        self.reason = reason
+        self.started = time.time()
+        self.seconds = None
+        self.results = dict()
+
+    @property
+    def complete(self) -> bool:
+        """
+        True if every handler finished successfully within its deadline
+        """
+        return all(result.ok for result in self.results.values())
+
+    def __str__(self) -> str:
+        return "{0} in {1:.0f}ms: {2}".format(self.mode.name, self.seconds * 1000,
+                                             " ".join(str(r) for r in self.results.values()))
+
+
+class TransitionEngine:
+    """
+    Runs submodule mode handlers concurrently, each bounded by a deadline.
+    Emergency transitions shed submodules in tiers following config['core']['emergency_shed_order'].
+    """
+
+    def __init__(self, config: dict, logger=logging, history: int = 32):
+        """
+        :param config: dictionary of configuration data
+        :param logger: logger used to report late and failing handlers
+        :param history: number of past transitions to keep
+        """
+        self.config = config
+        self.logger = logger
+        self.history = deque(maxlen=history)
+        self.states = dict()  # submodule name -> Mode the submodule last completed a transition into
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def deadline(self, name: str) -> float:
+        """
+        :param name: name of submodule
+        :return: Seconds the submodule's handler is allowed to take
+        """
+        section = self.config.get(name) or {}
+        return section.get('transition_timeout', self.config['core'].get('transition_timeout', 5))
+
+    def tiers(self, mode: Mode, names: list) -> list:
+        """
+        Groups submodules into tiers that are transitioned one after another.
+        Only emergency transitions are tiered; all other transitions run in a single tier.
+        :param mode: Mode being entered
+        :param names: names of the submodules to transition
+        :return: list of lists of submodule names
+        """
+        if mode != Mode.EMERGENCY:
+            return [list(names)]
+        tiers, seen = [], set()
+        for tier in self.config['core'].get('emergency_shed_order') or []:
+            tier = [tier] if isinstance(tier, str) else list(tier)
+            tier = [name for name in tier if name in names and name not in seen]
+            seen.update(tier)
+            if tier:
+                tiers.append(tier)
+        rest = [name for name in names if name not in seen]
+        if rest:
+            tiers.append(rest)
+        return tiers
+
+    def run(self, mode: Mode, submodules: dict, reason: str = '') -> Transition:
+        """
+        Calls the handler for mode on every submodule that has one.
+        :param mode: Mode to enter
+        :param submodules: dictionary of submodule name to submodule instance
+        :param reason: Reason for the transition
+        :return: Transition record
+        """
+        handler_name = HANDLERS[mode]
+        transition = Transition(mode, reason)
+        with self.lock:
+            self.generation += 1
+            generation = self.generation
+
+        names = [name for name in submodules if hasattr(submodules[name], handler_name)]
+        start = time.perf_counter()
+        for tier in self.tiers(mode, names):
+            threads = []
+            for name in tier:
+                result = HandlerResult(name)
+                transition.results[name] = result
+                thread = threading.Thread(
+                    target=self._call,
+                    args=(getattr(submodules[name], handler_name), result, mode, generation),
+                    name=f"{name}-{handler_name}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append((thread, time.perf_counter() + self.deadline(name), result))
+            for thread, deadline, result in threads:
+                thread.join(max(0.0, deadline - time.perf_counter()))
+                with self.lock:
+                    result.late = result.seconds is None
+                if result.late:
+                    self.logger.error(f"{result.name}.{handler_name} missed its deadline")
+        transition.seconds = time.perf_counter() - start
+        self.history.append(transition)
+        return transition
+
+    def _call(self, handler: callable, result: HandlerResult, mode: Mode, generation: int) -> None:
+        """
+        Runs a single handler and records its outcome, unless it missed its deadline: the transition was already
+        recorded as timed out then. A handler finishing after its deadline still updates the submodule's state,
+        unless a newer transition has started since.
+        """
+        start = time.perf_counter()
+        ok, error = False, None
+        try:
+            handler()
+            ok = True
+        except Exception as e:
+            error = e
+            self.logger.exception(f"{result.name} failed to enter {mode.name}")
+        with self.lock:
+            if not result.late:
+                result.ok, result.error, result.seconds = ok, error, time.perf_counter() - start
+            if ok and generation == self.generation:
+                self.states[result.name] = mode
@@ -0,0 +1,513 @@
+"""
+Factory for the serial ports and I2C buses used by the submodules, with a capture and a replay layer.
+
+By default open_serial and i2c_bus return the real pyserial and smbus2 objects. After configure(capture=path) they
+are wrapped so that every read and write is also recorded, with its time, into a compact binary log. After
+configure(replay=path) they are replaced by fakes that serve the recorded reads back, either at the recorded pace
+or as fast as possible, so that a captured pass can be rerun through unmodified pFS.
+
+Log format: b"PFSCAP" + version byte, then records of
+    >IBBH  microseconds since the previous record, channel, op, payload length
+followed by the payload. A NAME record declares a channel's name before its first use. Consecutive serial reads of
+a channel less than COALESCE_US apart are stored as one record.
+Ordering is kept per channel only: serial ports are one channel each, I2C buses one channel per thread.
+"""
+import atexit
+import struct
+import threading
+import time
+
+from collections import deque
+
+from helpers import metrics
+
+MAGIC = b"PFSCAP"
+VERSION = 1
+RECORD = struct.Struct(">IBBH")
+COALESCE_US = 2000
+
+# Record ops
+NAME = 0
+READ = 1
+WRITE = 2
+I2C = 3
+
+# I2C methods, stored as the first payload byte of an I2C record followed by address, register and data
+I2C_METHODS = ("read_byte", "read_byte_data", "write_byte_data", "read_i2c_block_data", "write_i2c_block_data")
+
+_capture = None  # CaptureLog while capturing
+_replay = None  # ReplayLog while replaying
+
+
+class ReplayMismatch(Exception):
+    """
+    Raised by replay fakes when pFS performs an I2C read the log does not contain
+    """
+
+
+def configure(capture: str = None, replay: str = None, realtime: bool = True) -> None:
+    """
+    Selects how devices are opened from now on
+    :param capture: path of a log to record every serial and I2C transaction into
+    :param replay: path of a log to serve serial and I2C reads from instead of the hardware
+    :param realtime: when replaying, deliver each read no earlier than it was recorded relative to the first record
+    """
+    global _capture, _replay
+    if capture and replay:
+        raise ValueError("cannot capture and replay at the same time")
+    _capture = CaptureLog(capture) if capture else None
+    _replay = ReplayLog(replay, realtime) if replay else None
+    if _capture is not None:
+        atexit.register(_capture.close)
+
+
+def get_capture():
+    return _capture
+
+
+def get_replay():
+    return _replay
+
+
+def open_serial(name: str, port: str, worker: dict = None, **kwargs):
+    """
+    Opens a serial port
+    :param name: channel name in capture logs, e.g. "aprs"
+    :param port: device path
+    :param worker: config['radio_workers']; if enabled, the port is served by a helpers.serialworker process
+    :param kwargs: passed to serial.Serial
+    :return: a serial.Serial or WorkerSerial, or a capture or replay wrapper with the same interface
+    """
+    if _replay is not None:
+        return MeteredSerial(ReplaySerial(_replay, name), name)
+    if worker is not None and worker.get("enabled"):
+        from helpers.serialworker import WorkerSerial
+        serial = WorkerSerial(name, port, worker, **kwargs)
+    else:
+        from serial import Serial
+        serial = Serial(port, **kwargs)
+    return MeteredSerial(CaptureSerial(serial, _capture, name) if _capture is not None else serial, name)
+
+
+class i2c_bus:
+    """
+    Context manager opening an I2C bus, used like smbus2.SMBusWrapper: `with i2c_bus(1) as bus:`
+    """
+
+    def __init__(self, number: int, name: str = None):
+        """
+        :param number: bus number, as in /dev/i2c-<number>
+        :param name: channel name in capture logs; defaults to i2c-<number>@<thread name>, so that each thread's
+            transactions replay in their own recorded order however the threads interleave
+        """
+        self.number = number
+        self.name = name
+        self.wrapper = None
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        if self.name is None:
+            self.name = f"i2c-{self.number}@{threading.current_thread().name}"
+        if _replay is not None:
+            return ReplayBus(_replay, self.name)
+        from smbus2 import SMBusWrapper
+        self.wrapper = SMBusWrapper(self.number)
+        bus = self.wrapper.__enter__()
+        return CaptureBus(bus, _capture, self.name) if _capture is not None else bus
+
+    def __exit__(self, *exc):
+        if self.wrapper is not None:
+            self.wrapper.__exit__(*exc)
+            self.wrapper = None
+        transactions, errors, latency = _i2c_metrics(self.number)
+        transactions.inc()
+        latency.observe(time.perf_counter() - self.start)
+        if exc[0] is not None:
+            errors.inc()
+        return False
+
+
+_i2c = dict()  # bus number -> (transactions, errors, latency)
+
+
+def _i2c_metrics(number: int) -> tuple:
+    found = _i2c.get(number)
+    if found is None:
+        labels = {"bus": number}
+        found = _i2c[number] = (
+            metrics.counter("pfs_i2c_transactions_total", "I2C bus sessions, one per `with i2c_bus()` block", labels),
+            metrics.counter("pfs_i2c_errors_total", "I2C bus sessions that raised", labels),
+            metrics.histogram("pfs_i2c_transaction_seconds", "Duration of I2C bus sessions", labels),
+        )
+    return found
+
+
+class MeteredSerial:
+    """
+    Serial port wrapper that counts the bytes read and written
+    """
+
+    def __init__(self, serial, name: str):
+        self._serial = serial
+        self._read = metrics.counter("pfs_serial_bytes_total", "Bytes through serial ports",
+                                     {"port": name, "direction": "in"})
+        self._written = metrics.counter("pfs_serial_bytes_total", "Bytes through serial ports",
+                                        {"port": name, "direction": "out"})
+
+    def read(self, size: int = 1) -> bytes:
+        data = self._serial.read(size)
+        self._read.inc(len(data))
+        return data
+
+    def readline(self, *args, **kwargs) -> bytes:
+        data = self._serial.readline(*args, **kwargs)
+        self._read.inc(len(data))
+        return data
+
+    def write(self, data: bytes) -> int:
+        self._written.inc(len(data))
+        return self._serial.write(data)
+
+    def __getattr__(self, item):
+        return getattr(self._serial, item)
+
+
+def _as_bytes(data) -> bytes:
+    if isinstance(data, int):
+        return bytes((data,))
+    return bytes(data)
+
+
+class CaptureLog:
+    """
+    Thread safe writer of a capture log
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        """
+        :param path: log file, overwritten
+        :param flush_interval: seconds between flushes of the file buffer
+        """
+        self.file = open(path, "wb")
+        self.file.write(MAGIC + bytes((VERSION,)))
+        self.lock = threading.Lock()
+        self.channels = dict()  # name -> channel id
+        self.last_ns = time.monotonic_ns()
+        self.pending = None  # [channel, first ns, last ns, bytearray] of a serial read that may still be extended
+        self.flush_interval = flush_interval
+        self.last_flush = time.monotonic()
+        self.records = 0
+        self.bytes = 0
+
+    def channel(self, name: str) -> int:
+        with self.lock:
+            if name not in self.channels:
+                if len(self.channels) == 255:
+                    raise ValueError("too many capture channels")
+                self.channels[name] = len(self.channels)
+                self._write(self.channels[name], NAME, time.monotonic_ns(), name.encode("utf-8"))
+            return self.channels[name]
+
+    def record(self, channel: int, op: int, payload: bytes) -> None:
+        now = time.monotonic_ns()
+        with self.lock:
+            pending = self.pending
+            if op == READ and pending is not None and pending[0] == channel and \
+                    (now - pending[2]) // 1000 < COALESCE_US and len(pending[3]) + len(payload) <= 0xFFFF:
+                pending[2] = now
+                pending[3] += payload
+                return
+            self._flush_pending()
+            if op == READ:
+                self.pending = [channel, now, now, bytearray(payload)]
+            else:
+                self._write(channel, op, now, payload)
+            if time.monotonic() - self.last_flush >= self.flush_interval:
+                self.file.flush()
+                self.last_flush = time.monotonic()
+
+    def _flush_pending(self) -> None:
+        if self.pending is not None:
+            channel, first, _, payload = self.pending
+            self.pending = None
+            self._write(channel, READ, first, bytes(payload))
+
+    def _write(self, channel: int, op: int, timestamp: int, payload: bytes) -> None:
+        delta = min(max(0, timestamp - self.last_ns) // 1000, 0xFFFFFFFF)
+        self.last_ns = max(self.last_ns, timestamp)
+        self.file.write(RECORD.pack(delta, channel, op, len(payload)))
+        self.file.write(payload)
+        self.records += 1
+        self.bytes += RECORD.size + len(payload)
+
+    def close(self) -> None:
+        with self.lock:
+            self._flush_pending()
+            self.file.close()
+
+
+def read_log(path: str) -> list:
+    """
+    :param path: capture log
+    :return: list of (microseconds since the first record, channel name, op, payload)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:len(MAGIC)] != MAGIC or data[len(MAGIC)] != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} capture log")
+    offset = len(MAGIC) + 1
+    names = dict()
+    records = []
+    elapsed = 0
+    while offset + RECORD.size <= len(data):
+        delta, channel, op, length = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        payload = data[offset:offset + length]
+        offset += length
+        elapsed += delta
+        if op == NAME:
+            names[channel] = payload.decode("utf-8")
+        else:
+            records.append((elapsed, names[channel], op, payload))
+    return records
+
+
+class CaptureSerial:
+    """
+    pyserial Serial wrapper that records reads and writes
+    """
+
+    def __init__(self, serial, log: CaptureLog, name: str):
+        self._serial = serial
+        self._log = log
+        self._channel = log.channel(name)
+
+    def read(self, size: int = 1) -> bytes:
+        data = self._serial.read(size)
+        if data:
+            self._log.record(self._channel, READ, data)
+        return data
+
+    def readline(self, *args, **kwargs) -> bytes:
+        data = self._serial.readline(*args, **kwargs)
+        if data:
+            self._log.record(self._channel, READ, data)
+        return data
+
+    def write(self, data: bytes) -> int:
+        self._log.record(self._channel, WRITE, bytes(data))
+        return self._serial.write(data)
+
+    def __getattr__(self, item):
+        return getattr(self._serial, item)
+
+
+class CaptureBus:
+    """
+    smbus2 SMBus wrapper that records the transactions used by pFS
+    """
+
+    def __init__(self, bus, log: CaptureLog, name: str):
+        self._bus = bus
+        self._log = log
+        self._channel = log.channel(name)
+
+    def _record(self, method: str, address: int, register: int, data) -> None:
+        payload = bytes((I2C_METHODS.index(method), address, register)) + _as_bytes(data)
+        self._log.record(self._channel, I2C, payload)
+
+    def read_byte(self, address: int, *args):
+        value = self._bus.read_byte(address, *args)
+        self._record("read_byte", address, 0, value)
+        return value
+
+    def read_byte_data(self, address: int, register: int, *args):
+        value = self._bus.read_byte_data(address, register, *args)
+        self._record("read_byte_data", address, register, value)
+        return value
+
+    def write_byte_data(self, address: int, register: int, value: int, *args):
+        self._record("write_byte_data", address, register, value)
+        return self._bus.write_byte_data(address, register, value, *args)
+
+    def read_i2c_block_data(self, address: int, register: int, length: int, *args):
+        values = self._bus.read_i2c_block_data(address, register, length, *args)
+        self._record("read_i2c_block_data", address, register, values)
+        return values
+
+    def write_i2c_block_data(self, address: int, register: int, data, *args):
+        self._record("write_i2c_block_data", address, register, data)
+        return self._bus.write_i2c_block_data(address, register, data, *args)
+
+    def __getattr__(self, item):
+        return getattr(self._bus, item)
+
+
+class ReplayLog:
+    """
+    Serves the records of a capture log back per channel
+    """
+
+    def __init__(self, path: str, realtime: bool = True):
+        """
+        :param path: capture log
+        :param realtime: deliver reads no earlier than recorded, relative to when replay started
+        """
+        self.realtime = realtime
+        self.queues = dict()  # channel name -> deque of (microseconds, op, payload)
+        for elapsed, name, op, payload in read_log(path):
+            self.queues.setdefault(name, deque()).append((elapsed, op, payload))
+        self.total = sum(len(queue) for queue in self.queues.values())
+        self.replayed = 0
+        self.mismatches = 0
+        self.lock = threading.Condition()
+        self.finished = threading.Event()
+        self.start_ns = None
+        if self.total == 0:
+            self.finished.set()
+
+    def begin(self) -> None:
+        if self.start_ns is None:
+            self.start_ns = time.monotonic_ns()
+
+    def pop(self, name: str, ops: tuple):
+        """
+        Takes the next record of a channel whose op is in ops, skipping and counting records of other ops
+        :return: (op, payload), or None once the channel is exhausted
+        """
+        self.begin()
+        with self.lock:
+            queue = self.queues.get(name)
+            while queue:
+                elapsed, op, payload = queue.popleft()
+                self.replayed += 1
+                if not any(self.queues.values()):
+                    self.finished.set()
+                if op in ops:
+                    break
+                self.mismatches += 1
+            else:
+                return None
+        if self.realtime:
+            delay = self.start_ns + elapsed * 1000 - time.monotonic_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+        return op, payload
+
+    def peek(self, name: str):
+        with self.lock:
+            queue = self.queues.get(name)
+            return queue[0][1] if queue else None
+
+    def expect(self, name: str, op: int, payload: bytes) -> None:
+        """
+        Consumes a recorded write and counts it as a mismatch if pFS wrote something else
+        """
+        if self.peek(name) != op:
+            with self.lock:
+                self.mismatches += 1
+            return
+        record = self.pop(name, (op,))
+        if record is None or record[1] != payload:
+            with self.lock:
+                self.mismatches += 1
+
+
+class ReplaySerial:
+    """
+    Stand-in for pyserial Serial that returns recorded reads and checks writes against the log.
+    Once the channel's records run out, read() times out like an idle port.
+    """
+
+    def __init__(self, log: ReplayLog, name: str, timeout: float = 1.0):
+        self.log = log
+        self.name = name
+        self.timeout = timeout
+        self.buffer = bytearray()
+        self.is_open = True
+
+    def open(self) -> None:
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def flush(self) -> None:
+        pass
+
+    def reset_input_buffer(self) -> None:
+        pass
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.buffer)
+
+    def read(self, size: int = 1) -> bytes:
+        while len(self.buffer) < size:
+            if self.log.peek(self.name) == WRITE:
+                break  # pFS has to write before the device answers
+            record = self.log.pop(self.name, (READ,))
+            if record is None:
+                break
+            self.buffer += record[1]
+        if not self.buffer:
+            self.log.finished.wait(self.timeout)
+            return b""
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def readline(self, *args, **kwargs) -> bytes:
+        line = bytearray()
+        while not line.endswith(b"\n"):
+            data = self.read(1)
+            if not data:
+                break
+            line += data
+        return bytes(line)
+
+    def write(self, data: bytes) -> int:
+        self.log.expect(self.name, WRITE, bytes(data))
+        return len(data)
+
+
+class ReplayBus:
+    """
+    Stand-in for smbus2 SMBus that returns recorded I2C reads and checks writes against the log
+    """
+
+    def __init__(self, log: ReplayLog, name: str):
+        self.log = log
+        self.name = name
+
+    def _read(self, method: str, address: int, register: int) -> bytes:
+        record = self.log.pop(self.name, (I2C,))
+        if record is None:
+            self.log.finished.wait()  # like a hung bus, until the other channels are done too
+            raise ReplayMismatch(f"{self.name}: {method}({address:#x}, {register:#x}) after the end of the log")
+        payload = record[1]
+        if payload[:3] != bytes((I2C_METHODS.index(method), address, register)):
+            with self.log.lock:
+                self.log.mismatches += 1
+            raise ReplayMismatch(f"{self.name}: {method}({address:#x}, {register:#x}) but the log has "
+                                 f"{I2C_METHODS[payload[0]]}({payload[1]:#x}, {payload[2]:#x})")
+        return payload[3:]
+
+    def _write(self, method: str, address: int, register: int, data) -> None:
+        self.log.expect(self.name, I2C, bytes((I2C_METHODS.index(method), address, register)) + _as_bytes(data))
+
+    def read_byte(self, address: int, *args) -> int:
+        return self._read("read_byte", address, 0)[0]
+
+    def read_byte_data(self, address: int, register: int, *args) -> int:
+        return self._read("read_byte_data", address, register)[0]
+
+    def write_byte_data(self, address: int, register: int, value: int, *args) -> None:
+        self._write("write_byte_data", address, register, value)
+
+    def read_i2c_block_data(self, address: int, register: int, length: int, *args) -> list:
+        return list(self._read("read_i2c_block_data", address, register))
+
+    def write_i2c_block_data(self, address: int, register: int, data, *args) -> None:
+        self._write("write_i2c_block_data", address, register, data)
@@ -1,26 +1,28 @@
 from datetime import datetime
 
+from helpers.record import Record
 
-class Error:
+
+class Error(Record):
     """
     A class representing error messages.
     """
+    __slots__ = ()
+
+    header = 'ERR!'
+    time_format = "%Y/%m/%d@%H.%M.%S"
 
-    def __init__(self, sys_name='CORE', ts: datetime = datetime.utcnow(), msg: str = None):
+    def __init__(self, sys_name='CORE', ts: datetime = None, msg: str = None):
         """
         Constructor.
         :param sys_name: The name of the subsystem.
-        :param ts: A timestamp in datetime format.
+        :param ts: A timestamp in datetime format; defaults to now.
         :param msg: A string representing the message.
         """
-        self.system = sys_name
-        self.timestamp = ts
-        self.message = msg
-        self.header = 'ERR!'
+        Record.__init__(self, sys_name, msg, ts)
 
-    def __str__(self) -> str:
+    def format(self) -> str:
         """
         :return: A string representation of this error.
         """
-        return "{0}:{1}:{2}:{3}".format(self.header, self.system,
-                                        self.timestamp.strftime("%Y/%m/%d@%H.%M.%S"), self.message)
\ No newline at end of file
+        return "{0}:{1}:{2}:{3}".format(self.header, self.system, self.format_time(), self.message)
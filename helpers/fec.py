@@ -0,0 +1,366 @@
+"""
+Reed-Solomon forward error correction for downlink frames, shared by the flight software and the ground decoder.
+
+Codes are over GF(256) with the primitive polynomial 0x11d and first consecutive root 1, shortened to the frame
+size. Encoding is vectorized with NumPy over every codeword of a dump; decoding, which only runs on the ground,
+corrects errors and erasures (frames that never arrived) with Berlekamp-Massey and Forney.
+
+Frame layout: "FEC$" followed by the base64 of
+    header: batch, index in batch, frames in batch, interleaving depth, parity symbols per codeword;
+        then the header's own 4 parity symbols
+    n codeword symbols
+The packets of a dump form one batch: they are terminated by SEPARATOR, padded with NULs to a multiple of
+k = n - parity bytes and cut into codewords, one per frame. Packets are printable ASCII text, so that the separator
+and the FILLER the ground decoder puts in place of uncorrectable codewords never occur in them, and so that the
+decoder can tell most miscorrected codewords, which decode to arbitrary bytes, from good ones. Each block of
+`interleaving depth` consecutive frames carries its codewords interleaved symbol by symbol, so that a burst, or a
+whole lost frame, is spread over every codeword of the block.
+"""
+import base64
+import struct
+
+import numpy as np
+
+PREFIX = "FEC$"
+SEPARATOR = b"\xfe"
+FILLER = b"\xff"
+HEADER = struct.Struct(">BBBBB")
+HEADER_PARITY = 4
+ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+TEXT = bytes(range(0x20, 0x7F)) + b"\t\n\r"  # bytes packets may contain
+
+EXP = np.zeros(512, dtype=np.uint8)
+LOG = np.zeros(256, dtype=np.int64)
+_x = 1
+for _i in range(255):
+    EXP[_i] = _x
+    LOG[_x] = _i
+    _x <<= 1
+    if _x & 0x100:
+        _x ^= 0x11d
+EXP[255:510] = EXP[:255]
+del _x, _i
+
+# MUL[a, b] = a * b in GF(256); 64 KiB
+MUL = EXP[(LOG[:, None] + LOG[None, :]) % 255]
+MUL[0, :] = 0
+MUL[:, 0] = 0
+
+_exp = EXP.tolist()
+_log = LOG.tolist()
+
+# Base64 decoding table that maps characters outside the alphabet, i.e. corrupted ones, to "A" so that every later
+# symbol keeps its position
+_SANITIZE = bytes(c if c in ALPHABET else ord("A") for c in range(256))
+
+
+class FECError(ValueError):
+    """
+    Raised when a codeword has more errors than its parity can correct
+    """
+
+
+def gf_mul(x: int, y: int) -> int:
+    if x == 0 or y == 0:
+        return 0
+    return _exp[_log[x] + _log[y]]
+
+
+def gf_div(x: int, y: int) -> int:
+    if y == 0:
+        raise ZeroDivisionError()
+    if x == 0:
+        return 0
+    return _exp[(_log[x] + 255 - _log[y]) % 255]
+
+
+def gf_pow(x: int, power: int) -> int:
+    return _exp[(_log[x] * power) % 255]
+
+
+def gf_inverse(x: int) -> int:
+    return _exp[255 - _log[x]]
+
+
+def poly_scale(p: list, x: int) -> list:
+    return [gf_mul(c, x) for c in p]
+
+
+def poly_add(p: list, q: list) -> list:
+    r = [0] * max(len(p), len(q))
+    for i, c in enumerate(p):
+        r[i + len(r) - len(p)] = c
+    for i, c in enumerate(q):
+        r[i + len(r) - len(q)] ^= c
+    return r
+
+
+def poly_mul(p: list, q: list) -> list:
+    r = [0] * (len(p) + len(q) - 1)
+    for j, b in enumerate(q):
+        if b == 0:
+            continue
+        for i, a in enumerate(p):
+            if a:
+                r[i + j] ^= _exp[_log[a] + _log[b]]
+    return r
+
+
+def poly_eval(p: list, x: int) -> int:
+    y = p[0]
+    for c in p[1:]:
+        y = gf_mul(y, x) ^ c
+    return y
+
+
+def poly_div(dividend: list, divisor: list) -> (list, list):
+    """
+    Synthetic division by a monic divisor
+    :return: (quotient, remainder)
+    """
+    out = list(dividend)
+    for i in range(len(dividend) - len(divisor) + 1):
+        coef = out[i]
+        if coef:
+            for j in range(1, len(divisor)):
+                if divisor[j]:
+                    out[i + j] ^= gf_mul(divisor[j], coef)
+    separator = -(len(divisor) - 1)
+    return out[:separator], out[separator:]
+
+
+def generator(parity: int) -> np.ndarray:
+    """
+    :return: Coefficients, highest degree first, of prod (x - 2^i) for i < parity
+    """
+    g = [1]
+    for i in range(parity):
+        g = poly_mul(g, [1, gf_pow(2, i)])
+    return np.array(g, dtype=np.uint8)
+
+
+class ReedSolomon:
+    """
+    Systematic RS(n, n - parity) code over GF(256) for any n up to 255
+    """
+
+    def __init__(self, parity: int):
+        if not 0 < parity < 255:
+            raise ValueError(f"Parity must be between 1 and 254 symbols, not {parity}")
+        self.parity = parity
+        self.generator = generator(parity)
+        self.taps = MUL[:, self.generator[1:]]  # taps[f] is what feedback symbol f adds to the shift register
+
+    def encode(self, messages: np.ndarray) -> np.ndarray:
+        """
+        Encodes every row at once with a shift register whose taps are looked up in a table
+        :param messages: uint8 array of shape (codewords, k)
+        :return: uint8 array of shape (codewords, k + parity), the messages followed by their parity
+        """
+        messages = np.asarray(messages, dtype=np.uint8)
+        remainder = np.zeros((len(messages), self.parity), dtype=np.uint8)
+        for column in messages.T:
+            feedback = column ^ remainder[:, 0]
+            remainder[:, :-1] = remainder[:, 1:]
+            remainder[:, -1] = 0
+            remainder ^= self.taps[feedback]
+        return np.concatenate([messages, remainder], axis=1)
+
+    def syndromes(self, codeword: list) -> list:
+        return [poly_eval(codeword, _exp[i]) for i in range(self.parity)]
+
+    def decode(self, codeword, erasures=()) -> (bytes, int):
+        """
+        :param codeword: n received symbols
+        :param erasures: positions known to be wrong, e.g. symbols of a frame that never arrived
+        :return: (the k message symbols, number of symbols corrected)
+        :raises FECError: if the codeword cannot be corrected
+        """
+        out = list(bytes(codeword))
+        n = len(out)
+        erasures = sorted(set(erasures))
+        if len(erasures) > self.parity:
+            raise FECError(f"{len(erasures)} erasures, more than {self.parity} parity symbols")
+        for position in erasures:
+            out[position] = 0
+        syndromes = self.syndromes(out)
+        if not any(syndromes):
+            return bytes(out[:-self.parity]), len(erasures)
+
+        # Syndromes with the erasures' contribution removed, leaving the unknown errors for Berlekamp-Massey
+        forney = list(syndromes)
+        for position in erasures:
+            x = gf_pow(2, n - 1 - position)
+            for j in range(len(forney) - 1):
+                forney[j] = gf_mul(forney[j], x) ^ forney[j + 1]
+
+        locator, previous = [1], [1]
+        for i in range(self.parity - len(erasures)):
+            delta = forney[i]
+            for j in range(1, len(locator)):
+                delta ^= gf_mul(locator[-(j + 1)], forney[i - j])
+            previous = previous + [0]
+            if delta:
+                if len(previous) > len(locator):
+                    new = poly_scale(previous, delta)
+                    previous = poly_scale(locator, gf_inverse(delta))
+                    locator = new
+                locator = poly_add(locator, poly_scale(previous, delta))
+        while locator and locator[0] == 0:
+            del locator[0]
+        errors = len(locator) - 1
+        if errors * 2 + len(erasures) > self.parity:
+            raise FECError(f"Too many errors to correct with {self.parity} parity symbols")
+
+        # Chien search, only over the positions that exist in the shortened code
+        reversed_locator = locator[::-1]
+        positions = [n - 1 - i for i in range(n) if poly_eval(reversed_locator, gf_pow(2, i)) == 0]
+        if len(positions) != errors:
+            raise FECError("Error locator does not match the codeword")
+
+        # Forney: magnitudes of every error and erasure
+        errata = erasures + positions
+        coefficients = [n - 1 - p for p in errata]
+        errata_locator = [1]
+        for c in coefficients:
+            errata_locator = poly_mul(errata_locator, poly_add([1], [gf_pow(2, c), 0]))
+        _, evaluator = poly_div(poly_mul(([0] + syndromes)[::-1], errata_locator), [1] + [0] * len(errata_locator))
+        xs = [gf_pow(2, c) for c in coefficients]
+        for i, xi in enumerate(xs):
+            xi_inverse = gf_inverse(xi)
+            derivative = 1
+            for j, xj in enumerate(xs):
+                if j != i:
+                    derivative = gf_mul(derivative, 1 ^ gf_mul(xi_inverse, xj))
+            if derivative == 0:
+                raise FECError("Could not find an error magnitude")
+            y = gf_mul(xi, poly_eval(evaluator, xi_inverse))
+            out[errata[i]] ^= gf_div(y, derivative)
+
+        if any(self.syndromes(out)):
+            raise FECError("Could not correct the codeword")
+        return bytes(out[:-self.parity]), len(errata)
+
+
+HEADER_CODE = ReedSolomon(HEADER_PARITY)
+
+
+class FrameCoder:
+    """
+    Encodes the packets of a dump into FEC frames no longer than a radio's max_packet_size and decodes them on
+    the ground
+    """
+
+    def __init__(self, max_packet_size: int, rate: float = 0.75, interleave: int = 1):
+        """
+        :param max_packet_size: Frames are shorter than this many characters, as telemetry packets are
+        :param rate: Code rate, message symbols over codeword symbols
+        :param interleave: Codewords interleaved over as many frames; 1 disables interleaving
+        """
+        symbols = (max_packet_size - len(PREFIX) - 1) // 4 * 3  # base64 without padding
+        self.n = min(255, symbols - HEADER.size - HEADER_PARITY)
+        self.k = int(self.n * rate)
+        self.parity = self.n - self.k
+        if self.k < 1 or self.parity < 1:
+            raise ValueError(f"Code rate {rate} does not fit a {self.n} symbol codeword")
+        if not 0 < interleave < 256:
+            raise ValueError(f"Interleaving depth must be between 1 and 255, not {interleave}")
+        self.interleave = interleave
+        self.code = ReedSolomon(self.parity)
+        self.frame_size = len(PREFIX) + 4 * -(-(HEADER.size + HEADER_PARITY + self.n) // 3)
+        self.batch = 0
+
+    def frames(self, stream_size: int) -> int:
+        """
+        :param stream_size: Total length of the packets to encode, plus one byte per packet for its separator
+        :return: Number of frames they are encoded into
+        """
+        return -(-stream_size // self.k)
+
+    def encode(self, packets: list) -> list:
+        """
+        :param packets: Printable ASCII text, see TEXT
+        :return: Frames carrying the packets as one batch
+        """
+        stream = b"".join(packet + SEPARATOR for packet in packets)
+        count = self.frames(len(stream))
+        if count == 0:
+            return []
+        if count > 255:
+            raise ValueError(f"{count} frames do not fit in one batch")
+        messages = np.zeros(count * self.k, dtype=np.uint8)
+        messages[:len(stream)] = np.frombuffer(stream, dtype=np.uint8)
+        codewords = self.code.encode(messages.reshape(count, self.k))
+        headers = HEADER_CODE.encode(np.frombuffer(b"".join(
+            HEADER.pack(self.batch, index, count, self.interleave, self.parity) for index in range(count)),
+            dtype=np.uint8).reshape(count, HEADER.size))
+        frames = []
+        for start in range(0, count, self.interleave):
+            block = codewords[start:start + self.interleave]
+            symbols = block.T.reshape(-1)  # symbol p of the block's codeword i at p * len(block) + i
+            for i in range(len(block)):
+                body = headers[start + i].tobytes() + symbols[i * self.n:(i + 1) * self.n].tobytes()
+                frames.append(PREFIX + base64.b64encode(body).decode("ascii"))
+        self.batch = (self.batch + 1) & 0xFF
+        return frames
+
+    @staticmethod
+    def parse(frame: str):
+        """
+        :return: (batch, index, count, interleave, parity, codeword symbols), or None if the frame or its header
+        is unreadable
+        """
+        if sum(a != b for a, b in zip(frame, PREFIX)) > 1:  # tolerates a corrupted prefix character
+            return None
+        text = frame[len(PREFIX):].encode("ascii", "replace").translate(_SANITIZE)
+        try:
+            body = base64.b64decode(text + b"=" * (-len(text) % 4))
+            header, _ = HEADER_CODE.decode(body[:HEADER.size + HEADER_PARITY])
+        except (ValueError, FECError):
+            return None
+        batch, index, count, interleave, parity = HEADER.unpack(header)
+        if index >= count or interleave == 0 or parity == 0:
+            return None
+        return (batch, index, count, interleave, parity, body[HEADER.size + HEADER_PARITY:])
+
+    @staticmethod
+    def decode(frames: list) -> (list, int, int):
+        """
+        Ground side: recovers the packets of every batch, treating the frames of a batch that did not arrive as
+        erasures. Packets that overlap a codeword that could not be corrected are dropped.
+        :param frames: Received frames in order of arrival; other frames are ignored
+        :return: (packets in order, as bytes, symbols corrected, codewords that could not be corrected)
+        """
+        batches = dict()  # (batch, count, interleave, parity) -> {index: symbols}, in order of first arrival
+        for frame in frames:
+            parsed = FrameCoder.parse(frame)
+            if parsed is not None:
+                batch, index, count, interleave, parity, symbols = parsed
+                batches.setdefault((batch, count, interleave, parity), dict())[index] = symbols
+        packets, corrected, failed = [], 0, 0
+        for (batch, count, interleave, parity), received in batches.items():
+            n = max(len(symbols) for symbols in received.values())
+            code = ReedSolomon(parity)
+            stream = bytearray()
+            for start in range(0, count, interleave):
+                depth = min(interleave, count - start)
+                symbols = np.zeros(depth * n, dtype=np.uint8)
+                erased = np.ones(depth * n, dtype=bool)
+                for i in range(depth):
+                    data = received.get(start + i, b"")[:n]
+                    symbols[i * n:i * n + len(data)] = np.frombuffer(data, dtype=np.uint8)
+                    erased[i * n:i * n + len(data)] = False
+                for codeword, erasure in zip(symbols.reshape(n, depth).T, erased.reshape(n, depth).T):
+                    try:
+                        message, count_corrected = code.decode(codeword.tobytes(), np.flatnonzero(erasure).tolist())
+                        if message.rstrip(b"\x00").translate(None, TEXT + SEPARATOR):
+                            raise FECError("Miscorrected codeword")  # packets are text, padded with NULs
+                    except FECError:
+                        failed += 1
+                        stream += FILLER * (n - parity)
+                        continue
+                    corrected += count_corrected
+                    stream += message
+            pieces = bytes(stream).rstrip(b"\x00").split(SEPARATOR)
+            packets += [piece for piece in pieces[:-1] if piece and FILLER not in piece]
+        return packets, corrected, failed
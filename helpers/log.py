@@ -1,28 +1,29 @@
 from datetime import datetime
 
+from helpers.record import Record
 
-class Log:
+
+class Log(Record):
     """
     A class representing log messages.
     """
+    __slots__ = ("level",)
+
+    header = 'LOG&'
 
-    def __init__(self, sys_name: str = 'CORE', lvl: str = 'INFO', ts: datetime = datetime.utcnow(), msg: str = None):
+    def __init__(self, sys_name: str = 'CORE', lvl: str = 'INFO', ts: datetime = None, msg: str = None):
         """
         Constructor.
         :param sys_name: Subsystem name
         :param lvl: Level of message (info, warning, error)
-        :param ts: Timestamp in datetime format.
+        :param ts: Timestamp in datetime format; defaults to now.
         :param msg: String message
         """
-        self.system = sys_name
+        Record.__init__(self, sys_name, msg, ts)
         self.level = lvl
-        self.timestamp = ts
-        self.message = msg
-        self.header = 'LOG&'
 
-    def __str__(self):
+    def format(self) -> str:
         """
         :return: String representation of log message.
         """
-        return "{0}:{1}:{2}:{3}:{4}".format(self.header, self.system, self.level,
-                                            self.timestamp.strftime("%Y/%m/%d@%H%M%S"), self.message)
+        return "{0}:{1}:{2}:{3}:{4}".format(self.header, self.system, self.level, self.format_time(), self.message)
@@ -0,0 +1,288 @@
+"""
+Process wide metrics: counters, gauges and fixed bucket histograms, readable as Prometheus text through a UNIX
+domain socket and as a compact binary snapshot for downlink.
+
+Updates take no lock. Each thread increments its own cell of a counter or histogram, allocated on the thread's first
+update; a scrape sums the cells. Metrics are created once, when their owner is set up, and updated in O(1) after.
+Gauges are either set or computed by a callback at scrape time, which keeps queue depths off the hot path entirely.
+
+Binary snapshot: >I UNIX time, then one >Hf record per series: the CRC-16/CCITT (binascii.crc_hqx, initial value
+0xFFFF) of the series as written in the text format, e.g. 'pfs_serial_bytes_total{port="aprs",direction="in"}',
+and its value as float32. The ground matches ids against the series names of a text scrape.
+"""
+import binascii
+import os
+import socket
+import struct
+import threading
+import time
+
+from bisect import bisect_left
+
+SNAPSHOT_HEADER = struct.Struct(">I")
+SNAPSHOT_RECORD = struct.Struct(">Hf")
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)  # seconds
+
+
+def series(name: str, labels: tuple) -> str:
+    """
+    :param labels: ((label, value), ...)
+    :return: The series as written in the text format
+    """
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{label}="{value}"' for label, value in labels) + "}"
+
+
+def series_id(key: str) -> int:
+    return binascii.crc_hqx(key.encode("utf-8"), 0xFFFF)
+
+
+class Counter:
+    """
+    Monotonically increasing count
+    """
+    kind = "counter"
+
+    def __init__(self):
+        self.local = threading.local()
+        self.cells = []  # one [value] per thread that ever updated the counter
+        self.lock = threading.Lock()
+
+    def cell(self) -> list:
+        cell = [0]
+        with self.lock:
+            self.cells.append(cell)
+        self.local.cell = cell
+        return cell
+
+    def inc(self, amount=1) -> None:
+        try:
+            self.local.cell[0] += amount
+        except AttributeError:
+            self.cell()[0] += amount
+
+    def samples(self, name: str, labels: tuple) -> list:
+        return [(series(name, labels), sum(cell[0] for cell in list(self.cells)))]
+
+
+class Gauge:
+    """
+    Value that goes up and down; either set, or computed at scrape time by fn
+    """
+    kind = "gauge"
+
+    def __init__(self, fn: callable = None):
+        self.value = 0
+        self.fn = fn
+        self.lock = threading.Lock()
+
+    def set(self, value) -> None:
+        self.value = value
+
+    def inc(self, amount=1) -> None:
+        with self.lock:
+            self.value += amount
+
+    def samples(self, name: str, labels: tuple) -> list:
+        if self.fn is None:
+            return [(series(name, labels), self.value)]
+        try:
+            return [(series(name, labels), self.fn())]
+        except Exception:  # the owner went away or is mid-update; skip the sample
+            return []
+
+
+class Histogram(Counter):
+    """
+    Distribution over fixed buckets; each thread keeps one count per bucket, an overflow count and a sum
+    """
+    kind = "histogram"
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        Counter.__init__(self)
+        self.buckets = tuple(sorted(buckets))
+
+    def cell(self) -> list:
+        cell = [0] * (len(self.buckets) + 2)
+        with self.lock:
+            self.cells.append(cell)
+        self.local.cell = cell
+        return cell
+
+    def observe(self, value) -> None:
+        try:
+            cell = self.local.cell
+        except AttributeError:
+            cell = self.cell()
+        cell[bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    def samples(self, name: str, labels: tuple) -> list:
+        totals = [sum(column) for column in zip(*list(self.cells))] or [0] * (len(self.buckets) + 2)
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + ("+Inf",), totals):
+            cumulative += count
+            samples.append((series(name + "_bucket", labels + (("le", bound),)), cumulative))
+        samples.append((series(name + "_sum", labels), totals[-1]))
+        samples.append((series(name + "_count", labels), cumulative))
+        return samples
+
+
+class Registry:
+    """
+    Metric families by name, each with one metric per label set, plus collectors that produce samples of their own
+    """
+
+    def __init__(self):
+        self.families = dict()  # name -> [kind, help, {labels: metric}]
+        self.collectors = []  # callables returning [(name, kind, help, labels dict, value)]
+        self.lock = threading.Lock()
+
+    def register(self, factory, name: str, help: str, labels: dict = None):
+        """
+        :return: The metric of name and labels, created by factory() unless it exists
+        """
+        key = tuple(sorted((labels or {}).items()))
+        with self.lock:
+            family = self.families.get(name)
+            if family is None:
+                family = self.families[name] = [None, help, dict()]
+            metric = family[2].get(key)
+            if metric is None:
+                metric = factory()
+                if family[0] not in (None, metric.kind):
+                    raise ValueError(f"{name} is a {family[0]}")
+                family[0] = metric.kind
+                family[2][key] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labels: dict = None) -> Counter:
+        return self.register(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str, labels: dict = None, fn: callable = None) -> Gauge:
+        """
+        :param fn: Computes the value at scrape time; replaces the callback of an existing gauge
+        """
+        gauge = self.register(Gauge, name, help, labels)
+        if fn is not None:
+            gauge.fn = fn
+        return gauge
+
+    def histogram(self, name: str, help: str, labels: dict = None, buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+        return self.register(lambda: Histogram(buckets), name, help, labels)
+
+    def add_collector(self, collector: callable) -> None:
+        with self.lock:
+            if collector not in self.collectors:
+                self.collectors.append(collector)
+
+    def collect(self) -> list:
+        """
+        :return: [(name, kind, help, [(series, value)])] of every family and collector
+        """
+        with self.lock:
+            families = [(name, kind, help, list(metrics.items()))
+                        for name, (kind, help, metrics) in self.families.items()]
+            collectors = list(self.collectors)
+        collected = [(name, kind, help, [sample for labels, metric in metrics
+                                         for sample in metric.samples(name, labels)])
+                     for name, kind, help, metrics in families]
+        extra = dict()
+        for collector in collectors:
+            try:
+                for name, kind, help, labels, value in collector():
+                    extra.setdefault((name, kind, help), []).append(
+                        (series(name, tuple(sorted(labels.items()))), value))
+            except Exception:
+                continue
+        return collected + [(name, kind, help, samples) for (name, kind, help), samples in extra.items()]
+
+    def render(self) -> str:
+        """
+        :return: Prometheus text exposition of every metric
+        """
+        lines = []
+        for name, kind, help, samples in self.collect():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{key} {value:.10g}" for key, value in samples)
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> bytes:
+        """
+        :return: Binary snapshot of every series, see the module docstring
+        """
+        records = [SNAPSHOT_RECORD.pack(series_id(key), value)
+                   for _, _, _, samples in self.collect() for key, value in samples]
+        return SNAPSHOT_HEADER.pack(int(time.time())) + b"".join(records)
+
+
+def decode_snapshot(data: bytes, names: list = ()) -> (int, dict):
+    """
+    Ground side decoder of Registry.snapshot()
+    :param names: Series names, as in a text scrape, to resolve ids with
+    :return: (UNIX time, {series name, or id if unknown: value})
+    """
+    by_id = {series_id(name): name for name in names}
+    timestamp, = SNAPSHOT_HEADER.unpack_from(data)
+    values = dict()
+    for key, value in SNAPSHOT_RECORD.iter_unpack(data[SNAPSHOT_HEADER.size:]):
+        values[by_id.get(key, key)] = value
+    return timestamp, values
+
+
+class MetricsServer:
+    """
+    Serves Registry.render() on a UNIX domain socket, one snapshot per connection. Clients that send an HTTP request
+    get an HTTP response, so `curl --unix-socket <path> http://pfs/metrics` and Prometheus through a socket proxy
+    work, as does `socat - UNIX-CONNECT:<path>`.
+    """
+
+    def __init__(self, path: str, registry: "Registry" = None, logger=None):
+        self.path = path
+        self.registry = registry or REGISTRY
+        self.logger = logger
+        self.sock = None
+
+    def start(self) -> None:
+        """
+        Binds the socket, replacing a stale one, and serves in a daemon thread
+        """
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(self.path)
+        self.sock.listen(4)
+        threading.Thread(target=self.serve, name="metrics", daemon=True).start()
+
+    def serve(self) -> None:
+        while True:
+            connection, _ = self.sock.accept()
+            with connection:
+                try:
+                    connection.settimeout(0.2)
+                    try:
+                        request = connection.recv(1024)
+                    except socket.timeout:
+                        request = b""
+                    body = self.registry.render().encode("utf-8")
+                    if request.startswith((b"GET", b"HEAD")):
+                        connection.sendall(b"HTTP/1.0 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                                           b"Content-Length: %d\r\n\r\n" % len(body))
+                        if request.startswith(b"HEAD"):
+                            continue
+                    connection.settimeout(5)
+                    connection.sendall(body)
+                except OSError as e:
+                    if self.logger is not None:
+                        self.logger.debug(f"Metrics client failed: {e}")
+
+
+REGISTRY = Registry()
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+add_collector = REGISTRY.add_collector
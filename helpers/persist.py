@@ -0,0 +1,46 @@
+import json
+import os
+import tempfile
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """
+    Writes data to path so that readers, and the file after a power cut, see either the old or the new contents
+    :param path: destination file
+    :param data: bytes to write
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def load_json(path: str, default=None):
+    """
+    :return: The JSON document stored at path, or default if it is missing or unreadable
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def dump_json(path: str, data) -> None:
+    """
+    Atomically stores data at path as JSON
+    """
+    atomic_write(path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
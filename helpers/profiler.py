@@ -0,0 +1,193 @@
+import functools
+import os
+import sys
+import threading
+import time
+
+from collections import Counter
+
+from helpers.persist import atomic_write
+
+TRUNCATED = "[truncated]"
+
+_active = None  # the running SamplingProfiler, if any; span() is a no-op without one
+
+
+class SpanStats:
+    """
+    Duration statistics of one named span
+    """
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+
+    def add(self, ns: int) -> None:
+        self.count += 1
+        self.total_ns += ns
+        self.min_ns = ns if self.min_ns is None else min(self.min_ns, ns)
+        self.max_ns = max(self.max_ns, ns)
+
+    def __str__(self) -> str:
+        return "count {0} total {1:.3f} s mean {2:.3f} ms min {3:.3f} ms max {4:.3f} ms".format(
+            self.count, self.total_ns / 1e9, self.total_ns / self.count / 1e6, self.min_ns / 1e6, self.max_ns / 1e6)
+
+
+class SamplingProfiler:
+    """
+    Periodically samples the stack of every other thread through sys._current_frames and accumulates them as
+    collapsed stacks (frame;frame;frame count), one file per thread name, which flamegraph.pl and speedscope read.
+    Memory and output size are bounded by max_stacks distinct stacks per thread, each at most max_depth frames deep.
+    """
+
+    def __init__(self, directory: str, rate: float = 25, max_stacks: int = 2000, max_depth: int = 48,
+                 flush_interval: float = 60):
+        """
+        :param directory: Output directory for <thread>.folded and spans.txt
+        :param rate: Samples per second
+        :param max_stacks: Distinct stacks kept per thread; further new stacks are counted as [truncated]
+        :param max_depth: Innermost frames kept per stack
+        :param flush_interval: Seconds between rewrites of the output files
+        """
+        self.directory = directory
+        self.interval = 1.0 / rate
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self.flush_interval = flush_interval
+        self.stacks = dict()  # thread name -> Counter of collapsed stacks
+        self.spans = dict()  # span name -> SpanStats
+        self.span_lock = threading.Lock()
+        self.labels = dict()  # code object -> frame label
+        self.samples = 0
+        self.cpu_seconds = 0.0  # CPU time used by the sampling thread, including flushes
+        self.wall_seconds = 0.0
+        self.running = False
+        self.thread = None
+
+    def start(self) -> None:
+        """
+        Starts sampling in a daemon thread and enables span timing
+        """
+        global _active
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="profiler", daemon=True)
+        self.thread.start()
+        _active = self
+
+    def stop(self) -> None:
+        """
+        Stops sampling, disables span timing and writes the output files a last time
+        """
+        global _active
+        if _active is self:
+            _active = None
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+        self.flush()
+
+    def run(self) -> None:
+        cpu_start, wall_start = time.thread_time(), time.monotonic()
+        last_flush = wall_start
+        while self.running:
+            self.sample()
+            if time.monotonic() - last_flush >= self.flush_interval:
+                self.flush()
+                last_flush = time.monotonic()
+            self.cpu_seconds = time.thread_time() - cpu_start
+            self.wall_seconds = time.monotonic() - wall_start
+            time.sleep(self.interval)
+
+    def label(self, code) -> str:
+        label = self.labels.get(code)
+        if label is None:
+            label = self.labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def sample(self) -> None:
+        """
+        Takes one sample of every thread except the profiler's own
+        """
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            frames = []
+            while frame is not None and len(frames) < self.max_depth:
+                frames.append(self.label(frame.f_code))
+                frame = frame.f_back
+            stack = ";".join(reversed(frames))
+            counts = self.stacks.setdefault(names.get(ident, f"thread-{ident}"), Counter())
+            if stack in counts or len(counts) < self.max_stacks:
+                counts[stack] += 1
+            else:
+                counts[TRUNCATED] += 1
+        self.samples += 1
+
+    def record(self, name: str, ns: int) -> None:
+        with self.span_lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.add(ns)
+
+    def overhead(self) -> float:
+        """
+        :return: CPU time of the sampling thread as a fraction of the wall time it ran for
+        """
+        return self.cpu_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    def flush(self) -> None:
+        """
+        Rewrites every output file from the accumulated samples
+        """
+        for name, counts in list(self.stacks.items()):
+            lines = [f"{stack} {count}" for stack, count in counts.most_common()]
+            safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+            atomic_write(os.path.join(self.directory, f"{safe}.folded"), ("\n".join(lines) + "\n").encode("utf-8"))
+        with self.span_lock:
+            lines = [f"{name}: {stats}" for name, stats in sorted(self.spans.items())]
+        lines.append(f"samples {self.samples}, sampler CPU {self.overhead() * 100:.2f}% of wall time")
+        atomic_write(os.path.join(self.directory, "spans.txt"), ("\n".join(lines) + "\n").encode("utf-8"))
+
+
+class span:
+    """
+    Times a block under a name while a profiler runs; otherwise it only checks whether one runs.
+    Use as `with span("aprs.serial.read"):` or as a decorator `@span("eps.i2c")`.
+    """
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if _active is not None:
+            self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None and _active is not None:
+            _active.record(self.name, time.perf_counter_ns() - self.start)
+        self.start = None
+        return False
+
+    def __call__(self, func):
+        name = self.name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if _active is not None:
+                    _active.record(name, time.perf_counter_ns() - start)
+        return wrapper
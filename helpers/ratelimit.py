@@ -0,0 +1,33 @@
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter. Holds up to burst tokens and refills at rate tokens per second.
+    Not thread safe; callers are expected to hold their own lock.
+    """
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float):
+        """
+        :param rate: Tokens added per second
+        :param burst: Maximum number of tokens held
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def consume(self, tokens: float = 1) -> bool:
+        """
+        Takes tokens from the bucket if enough are available.
+        :param tokens: Number of tokens to take
+        :return: True if the tokens were taken, False if the caller should be limited
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
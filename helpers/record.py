@@ -0,0 +1,103 @@
+import time
+
+from datetime import datetime, timezone
+
+
+class Record:
+    """
+    Base class for telemetry records. Timestamps are stored as integer nanoseconds, both monotonic (for ordering
+    and intervals) and wall clock (for the ground). The string form is built on first use and cached.
+    """
+    __slots__ = ("system", "message", "mono_ns", "wall_ns", "count", "first_wall_ns", "_text")
+
+    header = ''
+    time_format = "%Y/%m/%d@%H%M%S"
+
+    def __init__(self, sys_name: str, msg: str = None, ts: datetime = None):
+        """
+        :param sys_name: The name of the subsystem.
+        :param msg: A string representing the message.
+        :param ts: Optional wall clock timestamp in UTC; defaults to the time of construction.
+        """
+        self.system = sys_name
+        self.message = msg
+        self.mono_ns = time.monotonic_ns()
+        if ts is None:
+            self.wall_ns = time.time_ns()
+        else:
+            self.wall_ns = int(ts.replace(tzinfo=timezone.utc).timestamp()) * 1000000000 + ts.microsecond * 1000
+        self.count = 1
+        self.first_wall_ns = self.wall_ns
+        self._text = None
+
+    def collapse(self, count: int, first_wall_ns: int, last_wall_ns: int) -> None:
+        """
+        Turns this record into the summary of count identical records.
+        :param count: Number of occurrences the record stands for
+        :param first_wall_ns: Wall clock time of the first occurrence in nanoseconds
+        :param last_wall_ns: Wall clock time of the last occurrence in nanoseconds
+        """
+        self.count = count
+        self.first_wall_ns = first_wall_ns
+        self.wall_ns = last_wall_ns
+        self._text = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """
+        :return: The wall clock timestamp as a naive UTC datetime.
+        """
+        return datetime.utcfromtimestamp(self.wall_ns // 1000000000).replace(
+            microsecond=self.wall_ns % 1000000000 // 1000)
+
+    def format_time(self, wall_ns: int = None) -> str:
+        """
+        :param wall_ns: Wall clock time in nanoseconds; defaults to the record's timestamp.
+        :return: The wall clock timestamp formatted with time_format.
+        """
+        return time.strftime(self.time_format, time.gmtime((self.wall_ns if wall_ns is None else wall_ns) // 1000000000))
+
+    @classmethod
+    def state_slots(cls) -> list:
+        """
+        :return: The slots that make up a record's state; the monotonic timestamp and the cached text are derived
+        """
+        return [slot for klass in reversed(cls.__mro__) for slot in getattr(klass, "__slots__", ())
+                if slot not in ("mono_ns", "_text")]
+
+    def to_state(self) -> list:
+        """
+        :return: The record's state as a JSON-serializable list, in state_slots() order
+        """
+        return [getattr(self, slot) for slot in self.state_slots()]
+
+    @classmethod
+    def from_state(cls, state: list) -> "Record":
+        """
+        Rebuilds a record from to_state(), e.g. after a restart. Its monotonic timestamp is set as far in the past
+        as its wall clock timestamp, so it still orders before records created since.
+        :param state: Output of to_state()
+        :return: The record
+        """
+        record = cls.__new__(cls)
+        for slot, value in zip(cls.state_slots(), state):
+            setattr(record, slot, value)
+        record.mono_ns = time.monotonic_ns() - max(0, time.time_ns() - record.wall_ns)
+        record._text = None
+        return record
+
+    def format(self) -> str:
+        """
+        :return: A freshly built string representation of this record.
+        """
+        raise NotImplementedError
+
+    def __str__(self) -> str:
+        """
+        :return: The cached string representation of this record.
+        """
+        if self._text is None:
+            self._text = self.format()
+            if self.count > 1:
+                self._text += f" (x{self.count} since {self.format_time(self.first_wall_ns)})"
+        return self._text
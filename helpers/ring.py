@@ -0,0 +1,169 @@
+"""
+Single producer, single consumer ring buffer of byte records in shared memory, for passing frames between processes
+without pickling.
+
+Layout, native byte order, each index on its own cache line so producer and consumer do not share one:
+    offset   0: head, uint32, bytes consumed, written only by the consumer
+    offset  64: tail, uint32, bytes produced, written only by the producer
+    offset 128: waiting, uint32, set by a consumer about to sleep on the doorbell
+    offset 132: dropped, uint32, records the producer could not fit
+    offset 136: capacity, uint32, a power of two
+    offset 192: data
+Indices run freely and wrap at 2^32; head == tail is empty. A record is a uint32 length and the payload, padded to a
+multiple of 4 bytes, so that a length never straddles the end of the data area. The producer writes the payload
+before the tail that publishes it and the consumer reads it before the head that releases it; aligned 32 bit stores
+are atomic and, on the single core ARM of the flight computer and on x86, seen by the other process in order.
+
+Segments are files in /dev/shm mapped with mmap rather than multiprocessing.shared_memory, which Python 3.7 lacks
+and which, before 3.13, unlinks a segment when any process that attached to it exits: a crashing worker would take
+the rings with it.
+"""
+import mmap
+import os
+import struct
+
+HEAD = 0
+TAIL = 64
+WAITING = 128
+DROPPED = 132
+CAPACITY = 136
+DATA = 192
+WORD = struct.Struct("=I")
+MASK = 0xFFFFFFFF
+SHM_DIRECTORY = "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp"
+
+
+def shm_path(name: str) -> str:
+    return os.path.join(SHM_DIRECTORY, name)
+
+
+class Ring:
+    """
+    One direction of a channel. Exactly one process may call put() and exactly one get() or wait().
+    """
+
+    def __init__(self, name: str, capacity: int = None, doorbell=None):
+        """
+        Creates the segment, replacing one of the same name, if capacity is given; attaches to it otherwise
+        :param name: Segment name, a file in SHM_DIRECTORY
+        :param capacity: Bytes of record space, a power of two
+        :param doorbell: multiprocessing Semaphore the producer releases when the consumer waits, shared by both
+        """
+        self.name = name
+        self.path = shm_path(name)
+        self.doorbell = doorbell
+        if capacity is not None:
+            if capacity & (capacity - 1) or not 16 <= capacity <= 1 << 30:
+                raise ValueError("Ring capacity must be a power of two between 16 bytes and 1 GiB")
+            if os.path.exists(self.path):
+                os.unlink(self.path)  # a worker still attached to the old segment sees it go and exits
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600)
+            os.ftruncate(fd, DATA + capacity)
+        else:
+            fd = os.open(self.path, os.O_RDWR)
+        try:
+            self.inode = os.fstat(fd).st_ino
+            self.map = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        self.buf = memoryview(self.map)
+        if capacity is not None:
+            WORD.pack_into(self.buf, CAPACITY, capacity)
+        self.capacity = WORD.unpack_from(self.buf, CAPACITY)[0]
+        self.mask = self.capacity - 1
+
+    def __len__(self) -> int:
+        """
+        :return: Bytes of records waiting, including their length words and padding
+        """
+        return (WORD.unpack_from(self.buf, TAIL)[0] - WORD.unpack_from(self.buf, HEAD)[0]) & MASK
+
+    @property
+    def dropped(self) -> int:
+        return WORD.unpack_from(self.buf, DROPPED)[0]
+
+    def attached(self) -> bool:
+        """
+        :return: Whether the segment this ring maps is still the one under its name
+        """
+        try:
+            return os.stat(self.path).st_ino == self.inode
+        except OSError:
+            return False
+
+    def copy_in(self, index: int, data) -> None:
+        offset = index & self.mask
+        first = min(len(data), self.capacity - offset)
+        self.buf[DATA + offset:DATA + offset + first] = data[:first]
+        if first < len(data):
+            self.buf[DATA:DATA + len(data) - first] = data[first:]
+
+    def copy_out(self, index: int, size: int) -> bytes:
+        offset = index & self.mask
+        first = min(size, self.capacity - offset)
+        data = bytes(self.buf[DATA + offset:DATA + offset + first])
+        if first < size:
+            data += bytes(self.buf[DATA:DATA + size - first])
+        return data
+
+    def fits(self, length: int) -> bool:
+        """
+        Producer only
+        :return: Whether a record of length bytes fits right now
+        """
+        return WORD.size + (length + 3 & ~3) <= self.capacity - len(self)
+
+    def put(self, data: bytes) -> bool:
+        """
+        Producer only. Appends a record and rings the doorbell if the consumer is waiting.
+        :return: False, counting the record as dropped, if it does not fit
+        """
+        if not self.fits(len(data)):
+            WORD.pack_into(self.buf, DROPPED, (self.dropped + 1) & MASK)
+            return False
+        size = WORD.size + (len(data) + 3 & ~3)
+        tail = WORD.unpack_from(self.buf, TAIL)[0]
+        WORD.pack_into(self.buf, DATA + (tail & self.mask), len(data))
+        self.copy_in(tail + WORD.size, data)
+        WORD.pack_into(self.buf, TAIL, (tail + size) & MASK)
+        if self.doorbell is not None and WORD.unpack_from(self.buf, WAITING)[0]:
+            WORD.pack_into(self.buf, WAITING, 0)
+            self.doorbell.release()
+        return True
+
+    def get(self):
+        """
+        Consumer only
+        :return: The oldest record, or None if the ring is empty
+        """
+        head = WORD.unpack_from(self.buf, HEAD)[0]
+        if head == WORD.unpack_from(self.buf, TAIL)[0]:
+            return None
+        length = WORD.unpack_from(self.buf, DATA + (head & self.mask))[0]
+        data = self.copy_out(head + WORD.size, length)
+        WORD.pack_into(self.buf, HEAD, (head + WORD.size + (length + 3 & ~3)) & MASK)
+        return data
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Consumer only. Sleeps on the doorbell until a record arrives or timeout seconds pass.
+        :return: Whether the ring holds a record
+        """
+        if len(self):
+            return True
+        WORD.pack_into(self.buf, WAITING, 1)
+        if not len(self):  # a record published before the flag was seen would not ring
+            self.doorbell.acquire(timeout=timeout)
+        WORD.pack_into(self.buf, WAITING, 0)
+        return len(self) > 0
+
+    def close(self) -> None:
+        self.buf.release()
+        self.map.close()
+
+    def unlink(self) -> None:
+        """
+        Removes the segment if it is still the one this ring created
+        """
+        if self.attached():
+            os.unlink(self.path)
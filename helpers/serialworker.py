@@ -0,0 +1,258 @@
+"""
+Serial ports served by supervised worker processes, for radios whose reads must not wait on the GIL of the flight
+process or die with it.
+
+The worker owns the port: one thread reads whatever the port holds into the rx ring as soon as it arrives, the main
+thread carries writes and port control from the tx ring to the port. Both rings are helpers.ring.Ring segments, so
+bytes cross the process boundary without pickling. In the flight process, WorkerSerial stands in for pyserial's
+Serial, so the radios speak their protocols unchanged.
+
+tx records: one op byte, then its payload
+    W<data>  write data        O  open the port        C  close the port
+    F        flush output      R  discard unread input
+rx records: the bytes read, as read
+
+A worker that exits or is killed is started again, after restart_delay seconds doubling up to max_restart_delay
+while it keeps failing, on the same rings and with the port as WorkerSerial last left it. Bytes the device sent
+while no worker ran wait in the kernel's buffer. A worker exits by itself once its rings are unlinked or replaced,
+or the flight process is gone.
+"""
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+import time
+
+from helpers import metrics
+from helpers.ring import Ring
+
+WRITE = b"W"
+OPEN = b"O"
+CLOSE = b"C"
+FLUSH = b"F"
+RESET = b"R"
+POLL = 0.5  # seconds a blocked worker or reader sleeps before checking on the other side
+READ_TIMEOUT = 0.05  # seconds the worker's port read blocks, bounding how long a close waits for the reader
+
+
+def alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def serve(name: str, port: str, kwargs: dict, rx_name: str, tx_name: str, rx_bell, tx_bell, is_open: bool,
+          parent: int, ready) -> None:
+    """
+    Worker process entry point
+    :param kwargs: serial.Serial arguments; the timeout is replaced by READ_TIMEOUT
+    :param is_open: Whether the port starts open
+    :param parent: pid of the flight process
+    :param ready: multiprocessing Event set once the port is set up
+    """
+    from serial import Serial, SerialException
+    logger = logging.getLogger(f"{name}-worker")
+    rx = Ring(rx_name, doorbell=rx_bell)
+    tx = Ring(tx_name, doorbell=tx_bell)
+    serial = Serial(port, **dict(kwargs, timeout=READ_TIMEOUT))
+    opened = threading.Event()
+    port_lock = threading.Lock()
+    if is_open:
+        opened.set()
+    else:
+        serial.close()
+
+    def pump() -> None:
+        while True:
+            opened.wait()
+            with port_lock:
+                if not serial.is_open:
+                    continue
+                try:
+                    data = serial.read(serial.in_waiting or 1)
+                except SerialException as e:
+                    logger.error(f"Reading {port} failed: {e}")
+                    os._exit(1)
+            if data:
+                rx.put(data)
+
+    threading.Thread(target=pump, name=f"{name}-worker-rx", daemon=True).start()
+    ready.set()
+    while rx.attached() and tx.attached() and alive(parent):
+        if not tx.wait(POLL):
+            continue
+        record = tx.get()
+        while record is not None:
+            op, payload = record[:1], record[1:]
+            if op == WRITE:
+                serial.write(payload)
+            elif op == OPEN:
+                with port_lock:
+                    if not serial.is_open:
+                        serial.open()
+                opened.set()
+            elif op == CLOSE:
+                opened.clear()
+                with port_lock:
+                    serial.close()
+            elif op == FLUSH:
+                serial.flush()
+            elif op == RESET:
+                serial.reset_input_buffer()
+            record = tx.get()
+
+
+class WorkerSerial:
+    """
+    Stand-in for pyserial Serial whose port is served by a supervised worker process
+    """
+
+    def __init__(self, name: str, port: str, config: dict, logger=None, **kwargs):
+        """
+        Starts the worker and waits until it has set up the port
+        :param name: Radio name, e.g. "aprs"
+        :param port: Device path
+        :param config: config['radio_workers']
+        :param logger: Logger to report worker exits to
+        :param kwargs: passed to serial.Serial in the worker; the timeout also applies to read() here
+        """
+        self.name = name
+        self.port = port
+        self.config = config
+        self.logger = logger or logging.getLogger(f"{name}-worker")
+        self.kwargs = kwargs
+        self.timeout = kwargs.get("timeout")
+        self.context = multiprocessing.get_context(config.get("start_method", "forkserver"))
+        if self.context.get_start_method() == "forkserver":
+            self.context.set_forkserver_preload(["helpers.serialworker", "serial"])
+        prefix = f"pfs-{name}-{os.getpid()}"
+        self.rx = Ring(f"{prefix}-rx", config["ring_capacity"], self.context.Semaphore(0))
+        self.tx = Ring(f"{prefix}-tx", config["ring_capacity"], self.context.Semaphore(0))
+        self.buffer = bytearray()  # bytes taken off the rx ring but not read yet
+        self.read_lock = threading.Lock()  # the rx ring has one consumer; threads take turns
+        self.write_lock = threading.Lock()  # and the tx ring one producer
+        self.is_open = True
+        self.stopping = False
+        self.process = None
+        self.started = None  # time.monotonic() of the latest worker start
+        self.ready = None
+        self.restarts = metrics.counter("pfs_serial_worker_restarts_total", "Serial worker processes restarted",
+                                        {"port": name})
+        metrics.gauge("pfs_serial_worker_dropped_total", "Reads a serial worker could not fit into its rx ring",
+                      {"port": name}, fn=lambda: self.rx.dropped)
+        self.spawn()
+        if not self.ready.wait(config["start_timeout"]):
+            self.stop()
+            raise TimeoutError(f"{name} worker did not start within {config['start_timeout']} s")
+        threading.Thread(target=self.supervise, name=f"{name}-supervisor", daemon=True).start()
+        atexit.register(self.stop)
+
+    def spawn(self) -> None:
+        self.ready = self.context.Event()
+        self.process = self.context.Process(
+            target=serve, name=f"pfs-{self.name}", daemon=True,
+            args=(self.name, self.port, self.kwargs, self.rx.name, self.tx.name, self.rx.doorbell, self.tx.doorbell,
+                  self.is_open, os.getpid(), self.ready))
+        self.started = time.monotonic()
+        self.process.start()
+
+    def supervise(self) -> None:
+        """
+        Restarts the worker whenever it exits, backing off while it keeps failing
+        """
+        delay = self.config["restart_delay"]
+        while True:
+            self.process.join()
+            if self.stopping:
+                return
+            if time.monotonic() - self.started > self.config["max_restart_delay"]:
+                delay = self.config["restart_delay"]  # it ran for a while; not a crash loop
+            self.restarts.inc()
+            self.logger.error(f"{self.name} worker exited with {self.process.exitcode}, restarting in {delay} s")
+            time.sleep(delay)
+            delay = min(delay * 2, self.config["max_restart_delay"])
+            self.spawn()
+            if self.ready.wait(self.config["start_timeout"]):
+                self.logger.info(f"{self.name} worker restarted in {time.monotonic() - self.started:.3f} s")
+
+    def stop(self) -> None:
+        """
+        Stops the worker and removes the rings
+        """
+        self.stopping = True
+        self.rx.unlink()
+        self.tx.unlink()
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
+
+    def command(self, op: bytes, payload: bytes = b"") -> None:
+        record = op + payload
+        with self.write_lock:
+            while not self.tx.fits(len(record)):
+                time.sleep(0.001)
+            self.tx.put(record)
+
+    def fill(self, size: int, timeout) -> None:
+        """
+        Takes records off the rx ring until the buffer holds size bytes, the port closes or timeout seconds pass.
+        Must be called with read_lock held.
+        :param timeout: None to wait for size bytes however long it takes, like pyserial
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self.buffer) < size and self.is_open:
+            record = self.rx.get()
+            if record is not None:
+                self.buffer += record
+                continue
+            remaining = POLL if deadline is None else min(POLL, deadline - time.monotonic())
+            if remaining <= 0:
+                return
+            self.rx.wait(remaining)
+
+    def read(self, size: int = 1) -> bytes:
+        with self.read_lock:
+            self.fill(size, self.timeout)
+            data = bytes(self.buffer[:size])
+            del self.buffer[:size]
+            return data
+
+    def readline(self, *args, **kwargs) -> bytes:
+        line = bytearray()
+        while not line.endswith(b"\n"):
+            data = self.read(1)
+            if not data:
+                break
+            line += data
+        return bytes(line)
+
+    @property
+    def in_waiting(self) -> int:
+        with self.read_lock:
+            self.fill(1 << 30, 0)
+            return len(self.buffer)
+
+    def write(self, data: bytes) -> int:
+        self.command(WRITE, bytes(data))
+        return len(data)
+
+    def open(self) -> None:
+        self.is_open = True
+        self.command(OPEN)
+
+    def close(self) -> None:
+        self.is_open = False
+        self.command(CLOSE)
+
+    def flush(self) -> None:
+        self.command(FLUSH)
+
+    def reset_input_buffer(self) -> None:
+        with self.read_lock:
+            self.fill(1 << 30, 0)
+            self.buffer.clear()
+        self.command(RESET)
@@ -3,6 +3,8 @@ import logging
 import threading
 import time
 
+from helpers import metrics
+
 
 class ThreadHandler:
     def __init__(self, target: callable, name: str = None, parent_logger=logging, interval: int = 3,
@@ -39,6 +41,8 @@ class ThreadHandler:
         self.is_active = True
         self.is_alive = False
         self.daemon = daemon
+        self.restarts = metrics.counter("pfs_thread_restarts_total", "Times a thread's target raised or returned",
+                                        {"thread": self.name})
 
     def start(self):
         """
@@ -54,12 +58,14 @@ class ThreadHandler:
                 try:
                     self.target()
                 except BaseException as e:
+                    self.restarts.inc()
                     if not self.suppress_out:
                         self.parent_logger.exception(
                             str(e) + ", restarting '%s'" % self.name)
                     if not self.auto_restart:
                         self.is_active = False
                 else:
+                    self.restarts.inc()
                     if not self.suppress_out:
                         self.parent_logger.info(
                             "Bad thread, restarting '%s'" % self.name)
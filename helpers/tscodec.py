@@ -0,0 +1,183 @@
+"""
+Compact binary codec for housekeeping time series, shared by the flight software and the ground decoder.
+
+Layout (all integers are LEB128 varints, signed ones zig-zag encoded first):
+    b"TS", version
+    samples, analog channel count, flag channel count
+    time resolution (float32, seconds per tick), analog scales (float32 each)
+    first timestamp in ticks, then the run-length encoded delta-of-deltas of the timestamps
+    per analog channel: run-length encoded missing-value mask, then an encoding byte followed by the
+        zig-zag deltas of the quantized values, either plain (0) or run-length encoded (1)
+    run-length encoded flag words, one word per sample with bit i holding flag channel i
+
+Run-length encoded streams are a run count followed by (value, run length) pairs.
+"""
+import struct
+
+import numpy as np
+
+MAGIC = b"TS"
+VERSION = 1
+PLAIN = 0
+RLE = 1
+
+
+def zigzag(values: np.ndarray) -> np.ndarray:
+    """
+    Maps signed integers to unsigned ones so that small magnitudes stay small: 0, -1, 1, -2 -> 0, 1, 2, 3
+    """
+    values = values.astype(np.int64)
+    return ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+
+def unzigzag(values: np.ndarray) -> np.ndarray:
+    """
+    Inverse of zigzag()
+    """
+    values = values.astype(np.uint64)
+    return ((values >> np.uint64(1)).astype(np.int64) ^ -(values & np.uint64(1)).astype(np.int64))
+
+
+def varint_encode(values: np.ndarray) -> bytes:
+    """
+    LEB128 encodes unsigned integers, vectorized over the array
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    if len(values) == 0:
+        return b""
+    lengths = np.ones(len(values), dtype=np.int64)
+    for k in range(1, 10):
+        lengths += values >= np.uint64(1 << (7 * k))
+    offsets = np.cumsum(lengths) - lengths
+    out = np.empty(int(lengths.sum()), dtype=np.uint8)
+    for k in range(int(lengths.max())):
+        mask = lengths > k
+        byte = (values[mask] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        more = (lengths[mask] > k + 1).astype(np.uint64) << np.uint64(7)
+        out[offsets[mask] + k] = (byte | more).astype(np.uint8)
+    return out.tobytes()
+
+
+def varint_decode(buf: np.ndarray, offset: int, count: int) -> (np.ndarray, int):
+    """
+    Decodes count LEB128 varints, vectorized over the array
+    :param buf: encoded bytes as a uint8 array
+    :param offset: index of the first byte to decode
+    :param count: number of varints to decode
+    :return: (values, offset just past the last decoded byte)
+    """
+    if count == 0:
+        return np.empty(0, dtype=np.uint64), offset
+    ends = offset + np.flatnonzero(buf[offset:] < 0x80)[:count]
+    if len(ends) < count:
+        raise ValueError("Truncated varint stream")
+    starts = np.r_[offset, ends[:-1] + 1]
+    lengths = ends - starts + 1
+    values = np.zeros(count, dtype=np.uint64)
+    for k in range(int(lengths.max())):
+        mask = lengths > k
+        values[mask] |= (buf[starts[mask] + k] & 0x7F).astype(np.uint64) << np.uint64(7 * k)
+    return values, int(ends[-1]) + 1
+
+
+def rle_encode(values: np.ndarray) -> bytes:
+    """
+    Run-length encodes unsigned integers as a run count followed by (value, length) varint pairs
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    if len(values) == 0:
+        return varint_encode(np.zeros(1))
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    lengths = np.diff(np.r_[starts, len(values)])
+    pairs = np.empty(2 * len(starts), dtype=np.uint64)
+    pairs[0::2] = values[starts]
+    pairs[1::2] = lengths
+    return varint_encode(np.array([len(starts)])) + varint_encode(pairs)
+
+
+def rle_decode(buf: np.ndarray, offset: int) -> (np.ndarray, int):
+    """
+    Inverse of rle_encode()
+    :return: (values, offset just past the stream)
+    """
+    runs, offset = varint_decode(buf, offset, 1)
+    pairs, offset = varint_decode(buf, offset, 2 * int(runs[0]))
+    return np.repeat(pairs[0::2], pairs[1::2].astype(np.int64)), offset
+
+
+def encode(times: np.ndarray, analog: np.ndarray, flags: np.ndarray, scales=None, resolution: float = 1.0) -> bytes:
+    """
+    Encodes a block of samples
+    :param times: timestamps in seconds, non decreasing
+    :param analog: analog values shaped (channels, samples); NaN marks a missing value
+    :param flags: boolean values shaped (flag channels, samples), at most 64 channels
+    :param scales: per analog channel multiplier applied before rounding to integers; default 1
+    :param resolution: timestamp resolution in seconds
+    :return: encoded bytes
+    """
+    analog = np.atleast_2d(np.asarray(analog, dtype=np.float64))
+    flags = np.asarray(flags, dtype=bool).reshape(len(flags), len(times))
+    scales = np.ones(analog.shape[0]) if scales is None else np.asarray(scales, dtype=np.float64)
+    samples = len(times)
+
+    parts = [MAGIC, bytes([VERSION]),
+             varint_encode(np.array([samples, analog.shape[0], flags.shape[0]])),
+             struct.pack(f"<f{analog.shape[0]}f", resolution, *scales)]
+
+    ticks = np.round(np.asarray(times, dtype=np.float64) / resolution).astype(np.int64)
+    if samples:
+        parts.append(varint_encode(zigzag(ticks[:1])))
+        parts.append(rle_encode(zigzag(np.diff(np.diff(ticks), prepend=0))))
+
+    for channel, scale in zip(analog, scales):
+        missing = np.isnan(channel)
+        parts.append(rle_encode(missing))
+        quantized = np.round(np.where(missing, 0, channel) * scale).astype(np.int64)
+        if missing.any():  # repeat the previous value so that gaps cost a zero delta
+            index = np.where(missing, 0, np.arange(samples))
+            quantized = quantized[np.maximum.accumulate(index)]
+        deltas = zigzag(np.diff(quantized, prepend=0))
+        plain, runs = varint_encode(deltas), rle_encode(deltas)
+        parts.append(bytes([RLE]) + runs if len(runs) < len(plain) else bytes([PLAIN]) + plain)
+
+    words = np.zeros(samples, dtype=np.uint64)
+    for bit, channel in enumerate(flags):
+        words |= channel.astype(np.uint64) << np.uint64(bit)
+    parts.append(rle_encode(words))
+    return b"".join(parts)
+
+
+def decode(data: bytes) -> (np.ndarray, np.ndarray, np.ndarray):
+    """
+    Decodes bytes produced by encode()
+    :return: (times in seconds, analog values shaped (channels, samples), flags shaped (flag channels, samples))
+    """
+    if data[:2] != MAGIC or data[2] != VERSION:
+        raise ValueError("Not a version 1 time series block")
+    buf = np.frombuffer(data, dtype=np.uint8)
+    header, offset = varint_decode(buf, 3, 3)
+    samples, channels, flag_channels = (int(value) for value in header)
+    resolution, *scales = struct.unpack_from(f"<f{channels}f", data, offset)
+    offset += 4 * (channels + 1)
+
+    times = np.empty(0)
+    if samples:
+        first, offset = varint_decode(buf, offset, 1)
+        dods, offset = rle_decode(buf, offset)
+        deltas = np.cumsum(unzigzag(dods))
+        times = (unzigzag(first)[0] + np.r_[0, np.cumsum(deltas)]) * np.float64(resolution)
+
+    analog = np.empty((channels, samples))
+    for i in range(channels):
+        missing, offset = rle_decode(buf, offset)
+        encoding = data[offset]
+        if encoding == RLE:
+            deltas, offset = rle_decode(buf, offset + 1)
+        else:
+            deltas, offset = varint_decode(buf, offset + 1, samples)
+        analog[i] = np.cumsum(unzigzag(deltas)) / scales[i]
+        analog[i][missing.astype(bool)] = np.nan
+
+    words, offset = rle_decode(buf, offset)
+    flags = ((words[None, :] >> np.arange(flag_channels, dtype=np.uint64)[:, None]) & np.uint64(1)).astype(bool)
+    return times, analog, flags
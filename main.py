@@ -3,6 +3,7 @@ import logging
 import sys
 
 from core.core import Core
+from helpers import devices
 
 logger = logging.getLogger()
 if '--debug' in sys.argv or '-d' in sys.argv:
@@ -10,7 +11,13 @@ if '--debug' in sys.argv or '-d' in sys.argv:
 else:
     logger.setLevel(logging.INFO)
 
+
+def flag_value(flag: str):
+    return sys.argv[sys.argv.index(flag) + 1] if flag in sys.argv[:-1] else None
+
+
 if __name__ == '__main__':
+    devices.configure(capture=flag_value('--capture'), replay=flag_value('--replay'), realtime='--fast' not in sys.argv)
     logging.info("Starting application")
-    c = Core()
+    c = Core(import_profile='--import-profile' in sys.argv, profile='--profile' in sys.argv)
     c.start()
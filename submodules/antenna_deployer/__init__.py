@@ -1,5 +1,13 @@
-from helpers import log
+import time
+
+from functools import partial
+
+from helpers import error, log
+from helpers.profiler import span
+from helpers.threadhandler import ThreadHandler
 from submodules.submodule import Submodule
+from submodules.antenna_deployer.deployment import (ANTS_OK, AUTO, BURNING, DEPLOYED, DONE, FAILED, INDIVIDUAL,
+                                                    PENDING, UNVERIFIED, DeploymentState, antenna_status)
 
 from . import isisants
 
@@ -14,32 +22,226 @@ class AntennaDeployer(Submodule):
         :param config: dictionary of configuration data
         """
         Submodule.__init__(self, name="antenna_deployer", config=config)
+        self.state = None
+        self.processes = {
+            "deploy": ThreadHandler(
+                target=partial(self.deploy),
+                name="antenna-deploy",
+                parent_logger=self.logger,
+                auto_restart=False,
+                daemon=True,
+            )
+        }
 
     def start(self) -> None:
         """
-        Deploys the ISIS Antenna via I2C
+        Starts deploying the ISIS Antenna via I2C in the background, resuming any deployment interrupted by a reboot
         :return: None
         """
-        # Initialize connection with device
-        isisants.py_k_ants_init(b"/dev/i2c-1", 0x31, 0x32, 4, 10)
+        Submodule.start(self)
 
-        # Arms device
-        isisants.py_k_ants_arm()
+    def deploy(self) -> None:
+        """
+        Runs the deployment state machine until it finishes, run via ThreadHandler process['deploy']. An unexpected
+        error is logged and deployment resumes from the persisted state after max_poll_interval seconds, as it would
+        after a reboot.
+        :return: None
+        """
+        while True:
+            try:
+                self.run_deployment()
+                return
+            except Exception:
+                self.logger.exception("Antenna deployment failed, resuming")
+                time.sleep(self.config['antenna_deployer']['max_poll_interval'])
 
-        # Deploy
-        isisants.py_k_ants_deploy(self.config['antenna']['ANT_1'], False, 5)
-        isisants.py_k_ants_deploy(self.config['antenna']['ANT_2'], False, 5)
-        isisants.py_k_ants_deploy(self.config['antenna']['ANT_3'], False, 5)
-        isisants.py_k_ants_deploy(self.config['antenna']['ANT_4'], False, 5)
-        
-        if self.has_module("telemetry"):  # No need for RuntimeError for the process will terminate
-            self.modules["telemetry"].enqueue(
-                log.Log(
-                    sys_name="antenna_deployer",
-                    lvl='INFO',
-                    msg="antenna deployed"
-                )
-            )
+    def run_deployment(self) -> None:
+        """
+        Deployment state machine.
+        Burns every antenna in turn, polling the deployment status with backoff and retrying with the override flag,
+        then falls back to the controller's automatic sequence for antennas that still failed.
+        Progress is persisted after every step.
+        :return: None
+        """
+        config = self.config['antenna_deployer']
+        self.state = DeploymentState(config['state_path'],
+                                     {name: config[name] for name in ("ANT_1", "ANT_2", "ANT_3", "ANT_4")})
+        if self.state.done:
+            self.logger.info("Antennas already deployed: " + "; ".join(str(a) for a in self.state.antennas))
+            return
+
+        while isisants.py_k_ants_init(b"/dev/i2c-1", 0x31, 0x32, 4, 10) != ANTS_OK:
+            self.logger.error("Antenna controller init failed, retrying")
+            time.sleep(config['max_poll_interval'])
+        if isisants.py_k_ants_arm() != ANTS_OK:
+            self.logger.error("Antenna controller did not confirm arming")
+
+        if self.state.phase == INDIVIDUAL:
+            for progress in self.state.antennas:
+                self.burn(progress)
+            failed = any(a.state == FAILED for a in self.state.antennas)
+            self.state.phase = AUTO if failed and config['auto_deploy_attempts'] > 0 else DONE
+            self.state.save()
+
+        while self.state.phase == AUTO:
+            self.auto_deploy()
+
+        isisants.py_k_ants_disarm()
+        failed = [a for a in self.state.antennas if a.state == FAILED]
+        telemetry = self.get_telemetry()
+        self.report("Antenna deployment finished: " + "; ".join(str(a) for a in self.state.antennas) +
+                    (f"; controller {telemetry}" if telemetry is not None else ""), failed=bool(failed))
+
+    def burn(self, progress) -> None:
+        """
+        Deploys a single antenna, retrying with override until it reports deployed or max_attempts burns were made
+        :param progress: AntennaProgress of the antenna
+        :return: None
+        """
+        config = self.config['antenna_deployer']
+        while not progress.finished:
+            bits = self.get_deploy_status()
+            if bits is not None and antenna_status(bits, progress.antenna)[0]:
+                progress.state = DEPLOYED  # deployed by an earlier burn, e.g. one interrupted by a reboot
+                self.state.save()
+                break
+            if progress.attempts >= config['max_attempts']:
+                progress.state = FAILED
+                self.state.save()
+                self.report(f"{progress}", failed=True)
+                break
+
+            override = progress.attempts > 0
+            progress.attempts += 1
+            progress.state = BURNING
+            progress.started = time.time()
+            self.state.save()
+            if isisants.py_k_ants_deploy(progress.antenna, override, config['burn_timeout']) != ANTS_OK:
+                self.logger.error(f"{progress.name} deploy command failed")
+                progress.state = PENDING
+                self.state.save()
+                time.sleep(config['max_poll_interval'])
+                continue
+
+            progress.state = self.poll([progress.antenna], config['burn_timeout'])[progress.antenna]
+            progress.seconds += time.time() - progress.started
+            self.state.save()
+            self.report(f"{progress}" + self.get_activation(progress.antenna))
+
+    def auto_deploy(self) -> None:
+        """
+        Runs the controller's automatic deployment sequence once for every antenna still marked FAILED
+        :return: None
+        """
+        config = self.config['antenna_deployer']
+        failed = [a for a in self.state.antennas if a.state == FAILED]
+        self.state.auto_attempts += 1
+        self.state.save()
+
+        started = time.time()
+        if isisants.py_k_ants_auto_deploy(config['auto_deploy_timeout']) == ANTS_OK:
+            # The automatic sequence burns all four antennas one after the other
+            states = self.poll([a.antenna for a in self.state.antennas],
+                               config['auto_deploy_timeout'] * len(self.state.antennas))
+            for progress in failed:
+                progress.seconds += time.time() - started
+                if states[progress.antenna] in (DEPLOYED, UNVERIFIED):
+                    progress.state = states[progress.antenna]
+                    self.report(f"{progress} (auto deploy)" + self.get_activation(progress.antenna))
+        else:
+            self.logger.error("Auto deploy command failed")
+
+        if all(a.state != FAILED for a in self.state.antennas) or \
+                self.state.auto_attempts >= config['auto_deploy_attempts']:
+            self.state.phase = DONE
+        self.state.save()
+
+    def poll(self, antennas: list, timeout: float) -> dict:
+        """
+        Polls the deployment status with exponential backoff until every antenna is deployed, every burn stopped or
+        timeout (plus one max_poll_interval of grace) passed. A burn still active at the deadline is cancelled.
+        :param antennas: KANTSAnt values being burned
+        :param timeout: burn timeout in seconds
+        :return: KANTSAnt -> DEPLOYED, PENDING if the burn ended without deploying, or UNVERIFIED if the status
+            register could not be read
+        """
+        config = self.config['antenna_deployer']
+        deadline = time.monotonic() + timeout + config['max_poll_interval']
+        interval = config['poll_interval']
+        while True:
+            bits = self.get_deploy_status()
+            if bits is not None:
+                status = {antenna: antenna_status(bits, antenna) for antenna in antennas}
+                if all(deployed or stopped for deployed, _, stopped in status.values()):
+                    return {antenna: DEPLOYED if status[antenna][0] else PENDING for antenna in antennas}
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * config['poll_backoff'], config['max_poll_interval'])
+
+        if bits is None:
+            return {antenna: UNVERIFIED for antenna in antennas}
+        if any(active for _, active, _ in status.values()):
+            isisants.py_k_ants_cancel_deploy()
+        return {antenna: DEPLOYED if status[antenna][0] else PENDING for antenna in antennas}
+
+    @span("antenna_deployer.i2c")
+    def get_deploy_status(self):
+        """
+        Reads the deployment status register
+        :return: register value, or None if it cannot be read
+        """
+        try:
+            return isisants.py_k_ants_get_deploy_status()
+        except OSError as e:
+            self.logger.debug(f"Deploy status read failed: {e}")
+            return None
+
+    @span("antenna_deployer.i2c")
+    def get_activation(self, antenna: int) -> str:
+        """
+        :param antenna: KANTSAnt value
+        :return: The controller's activation count and time of an antenna, formatted for a report, or an empty
+            string if they cannot be read
+        """
+        try:
+            count = isisants.py_k_ants_get_activation_count(antenna)
+            seconds = isisants.py_k_ants_get_activation_time(antenna)
+        except OSError as e:
+            self.logger.debug(f"Activation read failed: {e}")
+            return ""
+        return f", controller counts {count} activation(s), {seconds} s"
+
+    @span("antenna_deployer.i2c")
+    def get_telemetry(self):
+        """
+        Reads the controller's system telemetry and every antenna's activation count and time in one call
+        :return: {"raw_temp", "deploy_status", "uptime", "activation_counts", "activation_times"}, or None if the
+            controller cannot be read
+        """
+        try:
+            return isisants.py_k_ants_read_all_telemetry()
+        except OSError as e:
+            self.logger.debug(f"Telemetry read failed: {e}")
+            return None
+
+    def report(self, message: str, failed: bool = False) -> None:
+        """
+        Logs a deployment result and sends it to telemetry
+        :param message: text of the report
+        :param failed: Whether to report it as an Error
+        :return: None
+        """
+        if failed:
+            self.logger.error(message)
+        else:
+            self.logger.info(message)
+        if self.has_module("telemetry"):
+            if failed:
+                self.modules["telemetry"].enqueue(error.Error(sys_name="antenna_deployer", msg=message))
+            else:
+                self.modules["telemetry"].enqueue(log.Log(sys_name="antenna_deployer", lvl='INFO', msg=message))
 
     def enter_low_power_mode(self) -> None:
         """
@@ -48,6 +250,13 @@ class AntennaDeployer(Submodule):
         """
         pass  # Antenna Deployer has no-op
 
+    def enter_emergency_mode(self) -> None:
+        """
+        Empty because Antenna Deployer does not react to changes in Modes
+        :return: None
+        """
+        pass  # Antenna Deployer has no-op
+
     def enter_normal_mode(self) -> None:
         """
         Empty because Antenna Deployer does not react to changes in Modes
@@ -0,0 +1,99 @@
+import time
+
+from helpers.persist import dump_json, load_json
+
+ANTS_OK = 0  # KANTSStatus
+
+# Deployment status register bits, indexed by KANTSAnt (ANT_1 = 0 ... ANT_4 = 3)
+NOT_DEPLOYED = (1 << 15, 1 << 11, 1 << 7, 1 << 3)
+STOPPED_TIME = (1 << 14, 1 << 10, 1 << 6, 1 << 2)
+ACTIVE = (1 << 13, 1 << 9, 1 << 5, 1 << 1)
+SYS_ARMED = 1 << 0
+
+# Antenna states
+PENDING = "pending"
+BURNING = "burning"
+DEPLOYED = "deployed"
+UNVERIFIED = "unverified"  # burn ran its full timeout but the status register could not be read
+FAILED = "failed"
+
+# Deployment phases
+INDIVIDUAL = "individual"
+AUTO = "auto"
+DONE = "done"
+
+
+class AntennaProgress:
+    """
+    Deployment progress of a single antenna
+    """
+    __slots__ = ("name", "antenna", "state", "attempts", "started", "seconds")
+
+    def __init__(self, name: str, antenna: int, state: str = PENDING, attempts: int = 0, started: float = None,
+                 seconds: float = 0.0):
+        """
+        :param name: config key, e.g. ANT_1
+        :param antenna: KANTSAnt value
+        :param state: one of PENDING, BURNING, DEPLOYED, UNVERIFIED, FAILED
+        :param attempts: number of burns started
+        :param started: wall clock start of the current burn
+        :param seconds: total burn time over every attempt
+        """
+        self.name = name
+        self.antenna = antenna
+        self.state = state
+        self.attempts = attempts
+        self.started = started
+        self.seconds = seconds
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (DEPLOYED, UNVERIFIED, FAILED)
+
+    def to_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __str__(self) -> str:
+        return f"{self.name} {self.state} after {self.attempts} attempt(s), {self.seconds:.1f} s burning"
+
+
+class DeploymentState:
+    """
+    Persistent progress of the antenna deployment, stored as JSON so that a reboot resumes it instead of redoing or
+    skipping it
+    """
+
+    def __init__(self, path: str, antennas: dict):
+        """
+        :param path: JSON file the state is stored in
+        :param antennas: config name -> KANTSAnt value of every antenna to deploy
+        """
+        self.path = path
+        stored = load_json(path, default=dict())
+        self.phase = stored.get("phase", INDIVIDUAL)
+        self.auto_attempts = stored.get("auto_attempts", 0)
+        known = {a["name"]: a for a in stored.get("antennas", [])}
+        self.antennas = [AntennaProgress(**known[name]) if name in known else AntennaProgress(name, antenna)
+                         for name, antenna in antennas.items()]
+
+    @property
+    def done(self) -> bool:
+        return self.phase == DONE
+
+    def save(self) -> None:
+        dump_json(self.path, {
+            "phase": self.phase,
+            "auto_attempts": self.auto_attempts,
+            "antennas": [a.to_dict() for a in self.antennas],
+            "saved": time.time(),
+        })
+
+
+def antenna_status(bits: int, antenna: int) -> (bool, bool, bool):
+    """
+    Decodes one antenna's bits of the deployment status register
+    :param bits: value read by k_ants_get_deploy_status
+    :param antenna: KANTSAnt value
+    :return: (deployed, burn active, burn stopped by its timeout)
+    """
+    return not bits & NOT_DEPLOYED[antenna], bool(bits & ACTIVE[antenna]), bool(bits & STOPPED_TIME[antenna])
@@ -1,4 +1,4 @@
-/* Generated by Cython 0.29.7 */
+/* Generated by Cython 0.29.37 */
 
 /* BEGIN: Cython Metadata
 {
@@ -26,16 +26,18 @@
 }
 END: Cython Metadata */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
     #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#define CYTHON_ABI "0_29_7"
-#define CYTHON_HEX_VERSION 0x001D07F0
-#define CYTHON_FUTURE_DIVISION 0
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
 #include <stddef.h>
 #ifndef offsetof
   #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
@@ -73,6 +75,7 @@ END: Cython Metadata */
   #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_PYTYPE_LOOKUP
@@ -101,18 +104,26 @@ END: Cython Metadata */
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_PYCALL
   #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
   #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
 #elif defined(PYSTON_VERSION)
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -150,10 +161,59 @@ END: Cython Metadata */
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -173,7 +233,7 @@ END: Cython Metadata */
     #undef CYTHON_USE_PYLONG_INTERNALS
     #define CYTHON_USE_PYLONG_INTERNALS 0
   #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
-    #define CYTHON_USE_PYLONG_INTERNALS 1
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
   #endif
   #ifndef CYTHON_USE_PYLIST_INTERNALS
     #define CYTHON_USE_PYLIST_INTERNALS 1
@@ -181,7 +241,7 @@ END: Cython Metadata */
   #ifndef CYTHON_USE_UNICODE_INTERNALS
     #define CYTHON_USE_UNICODE_INTERNALS 1
   #endif
-  #if PY_VERSION_HEX < 0x030300F0
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
     #undef CYTHON_USE_UNICODE_WRITER
     #define CYTHON_USE_UNICODE_WRITER 0
   #elif !defined(CYTHON_USE_UNICODE_WRITER)
@@ -196,11 +256,14 @@ END: Cython Metadata */
   #ifndef CYTHON_UNPACK_METHODS
     #define CYTHON_UNPACK_METHODS 1
   #endif
-  #ifndef CYTHON_FAST_THREAD_STATE
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
     #define CYTHON_FAST_THREAD_STATE 1
   #endif
   #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
   #endif
   #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
     #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
@@ -209,17 +272,25 @@ END: Cython Metadata */
     #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
   #endif
   #ifndef CYTHON_USE_DICT_VERSIONS
-    #define CYTHON_USE_DICT_VERSIONS (PY_VERSION_HEX >= 0x030600B1)
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
   #endif
-  #ifndef CYTHON_USE_EXC_INFO_STACK
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
     #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
   #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
 #endif
 #if !defined(CYTHON_FAST_PYCCALL)
 #define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
 #endif
 #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
   #undef SHIFT
   #undef BASE
   #undef MASK
@@ -324,9 +395,6 @@ END: Cython Metadata */
   #endif
 #endif
 
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
@@ -336,10 +404,79 @@ END: Cython Metadata */
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
   #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
   #define __Pyx_DefaultClassType PyType_Type
 #endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
 #ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
 #endif
@@ -447,8 +584,12 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
@@ -456,7 +597,15 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
   #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
   #define PyUnicode_1BYTE_KIND  1
@@ -505,8 +654,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define PyString_Type                PyUnicode_Type
   #define PyString_Check               PyUnicode_Check
   #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
   #define PyObject_Unicode             PyObject_Str
 #endif
+#endif
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
   #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
@@ -517,6 +668,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #ifndef PySet_CheckExact
   #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
 #endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
 #if CYTHON_ASSUME_SAFE_MACROS
   #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
 #else
@@ -550,13 +708,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
 #if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : (Py_INCREF(func), func))
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
 #else
   #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
@@ -578,8 +736,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
     } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
 #ifdef NAN
@@ -597,11 +757,10 @@ static CYTHON_INLINE float __PYX_NAN() {
 #define __Pyx_truncl truncl
 #endif
 
-
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
 #define __PYX_ERR(f_index, lineno, Ln_error) \
-{ \
-  __pyx_filename = __pyx_f[f_index]; __pyx_lineno = lineno; __pyx_clineno = __LINE__; goto Ln_error; \
-}
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
 
 #ifndef __PYX_EXTERN_C
   #ifdef __cplusplus
@@ -713,6 +872,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #else
@@ -827,6 +987,18 @@ static const char *__pyx_filename;
 static const char *__pyx_f[] = {
   "isisants.pyx",
 };
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
 
 /*--- Type declarations ---*/
 
@@ -894,6 +1066,16 @@ static const char *__pyx_f[] = {
 #define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
 /* RaiseArgTupleInvalid.proto */
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
@@ -906,6 +1088,89 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
     const char* function_name);
 
+/* PyObjectFormatSimple.proto */
+#if CYTHON_COMPILING_IN_PYPY
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#elif PY_MAJOR_VERSION < 3
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyString_CheckExact(s)) ? PyUnicode_FromEncodedObject(s, NULL, "strict") :\
+        PyObject_Format(s, f))
+#elif CYTHON_USE_TYPE_SLOTS
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyLong_CheckExact(s)) ? PyLong_Type.tp_str(s) :\
+        likely(PyFloat_CheckExact(s)) ? PyFloat_Type.tp_str(s) :\
+        PyObject_Format(s, f))
+#else
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#endif
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* JoinPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectSetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
+#else
+#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
+#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
+#endif
+
 /* PyDictVersioning.proto */
 #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
 #define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
@@ -932,11 +1197,25 @@ static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UIN
 #define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
 #endif
 
-/* PyObjectGetAttrStr.proto */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
 #else
-#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
 #endif
 
 /* PyThreadStateGet.proto */
@@ -975,6 +1254,148 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 #define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
 #endif
 
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* ModInt[long].proto */
+static CYTHON_INLINE long __Pyx_mod_long(long, long);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* CalculateMetaclass.proto */
+static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases);
+
+/* FetchCommonType.proto */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
+
+/* CythonFunctionShared.proto */
+#define __Pyx_CyFunction_USED 1
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#define __Pyx_CyFunction_GetClassObj(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+    PyCFunctionObject func;
+#if PY_VERSION_HEX < 0x030500A0
+    PyObject *func_weakreflist;
+#endif
+    PyObject *func_dict;
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+    PyObject *func_classobj;
+    void *defaults;
+    int defaults_pyobjects;
+    size_t defaults_size;  // used by FusedFunction for copying defaults
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+} __pyx_CyFunctionObject;
+static PyTypeObject *__pyx_CyFunctionType = 0;
+#define __Pyx_CyFunction_Check(obj)  (__Pyx_TypeCheck(obj, __pyx_CyFunctionType))
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *self,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *m,
+                                                         size_t size,
+                                                         int pyobjects);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(void);
+
+/* CythonFunction.proto */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+
+/* SetNameInClass.proto */
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+#define __Pyx_SetNameInClass(ns, name, value)\
+    (likely(PyDict_CheckExact(ns)) ? _PyDict_SetItem_KnownHash(ns, name, value, ((PyASCIIObject *) name)->hash) : PyObject_SetItem(ns, name, value))
+#elif CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_SetNameInClass(ns, name, value)\
+    (likely(PyDict_CheckExact(ns)) ? PyDict_SetItem(ns, name, value) : PyObject_SetItem(ns, name, value))
+#else
+#define __Pyx_SetNameInClass(ns, name, value)  PyObject_SetItem(ns, name, value)
+#endif
+
+/* Py3ClassCreate.proto */
+static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name, PyObject *qualname,
+                                           PyObject *mkw, PyObject *modname, PyObject *doc);
+static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases, PyObject *dict,
+                                      PyObject *mkw, int calculate_metaclass, int allow_py2_metaclass);
+
 /* CLineInTraceback.proto */
 #ifdef CYTHON_CLINE_IN_TRACEBACK
 #define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
@@ -1001,11 +1422,10 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_KANTSStatus(KANTSStatus value);
-
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_KI2CStatus(KI2CStatus value);
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
 
 /* CIntFromPy.proto */
 static CYTHON_INLINE uint8_t __Pyx_PyInt_As_uint8_t(PyObject *);
@@ -1020,14 +1440,32 @@ static CYTHON_INLINE KANTSController __Pyx_PyInt_As_KANTSController(PyObject *);
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
 /* CIntFromPy.proto */
-static CYTHON_INLINE KANTSAnt __Pyx_PyInt_As_KANTSAnt(PyObject *);
+static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_KANTSStatus(KANTSStatus value);
 
 /* CIntFromPy.proto */
-static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *);
+static CYTHON_INLINE KANTSAnt __Pyx_PyInt_As_KANTSAnt(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint16_t(uint16_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint32_t(uint32_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint8_t(uint8_t value);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_KI2CStatus(KI2CStatus value);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
@@ -1056,48 +1494,87 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 /* Module declarations from 'libcpp' */
 
 /* Module declarations from 'isisants' */
+static CYTHON_INLINE void __pyx_f_8isisants_check(PyObject *, int); /*proto*/
 #define __Pyx_MODULE_NAME "isisants"
 extern int __pyx_module_is_main_isisants;
 int __pyx_module_is_main_isisants = 0;
 
 /* Implementation of 'isisants' */
+static PyObject *__pyx_builtin_OSError;
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_range;
+static const char __pyx_k_i[] = "i";
 static const char __pyx_k_fp[] = "fp";
 static const char __pyx_k_rx[] = "rx";
 static const char __pyx_k_tx[] = "tx";
 static const char __pyx_k_bus[] = "bus";
+static const char __pyx_k_doc[] = "__doc__";
 static const char __pyx_k_i2c[] = "i2c";
-static const char __pyx_k_len[] = "len";
 static const char __pyx_k_ptr[] = "ptr";
 static const char __pyx_k_addr[] = "addr";
+static const char __pyx_k_call[] = "call";
+static const char __pyx_k_data[] = "data";
+static const char __pyx_k_init[] = "__init__";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_resp[] = "resp";
+static const char __pyx_k_self[] = "self";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_time[] = "time";
 static const char __pyx_k_count[] = "count";
+static const char __pyx_k_range[] = "range";
 static const char __pyx_k_telem[] = "telem";
+static const char __pyx_k_times[] = "times";
 static const char __pyx_k_config[] = "config";
+static const char __pyx_k_counts[] = "counts";
 static const char __pyx_k_device[] = "device";
+static const char __pyx_k_failed[] = "failed";
+static const char __pyx_k_length[] = "length";
+static const char __pyx_k_module[] = "__module__";
 static const char __pyx_k_rx_len[] = "rx_len";
+static const char __pyx_k_rx_ptr[] = "rx_ptr";
+static const char __pyx_k_status[] = "status";
 static const char __pyx_k_tx_len[] = "tx_len";
+static const char __pyx_k_tx_ptr[] = "tx_ptr";
 static const char __pyx_k_uptime[] = "uptime";
+static const char __pyx_k_OSError[] = "OSError";
 static const char __pyx_k_antenna[] = "antenna";
+static const char __pyx_k_prepare[] = "__prepare__";
 static const char __pyx_k_primary[] = "primary";
 static const char __pyx_k_timeout[] = "timeout";
 static const char __pyx_k_isisants[] = "isisants";
 static const char __pyx_k_override[] = "override";
+static const char __pyx_k_qualname[] = "__qualname__";
+static const char __pyx_k_raw_temp[] = "raw_temp";
+static const char __pyx_k_ANT_COUNT[] = "ANT_COUNT";
+static const char __pyx_k_AntsError[] = "AntsError";
 static const char __pyx_k_ant_count[] = "ant_count";
+static const char __pyx_k_c_antenna[] = "c_antenna";
+static const char __pyx_k_c_timeout[] = "c_timeout";
+static const char __pyx_k_metaclass[] = "__metaclass__";
 static const char __pyx_k_secondary[] = "secondary";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_c_override[] = "c_override";
+static const char __pyx_k_k_i2c_init[] = "k_i2c_init";
+static const char __pyx_k_k_i2c_read[] = "k_i2c_read";
 static const char __pyx_k_isisants_pyx[] = "isisants.pyx";
+static const char __pyx_k_deploy_status[] = "deploy_status";
 static const char __pyx_k_py_k_ants_arm[] = "py_k_ants_arm";
 static const char __pyx_k_py_k_i2c_init[] = "py_k_i2c_init";
 static const char __pyx_k_py_k_i2c_read[] = "py_k_i2c_read";
 static const char __pyx_k_py_k_ants_init[] = "py_k_ants_init";
 static const char __pyx_k_py_k_i2c_write[] = "py_k_i2c_write";
 static const char __pyx_k_py_k_ants_reset[] = "py_k_ants_reset";
+static const char __pyx_k_returned_status[] = " returned status ";
+static const char __pyx_k_AntsError___init[] = "AntsError.__init__";
+static const char __pyx_k_activation_times[] = "activation_times";
 static const char __pyx_k_py_k_ants_deploy[] = "py_k_ants_deploy";
 static const char __pyx_k_py_k_ants_disarm[] = "py_k_ants_disarm";
+static const char __pyx_k_activation_counts[] = "activation_counts";
+static const char __pyx_k_k_ants_get_uptime[] = "k_ants_get_uptime";
+static const char __pyx_k_at_most_4_antennas[] = "at most 4 antennas";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_k_ants_passthrough[] = "k_ants_passthrough";
 static const char __pyx_k_py_k_i2c_terminate[] = "py_k_i2c_terminate";
 static const char __pyx_k_py_k_ants_configure[] = "py_k_ants_configure";
 static const char __pyx_k_py_k_ants_terminate[] = "py_k_ants_terminate";
@@ -1107,27 +1584,65 @@ static const char __pyx_k_py_k_ants_passthrough[] = "py_k_ants_passthrough";
 static const char __pyx_k_py_k_ants_cancel_deploy[] = "py_k_ants_cancel_deploy";
 static const char __pyx_k_py_k_ants_watchdog_kick[] = "py_k_ants_watchdog_kick";
 static const char __pyx_k_py_k_ants_watchdog_stop[] = "py_k_ants_watchdog_stop";
+static const char __pyx_k_k_ants_get_deploy_status[] = "k_ants_get_deploy_status";
 static const char __pyx_k_py_k_ants_watchdog_start[] = "py_k_ants_watchdog_start";
+static const char __pyx_k_k_ants_get_activation_time[] = "k_ants_get_activation_time";
+static const char __pyx_k_k_ants_get_activation_count[] = "k_ants_get_activation_count";
+static const char __pyx_k_k_ants_get_system_telemetry[] = "k_ants_get_system_telemetry";
 static const char __pyx_k_py_k_ants_get_deploy_status[] = "py_k_ants_get_deploy_status";
+static const char __pyx_k_py_k_ants_read_all_telemetry[] = "py_k_ants_read_all_telemetry";
 static const char __pyx_k_py_k_ants_get_activation_time[] = "py_k_ants_get_activation_time";
 static const char __pyx_k_py_k_ants_get_activation_count[] = "py_k_ants_get_activation_count";
 static const char __pyx_k_py_k_ants_get_system_telemetry[] = "py_k_ants_get_system_telemetry";
+static const char __pyx_k_Binding_for_the_Kubos_ISIS_ante[] = "\nBinding for the Kubos ISIS antenna system API (ants-api.h) and its I2C helpers (i2c.h).\n\nEvery C call runs with the GIL released, so a multi-second deploy or a slow I2C transaction does not stall other\nPython threads. Commands return their KANTSStatus; getters return their value and raise AntsError if the\ncontroller does not answer with ANTS_OK.\n";
+static const char __pyx_k_Raised_by_a_getter_when_the_ant[] = "\n    Raised by a getter when the antenna controller or I2C bus returns a status other than OK\n    ";
+static PyObject *__pyx_n_s_ANT_COUNT;
+static PyObject *__pyx_n_s_AntsError;
+static PyObject *__pyx_n_s_AntsError___init;
+static PyObject *__pyx_n_s_OSError;
+static PyObject *__pyx_kp_s_Raised_by_a_getter_when_the_ant;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_n_u_activation_counts;
+static PyObject *__pyx_n_u_activation_times;
 static PyObject *__pyx_n_s_addr;
 static PyObject *__pyx_n_s_ant_count;
 static PyObject *__pyx_n_s_antenna;
+static PyObject *__pyx_kp_u_at_most_4_antennas;
 static PyObject *__pyx_n_s_bus;
+static PyObject *__pyx_n_s_c_antenna;
+static PyObject *__pyx_n_s_c_override;
+static PyObject *__pyx_n_s_c_timeout;
+static PyObject *__pyx_n_s_call;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_config;
 static PyObject *__pyx_n_s_count;
+static PyObject *__pyx_n_s_counts;
+static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_u_deploy_status;
 static PyObject *__pyx_n_s_device;
+static PyObject *__pyx_n_s_doc;
+static PyObject *__pyx_n_s_failed;
 static PyObject *__pyx_n_s_fp;
+static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_s_i2c;
+static PyObject *__pyx_n_s_init;
 static PyObject *__pyx_n_s_isisants;
 static PyObject *__pyx_kp_s_isisants_pyx;
-static PyObject *__pyx_n_s_len;
+static PyObject *__pyx_n_u_k_ants_get_activation_count;
+static PyObject *__pyx_n_u_k_ants_get_activation_time;
+static PyObject *__pyx_n_u_k_ants_get_deploy_status;
+static PyObject *__pyx_n_u_k_ants_get_system_telemetry;
+static PyObject *__pyx_n_u_k_ants_get_uptime;
+static PyObject *__pyx_n_u_k_ants_passthrough;
+static PyObject *__pyx_n_u_k_i2c_init;
+static PyObject *__pyx_n_u_k_i2c_read;
+static PyObject *__pyx_n_s_length;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_metaclass;
+static PyObject *__pyx_n_s_module;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_override;
+static PyObject *__pyx_n_s_prepare;
 static PyObject *__pyx_n_s_primary;
 static PyObject *__pyx_n_s_ptr;
 static PyObject *__pyx_n_s_py_k_ants_arm;
@@ -1143,6 +1658,7 @@ static PyObject *__pyx_n_s_py_k_ants_get_system_telemetry;
 static PyObject *__pyx_n_s_py_k_ants_get_uptime;
 static PyObject *__pyx_n_s_py_k_ants_init;
 static PyObject *__pyx_n_s_py_k_ants_passthrough;
+static PyObject *__pyx_n_s_py_k_ants_read_all_telemetry;
 static PyObject *__pyx_n_s_py_k_ants_reset;
 static PyObject *__pyx_n_s_py_k_ants_terminate;
 static PyObject *__pyx_n_s_py_k_ants_watchdog_kick;
@@ -1152,17 +1668,28 @@ static PyObject *__pyx_n_s_py_k_i2c_init;
 static PyObject *__pyx_n_s_py_k_i2c_read;
 static PyObject *__pyx_n_s_py_k_i2c_terminate;
 static PyObject *__pyx_n_s_py_k_i2c_write;
+static PyObject *__pyx_n_s_qualname;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_u_raw_temp;
 static PyObject *__pyx_n_s_resp;
+static PyObject *__pyx_kp_u_returned_status;
 static PyObject *__pyx_n_s_rx;
 static PyObject *__pyx_n_s_rx_len;
+static PyObject *__pyx_n_s_rx_ptr;
 static PyObject *__pyx_n_s_secondary;
+static PyObject *__pyx_n_s_self;
+static PyObject *__pyx_n_s_status;
 static PyObject *__pyx_n_s_telem;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_time;
 static PyObject *__pyx_n_s_timeout;
+static PyObject *__pyx_n_s_times;
 static PyObject *__pyx_n_s_tx;
 static PyObject *__pyx_n_s_tx_len;
+static PyObject *__pyx_n_s_tx_ptr;
 static PyObject *__pyx_n_s_uptime;
+static PyObject *__pyx_n_u_uptime;
+static PyObject *__pyx_pf_8isisants_9AntsError___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_call, PyObject *__pyx_v_status); /* proto */
 static PyObject *__pyx_pf_8isisants_py_k_ants_init(CYTHON_UNUSED PyObject *__pyx_self, char *__pyx_v_bus, uint8_t __pyx_v_primary, uint8_t __pyx_v_secondary, uint8_t __pyx_v_ant_count, uint32_t __pyx_v_timeout); /* proto */
 static PyObject *__pyx_pf_8isisants_2py_k_ants_terminate(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
 static PyObject *__pyx_pf_8isisants_4py_k_ants_configure(CYTHON_UNUSED PyObject *__pyx_self, KANTSController __pyx_v_config); /* proto */
@@ -1172,88 +1699,102 @@ static PyObject *__pyx_pf_8isisants_10py_k_ants_disarm(CYTHON_UNUSED PyObject *_
 static PyObject *__pyx_pf_8isisants_12py_k_ants_deploy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna, PyObject *__pyx_v_override, PyObject *__pyx_v_timeout); /* proto */
 static PyObject *__pyx_pf_8isisants_14py_k_ants_auto_deploy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_timeout); /* proto */
 static PyObject *__pyx_pf_8isisants_16py_k_ants_cancel_deploy(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
-static PyObject *__pyx_pf_8isisants_18py_k_ants_get_deploy_status(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_resp); /* proto */
-static PyObject *__pyx_pf_8isisants_20py_k_ants_get_uptime(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_uptime); /* proto */
-static PyObject *__pyx_pf_8isisants_22py_k_ants_get_system_telemetry(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_telem); /* proto */
-static PyObject *__pyx_pf_8isisants_24py_k_ants_get_activation_count(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna, PyObject *__pyx_v_count); /* proto */
-static PyObject *__pyx_pf_8isisants_26py_k_ants_get_activation_time(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna, int __pyx_v_time); /* proto */
-static PyObject *__pyx_pf_8isisants_28py_k_ants_watchdog_kick(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
-static PyObject *__pyx_pf_8isisants_30py_k_ants_watchdog_start(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
-static PyObject *__pyx_pf_8isisants_32py_k_ants_watchdog_stop(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
-static PyObject *__pyx_pf_8isisants_34py_k_ants_passthrough(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_tx, PyObject *__pyx_v_tx_len, PyObject *__pyx_v_rx, PyObject *__pyx_v_rx_len); /* proto */
-static PyObject *__pyx_pf_8isisants_36py_k_i2c_init(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_device, int __pyx_v_fp); /* proto */
-static PyObject *__pyx_pf_8isisants_38py_k_i2c_terminate(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_fp); /* proto */
-static PyObject *__pyx_pf_8isisants_40py_k_i2c_write(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_i2c, PyObject *__pyx_v_addr, PyObject *__pyx_v_ptr, PyObject *__pyx_v_len); /* proto */
-static PyObject *__pyx_pf_8isisants_42py_k_i2c_read(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_i2c, PyObject *__pyx_v_addr, PyObject *__pyx_v_ptr, int __pyx_v_len); /* proto */
-static PyObject *__pyx_tuple_;
+static PyObject *__pyx_pf_8isisants_18py_k_ants_get_deploy_status(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_8isisants_20py_k_ants_get_uptime(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_8isisants_22py_k_ants_get_system_telemetry(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_8isisants_24py_k_ants_get_activation_count(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna); /* proto */
+static PyObject *__pyx_pf_8isisants_26py_k_ants_get_activation_time(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna); /* proto */
+static PyObject *__pyx_pf_8isisants_28py_k_ants_read_all_telemetry(CYTHON_UNUSED PyObject *__pyx_self, uint8_t __pyx_v_ant_count); /* proto */
+static PyObject *__pyx_pf_8isisants_30py_k_ants_watchdog_kick(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_8isisants_32py_k_ants_watchdog_start(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_8isisants_34py_k_ants_watchdog_stop(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_8isisants_36py_k_ants_passthrough(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_tx, int __pyx_v_rx_len); /* proto */
+static PyObject *__pyx_pf_8isisants_38py_k_i2c_init(CYTHON_UNUSED PyObject *__pyx_self, char *__pyx_v_device); /* proto */
+static PyObject *__pyx_pf_8isisants_40py_k_i2c_terminate(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_fp); /* proto */
+static PyObject *__pyx_pf_8isisants_42py_k_i2c_write(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_i2c, uint16_t __pyx_v_addr, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_pf_8isisants_44py_k_i2c_read(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_i2c, uint16_t __pyx_v_addr, int __pyx_v_length); /* proto */
+static PyObject *__pyx_int_4;
+static uint8_t __pyx_k_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
 static PyObject *__pyx_tuple__4;
-static PyObject *__pyx_tuple__9;
-static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_tuple__12;
 static PyObject *__pyx_tuple__14;
 static PyObject *__pyx_tuple__16;
 static PyObject *__pyx_tuple__18;
 static PyObject *__pyx_tuple__20;
 static PyObject *__pyx_tuple__22;
-static PyObject *__pyx_tuple__27;
-static PyObject *__pyx_tuple__29;
-static PyObject *__pyx_tuple__31;
-static PyObject *__pyx_tuple__33;
-static PyObject *__pyx_tuple__35;
-static PyObject *__pyx_codeobj__2;
-static PyObject *__pyx_codeobj__3;
-static PyObject *__pyx_codeobj__5;
+static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__32;
+static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_tuple__36;
+static PyObject *__pyx_tuple__38;
+static PyObject *__pyx_tuple__40;
+static PyObject *__pyx_tuple__42;
+static PyObject *__pyx_tuple__44;
+static PyObject *__pyx_tuple__46;
+static PyObject *__pyx_tuple__48;
+static PyObject *__pyx_tuple__50;
 static PyObject *__pyx_codeobj__6;
-static PyObject *__pyx_codeobj__7;
 static PyObject *__pyx_codeobj__8;
-static PyObject *__pyx_codeobj__10;
-static PyObject *__pyx_codeobj__12;
+static PyObject *__pyx_codeobj__9;
+static PyObject *__pyx_codeobj__11;
 static PyObject *__pyx_codeobj__13;
 static PyObject *__pyx_codeobj__15;
 static PyObject *__pyx_codeobj__17;
 static PyObject *__pyx_codeobj__19;
 static PyObject *__pyx_codeobj__21;
 static PyObject *__pyx_codeobj__23;
-static PyObject *__pyx_codeobj__24;
 static PyObject *__pyx_codeobj__25;
-static PyObject *__pyx_codeobj__26;
-static PyObject *__pyx_codeobj__28;
-static PyObject *__pyx_codeobj__30;
-static PyObject *__pyx_codeobj__32;
-static PyObject *__pyx_codeobj__34;
-static PyObject *__pyx_codeobj__36;
+static PyObject *__pyx_codeobj__27;
+static PyObject *__pyx_codeobj__29;
+static PyObject *__pyx_codeobj__31;
+static PyObject *__pyx_codeobj__33;
+static PyObject *__pyx_codeobj__35;
+static PyObject *__pyx_codeobj__37;
+static PyObject *__pyx_codeobj__39;
+static PyObject *__pyx_codeobj__41;
+static PyObject *__pyx_codeobj__43;
+static PyObject *__pyx_codeobj__45;
+static PyObject *__pyx_codeobj__47;
+static PyObject *__pyx_codeobj__49;
+static PyObject *__pyx_codeobj__51;
 /* Late includes */
 
-/* "isisants.pyx":57
- * 
+/* "isisants.pyx":79
+ *     """
  * 
- * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)
- * def py_k_ants_terminate():
+ *     def __init__(self, call, status):             # <<<<<<<<<<<<<<
+ *         OSError.__init__(self, f"{call} returned status {status}")
+ *         self.call = call
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_1py_k_ants_init(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_1py_k_ants_init = {"py_k_ants_init", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_1py_k_ants_init, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_8isisants_1py_k_ants_init(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  char *__pyx_v_bus;
-  uint8_t __pyx_v_primary;
-  uint8_t __pyx_v_secondary;
-  uint8_t __pyx_v_ant_count;
-  uint32_t __pyx_v_timeout;
+static PyObject *__pyx_pw_8isisants_9AntsError_1__init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_8isisants_9AntsError_1__init__ = {"__init__", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_9AntsError_1__init__, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_8isisants_9AntsError_1__init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_call = 0;
+  PyObject *__pyx_v_status = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("py_k_ants_init (wrapper)", 0);
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bus,&__pyx_n_s_primary,&__pyx_n_s_secondary,&__pyx_n_s_ant_count,&__pyx_n_s_timeout,0};
-    PyObject* values[5] = {0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_call,&__pyx_n_s_status,0};
+    PyObject* values[3] = {0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
@@ -1266,98 +1807,185 @@ static PyObject *__pyx_pw_8isisants_1py_k_ants_init(PyObject *__pyx_self, PyObje
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bus)) != 0)) kw_args--;
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_primary)) != 0)) kw_args--;
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_call)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, 1); __PYX_ERR(0, 57, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 1); __PYX_ERR(0, 79, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_secondary)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, 2); __PYX_ERR(0, 57, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ant_count)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, 3); __PYX_ERR(0, 57, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_timeout)) != 0)) kw_args--;
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_status)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, 4); __PYX_ERR(0, 57, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 2); __PYX_ERR(0, 79, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_ants_init") < 0)) __PYX_ERR(0, 57, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 79, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
     }
-    __pyx_v_bus = __Pyx_PyObject_AsWritableString(values[0]); if (unlikely((!__pyx_v_bus) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
-    __pyx_v_primary = __Pyx_PyInt_As_uint8_t(values[1]); if (unlikely((__pyx_v_primary == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
-    __pyx_v_secondary = __Pyx_PyInt_As_uint8_t(values[2]); if (unlikely((__pyx_v_secondary == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
-    __pyx_v_ant_count = __Pyx_PyInt_As_uint8_t(values[3]); if (unlikely((__pyx_v_ant_count == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
-    __pyx_v_timeout = __Pyx_PyInt_As_uint32_t(values[4]); if (unlikely((__pyx_v_timeout == ((uint32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
+    __pyx_v_self = values[0];
+    __pyx_v_call = values[1];
+    __pyx_v_status = values[2];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 57, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 79, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("isisants.py_k_ants_init", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("isisants.AntsError.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_py_k_ants_init(__pyx_self, __pyx_v_bus, __pyx_v_primary, __pyx_v_secondary, __pyx_v_ant_count, __pyx_v_timeout);
+  __pyx_r = __pyx_pf_8isisants_9AntsError___init__(__pyx_self, __pyx_v_self, __pyx_v_call, __pyx_v_status);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_py_k_ants_init(CYTHON_UNUSED PyObject *__pyx_self, char *__pyx_v_bus, uint8_t __pyx_v_primary, uint8_t __pyx_v_secondary, uint8_t __pyx_v_ant_count, uint32_t __pyx_v_timeout) {
+static PyObject *__pyx_pf_8isisants_9AntsError___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_call, PyObject *__pyx_v_status) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("py_k_ants_init", 0);
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  Py_UCS4 __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "isisants.pyx":58
+  /* "isisants.pyx":80
  * 
- * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)             # <<<<<<<<<<<<<<
- * def py_k_ants_terminate():
- *     k_ants_terminate()
+ *     def __init__(self, call, status):
+ *         OSError.__init__(self, f"{call} returned status {status}")             # <<<<<<<<<<<<<<
+ *         self.call = call
+ *         self.status = status
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_init(__pyx_v_bus, __pyx_v_primary, __pyx_v_secondary, __pyx_v_ant_count, __pyx_v_timeout)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_builtin_OSError, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 127;
+  __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_v_call, __pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) > __pyx_t_5) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) : __pyx_t_5;
+  __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __Pyx_INCREF(__pyx_kp_u_returned_status);
+  __pyx_t_4 += 17;
+  __Pyx_GIVEREF(__pyx_kp_u_returned_status);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_kp_u_returned_status);
+  __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_v_status, __pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) > __pyx_t_5) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) : __pyx_t_5;
+  __pyx_t_4 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_6);
+  __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_3, 3, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  __pyx_t_7 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_7 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_self, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_self, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 80, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__pyx_t_3) {
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_3); __pyx_t_3 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_self);
+    __Pyx_GIVEREF(__pyx_v_self);
+    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_v_self);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "isisants.pyx":81
+ *     def __init__(self, call, status):
+ *         OSError.__init__(self, f"{call} returned status {status}")
+ *         self.call = call             # <<<<<<<<<<<<<<
+ *         self.status = status
+ * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_call, __pyx_v_call) < 0) __PYX_ERR(0, 81, __pyx_L1_error)
 
-  /* "isisants.pyx":57
+  /* "isisants.pyx":82
+ *         OSError.__init__(self, f"{call} returned status {status}")
+ *         self.call = call
+ *         self.status = status             # <<<<<<<<<<<<<<
  * 
  * 
- * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)
- * def py_k_ants_terminate():
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_status, __pyx_v_status) < 0) __PYX_ERR(0, 82, __pyx_L1_error)
+
+  /* "isisants.pyx":79
+ *     """
+ * 
+ *     def __init__(self, call, status):             # <<<<<<<<<<<<<<
+ *         OSError.__init__(self, f"{call} returned status {status}")
+ *         self.call = call
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("isisants.py_k_ants_init", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("isisants.AntsError.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -1365,48 +1993,400 @@ static PyObject *__pyx_pf_8isisants_py_k_ants_init(CYTHON_UNUSED PyObject *__pyx
   return __pyx_r;
 }
 
-/* "isisants.pyx":59
- * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)
- * def py_k_ants_terminate():             # <<<<<<<<<<<<<<
- *     k_ants_terminate()
- * def py_k_ants_configure(KANTSController config):
+/* "isisants.pyx":85
+ * 
+ * 
+ * cdef inline void check(str call, int status) except *:             # <<<<<<<<<<<<<<
+ *     if status != ANTS_OK:
+ *         raise AntsError(call, status)
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_8isisants_3py_k_ants_terminate(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_3py_k_ants_terminate = {"py_k_ants_terminate", (PyCFunction)__pyx_pw_8isisants_3py_k_ants_terminate, METH_NOARGS, 0};
-static PyObject *__pyx_pw_8isisants_3py_k_ants_terminate(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
+static CYTHON_INLINE void __pyx_f_8isisants_check(PyObject *__pyx_v_call, int __pyx_v_status) {
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("py_k_ants_terminate (wrapper)", 0);
-  __pyx_r = __pyx_pf_8isisants_2py_k_ants_terminate(__pyx_self);
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("check", 0);
 
-static PyObject *__pyx_pf_8isisants_2py_k_ants_terminate(CYTHON_UNUSED PyObject *__pyx_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("py_k_ants_terminate", 0);
+  /* "isisants.pyx":86
+ * 
+ * cdef inline void check(str call, int status) except *:
+ *     if status != ANTS_OK:             # <<<<<<<<<<<<<<
+ *         raise AntsError(call, status)
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_status != ANTS_OK) != 0);
+  if (unlikely(__pyx_t_1)) {
 
-  /* "isisants.pyx":60
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)
- * def py_k_ants_terminate():
- *     k_ants_terminate()             # <<<<<<<<<<<<<<
- * def py_k_ants_configure(KANTSController config):
- *     return k_ants_configure(config)
+    /* "isisants.pyx":87
+ * cdef inline void check(str call, int status) except *:
+ *     if status != ANTS_OK:
+ *         raise AntsError(call, status)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AntsError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_status); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 87, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_call, __pyx_t_4};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_call, __pyx_t_4};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_5) {
+        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      }
+      __Pyx_INCREF(__pyx_v_call);
+      __Pyx_GIVEREF(__pyx_v_call);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_v_call);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 87, __pyx_L1_error)
+
+    /* "isisants.pyx":86
+ * 
+ * cdef inline void check(str call, int status) except *:
+ *     if status != ANTS_OK:             # <<<<<<<<<<<<<<
+ *         raise AntsError(call, status)
+ * 
+ */
+  }
+
+  /* "isisants.pyx":85
+ * 
+ * 
+ * cdef inline void check(str call, int status) except *:             # <<<<<<<<<<<<<<
+ *     if status != ANTS_OK:
+ *         raise AntsError(call, status)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("isisants.check", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "isisants.pyx":90
+ * 
+ * 
+ * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8isisants_1py_k_ants_init(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_8isisants_1py_k_ants_init = {"py_k_ants_init", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_1py_k_ants_init, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_8isisants_1py_k_ants_init(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  char *__pyx_v_bus;
+  uint8_t __pyx_v_primary;
+  uint8_t __pyx_v_secondary;
+  uint8_t __pyx_v_ant_count;
+  uint32_t __pyx_v_timeout;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("py_k_ants_init (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bus,&__pyx_n_s_primary,&__pyx_n_s_secondary,&__pyx_n_s_ant_count,&__pyx_n_s_timeout,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bus)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_primary)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, 1); __PYX_ERR(0, 90, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_secondary)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, 2); __PYX_ERR(0, 90, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ant_count)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, 3); __PYX_ERR(0, 90, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_timeout)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, 4); __PYX_ERR(0, 90, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_ants_init") < 0)) __PYX_ERR(0, 90, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+    }
+    __pyx_v_bus = __Pyx_PyObject_AsWritableString(values[0]); if (unlikely((!__pyx_v_bus) && PyErr_Occurred())) __PYX_ERR(0, 90, __pyx_L3_error)
+    __pyx_v_primary = __Pyx_PyInt_As_uint8_t(values[1]); if (unlikely((__pyx_v_primary == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 90, __pyx_L3_error)
+    __pyx_v_secondary = __Pyx_PyInt_As_uint8_t(values[2]); if (unlikely((__pyx_v_secondary == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 90, __pyx_L3_error)
+    __pyx_v_ant_count = __Pyx_PyInt_As_uint8_t(values[3]); if (unlikely((__pyx_v_ant_count == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 90, __pyx_L3_error)
+    __pyx_v_timeout = __Pyx_PyInt_As_uint32_t(values[4]); if (unlikely((__pyx_v_timeout == ((uint32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 90, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("py_k_ants_init", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 90, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("isisants.py_k_ants_init", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_8isisants_py_k_ants_init(__pyx_self, __pyx_v_bus, __pyx_v_primary, __pyx_v_secondary, __pyx_v_ant_count, __pyx_v_timeout);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8isisants_py_k_ants_init(CYTHON_UNUSED PyObject *__pyx_self, char *__pyx_v_bus, uint8_t __pyx_v_primary, uint8_t __pyx_v_secondary, uint8_t __pyx_v_ant_count, uint32_t __pyx_v_timeout) {
+  KANTSStatus __pyx_v_status;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("py_k_ants_init", 0);
+
+  /* "isisants.pyx":92
+ * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_init(bus, primary, secondary, ant_count, timeout)
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":93
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_init(bus, primary, secondary, ant_count, timeout)             # <<<<<<<<<<<<<<
+ *     return status
+ * 
  */
-  k_ants_terminate();
+        __pyx_v_status = k_ants_init(__pyx_v_bus, __pyx_v_primary, __pyx_v_secondary, __pyx_v_ant_count, __pyx_v_timeout);
+      }
 
-  /* "isisants.pyx":59
+      /* "isisants.pyx":92
  * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_init(bus, primary, secondary, ant_count, timeout)
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":94
+ *     with nogil:
+ *         status = k_ants_init(bus, primary, secondary, ant_count, timeout)
+ *     return status             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_ants_terminate():
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "isisants.pyx":90
+ * 
+ * 
+ * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("isisants.py_k_ants_init", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isisants.pyx":96
+ *     return status
+ * 
  * def py_k_ants_terminate():             # <<<<<<<<<<<<<<
- *     k_ants_terminate()
+ *     with nogil:
+ *         k_ants_terminate()
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8isisants_3py_k_ants_terminate(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyMethodDef __pyx_mdef_8isisants_3py_k_ants_terminate = {"py_k_ants_terminate", (PyCFunction)__pyx_pw_8isisants_3py_k_ants_terminate, METH_NOARGS, 0};
+static PyObject *__pyx_pw_8isisants_3py_k_ants_terminate(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("py_k_ants_terminate (wrapper)", 0);
+  __pyx_r = __pyx_pf_8isisants_2py_k_ants_terminate(__pyx_self);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8isisants_2py_k_ants_terminate(CYTHON_UNUSED PyObject *__pyx_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("py_k_ants_terminate", 0);
+
+  /* "isisants.pyx":97
+ * 
+ * def py_k_ants_terminate():
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         k_ants_terminate()
+ * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":98
+ * def py_k_ants_terminate():
+ *     with nogil:
+ *         k_ants_terminate()             # <<<<<<<<<<<<<<
+ * 
  * def py_k_ants_configure(KANTSController config):
+ */
+        k_ants_terminate();
+      }
+
+      /* "isisants.pyx":97
+ * 
+ * def py_k_ants_terminate():
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         k_ants_terminate()
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":96
+ *     return status
+ * 
+ * def py_k_ants_terminate():             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         k_ants_terminate()
  */
 
   /* function exit code */
@@ -1416,12 +2396,12 @@ static PyObject *__pyx_pf_8isisants_2py_k_ants_terminate(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "isisants.pyx":61
- * def py_k_ants_terminate():
- *     k_ants_terminate()
+/* "isisants.pyx":100
+ *         k_ants_terminate()
+ * 
  * def py_k_ants_configure(KANTSController config):             # <<<<<<<<<<<<<<
- *     return k_ants_configure(config)
- * def py_k_ants_reset():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
 /* Python wrapper */
@@ -1429,11 +2409,14 @@ static PyObject *__pyx_pw_8isisants_5py_k_ants_configure(PyObject *__pyx_self, P
 static PyMethodDef __pyx_mdef_8isisants_5py_k_ants_configure = {"py_k_ants_configure", (PyCFunction)__pyx_pw_8isisants_5py_k_ants_configure, METH_O, 0};
 static PyObject *__pyx_pw_8isisants_5py_k_ants_configure(PyObject *__pyx_self, PyObject *__pyx_arg_config) {
   KANTSController __pyx_v_config;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_configure (wrapper)", 0);
   assert(__pyx_arg_config); {
-    __pyx_v_config = ((KANTSController)__Pyx_PyInt_As_KANTSController(__pyx_arg_config)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L3_error)
+    __pyx_v_config = ((KANTSController)__Pyx_PyInt_As_KANTSController(__pyx_arg_config)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 100, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -1449,31 +2432,79 @@ static PyObject *__pyx_pw_8isisants_5py_k_ants_configure(PyObject *__pyx_self, P
 }
 
 static PyObject *__pyx_pf_8isisants_4py_k_ants_configure(CYTHON_UNUSED PyObject *__pyx_self, KANTSController __pyx_v_config) {
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_configure", 0);
 
-  /* "isisants.pyx":62
- *     k_ants_terminate()
+  /* "isisants.pyx":102
  * def py_k_ants_configure(KANTSController config):
- *     return k_ants_configure(config)             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_configure(config)
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":103
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_configure(config)             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_configure(__pyx_v_config);
+      }
+
+      /* "isisants.pyx":102
+ * def py_k_ants_configure(KANTSController config):
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_configure(config)
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":104
+ *     with nogil:
+ *         status = k_ants_configure(config)
+ *     return status             # <<<<<<<<<<<<<<
+ * 
  * def py_k_ants_reset():
- *     return k_ants_reset()
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_configure(__pyx_v_config)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":61
- * def py_k_ants_terminate():
- *     k_ants_terminate()
+  /* "isisants.pyx":100
+ *         k_ants_terminate()
+ * 
  * def py_k_ants_configure(KANTSController config):             # <<<<<<<<<<<<<<
- *     return k_ants_configure(config)
- * def py_k_ants_reset():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
   /* function exit code */
@@ -1487,12 +2518,12 @@ static PyObject *__pyx_pf_8isisants_4py_k_ants_configure(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "isisants.pyx":63
- * def py_k_ants_configure(KANTSController config):
- *     return k_ants_configure(config)
+/* "isisants.pyx":106
+ *     return status
+ * 
  * def py_k_ants_reset():             # <<<<<<<<<<<<<<
- *     return k_ants_reset()
- * def py_k_ants_arm():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
 /* Python wrapper */
@@ -1510,31 +2541,79 @@ static PyObject *__pyx_pw_8isisants_7py_k_ants_reset(PyObject *__pyx_self, CYTHO
 }
 
 static PyObject *__pyx_pf_8isisants_6py_k_ants_reset(CYTHON_UNUSED PyObject *__pyx_self) {
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_reset", 0);
 
-  /* "isisants.pyx":64
- *     return k_ants_configure(config)
+  /* "isisants.pyx":108
+ * def py_k_ants_reset():
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_reset()
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":109
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_reset()             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_reset();
+      }
+
+      /* "isisants.pyx":108
  * def py_k_ants_reset():
- *     return k_ants_reset()             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_reset()
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":110
+ *     with nogil:
+ *         status = k_ants_reset()
+ *     return status             # <<<<<<<<<<<<<<
+ * 
  * def py_k_ants_arm():
- *     return k_ants_arm()
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_reset()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":63
- * def py_k_ants_configure(KANTSController config):
- *     return k_ants_configure(config)
+  /* "isisants.pyx":106
+ *     return status
+ * 
  * def py_k_ants_reset():             # <<<<<<<<<<<<<<
- *     return k_ants_reset()
- * def py_k_ants_arm():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
   /* function exit code */
@@ -1548,12 +2627,12 @@ static PyObject *__pyx_pf_8isisants_6py_k_ants_reset(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "isisants.pyx":65
- * def py_k_ants_reset():
- *     return k_ants_reset()
+/* "isisants.pyx":112
+ *     return status
+ * 
  * def py_k_ants_arm():             # <<<<<<<<<<<<<<
- *     return k_ants_arm()
- * def py_k_ants_disarm():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
 /* Python wrapper */
@@ -1571,31 +2650,79 @@ static PyObject *__pyx_pw_8isisants_9py_k_ants_arm(PyObject *__pyx_self, CYTHON_
 }
 
 static PyObject *__pyx_pf_8isisants_8py_k_ants_arm(CYTHON_UNUSED PyObject *__pyx_self) {
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_arm", 0);
 
-  /* "isisants.pyx":66
- *     return k_ants_reset()
+  /* "isisants.pyx":114
  * def py_k_ants_arm():
- *     return k_ants_arm()             # <<<<<<<<<<<<<<
- * def py_k_ants_disarm():
- *     return k_ants_disarm()
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_arm()
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":115
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_arm()             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_arm();
+      }
+
+      /* "isisants.pyx":114
+ * def py_k_ants_arm():
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_arm()
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":116
+ *     with nogil:
+ *         status = k_ants_arm()
+ *     return status             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_ants_disarm():
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_arm()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":65
- * def py_k_ants_reset():
- *     return k_ants_reset()
+  /* "isisants.pyx":112
+ *     return status
+ * 
  * def py_k_ants_arm():             # <<<<<<<<<<<<<<
- *     return k_ants_arm()
- * def py_k_ants_disarm():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
   /* function exit code */
@@ -1609,12 +2736,12 @@ static PyObject *__pyx_pf_8isisants_8py_k_ants_arm(CYTHON_UNUSED PyObject *__pyx
   return __pyx_r;
 }
 
-/* "isisants.pyx":67
- * def py_k_ants_arm():
- *     return k_ants_arm()
+/* "isisants.pyx":118
+ *     return status
+ * 
  * def py_k_ants_disarm():             # <<<<<<<<<<<<<<
- *     return k_ants_disarm()
- * def py_k_ants_deploy(antenna, override, timeout):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
 /* Python wrapper */
@@ -1632,31 +2759,79 @@ static PyObject *__pyx_pw_8isisants_11py_k_ants_disarm(PyObject *__pyx_self, CYT
 }
 
 static PyObject *__pyx_pf_8isisants_10py_k_ants_disarm(CYTHON_UNUSED PyObject *__pyx_self) {
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_disarm", 0);
 
-  /* "isisants.pyx":68
- *     return k_ants_arm()
+  /* "isisants.pyx":120
+ * def py_k_ants_disarm():
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_disarm()
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":121
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_disarm()             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_disarm();
+      }
+
+      /* "isisants.pyx":120
  * def py_k_ants_disarm():
- *     return k_ants_disarm()             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_disarm()
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":122
+ *     with nogil:
+ *         status = k_ants_disarm()
+ *     return status             # <<<<<<<<<<<<<<
+ * 
  * def py_k_ants_deploy(antenna, override, timeout):
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_disarm()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":67
- * def py_k_ants_arm():
- *     return k_ants_arm()
+  /* "isisants.pyx":118
+ *     return status
+ * 
  * def py_k_ants_disarm():             # <<<<<<<<<<<<<<
- *     return k_ants_disarm()
- * def py_k_ants_deploy(antenna, override, timeout):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
   /* function exit code */
@@ -1670,12 +2845,12 @@ static PyObject *__pyx_pf_8isisants_10py_k_ants_disarm(CYTHON_UNUSED PyObject *_
   return __pyx_r;
 }
 
-/* "isisants.pyx":69
- * def py_k_ants_disarm():
- *     return k_ants_disarm()
+/* "isisants.pyx":124
+ *     return status
+ * 
  * def py_k_ants_deploy(antenna, override, timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
- * def py_k_ants_auto_deploy(timeout):
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+ *     cdef bool c_override = <bool>override
  */
 
 /* Python wrapper */
@@ -1685,6 +2860,9 @@ static PyObject *__pyx_pw_8isisants_13py_k_ants_deploy(PyObject *__pyx_self, PyO
   PyObject *__pyx_v_antenna = 0;
   PyObject *__pyx_v_override = 0;
   PyObject *__pyx_v_timeout = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_deploy (wrapper)", 0);
@@ -1713,17 +2891,17 @@ static PyObject *__pyx_pw_8isisants_13py_k_ants_deploy(PyObject *__pyx_self, PyO
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_override)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_deploy", 1, 3, 3, 1); __PYX_ERR(0, 69, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("py_k_ants_deploy", 1, 3, 3, 1); __PYX_ERR(0, 124, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_timeout)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_deploy", 1, 3, 3, 2); __PYX_ERR(0, 69, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("py_k_ants_deploy", 1, 3, 3, 2); __PYX_ERR(0, 124, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_ants_deploy") < 0)) __PYX_ERR(0, 69, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_ants_deploy") < 0)) __PYX_ERR(0, 124, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -1738,7 +2916,7 @@ static PyObject *__pyx_pw_8isisants_13py_k_ants_deploy(PyObject *__pyx_self, PyO
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("py_k_ants_deploy", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 69, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("py_k_ants_deploy", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 124, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("isisants.py_k_ants_deploy", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1752,37 +2930,115 @@ static PyObject *__pyx_pw_8isisants_13py_k_ants_deploy(PyObject *__pyx_self, PyO
 }
 
 static PyObject *__pyx_pf_8isisants_12py_k_ants_deploy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna, PyObject *__pyx_v_override, PyObject *__pyx_v_timeout) {
+  KANTSAnt __pyx_v_c_antenna;
+  bool __pyx_v_c_override;
+  uint8_t __pyx_v_c_timeout;
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   KANTSAnt __pyx_t_1;
   bool __pyx_t_2;
   uint8_t __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_deploy", 0);
 
-  /* "isisants.pyx":70
- *     return k_ants_disarm()
+  /* "isisants.pyx":125
+ * 
+ * def py_k_ants_deploy(antenna, override, timeout):
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna             # <<<<<<<<<<<<<<
+ *     cdef bool c_override = <bool>override
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ */
+  __pyx_t_1 = ((KANTSAnt)__Pyx_PyInt_As_KANTSAnt(__pyx_v_antenna)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 125, __pyx_L1_error)
+  __pyx_v_c_antenna = ((KANTSAnt)__pyx_t_1);
+
+  /* "isisants.pyx":126
  * def py_k_ants_deploy(antenna, override, timeout):
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)             # <<<<<<<<<<<<<<
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+ *     cdef bool c_override = <bool>override             # <<<<<<<<<<<<<<
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ *     cdef KANTSStatus status
+ */
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_override); if (unlikely((__pyx_t_2 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 126, __pyx_L1_error)
+  __pyx_v_c_override = ((bool)__pyx_t_2);
+
+  /* "isisants.pyx":127
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+ *     cdef bool c_override = <bool>override
+ *     cdef uint8_t c_timeout = <uint8_t>timeout             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_uint8_t(__pyx_v_timeout); if (unlikely((__pyx_t_3 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_v_c_timeout = ((uint8_t)__pyx_t_3);
+
+  /* "isisants.pyx":129
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_deploy(c_antenna, c_override, c_timeout)
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":130
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_deploy(c_antenna, c_override, c_timeout)             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_deploy(__pyx_v_c_antenna, __pyx_v_c_override, __pyx_v_c_timeout);
+      }
+
+      /* "isisants.pyx":129
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_deploy(c_antenna, c_override, c_timeout)
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":131
+ *     with nogil:
+ *         status = k_ants_deploy(c_antenna, c_override, c_timeout)
+ *     return status             # <<<<<<<<<<<<<<
+ * 
  * def py_k_ants_auto_deploy(timeout):
- *     return k_ants_auto_deploy(<uint8_t>timeout)
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((KANTSAnt)__Pyx_PyInt_As_KANTSAnt(__pyx_v_antenna)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_override); if (unlikely((__pyx_t_2 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyInt_As_uint8_t(__pyx_v_timeout); if (unlikely((__pyx_t_3 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L1_error)
-  __pyx_t_4 = __Pyx_PyInt_From_KANTSStatus(k_ants_deploy(((KANTSAnt)__pyx_t_1), ((bool)__pyx_t_2), ((uint8_t)__pyx_t_3))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 131, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_r = __pyx_t_4;
   __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":69
- * def py_k_ants_disarm():
- *     return k_ants_disarm()
+  /* "isisants.pyx":124
+ *     return status
+ * 
  * def py_k_ants_deploy(antenna, override, timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
- * def py_k_ants_auto_deploy(timeout):
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+ *     cdef bool c_override = <bool>override
  */
 
   /* function exit code */
@@ -1796,12 +3052,12 @@ static PyObject *__pyx_pf_8isisants_12py_k_ants_deploy(CYTHON_UNUSED PyObject *_
   return __pyx_r;
 }
 
-/* "isisants.pyx":71
- * def py_k_ants_deploy(antenna, override, timeout):
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
+/* "isisants.pyx":133
+ *     return status
+ * 
  * def py_k_ants_auto_deploy(timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_auto_deploy(<uint8_t>timeout)
- * def py_k_ants_cancel_deploy():
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ *     cdef KANTSStatus status
  */
 
 /* Python wrapper */
@@ -1819,33 +3075,91 @@ static PyObject *__pyx_pw_8isisants_15py_k_ants_auto_deploy(PyObject *__pyx_self
 }
 
 static PyObject *__pyx_pf_8isisants_14py_k_ants_auto_deploy(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_timeout) {
+  uint8_t __pyx_v_c_timeout;
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   uint8_t __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_auto_deploy", 0);
 
-  /* "isisants.pyx":72
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
+  /* "isisants.pyx":134
+ * 
  * def py_k_ants_auto_deploy(timeout):
- *     return k_ants_auto_deploy(<uint8_t>timeout)             # <<<<<<<<<<<<<<
+ *     cdef uint8_t c_timeout = <uint8_t>timeout             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_uint8_t(__pyx_v_timeout); if (unlikely((__pyx_t_1 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_v_c_timeout = ((uint8_t)__pyx_t_1);
+
+  /* "isisants.pyx":136
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_auto_deploy(c_timeout)
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":137
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_auto_deploy(c_timeout)             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_auto_deploy(__pyx_v_c_timeout);
+      }
+
+      /* "isisants.pyx":136
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_auto_deploy(c_timeout)
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":138
+ *     with nogil:
+ *         status = k_ants_auto_deploy(c_timeout)
+ *     return status             # <<<<<<<<<<<<<<
+ * 
  * def py_k_ants_cancel_deploy():
- *     return k_ants_cancel_deploy()
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_As_uint8_t(__pyx_v_timeout); if (unlikely((__pyx_t_1 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 72, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyInt_From_KANTSStatus(k_ants_auto_deploy(((uint8_t)__pyx_t_1))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 72, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":71
- * def py_k_ants_deploy(antenna, override, timeout):
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
+  /* "isisants.pyx":133
+ *     return status
+ * 
  * def py_k_ants_auto_deploy(timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_auto_deploy(<uint8_t>timeout)
- * def py_k_ants_cancel_deploy():
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ *     cdef KANTSStatus status
  */
 
   /* function exit code */
@@ -1859,12 +3173,12 @@ static PyObject *__pyx_pf_8isisants_14py_k_ants_auto_deploy(CYTHON_UNUSED PyObje
   return __pyx_r;
 }
 
-/* "isisants.pyx":73
- * def py_k_ants_auto_deploy(timeout):
- *     return k_ants_auto_deploy(<uint8_t>timeout)
+/* "isisants.pyx":140
+ *     return status
+ * 
  * def py_k_ants_cancel_deploy():             # <<<<<<<<<<<<<<
- *     return k_ants_cancel_deploy()
- * def py_k_ants_get_deploy_status(int resp):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
 /* Python wrapper */
@@ -1882,31 +3196,79 @@ static PyObject *__pyx_pw_8isisants_17py_k_ants_cancel_deploy(PyObject *__pyx_se
 }
 
 static PyObject *__pyx_pf_8isisants_16py_k_ants_cancel_deploy(CYTHON_UNUSED PyObject *__pyx_self) {
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_cancel_deploy", 0);
 
-  /* "isisants.pyx":74
- *     return k_ants_auto_deploy(<uint8_t>timeout)
+  /* "isisants.pyx":142
+ * def py_k_ants_cancel_deploy():
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_cancel_deploy()
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":143
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_cancel_deploy()             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_cancel_deploy();
+      }
+
+      /* "isisants.pyx":142
  * def py_k_ants_cancel_deploy():
- *     return k_ants_cancel_deploy()             # <<<<<<<<<<<<<<
- * def py_k_ants_get_deploy_status(int resp):
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_cancel_deploy()
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":144
+ *     with nogil:
+ *         status = k_ants_cancel_deploy()
+ *     return status             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_ants_get_deploy_status():
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_cancel_deploy()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":73
- * def py_k_ants_auto_deploy(timeout):
- *     return k_ants_auto_deploy(<uint8_t>timeout)
+  /* "isisants.pyx":140
+ *     return status
+ * 
  * def py_k_ants_cancel_deploy():             # <<<<<<<<<<<<<<
- *     return k_ants_cancel_deploy()
- * def py_k_ants_get_deploy_status(int resp):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
   /* function exit code */
@@ -1920,64 +3282,122 @@ static PyObject *__pyx_pf_8isisants_16py_k_ants_cancel_deploy(CYTHON_UNUSED PyOb
   return __pyx_r;
 }
 
-/* "isisants.pyx":75
- * def py_k_ants_cancel_deploy():
- *     return k_ants_cancel_deploy()
- * def py_k_ants_get_deploy_status(int resp):             # <<<<<<<<<<<<<<
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
- * def py_k_ants_get_uptime( int uptime):
+/* "isisants.pyx":146
+ *     return status
+ * 
+ * def py_k_ants_get_deploy_status():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: deployment status register bits
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_19py_k_ants_get_deploy_status(PyObject *__pyx_self, PyObject *__pyx_arg_resp); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_19py_k_ants_get_deploy_status = {"py_k_ants_get_deploy_status", (PyCFunction)__pyx_pw_8isisants_19py_k_ants_get_deploy_status, METH_O, 0};
-static PyObject *__pyx_pw_8isisants_19py_k_ants_get_deploy_status(PyObject *__pyx_self, PyObject *__pyx_arg_resp) {
-  int __pyx_v_resp;
+static PyObject *__pyx_pw_8isisants_19py_k_ants_get_deploy_status(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_8isisants_18py_k_ants_get_deploy_status[] = "\n    :return: deployment status register bits\n    ";
+static PyMethodDef __pyx_mdef_8isisants_19py_k_ants_get_deploy_status = {"py_k_ants_get_deploy_status", (PyCFunction)__pyx_pw_8isisants_19py_k_ants_get_deploy_status, METH_NOARGS, __pyx_doc_8isisants_18py_k_ants_get_deploy_status};
+static PyObject *__pyx_pw_8isisants_19py_k_ants_get_deploy_status(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_get_deploy_status (wrapper)", 0);
-  assert(__pyx_arg_resp); {
-    __pyx_v_resp = __Pyx_PyInt_As_int(__pyx_arg_resp); if (unlikely((__pyx_v_resp == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 75, __pyx_L3_error)
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("isisants.py_k_ants_get_deploy_status", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_18py_k_ants_get_deploy_status(__pyx_self, ((int)__pyx_v_resp));
+  __pyx_r = __pyx_pf_8isisants_18py_k_ants_get_deploy_status(__pyx_self);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_18py_k_ants_get_deploy_status(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_resp) {
+static PyObject *__pyx_pf_8isisants_18py_k_ants_get_deploy_status(CYTHON_UNUSED PyObject *__pyx_self) {
+  uint16_t __pyx_v_resp;
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_get_deploy_status", 0);
 
-  /* "isisants.pyx":76
- *     return k_ants_cancel_deploy()
- * def py_k_ants_get_deploy_status(int resp):
- *     return k_ants_get_deploy_status(<uint16_t *>resp)             # <<<<<<<<<<<<<<
- * def py_k_ants_get_uptime( int uptime):
- *     return k_ants_get_uptime(<uint32_t *>uptime)
+  /* "isisants.pyx":150
+ *     :return: deployment status register bits
+ *     """
+ *     cdef uint16_t resp = 0             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:
+ */
+  __pyx_v_resp = 0;
+
+  /* "isisants.pyx":152
+ *     cdef uint16_t resp = 0
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_deploy_status(&resp)
+ *     check("k_ants_get_deploy_status", status)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":153
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_get_deploy_status(&resp)             # <<<<<<<<<<<<<<
+ *     check("k_ants_get_deploy_status", status)
+ *     return resp
+ */
+        __pyx_v_status = k_ants_get_deploy_status((&__pyx_v_resp));
+      }
+
+      /* "isisants.pyx":152
+ *     cdef uint16_t resp = 0
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_deploy_status(&resp)
+ *     check("k_ants_get_deploy_status", status)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":154
+ *     with nogil:
+ *         status = k_ants_get_deploy_status(&resp)
+ *     check("k_ants_get_deploy_status", status)             # <<<<<<<<<<<<<<
+ *     return resp
+ * 
+ */
+  __pyx_f_8isisants_check(__pyx_n_u_k_ants_get_deploy_status, __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 154, __pyx_L1_error)
+
+  /* "isisants.pyx":155
+ *         status = k_ants_get_deploy_status(&resp)
+ *     check("k_ants_get_deploy_status", status)
+ *     return resp             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_ants_get_uptime():
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_get_deploy_status(((uint16_t *)__pyx_v_resp))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_uint16_t(__pyx_v_resp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":75
- * def py_k_ants_cancel_deploy():
- *     return k_ants_cancel_deploy()
- * def py_k_ants_get_deploy_status(int resp):             # <<<<<<<<<<<<<<
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
- * def py_k_ants_get_uptime( int uptime):
+  /* "isisants.pyx":146
+ *     return status
+ * 
+ * def py_k_ants_get_deploy_status():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: deployment status register bits
  */
 
   /* function exit code */
@@ -1991,64 +3411,122 @@ static PyObject *__pyx_pf_8isisants_18py_k_ants_get_deploy_status(CYTHON_UNUSED
   return __pyx_r;
 }
 
-/* "isisants.pyx":77
- * def py_k_ants_get_deploy_status(int resp):
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
- * def py_k_ants_get_uptime( int uptime):             # <<<<<<<<<<<<<<
- *     return k_ants_get_uptime(<uint32_t *>uptime)
- * def py_k_ants_get_system_telemetry(telem):
+/* "isisants.pyx":157
+ *     return resp
+ * 
+ * def py_k_ants_get_uptime():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: controller uptime in seconds
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_21py_k_ants_get_uptime(PyObject *__pyx_self, PyObject *__pyx_arg_uptime); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_21py_k_ants_get_uptime = {"py_k_ants_get_uptime", (PyCFunction)__pyx_pw_8isisants_21py_k_ants_get_uptime, METH_O, 0};
-static PyObject *__pyx_pw_8isisants_21py_k_ants_get_uptime(PyObject *__pyx_self, PyObject *__pyx_arg_uptime) {
-  int __pyx_v_uptime;
+static PyObject *__pyx_pw_8isisants_21py_k_ants_get_uptime(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_8isisants_20py_k_ants_get_uptime[] = "\n    :return: controller uptime in seconds\n    ";
+static PyMethodDef __pyx_mdef_8isisants_21py_k_ants_get_uptime = {"py_k_ants_get_uptime", (PyCFunction)__pyx_pw_8isisants_21py_k_ants_get_uptime, METH_NOARGS, __pyx_doc_8isisants_20py_k_ants_get_uptime};
+static PyObject *__pyx_pw_8isisants_21py_k_ants_get_uptime(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_get_uptime (wrapper)", 0);
-  assert(__pyx_arg_uptime); {
-    __pyx_v_uptime = __Pyx_PyInt_As_int(__pyx_arg_uptime); if (unlikely((__pyx_v_uptime == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 77, __pyx_L3_error)
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("isisants.py_k_ants_get_uptime", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_20py_k_ants_get_uptime(__pyx_self, ((int)__pyx_v_uptime));
+  __pyx_r = __pyx_pf_8isisants_20py_k_ants_get_uptime(__pyx_self);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_20py_k_ants_get_uptime(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_uptime) {
+static PyObject *__pyx_pf_8isisants_20py_k_ants_get_uptime(CYTHON_UNUSED PyObject *__pyx_self) {
+  uint32_t __pyx_v_uptime;
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_get_uptime", 0);
 
-  /* "isisants.pyx":78
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
- * def py_k_ants_get_uptime( int uptime):
- *     return k_ants_get_uptime(<uint32_t *>uptime)             # <<<<<<<<<<<<<<
- * def py_k_ants_get_system_telemetry(telem):
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
+  /* "isisants.pyx":161
+ *     :return: controller uptime in seconds
+ *     """
+ *     cdef uint32_t uptime = 0             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:
+ */
+  __pyx_v_uptime = 0;
+
+  /* "isisants.pyx":163
+ *     cdef uint32_t uptime = 0
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_uptime(&uptime)
+ *     check("k_ants_get_uptime", status)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":164
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_get_uptime(&uptime)             # <<<<<<<<<<<<<<
+ *     check("k_ants_get_uptime", status)
+ *     return uptime
+ */
+        __pyx_v_status = k_ants_get_uptime((&__pyx_v_uptime));
+      }
+
+      /* "isisants.pyx":163
+ *     cdef uint32_t uptime = 0
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_uptime(&uptime)
+ *     check("k_ants_get_uptime", status)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":165
+ *     with nogil:
+ *         status = k_ants_get_uptime(&uptime)
+ *     check("k_ants_get_uptime", status)             # <<<<<<<<<<<<<<
+ *     return uptime
+ * 
+ */
+  __pyx_f_8isisants_check(__pyx_n_u_k_ants_get_uptime, __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 165, __pyx_L1_error)
+
+  /* "isisants.pyx":166
+ *         status = k_ants_get_uptime(&uptime)
+ *     check("k_ants_get_uptime", status)
+ *     return uptime             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_ants_get_system_telemetry():
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_get_uptime(((uint32_t *)__pyx_v_uptime))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_uint32_t(__pyx_v_uptime); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":77
- * def py_k_ants_get_deploy_status(int resp):
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
- * def py_k_ants_get_uptime( int uptime):             # <<<<<<<<<<<<<<
- *     return k_ants_get_uptime(<uint32_t *>uptime)
- * def py_k_ants_get_system_telemetry(telem):
+  /* "isisants.pyx":157
+ *     return resp
+ * 
+ * def py_k_ants_get_uptime():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: controller uptime in seconds
  */
 
   /* function exit code */
@@ -2062,59 +3540,132 @@ static PyObject *__pyx_pf_8isisants_20py_k_ants_get_uptime(CYTHON_UNUSED PyObjec
   return __pyx_r;
 }
 
-/* "isisants.pyx":79
- * def py_k_ants_get_uptime( int uptime):
- *     return k_ants_get_uptime(<uint32_t *>uptime)
- * def py_k_ants_get_system_telemetry(telem):             # <<<<<<<<<<<<<<
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
- * def py_k_ants_get_activation_count(antenna, count):
+/* "isisants.pyx":168
+ *     return uptime
+ * 
+ * def py_k_ants_get_system_telemetry():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: {"raw_temp", "deploy_status", "uptime"}
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_23py_k_ants_get_system_telemetry(PyObject *__pyx_self, PyObject *__pyx_v_telem); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_23py_k_ants_get_system_telemetry = {"py_k_ants_get_system_telemetry", (PyCFunction)__pyx_pw_8isisants_23py_k_ants_get_system_telemetry, METH_O, 0};
-static PyObject *__pyx_pw_8isisants_23py_k_ants_get_system_telemetry(PyObject *__pyx_self, PyObject *__pyx_v_telem) {
+static PyObject *__pyx_pw_8isisants_23py_k_ants_get_system_telemetry(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_8isisants_22py_k_ants_get_system_telemetry[] = "\n    :return: {\"raw_temp\", \"deploy_status\", \"uptime\"}\n    ";
+static PyMethodDef __pyx_mdef_8isisants_23py_k_ants_get_system_telemetry = {"py_k_ants_get_system_telemetry", (PyCFunction)__pyx_pw_8isisants_23py_k_ants_get_system_telemetry, METH_NOARGS, __pyx_doc_8isisants_22py_k_ants_get_system_telemetry};
+static PyObject *__pyx_pw_8isisants_23py_k_ants_get_system_telemetry(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_get_system_telemetry (wrapper)", 0);
-  __pyx_r = __pyx_pf_8isisants_22py_k_ants_get_system_telemetry(__pyx_self, ((PyObject *)__pyx_v_telem));
+  __pyx_r = __pyx_pf_8isisants_22py_k_ants_get_system_telemetry(__pyx_self);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_22py_k_ants_get_system_telemetry(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_telem) {
+static PyObject *__pyx_pf_8isisants_22py_k_ants_get_system_telemetry(CYTHON_UNUSED PyObject *__pyx_self) {
+  ants_telemetry __pyx_v_telem;
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_get_system_telemetry", 0);
 
-  /* "isisants.pyx":80
- *     return k_ants_get_uptime(<uint32_t *>uptime)
- * def py_k_ants_get_system_telemetry(telem):
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)             # <<<<<<<<<<<<<<
- * def py_k_ants_get_activation_count(antenna, count):
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
+  /* "isisants.pyx":174
+ *     cdef ants_telemetry telem
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_system_telemetry(&telem)
+ *     check("k_ants_get_system_telemetry", status)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":175
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_get_system_telemetry(&telem)             # <<<<<<<<<<<<<<
+ *     check("k_ants_get_system_telemetry", status)
+ *     return {"raw_temp": telem.raw_temp, "deploy_status": telem.deploy_status, "uptime": telem.uptime}
+ */
+        __pyx_v_status = k_ants_get_system_telemetry((&__pyx_v_telem));
+      }
+
+      /* "isisants.pyx":174
+ *     cdef ants_telemetry telem
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_system_telemetry(&telem)
+ *     check("k_ants_get_system_telemetry", status)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":176
+ *     with nogil:
+ *         status = k_ants_get_system_telemetry(&telem)
+ *     check("k_ants_get_system_telemetry", status)             # <<<<<<<<<<<<<<
+ *     return {"raw_temp": telem.raw_temp, "deploy_status": telem.deploy_status, "uptime": telem.uptime}
+ * 
+ */
+  __pyx_f_8isisants_check(__pyx_n_u_k_ants_get_system_telemetry, __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 176, __pyx_L1_error)
+
+  /* "isisants.pyx":177
+ *         status = k_ants_get_system_telemetry(&telem)
+ *     check("k_ants_get_system_telemetry", status)
+ *     return {"raw_temp": telem.raw_temp, "deploy_status": telem.deploy_status, "uptime": telem.uptime}             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_ants_get_activation_count(antenna):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_get_system_telemetry(((ants_telemetry *)__pyx_v_telem))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 177, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_uint16_t(__pyx_v_telem.raw_temp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_raw_temp, __pyx_t_2) < 0) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_uint16_t(__pyx_v_telem.deploy_status); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_deploy_status, __pyx_t_2) < 0) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_uint32_t(__pyx_v_telem.uptime); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_uptime, __pyx_t_2) < 0) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":79
- * def py_k_ants_get_uptime( int uptime):
- *     return k_ants_get_uptime(<uint32_t *>uptime)
- * def py_k_ants_get_system_telemetry(telem):             # <<<<<<<<<<<<<<
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
- * def py_k_ants_get_activation_count(antenna, count):
+  /* "isisants.pyx":168
+ *     return uptime
+ * 
+ * def py_k_ants_get_system_telemetry():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: {"raw_temp", "deploy_status", "uptime"}
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_AddTraceback("isisants.py_k_ants_get_system_telemetry", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -2123,111 +3674,139 @@ static PyObject *__pyx_pf_8isisants_22py_k_ants_get_system_telemetry(CYTHON_UNUS
   return __pyx_r;
 }
 
-/* "isisants.pyx":81
- * def py_k_ants_get_system_telemetry(telem):
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
- * def py_k_ants_get_activation_count(antenna, count):             # <<<<<<<<<<<<<<
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
- * def py_k_ants_get_activation_time(antenna, int time):
+/* "isisants.pyx":179
+ *     return {"raw_temp": telem.raw_temp, "deploy_status": telem.deploy_status, "uptime": telem.uptime}
+ * 
+ * def py_k_ants_get_activation_count(antenna):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: number of deployment attempts made on antenna
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_25py_k_ants_get_activation_count(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_25py_k_ants_get_activation_count = {"py_k_ants_get_activation_count", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_25py_k_ants_get_activation_count, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_8isisants_25py_k_ants_get_activation_count(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_antenna = 0;
-  PyObject *__pyx_v_count = 0;
+static PyObject *__pyx_pw_8isisants_25py_k_ants_get_activation_count(PyObject *__pyx_self, PyObject *__pyx_v_antenna); /*proto*/
+static char __pyx_doc_8isisants_24py_k_ants_get_activation_count[] = "\n    :return: number of deployment attempts made on antenna\n    ";
+static PyMethodDef __pyx_mdef_8isisants_25py_k_ants_get_activation_count = {"py_k_ants_get_activation_count", (PyCFunction)__pyx_pw_8isisants_25py_k_ants_get_activation_count, METH_O, __pyx_doc_8isisants_24py_k_ants_get_activation_count};
+static PyObject *__pyx_pw_8isisants_25py_k_ants_get_activation_count(PyObject *__pyx_self, PyObject *__pyx_v_antenna) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_get_activation_count (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_antenna,&__pyx_n_s_count,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_antenna)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_count)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_get_activation_count", 1, 2, 2, 1); __PYX_ERR(0, 81, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_ants_get_activation_count") < 0)) __PYX_ERR(0, 81, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_antenna = values[0];
-    __pyx_v_count = values[1];
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("py_k_ants_get_activation_count", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 81, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("isisants.py_k_ants_get_activation_count", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_24py_k_ants_get_activation_count(__pyx_self, __pyx_v_antenna, __pyx_v_count);
+  __pyx_r = __pyx_pf_8isisants_24py_k_ants_get_activation_count(__pyx_self, ((PyObject *)__pyx_v_antenna));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_24py_k_ants_get_activation_count(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna, PyObject *__pyx_v_count) {
+static PyObject *__pyx_pf_8isisants_24py_k_ants_get_activation_count(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna) {
+  KANTSAnt __pyx_v_c_antenna;
+  uint8_t __pyx_v_count;
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   KANTSAnt __pyx_t_1;
-  uint8_t *__pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_get_activation_count", 0);
 
-  /* "isisants.pyx":82
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
- * def py_k_ants_get_activation_count(antenna, count):
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)             # <<<<<<<<<<<<<<
- * def py_k_ants_get_activation_time(antenna, int time):
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
+  /* "isisants.pyx":183
+ *     :return: number of deployment attempts made on antenna
+ *     """
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna             # <<<<<<<<<<<<<<
+ *     cdef uint8_t count = 0
+ *     cdef KANTSStatus status
+ */
+  __pyx_t_1 = ((KANTSAnt)__Pyx_PyInt_As_KANTSAnt(__pyx_v_antenna)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 183, __pyx_L1_error)
+  __pyx_v_c_antenna = ((KANTSAnt)__pyx_t_1);
+
+  /* "isisants.pyx":184
+ *     """
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+ *     cdef uint8_t count = 0             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:
+ */
+  __pyx_v_count = 0;
+
+  /* "isisants.pyx":186
+ *     cdef uint8_t count = 0
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_activation_count(c_antenna, &count)
+ *     check("k_ants_get_activation_count", status)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":187
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_get_activation_count(c_antenna, &count)             # <<<<<<<<<<<<<<
+ *     check("k_ants_get_activation_count", status)
+ *     return count
+ */
+        __pyx_v_status = k_ants_get_activation_count(__pyx_v_c_antenna, (&__pyx_v_count));
+      }
+
+      /* "isisants.pyx":186
+ *     cdef uint8_t count = 0
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_activation_count(c_antenna, &count)
+ *     check("k_ants_get_activation_count", status)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":188
+ *     with nogil:
+ *         status = k_ants_get_activation_count(c_antenna, &count)
+ *     check("k_ants_get_activation_count", status)             # <<<<<<<<<<<<<<
+ *     return count
+ * 
+ */
+  __pyx_f_8isisants_check(__pyx_n_u_k_ants_get_activation_count, __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 188, __pyx_L1_error)
+
+  /* "isisants.pyx":189
+ *         status = k_ants_get_activation_count(c_antenna, &count)
+ *     check("k_ants_get_activation_count", status)
+ *     return count             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_ants_get_activation_time(antenna):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((KANTSAnt)__Pyx_PyInt_As_KANTSAnt(__pyx_v_antenna)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 82, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyObject_AsWritableUString(__pyx_v_count); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 82, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyInt_From_KANTSStatus(k_ants_get_activation_count(((KANTSAnt)__pyx_t_1), ((uint8_t *)__pyx_t_2))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_uint8_t(__pyx_v_count); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":81
- * def py_k_ants_get_system_telemetry(telem):
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
- * def py_k_ants_get_activation_count(antenna, count):             # <<<<<<<<<<<<<<
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
- * def py_k_ants_get_activation_time(antenna, int time):
+  /* "isisants.pyx":179
+ *     return {"raw_temp": telem.raw_temp, "deploy_status": telem.deploy_status, "uptime": telem.uptime}
+ * 
+ * def py_k_ants_get_activation_count(antenna):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: number of deployment attempts made on antenna
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_AddTraceback("isisants.py_k_ants_get_activation_count", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -2236,33 +3815,175 @@ static PyObject *__pyx_pf_8isisants_24py_k_ants_get_activation_count(CYTHON_UNUS
   return __pyx_r;
 }
 
-/* "isisants.pyx":83
- * def py_k_ants_get_activation_count(antenna, count):
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
- * def py_k_ants_get_activation_time(antenna, int time):             # <<<<<<<<<<<<<<
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
- * def py_k_ants_watchdog_kick():
+/* "isisants.pyx":191
+ *     return count
+ * 
+ * def py_k_ants_get_activation_time(antenna):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: cumulative deployment time of antenna in seconds
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_27py_k_ants_get_activation_time(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_27py_k_ants_get_activation_time = {"py_k_ants_get_activation_time", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_27py_k_ants_get_activation_time, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_8isisants_27py_k_ants_get_activation_time(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_antenna = 0;
-  int __pyx_v_time;
+static PyObject *__pyx_pw_8isisants_27py_k_ants_get_activation_time(PyObject *__pyx_self, PyObject *__pyx_v_antenna); /*proto*/
+static char __pyx_doc_8isisants_26py_k_ants_get_activation_time[] = "\n    :return: cumulative deployment time of antenna in seconds\n    ";
+static PyMethodDef __pyx_mdef_8isisants_27py_k_ants_get_activation_time = {"py_k_ants_get_activation_time", (PyCFunction)__pyx_pw_8isisants_27py_k_ants_get_activation_time, METH_O, __pyx_doc_8isisants_26py_k_ants_get_activation_time};
+static PyObject *__pyx_pw_8isisants_27py_k_ants_get_activation_time(PyObject *__pyx_self, PyObject *__pyx_v_antenna) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_get_activation_time (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_antenna,&__pyx_n_s_time,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+  __pyx_r = __pyx_pf_8isisants_26py_k_ants_get_activation_time(__pyx_self, ((PyObject *)__pyx_v_antenna));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8isisants_26py_k_ants_get_activation_time(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna) {
+  KANTSAnt __pyx_v_c_antenna;
+  uint16_t __pyx_v_time;
+  KANTSStatus __pyx_v_status;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  KANTSAnt __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("py_k_ants_get_activation_time", 0);
+
+  /* "isisants.pyx":195
+ *     :return: cumulative deployment time of antenna in seconds
+ *     """
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna             # <<<<<<<<<<<<<<
+ *     cdef uint16_t time = 0
+ *     cdef KANTSStatus status
+ */
+  __pyx_t_1 = ((KANTSAnt)__Pyx_PyInt_As_KANTSAnt(__pyx_v_antenna)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_v_c_antenna = ((KANTSAnt)__pyx_t_1);
+
+  /* "isisants.pyx":196
+ *     """
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+ *     cdef uint16_t time = 0             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:
+ */
+  __pyx_v_time = 0;
+
+  /* "isisants.pyx":198
+ *     cdef uint16_t time = 0
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_activation_time(c_antenna, &time)
+ *     check("k_ants_get_activation_time", status)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":199
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_get_activation_time(c_antenna, &time)             # <<<<<<<<<<<<<<
+ *     check("k_ants_get_activation_time", status)
+ *     return time
+ */
+        __pyx_v_status = k_ants_get_activation_time(__pyx_v_c_antenna, (&__pyx_v_time));
+      }
+
+      /* "isisants.pyx":198
+ *     cdef uint16_t time = 0
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_activation_time(c_antenna, &time)
+ *     check("k_ants_get_activation_time", status)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":200
+ *     with nogil:
+ *         status = k_ants_get_activation_time(c_antenna, &time)
+ *     check("k_ants_get_activation_time", status)             # <<<<<<<<<<<<<<
+ *     return time
+ * 
+ */
+  __pyx_f_8isisants_check(__pyx_n_u_k_ants_get_activation_time, __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 200, __pyx_L1_error)
+
+  /* "isisants.pyx":201
+ *         status = k_ants_get_activation_time(c_antenna, &time)
+ *     check("k_ants_get_activation_time", status)
+ *     return time             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_ants_read_all_telemetry(uint8_t ant_count=ANT_COUNT):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyInt_From_uint16_t(__pyx_v_time); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 201, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "isisants.pyx":191
+ *     return count
+ * 
+ * def py_k_ants_get_activation_time(antenna):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: cumulative deployment time of antenna in seconds
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("isisants.py_k_ants_get_activation_time", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isisants.pyx":203
+ *     return time
+ * 
+ * def py_k_ants_read_all_telemetry(uint8_t ant_count=ANT_COUNT):             # <<<<<<<<<<<<<<
+ *     """
+ *     Reads the system telemetry and every antenna's activation count and time in a single GIL release
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8isisants_29py_k_ants_read_all_telemetry(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8isisants_28py_k_ants_read_all_telemetry[] = "\n    Reads the system telemetry and every antenna's activation count and time in a single GIL release\n    :return: {\"raw_temp\", \"deploy_status\", \"uptime\", \"activation_counts\": [...], \"activation_times\": [...]}\n    ";
+static PyMethodDef __pyx_mdef_8isisants_29py_k_ants_read_all_telemetry = {"py_k_ants_read_all_telemetry", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_29py_k_ants_read_all_telemetry, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8isisants_28py_k_ants_read_all_telemetry};
+static PyObject *__pyx_pw_8isisants_29py_k_ants_read_all_telemetry(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  uint8_t __pyx_v_ant_count;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("py_k_ants_read_all_telemetry (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ant_count,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
@@ -2270,76 +3991,462 @@ static PyObject *__pyx_pw_8isisants_27py_k_ants_get_activation_time(PyObject *__
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_antenna)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_time)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_get_activation_time", 1, 2, 2, 1); __PYX_ERR(0, 83, __pyx_L3_error)
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ant_count);
+          if (value) { values[0] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_ants_get_activation_time") < 0)) __PYX_ERR(0, 83, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_ants_read_all_telemetry") < 0)) __PYX_ERR(0, 203, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_ant_count = __Pyx_PyInt_As_uint8_t(values[0]); if (unlikely((__pyx_v_ant_count == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 203, __pyx_L3_error)
+    } else {
+      __pyx_v_ant_count = __pyx_k_;
     }
-    __pyx_v_antenna = values[0];
-    __pyx_v_time = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_time == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("py_k_ants_get_activation_time", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 83, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("py_k_ants_read_all_telemetry", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 203, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("isisants.py_k_ants_get_activation_time", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("isisants.py_k_ants_read_all_telemetry", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_26py_k_ants_get_activation_time(__pyx_self, __pyx_v_antenna, __pyx_v_time);
+  __pyx_r = __pyx_pf_8isisants_28py_k_ants_read_all_telemetry(__pyx_self, __pyx_v_ant_count);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_26py_k_ants_get_activation_time(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_antenna, int __pyx_v_time) {
+static PyObject *__pyx_pf_8isisants_28py_k_ants_read_all_telemetry(CYTHON_UNUSED PyObject *__pyx_self, uint8_t __pyx_v_ant_count) {
+  ants_telemetry __pyx_v_telem;
+  uint8_t __pyx_v_counts[4];
+  uint16_t __pyx_v_times[4];
+  KANTSStatus __pyx_v_status;
+  uint8_t __pyx_v_i;
+  int __pyx_v_failed;
+  uint8_t __pyx_7genexpr__pyx_v_i;
+  uint8_t __pyx_8genexpr1__pyx_v_i;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  KANTSAnt __pyx_t_1;
+  int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("py_k_ants_get_activation_time", 0);
+  uint8_t __pyx_t_3;
+  uint8_t __pyx_t_4;
+  uint8_t __pyx_t_5;
+  long __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("py_k_ants_read_all_telemetry", 0);
+
+  /* "isisants.pyx":213
+ *     cdef KANTSStatus status
+ *     cdef uint8_t i
+ *     cdef int failed = -1  # index of the failing call: 0 telemetry, 1 + 2 * antenna count, 2 + 2 * antenna time             # <<<<<<<<<<<<<<
+ *     if ant_count > 4:
+ *         raise ValueError("at most 4 antennas")
+ */
+  __pyx_v_failed = -1;
+
+  /* "isisants.pyx":214
+ *     cdef uint8_t i
+ *     cdef int failed = -1  # index of the failing call: 0 telemetry, 1 + 2 * antenna count, 2 + 2 * antenna time
+ *     if ant_count > 4:             # <<<<<<<<<<<<<<
+ *         raise ValueError("at most 4 antennas")
+ *     with nogil:
+ */
+  __pyx_t_1 = ((__pyx_v_ant_count > 4) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "isisants.pyx":215
+ *     cdef int failed = -1  # index of the failing call: 0 telemetry, 1 + 2 * antenna count, 2 + 2 * antenna time
+ *     if ant_count > 4:
+ *         raise ValueError("at most 4 antennas")             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         status = k_ants_get_system_telemetry(&telem)
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 215, __pyx_L1_error)
+
+    /* "isisants.pyx":214
+ *     cdef uint8_t i
+ *     cdef int failed = -1  # index of the failing call: 0 telemetry, 1 + 2 * antenna count, 2 + 2 * antenna time
+ *     if ant_count > 4:             # <<<<<<<<<<<<<<
+ *         raise ValueError("at most 4 antennas")
+ *     with nogil:
+ */
+  }
 
-  /* "isisants.pyx":84
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
- * def py_k_ants_get_activation_time(antenna, int time):
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)             # <<<<<<<<<<<<<<
- * def py_k_ants_watchdog_kick():
- *     return k_ants_watchdog_kick()
+  /* "isisants.pyx":216
+ *     if ant_count > 4:
+ *         raise ValueError("at most 4 antennas")
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_system_telemetry(&telem)
+ *         if status != ANTS_OK:
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":217
+ *         raise ValueError("at most 4 antennas")
+ *     with nogil:
+ *         status = k_ants_get_system_telemetry(&telem)             # <<<<<<<<<<<<<<
+ *         if status != ANTS_OK:
+ *             failed = 0
+ */
+        __pyx_v_status = k_ants_get_system_telemetry((&__pyx_v_telem));
+
+        /* "isisants.pyx":218
+ *     with nogil:
+ *         status = k_ants_get_system_telemetry(&telem)
+ *         if status != ANTS_OK:             # <<<<<<<<<<<<<<
+ *             failed = 0
+ *         else:
+ */
+        __pyx_t_1 = ((__pyx_v_status != ANTS_OK) != 0);
+        if (__pyx_t_1) {
+
+          /* "isisants.pyx":219
+ *         status = k_ants_get_system_telemetry(&telem)
+ *         if status != ANTS_OK:
+ *             failed = 0             # <<<<<<<<<<<<<<
+ *         else:
+ *             for i in range(ant_count):
+ */
+          __pyx_v_failed = 0;
+
+          /* "isisants.pyx":218
+ *     with nogil:
+ *         status = k_ants_get_system_telemetry(&telem)
+ *         if status != ANTS_OK:             # <<<<<<<<<<<<<<
+ *             failed = 0
+ *         else:
+ */
+          goto __pyx_L7;
+        }
+
+        /* "isisants.pyx":221
+ *             failed = 0
+ *         else:
+ *             for i in range(ant_count):             # <<<<<<<<<<<<<<
+ *                 status = k_ants_get_activation_count(<KANTSAnt>i, &counts[i])
+ *                 if status != ANTS_OK:
+ */
+        /*else*/ {
+          __pyx_t_3 = __pyx_v_ant_count;
+          __pyx_t_4 = __pyx_t_3;
+          for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+            __pyx_v_i = __pyx_t_5;
+
+            /* "isisants.pyx":222
+ *         else:
+ *             for i in range(ant_count):
+ *                 status = k_ants_get_activation_count(<KANTSAnt>i, &counts[i])             # <<<<<<<<<<<<<<
+ *                 if status != ANTS_OK:
+ *                     failed = 1 + 2 * i
+ */
+            __pyx_v_status = k_ants_get_activation_count(((KANTSAnt)__pyx_v_i), (&(__pyx_v_counts[__pyx_v_i])));
+
+            /* "isisants.pyx":223
+ *             for i in range(ant_count):
+ *                 status = k_ants_get_activation_count(<KANTSAnt>i, &counts[i])
+ *                 if status != ANTS_OK:             # <<<<<<<<<<<<<<
+ *                     failed = 1 + 2 * i
+ *                     break
+ */
+            __pyx_t_1 = ((__pyx_v_status != ANTS_OK) != 0);
+            if (__pyx_t_1) {
+
+              /* "isisants.pyx":224
+ *                 status = k_ants_get_activation_count(<KANTSAnt>i, &counts[i])
+ *                 if status != ANTS_OK:
+ *                     failed = 1 + 2 * i             # <<<<<<<<<<<<<<
+ *                     break
+ *                 status = k_ants_get_activation_time(<KANTSAnt>i, &times[i])
+ */
+              __pyx_v_failed = (1 + (2 * __pyx_v_i));
+
+              /* "isisants.pyx":225
+ *                 if status != ANTS_OK:
+ *                     failed = 1 + 2 * i
+ *                     break             # <<<<<<<<<<<<<<
+ *                 status = k_ants_get_activation_time(<KANTSAnt>i, &times[i])
+ *                 if status != ANTS_OK:
+ */
+              goto __pyx_L9_break;
+
+              /* "isisants.pyx":223
+ *             for i in range(ant_count):
+ *                 status = k_ants_get_activation_count(<KANTSAnt>i, &counts[i])
+ *                 if status != ANTS_OK:             # <<<<<<<<<<<<<<
+ *                     failed = 1 + 2 * i
+ *                     break
+ */
+            }
+
+            /* "isisants.pyx":226
+ *                     failed = 1 + 2 * i
+ *                     break
+ *                 status = k_ants_get_activation_time(<KANTSAnt>i, &times[i])             # <<<<<<<<<<<<<<
+ *                 if status != ANTS_OK:
+ *                     failed = 2 + 2 * i
+ */
+            __pyx_v_status = k_ants_get_activation_time(((KANTSAnt)__pyx_v_i), (&(__pyx_v_times[__pyx_v_i])));
+
+            /* "isisants.pyx":227
+ *                     break
+ *                 status = k_ants_get_activation_time(<KANTSAnt>i, &times[i])
+ *                 if status != ANTS_OK:             # <<<<<<<<<<<<<<
+ *                     failed = 2 + 2 * i
+ *                     break
+ */
+            __pyx_t_1 = ((__pyx_v_status != ANTS_OK) != 0);
+            if (__pyx_t_1) {
+
+              /* "isisants.pyx":228
+ *                 status = k_ants_get_activation_time(<KANTSAnt>i, &times[i])
+ *                 if status != ANTS_OK:
+ *                     failed = 2 + 2 * i             # <<<<<<<<<<<<<<
+ *                     break
+ *     if failed == 0:
+ */
+              __pyx_v_failed = (2 + (2 * __pyx_v_i));
+
+              /* "isisants.pyx":229
+ *                 if status != ANTS_OK:
+ *                     failed = 2 + 2 * i
+ *                     break             # <<<<<<<<<<<<<<
+ *     if failed == 0:
+ *         check("k_ants_get_system_telemetry", status)
+ */
+              goto __pyx_L9_break;
+
+              /* "isisants.pyx":227
+ *                     break
+ *                 status = k_ants_get_activation_time(<KANTSAnt>i, &times[i])
+ *                 if status != ANTS_OK:             # <<<<<<<<<<<<<<
+ *                     failed = 2 + 2 * i
+ *                     break
+ */
+            }
+          }
+          __pyx_L9_break:;
+        }
+        __pyx_L7:;
+      }
+
+      /* "isisants.pyx":216
+ *     if ant_count > 4:
+ *         raise ValueError("at most 4 antennas")
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_get_system_telemetry(&telem)
+ *         if status != ANTS_OK:
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L6;
+        }
+        __pyx_L6:;
+      }
+  }
+
+  /* "isisants.pyx":230
+ *                     failed = 2 + 2 * i
+ *                     break
+ *     if failed == 0:             # <<<<<<<<<<<<<<
+ *         check("k_ants_get_system_telemetry", status)
+ *     elif failed > 0:
+ */
+  __pyx_t_1 = ((__pyx_v_failed == 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "isisants.pyx":231
+ *                     break
+ *     if failed == 0:
+ *         check("k_ants_get_system_telemetry", status)             # <<<<<<<<<<<<<<
+ *     elif failed > 0:
+ *         check(("k_ants_get_activation_count", "k_ants_get_activation_time")[(failed - 1) % 2], status)
+ */
+    __pyx_f_8isisants_check(__pyx_n_u_k_ants_get_system_telemetry, __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 231, __pyx_L1_error)
+
+    /* "isisants.pyx":230
+ *                     failed = 2 + 2 * i
+ *                     break
+ *     if failed == 0:             # <<<<<<<<<<<<<<
+ *         check("k_ants_get_system_telemetry", status)
+ *     elif failed > 0:
+ */
+    goto __pyx_L12;
+  }
+
+  /* "isisants.pyx":232
+ *     if failed == 0:
+ *         check("k_ants_get_system_telemetry", status)
+ *     elif failed > 0:             # <<<<<<<<<<<<<<
+ *         check(("k_ants_get_activation_count", "k_ants_get_activation_time")[(failed - 1) % 2], status)
+ *     return {
+ */
+  __pyx_t_1 = ((__pyx_v_failed > 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "isisants.pyx":233
+ *         check("k_ants_get_system_telemetry", status)
+ *     elif failed > 0:
+ *         check(("k_ants_get_activation_count", "k_ants_get_activation_time")[(failed - 1) % 2], status)             # <<<<<<<<<<<<<<
+ *     return {
+ *         "raw_temp": telem.raw_temp,
+ */
+    __pyx_t_6 = __Pyx_mod_long((__pyx_v_failed - 1), 2);
+    __pyx_t_2 = __Pyx_GetItemInt_Tuple(__pyx_tuple__3, __pyx_t_6, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 233, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_f_8isisants_check(((PyObject*)__pyx_t_2), __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 233, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "isisants.pyx":232
+ *     if failed == 0:
+ *         check("k_ants_get_system_telemetry", status)
+ *     elif failed > 0:             # <<<<<<<<<<<<<<
+ *         check(("k_ants_get_activation_count", "k_ants_get_activation_time")[(failed - 1) % 2], status)
+ *     return {
+ */
+  }
+  __pyx_L12:;
+
+  /* "isisants.pyx":234
+ *     elif failed > 0:
+ *         check(("k_ants_get_activation_count", "k_ants_get_activation_time")[(failed - 1) % 2], status)
+ *     return {             # <<<<<<<<<<<<<<
+ *         "raw_temp": telem.raw_temp,
+ *         "deploy_status": telem.deploy_status,
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((KANTSAnt)__Pyx_PyInt_As_KANTSAnt(__pyx_v_antenna)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyInt_From_KANTSStatus(k_ants_get_activation_time(((KANTSAnt)__pyx_t_1), ((uint16_t *)__pyx_v_time))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
+
+  /* "isisants.pyx":235
+ *         check(("k_ants_get_activation_count", "k_ants_get_activation_time")[(failed - 1) % 2], status)
+ *     return {
+ *         "raw_temp": telem.raw_temp,             # <<<<<<<<<<<<<<
+ *         "deploy_status": telem.deploy_status,
+ *         "uptime": telem.uptime,
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = __Pyx_PyInt_From_uint16_t(__pyx_v_telem.raw_temp); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_raw_temp, __pyx_t_7) < 0) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "isisants.pyx":236
+ *     return {
+ *         "raw_temp": telem.raw_temp,
+ *         "deploy_status": telem.deploy_status,             # <<<<<<<<<<<<<<
+ *         "uptime": telem.uptime,
+ *         "activation_counts": [counts[i] for i in range(ant_count)],
+ */
+  __pyx_t_7 = __Pyx_PyInt_From_uint16_t(__pyx_v_telem.deploy_status); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_deploy_status, __pyx_t_7) < 0) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "isisants.pyx":237
+ *         "raw_temp": telem.raw_temp,
+ *         "deploy_status": telem.deploy_status,
+ *         "uptime": telem.uptime,             # <<<<<<<<<<<<<<
+ *         "activation_counts": [counts[i] for i in range(ant_count)],
+ *         "activation_times": [times[i] for i in range(ant_count)],
+ */
+  __pyx_t_7 = __Pyx_PyInt_From_uint32_t(__pyx_v_telem.uptime); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 237, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_uptime, __pyx_t_7) < 0) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  { /* enter inner scope */
+
+    /* "isisants.pyx":238
+ *         "deploy_status": telem.deploy_status,
+ *         "uptime": telem.uptime,
+ *         "activation_counts": [counts[i] for i in range(ant_count)],             # <<<<<<<<<<<<<<
+ *         "activation_times": [times[i] for i in range(ant_count)],
+ *     }
+ */
+    __pyx_t_7 = PyList_New(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 238, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_3 = __pyx_v_ant_count;
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_7genexpr__pyx_v_i = __pyx_t_5;
+      __pyx_t_8 = __Pyx_PyInt_From_uint8_t((__pyx_v_counts[__pyx_7genexpr__pyx_v_i])); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 238, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_7, (PyObject*)__pyx_t_8))) __PYX_ERR(0, 238, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+  } /* exit inner scope */
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_activation_counts, __pyx_t_7) < 0) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  { /* enter inner scope */
+
+    /* "isisants.pyx":239
+ *         "uptime": telem.uptime,
+ *         "activation_counts": [counts[i] for i in range(ant_count)],
+ *         "activation_times": [times[i] for i in range(ant_count)],             # <<<<<<<<<<<<<<
+ *     }
+ * 
+ */
+    __pyx_t_7 = PyList_New(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 239, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_3 = __pyx_v_ant_count;
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_8genexpr1__pyx_v_i = __pyx_t_5;
+      __pyx_t_8 = __Pyx_PyInt_From_uint16_t((__pyx_v_times[__pyx_8genexpr1__pyx_v_i])); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 239, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_7, (PyObject*)__pyx_t_8))) __PYX_ERR(0, 239, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+  } /* exit inner scope */
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_activation_times, __pyx_t_7) < 0) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":83
- * def py_k_ants_get_activation_count(antenna, count):
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
- * def py_k_ants_get_activation_time(antenna, int time):             # <<<<<<<<<<<<<<
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
- * def py_k_ants_watchdog_kick():
+  /* "isisants.pyx":203
+ *     return time
+ * 
+ * def py_k_ants_read_all_telemetry(uint8_t ant_count=ANT_COUNT):             # <<<<<<<<<<<<<<
+ *     """
+ *     Reads the system telemetry and every antenna's activation count and time in a single GIL release
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("isisants.py_k_ants_get_activation_time", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("isisants.py_k_ants_read_all_telemetry", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -2347,54 +4454,102 @@ static PyObject *__pyx_pf_8isisants_26py_k_ants_get_activation_time(CYTHON_UNUSE
   return __pyx_r;
 }
 
-/* "isisants.pyx":85
- * def py_k_ants_get_activation_time(antenna, int time):
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
+/* "isisants.pyx":242
+ *     }
+ * 
  * def py_k_ants_watchdog_kick():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_kick()
- * def py_k_ants_watchdog_start():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_29py_k_ants_watchdog_kick(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_29py_k_ants_watchdog_kick = {"py_k_ants_watchdog_kick", (PyCFunction)__pyx_pw_8isisants_29py_k_ants_watchdog_kick, METH_NOARGS, 0};
-static PyObject *__pyx_pw_8isisants_29py_k_ants_watchdog_kick(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_8isisants_31py_k_ants_watchdog_kick(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyMethodDef __pyx_mdef_8isisants_31py_k_ants_watchdog_kick = {"py_k_ants_watchdog_kick", (PyCFunction)__pyx_pw_8isisants_31py_k_ants_watchdog_kick, METH_NOARGS, 0};
+static PyObject *__pyx_pw_8isisants_31py_k_ants_watchdog_kick(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_watchdog_kick (wrapper)", 0);
-  __pyx_r = __pyx_pf_8isisants_28py_k_ants_watchdog_kick(__pyx_self);
+  __pyx_r = __pyx_pf_8isisants_30py_k_ants_watchdog_kick(__pyx_self);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_28py_k_ants_watchdog_kick(CYTHON_UNUSED PyObject *__pyx_self) {
+static PyObject *__pyx_pf_8isisants_30py_k_ants_watchdog_kick(CYTHON_UNUSED PyObject *__pyx_self) {
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_watchdog_kick", 0);
 
-  /* "isisants.pyx":86
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
+  /* "isisants.pyx":244
+ * def py_k_ants_watchdog_kick():
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_watchdog_kick()
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":245
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_watchdog_kick()             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_watchdog_kick();
+      }
+
+      /* "isisants.pyx":244
  * def py_k_ants_watchdog_kick():
- *     return k_ants_watchdog_kick()             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_watchdog_kick()
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":246
+ *     with nogil:
+ *         status = k_ants_watchdog_kick()
+ *     return status             # <<<<<<<<<<<<<<
+ * 
  * def py_k_ants_watchdog_start():
- *     return k_ants_watchdog_start()
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_watchdog_kick()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 246, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":85
- * def py_k_ants_get_activation_time(antenna, int time):
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
+  /* "isisants.pyx":242
+ *     }
+ * 
  * def py_k_ants_watchdog_kick():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_kick()
- * def py_k_ants_watchdog_start():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
   /* function exit code */
@@ -2408,54 +4563,102 @@ static PyObject *__pyx_pf_8isisants_28py_k_ants_watchdog_kick(CYTHON_UNUSED PyOb
   return __pyx_r;
 }
 
-/* "isisants.pyx":87
- * def py_k_ants_watchdog_kick():
- *     return k_ants_watchdog_kick()
+/* "isisants.pyx":248
+ *     return status
+ * 
  * def py_k_ants_watchdog_start():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_start()
- * def py_k_ants_watchdog_stop():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_31py_k_ants_watchdog_start(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_31py_k_ants_watchdog_start = {"py_k_ants_watchdog_start", (PyCFunction)__pyx_pw_8isisants_31py_k_ants_watchdog_start, METH_NOARGS, 0};
-static PyObject *__pyx_pw_8isisants_31py_k_ants_watchdog_start(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_8isisants_33py_k_ants_watchdog_start(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyMethodDef __pyx_mdef_8isisants_33py_k_ants_watchdog_start = {"py_k_ants_watchdog_start", (PyCFunction)__pyx_pw_8isisants_33py_k_ants_watchdog_start, METH_NOARGS, 0};
+static PyObject *__pyx_pw_8isisants_33py_k_ants_watchdog_start(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_watchdog_start (wrapper)", 0);
-  __pyx_r = __pyx_pf_8isisants_30py_k_ants_watchdog_start(__pyx_self);
+  __pyx_r = __pyx_pf_8isisants_32py_k_ants_watchdog_start(__pyx_self);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_30py_k_ants_watchdog_start(CYTHON_UNUSED PyObject *__pyx_self) {
+static PyObject *__pyx_pf_8isisants_32py_k_ants_watchdog_start(CYTHON_UNUSED PyObject *__pyx_self) {
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_watchdog_start", 0);
 
-  /* "isisants.pyx":88
- *     return k_ants_watchdog_kick()
+  /* "isisants.pyx":250
+ * def py_k_ants_watchdog_start():
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_watchdog_start()
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":251
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_watchdog_start()             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_watchdog_start();
+      }
+
+      /* "isisants.pyx":250
  * def py_k_ants_watchdog_start():
- *     return k_ants_watchdog_start()             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_watchdog_start()
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":252
+ *     with nogil:
+ *         status = k_ants_watchdog_start()
+ *     return status             # <<<<<<<<<<<<<<
+ * 
  * def py_k_ants_watchdog_stop():
- *     return k_ants_watchdog_stop()
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_watchdog_start()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":87
- * def py_k_ants_watchdog_kick():
- *     return k_ants_watchdog_kick()
+  /* "isisants.pyx":248
+ *     return status
+ * 
  * def py_k_ants_watchdog_start():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_start()
- * def py_k_ants_watchdog_stop():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
   /* function exit code */
@@ -2469,54 +4672,102 @@ static PyObject *__pyx_pf_8isisants_30py_k_ants_watchdog_start(CYTHON_UNUSED PyO
   return __pyx_r;
 }
 
-/* "isisants.pyx":89
- * def py_k_ants_watchdog_start():
- *     return k_ants_watchdog_start()
+/* "isisants.pyx":254
+ *     return status
+ * 
  * def py_k_ants_watchdog_stop():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_stop()
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_33py_k_ants_watchdog_stop(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_33py_k_ants_watchdog_stop = {"py_k_ants_watchdog_stop", (PyCFunction)__pyx_pw_8isisants_33py_k_ants_watchdog_stop, METH_NOARGS, 0};
-static PyObject *__pyx_pw_8isisants_33py_k_ants_watchdog_stop(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_8isisants_35py_k_ants_watchdog_stop(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyMethodDef __pyx_mdef_8isisants_35py_k_ants_watchdog_stop = {"py_k_ants_watchdog_stop", (PyCFunction)__pyx_pw_8isisants_35py_k_ants_watchdog_stop, METH_NOARGS, 0};
+static PyObject *__pyx_pw_8isisants_35py_k_ants_watchdog_stop(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_watchdog_stop (wrapper)", 0);
-  __pyx_r = __pyx_pf_8isisants_32py_k_ants_watchdog_stop(__pyx_self);
+  __pyx_r = __pyx_pf_8isisants_34py_k_ants_watchdog_stop(__pyx_self);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_32py_k_ants_watchdog_stop(CYTHON_UNUSED PyObject *__pyx_self) {
+static PyObject *__pyx_pf_8isisants_34py_k_ants_watchdog_stop(CYTHON_UNUSED PyObject *__pyx_self) {
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_watchdog_stop", 0);
 
-  /* "isisants.pyx":90
- *     return k_ants_watchdog_start()
+  /* "isisants.pyx":256
  * def py_k_ants_watchdog_stop():
- *     return k_ants_watchdog_stop()             # <<<<<<<<<<<<<<
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_watchdog_stop()
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":257
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_watchdog_stop()             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_ants_watchdog_stop();
+      }
+
+      /* "isisants.pyx":256
+ * def py_k_ants_watchdog_stop():
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_watchdog_stop()
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":258
+ *     with nogil:
+ *         status = k_ants_watchdog_stop()
+ *     return status             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_ants_passthrough(bytes tx, int rx_len):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(k_ants_watchdog_stop()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_KANTSStatus(__pyx_v_status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 258, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":89
- * def py_k_ants_watchdog_start():
- *     return k_ants_watchdog_start()
+  /* "isisants.pyx":254
+ *     return status
+ * 
  * def py_k_ants_watchdog_stop():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_stop()
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
 
   /* function exit code */
@@ -2530,36 +4781,34 @@ static PyObject *__pyx_pf_8isisants_32py_k_ants_watchdog_stop(CYTHON_UNUSED PyOb
   return __pyx_r;
 }
 
-/* "isisants.pyx":91
- * def py_k_ants_watchdog_stop():
- *     return k_ants_watchdog_stop()
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):             # <<<<<<<<<<<<<<
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
- * def py_k_i2c_init(device, int fp):
+/* "isisants.pyx":260
+ *     return status
+ * 
+ * def py_k_ants_passthrough(bytes tx, int rx_len):             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends raw bytes to the controller and reads its reply
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_35py_k_ants_passthrough(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_35py_k_ants_passthrough = {"py_k_ants_passthrough", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_35py_k_ants_passthrough, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_8isisants_35py_k_ants_passthrough(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_8isisants_37py_k_ants_passthrough(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8isisants_36py_k_ants_passthrough[] = "\n    Sends raw bytes to the controller and reads its reply\n    :return: rx_len bytes read back\n    ";
+static PyMethodDef __pyx_mdef_8isisants_37py_k_ants_passthrough = {"py_k_ants_passthrough", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_37py_k_ants_passthrough, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8isisants_36py_k_ants_passthrough};
+static PyObject *__pyx_pw_8isisants_37py_k_ants_passthrough(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_tx = 0;
-  PyObject *__pyx_v_tx_len = 0;
-  PyObject *__pyx_v_rx = 0;
-  PyObject *__pyx_v_rx_len = 0;
+  int __pyx_v_rx_len;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_ants_passthrough (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_tx,&__pyx_n_s_tx_len,&__pyx_n_s_rx,&__pyx_n_s_rx_len,0};
-    PyObject* values[4] = {0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_tx,&__pyx_n_s_rx_len,0};
+    PyObject* values[2] = {0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -2574,204 +4823,336 @@ static PyObject *__pyx_pw_8isisants_35py_k_ants_passthrough(PyObject *__pyx_self
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_tx_len)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_passthrough", 1, 4, 4, 1); __PYX_ERR(0, 91, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_rx)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_passthrough", 1, 4, 4, 2); __PYX_ERR(0, 91, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_rx_len)) != 0)) kw_args--;
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_rx_len)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("py_k_ants_passthrough", 1, 4, 4, 3); __PYX_ERR(0, 91, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("py_k_ants_passthrough", 1, 2, 2, 1); __PYX_ERR(0, 260, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_ants_passthrough") < 0)) __PYX_ERR(0, 91, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_ants_passthrough") < 0)) __PYX_ERR(0, 260, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_tx = values[0];
-    __pyx_v_tx_len = values[1];
-    __pyx_v_rx = values[2];
-    __pyx_v_rx_len = values[3];
+    __pyx_v_tx = ((PyObject*)values[0]);
+    __pyx_v_rx_len = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_rx_len == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 260, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("py_k_ants_passthrough", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 91, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("py_k_ants_passthrough", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 260, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("isisants.py_k_ants_passthrough", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_34py_k_ants_passthrough(__pyx_self, __pyx_v_tx, __pyx_v_tx_len, __pyx_v_rx, __pyx_v_rx_len);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_tx), (&PyBytes_Type), 1, "tx", 1))) __PYX_ERR(0, 260, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8isisants_36py_k_ants_passthrough(__pyx_self, __pyx_v_tx, __pyx_v_rx_len);
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_34py_k_ants_passthrough(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_tx, PyObject *__pyx_v_tx_len, PyObject *__pyx_v_rx, PyObject *__pyx_v_rx_len) {
+static PyObject *__pyx_pf_8isisants_36py_k_ants_passthrough(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_tx, int __pyx_v_rx_len) {
+  PyObject *__pyx_v_rx = 0;
+  uint8_t *__pyx_v_rx_ptr;
+  int __pyx_v_tx_len;
+  uint8_t const *__pyx_v_tx_ptr;
+  KANTSStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  uint8_t const *__pyx_t_1;
-  int __pyx_t_2;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
   uint8_t *__pyx_t_3;
-  int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_4;
+  char *__pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_ants_passthrough", 0);
 
-  /* "isisants.pyx":92
- *     return k_ants_watchdog_stop()
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)             # <<<<<<<<<<<<<<
- * def py_k_i2c_init(device, int fp):
- *     return k_i2c_init(<char *>device, <int *>fp)
+  /* "isisants.pyx":265
+ *     :return: rx_len bytes read back
+ *     """
+ *     cdef bytearray rx = bytearray(rx_len)             # <<<<<<<<<<<<<<
+ *     cdef uint8_t * rx_ptr = rx
+ *     cdef int tx_len = len(tx)
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_AsUString(__pyx_v_tx); if (unlikely((!__pyx_t_1) && PyErr_Occurred())) __PYX_ERR(0, 92, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_tx_len); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 92, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyObject_AsWritableUString(__pyx_v_rx); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 92, __pyx_L1_error)
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_rx_len); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 92, __pyx_L1_error)
-  __pyx_t_5 = __Pyx_PyInt_From_KANTSStatus(k_ants_passthrough(((uint8_t const *)__pyx_t_1), ((int)__pyx_t_2), ((uint8_t *)__pyx_t_3), ((int)__pyx_t_4))); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 92, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_r = __pyx_t_5;
-  __pyx_t_5 = 0;
-  goto __pyx_L0;
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_rx_len); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_rx = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "isisants.pyx":91
- * def py_k_ants_watchdog_stop():
- *     return k_ants_watchdog_stop()
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):             # <<<<<<<<<<<<<<
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
- * def py_k_i2c_init(device, int fp):
+  /* "isisants.pyx":266
+ *     """
+ *     cdef bytearray rx = bytearray(rx_len)
+ *     cdef uint8_t * rx_ptr = rx             # <<<<<<<<<<<<<<
+ *     cdef int tx_len = len(tx)
+ *     cdef const uint8_t * tx_ptr = <const uint8_t *><char *>tx
  */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("isisants.py_k_ants_passthrough", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "isisants.pyx":93
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
- * def py_k_i2c_init(device, int fp):             # <<<<<<<<<<<<<<
- *     return k_i2c_init(<char *>device, <int *>fp)
- * def py_k_i2c_terminate(int fp):
+  __pyx_t_3 = __Pyx_PyObject_AsWritableUString(__pyx_v_rx); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 266, __pyx_L1_error)
+  __pyx_v_rx_ptr = __pyx_t_3;
+
+  /* "isisants.pyx":267
+ *     cdef bytearray rx = bytearray(rx_len)
+ *     cdef uint8_t * rx_ptr = rx
+ *     cdef int tx_len = len(tx)             # <<<<<<<<<<<<<<
+ *     cdef const uint8_t * tx_ptr = <const uint8_t *><char *>tx
+ *     cdef KANTSStatus status
+ */
+  if (unlikely(__pyx_v_tx == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 267, __pyx_L1_error)
+  }
+  __pyx_t_4 = PyBytes_GET_SIZE(__pyx_v_tx); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 267, __pyx_L1_error)
+  __pyx_v_tx_len = __pyx_t_4;
+
+  /* "isisants.pyx":268
+ *     cdef uint8_t * rx_ptr = rx
+ *     cdef int tx_len = len(tx)
+ *     cdef const uint8_t * tx_ptr = <const uint8_t *><char *>tx             # <<<<<<<<<<<<<<
+ *     cdef KANTSStatus status
+ *     with nogil:
+ */
+  if (unlikely(__pyx_v_tx == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+    __PYX_ERR(0, 268, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_PyBytes_AsWritableString(__pyx_v_tx); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 268, __pyx_L1_error)
+  __pyx_v_tx_ptr = ((uint8_t const *)((char *)__pyx_t_5));
+
+  /* "isisants.pyx":270
+ *     cdef const uint8_t * tx_ptr = <const uint8_t *><char *>tx
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_passthrough(tx_ptr, tx_len, rx_ptr, rx_len)
+ *     check("k_ants_passthrough", status)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":271
+ *     cdef KANTSStatus status
+ *     with nogil:
+ *         status = k_ants_passthrough(tx_ptr, tx_len, rx_ptr, rx_len)             # <<<<<<<<<<<<<<
+ *     check("k_ants_passthrough", status)
+ *     return bytes(rx)
  */
+        __pyx_v_status = k_ants_passthrough(__pyx_v_tx_ptr, __pyx_v_tx_len, __pyx_v_rx_ptr, __pyx_v_rx_len);
+      }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_8isisants_37py_k_i2c_init(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_37py_k_i2c_init = {"py_k_i2c_init", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_37py_k_i2c_init, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_8isisants_37py_k_i2c_init(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_device = 0;
-  int __pyx_v_fp;
+      /* "isisants.pyx":270
+ *     cdef const uint8_t * tx_ptr = <const uint8_t *><char *>tx
+ *     cdef KANTSStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_ants_passthrough(tx_ptr, tx_len, rx_ptr, rx_len)
+ *     check("k_ants_passthrough", status)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":272
+ *     with nogil:
+ *         status = k_ants_passthrough(tx_ptr, tx_len, rx_ptr, rx_len)
+ *     check("k_ants_passthrough", status)             # <<<<<<<<<<<<<<
+ *     return bytes(rx)
+ * 
+ */
+  __pyx_f_8isisants_check(__pyx_n_u_k_ants_passthrough, __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 272, __pyx_L1_error)
+
+  /* "isisants.pyx":273
+ *         status = k_ants_passthrough(tx_ptr, tx_len, rx_ptr, rx_len)
+ *     check("k_ants_passthrough", status)
+ *     return bytes(rx)             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_i2c_init(char * device):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_v_rx); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "isisants.pyx":260
+ *     return status
+ * 
+ * def py_k_ants_passthrough(bytes tx, int rx_len):             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends raw bytes to the controller and reads its reply
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("isisants.py_k_ants_passthrough", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_rx);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isisants.pyx":275
+ *     return bytes(rx)
+ * 
+ * def py_k_i2c_init(char * device):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: file descriptor of the opened bus
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8isisants_39py_k_i2c_init(PyObject *__pyx_self, PyObject *__pyx_arg_device); /*proto*/
+static char __pyx_doc_8isisants_38py_k_i2c_init[] = "\n    :return: file descriptor of the opened bus\n    ";
+static PyMethodDef __pyx_mdef_8isisants_39py_k_i2c_init = {"py_k_i2c_init", (PyCFunction)__pyx_pw_8isisants_39py_k_i2c_init, METH_O, __pyx_doc_8isisants_38py_k_i2c_init};
+static PyObject *__pyx_pw_8isisants_39py_k_i2c_init(PyObject *__pyx_self, PyObject *__pyx_arg_device) {
+  char *__pyx_v_device;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_i2c_init (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_device,&__pyx_n_s_fp,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_device)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_fp)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("py_k_i2c_init", 1, 2, 2, 1); __PYX_ERR(0, 93, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_i2c_init") < 0)) __PYX_ERR(0, 93, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_device = values[0];
-    __pyx_v_fp = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_fp == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 93, __pyx_L3_error)
+  assert(__pyx_arg_device); {
+    __pyx_v_device = __Pyx_PyObject_AsWritableString(__pyx_arg_device); if (unlikely((!__pyx_v_device) && PyErr_Occurred())) __PYX_ERR(0, 275, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("py_k_i2c_init", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 93, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("isisants.py_k_i2c_init", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_36py_k_i2c_init(__pyx_self, __pyx_v_device, __pyx_v_fp);
+  __pyx_r = __pyx_pf_8isisants_38py_k_i2c_init(__pyx_self, ((char *)__pyx_v_device));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_36py_k_i2c_init(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_device, int __pyx_v_fp) {
+static PyObject *__pyx_pf_8isisants_38py_k_i2c_init(CYTHON_UNUSED PyObject *__pyx_self, char *__pyx_v_device) {
+  int __pyx_v_fp;
+  KI2CStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  char *__pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_i2c_init", 0);
 
-  /* "isisants.pyx":94
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
- * def py_k_i2c_init(device, int fp):
- *     return k_i2c_init(<char *>device, <int *>fp)             # <<<<<<<<<<<<<<
+  /* "isisants.pyx":279
+ *     :return: file descriptor of the opened bus
+ *     """
+ *     cdef int fp = 0             # <<<<<<<<<<<<<<
+ *     cdef KI2CStatus status
+ *     with nogil:
+ */
+  __pyx_v_fp = 0;
+
+  /* "isisants.pyx":281
+ *     cdef int fp = 0
+ *     cdef KI2CStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_i2c_init(device, &fp)
+ *     check("k_i2c_init", status)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":282
+ *     cdef KI2CStatus status
+ *     with nogil:
+ *         status = k_i2c_init(device, &fp)             # <<<<<<<<<<<<<<
+ *     check("k_i2c_init", status)
+ *     return fp
+ */
+        __pyx_v_status = k_i2c_init(__pyx_v_device, (&__pyx_v_fp));
+      }
+
+      /* "isisants.pyx":281
+ *     cdef int fp = 0
+ *     cdef KI2CStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_i2c_init(device, &fp)
+ *     check("k_i2c_init", status)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":283
+ *     with nogil:
+ *         status = k_i2c_init(device, &fp)
+ *     check("k_i2c_init", status)             # <<<<<<<<<<<<<<
+ *     return fp
+ * 
+ */
+  __pyx_f_8isisants_check(__pyx_n_u_k_i2c_init, __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 283, __pyx_L1_error)
+
+  /* "isisants.pyx":284
+ *         status = k_i2c_init(device, &fp)
+ *     check("k_i2c_init", status)
+ *     return fp             # <<<<<<<<<<<<<<
+ * 
  * def py_k_i2c_terminate(int fp):
- *     k_i2c_terminate(<int *>fp)
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_AsWritableString(__pyx_v_device); if (unlikely((!__pyx_t_1) && PyErr_Occurred())) __PYX_ERR(0, 94, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyInt_From_KI2CStatus(k_i2c_init(((char *)__pyx_t_1), ((int *)__pyx_v_fp))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_fp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 284, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":93
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
- * def py_k_i2c_init(device, int fp):             # <<<<<<<<<<<<<<
- *     return k_i2c_init(<char *>device, <int *>fp)
- * def py_k_i2c_terminate(int fp):
+  /* "isisants.pyx":275
+ *     return bytes(rx)
+ * 
+ * def py_k_i2c_init(char * device):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: file descriptor of the opened bus
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_AddTraceback("isisants.py_k_i2c_init", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -2780,24 +5161,27 @@ static PyObject *__pyx_pf_8isisants_36py_k_i2c_init(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "isisants.pyx":95
- * def py_k_i2c_init(device, int fp):
- *     return k_i2c_init(<char *>device, <int *>fp)
+/* "isisants.pyx":286
+ *     return fp
+ * 
  * def py_k_i2c_terminate(int fp):             # <<<<<<<<<<<<<<
- *     k_i2c_terminate(<int *>fp)
- * def py_k_i2c_write(i2c, addr, ptr, len):
+ *     with nogil:
+ *         k_i2c_terminate(&fp)
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_39py_k_i2c_terminate(PyObject *__pyx_self, PyObject *__pyx_arg_fp); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_39py_k_i2c_terminate = {"py_k_i2c_terminate", (PyCFunction)__pyx_pw_8isisants_39py_k_i2c_terminate, METH_O, 0};
-static PyObject *__pyx_pw_8isisants_39py_k_i2c_terminate(PyObject *__pyx_self, PyObject *__pyx_arg_fp) {
+static PyObject *__pyx_pw_8isisants_41py_k_i2c_terminate(PyObject *__pyx_self, PyObject *__pyx_arg_fp); /*proto*/
+static PyMethodDef __pyx_mdef_8isisants_41py_k_i2c_terminate = {"py_k_i2c_terminate", (PyCFunction)__pyx_pw_8isisants_41py_k_i2c_terminate, METH_O, 0};
+static PyObject *__pyx_pw_8isisants_41py_k_i2c_terminate(PyObject *__pyx_self, PyObject *__pyx_arg_fp) {
   int __pyx_v_fp;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_i2c_terminate (wrapper)", 0);
   assert(__pyx_arg_fp); {
-    __pyx_v_fp = __Pyx_PyInt_As_int(__pyx_arg_fp); if (unlikely((__pyx_v_fp == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 95, __pyx_L3_error)
+    __pyx_v_fp = __Pyx_PyInt_As_int(__pyx_arg_fp); if (unlikely((__pyx_v_fp == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 286, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -2805,33 +5189,68 @@ static PyObject *__pyx_pw_8isisants_39py_k_i2c_terminate(PyObject *__pyx_self, P
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_38py_k_i2c_terminate(__pyx_self, ((int)__pyx_v_fp));
+  __pyx_r = __pyx_pf_8isisants_40py_k_i2c_terminate(__pyx_self, ((int)__pyx_v_fp));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_38py_k_i2c_terminate(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_fp) {
+static PyObject *__pyx_pf_8isisants_40py_k_i2c_terminate(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_fp) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_i2c_terminate", 0);
 
-  /* "isisants.pyx":96
- *     return k_i2c_init(<char *>device, <int *>fp)
+  /* "isisants.pyx":287
+ * 
+ * def py_k_i2c_terminate(int fp):
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         k_i2c_terminate(&fp)
+ * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":288
+ * def py_k_i2c_terminate(int fp):
+ *     with nogil:
+ *         k_i2c_terminate(&fp)             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_i2c_write(int i2c, uint16_t addr, bytes data):
+ */
+        k_i2c_terminate((&__pyx_v_fp));
+      }
+
+      /* "isisants.pyx":287
+ * 
  * def py_k_i2c_terminate(int fp):
- *     k_i2c_terminate(<int *>fp)             # <<<<<<<<<<<<<<
- * def py_k_i2c_write(i2c, addr, ptr, len):
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         k_i2c_terminate(&fp)
+ * 
  */
-  k_i2c_terminate(((int *)__pyx_v_fp));
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
 
-  /* "isisants.pyx":95
- * def py_k_i2c_init(device, int fp):
- *     return k_i2c_init(<char *>device, <int *>fp)
+  /* "isisants.pyx":286
+ *     return fp
+ * 
  * def py_k_i2c_terminate(int fp):             # <<<<<<<<<<<<<<
- *     k_i2c_terminate(<int *>fp)
- * def py_k_i2c_write(i2c, addr, ptr, len):
+ *     with nogil:
+ *         k_i2c_terminate(&fp)
  */
 
   /* function exit code */
@@ -2841,34 +5260,34 @@ static PyObject *__pyx_pf_8isisants_38py_k_i2c_terminate(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "isisants.pyx":97
- * def py_k_i2c_terminate(int fp):
- *     k_i2c_terminate(<int *>fp)
- * def py_k_i2c_write(i2c, addr, ptr, len):             # <<<<<<<<<<<<<<
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- * def py_k_i2c_read( i2c, addr, ptr, int len):
+/* "isisants.pyx":290
+ *         k_i2c_terminate(&fp)
+ * 
+ * def py_k_i2c_write(int i2c, uint16_t addr, bytes data):             # <<<<<<<<<<<<<<
+ *     cdef int length = len(data)
+ *     cdef uint8_t * ptr = <uint8_t *><char *>data
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_41py_k_i2c_write(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_41py_k_i2c_write = {"py_k_i2c_write", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_41py_k_i2c_write, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_8isisants_41py_k_i2c_write(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_i2c = 0;
-  PyObject *__pyx_v_addr = 0;
-  PyObject *__pyx_v_ptr = 0;
-  PyObject *__pyx_v_len = 0;
+static PyObject *__pyx_pw_8isisants_43py_k_i2c_write(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_8isisants_43py_k_i2c_write = {"py_k_i2c_write", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_43py_k_i2c_write, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_8isisants_43py_k_i2c_write(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_i2c;
+  uint16_t __pyx_v_addr;
+  PyObject *__pyx_v_data = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_i2c_write (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i2c,&__pyx_n_s_addr,&__pyx_n_s_ptr,&__pyx_n_s_len,0};
-    PyObject* values[4] = {0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i2c,&__pyx_n_s_addr,&__pyx_n_s_data,0};
+    PyObject* values[3] = {0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
@@ -2887,91 +5306,160 @@ static PyObject *__pyx_pw_8isisants_41py_k_i2c_write(PyObject *__pyx_self, PyObj
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_addr)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("py_k_i2c_write", 1, 4, 4, 1); __PYX_ERR(0, 97, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("py_k_i2c_write", 1, 3, 3, 1); __PYX_ERR(0, 290, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ptr)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("py_k_i2c_write", 1, 4, 4, 2); __PYX_ERR(0, 97, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_len)) != 0)) kw_args--;
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("py_k_i2c_write", 1, 4, 4, 3); __PYX_ERR(0, 97, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("py_k_i2c_write", 1, 3, 3, 2); __PYX_ERR(0, 290, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_i2c_write") < 0)) __PYX_ERR(0, 97, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_i2c_write") < 0)) __PYX_ERR(0, 290, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_i2c = values[0];
-    __pyx_v_addr = values[1];
-    __pyx_v_ptr = values[2];
-    __pyx_v_len = values[3];
+    __pyx_v_i2c = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_i2c == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 290, __pyx_L3_error)
+    __pyx_v_addr = __Pyx_PyInt_As_uint16_t(values[1]); if (unlikely((__pyx_v_addr == ((uint16_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 290, __pyx_L3_error)
+    __pyx_v_data = ((PyObject*)values[2]);
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("py_k_i2c_write", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 97, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("py_k_i2c_write", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 290, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("isisants.py_k_i2c_write", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_40py_k_i2c_write(__pyx_self, __pyx_v_i2c, __pyx_v_addr, __pyx_v_ptr, __pyx_v_len);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_data), (&PyBytes_Type), 1, "data", 1))) __PYX_ERR(0, 290, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8isisants_42py_k_i2c_write(__pyx_self, __pyx_v_i2c, __pyx_v_addr, __pyx_v_data);
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_40py_k_i2c_write(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_i2c, PyObject *__pyx_v_addr, PyObject *__pyx_v_ptr, PyObject *__pyx_v_len) {
+static PyObject *__pyx_pf_8isisants_42py_k_i2c_write(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_i2c, uint16_t __pyx_v_addr, PyObject *__pyx_v_data) {
+  int __pyx_v_length;
+  uint8_t *__pyx_v_ptr;
+  KI2CStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  uint16_t __pyx_t_2;
-  uint8_t *__pyx_t_3;
-  int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_1;
+  char *__pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_i2c_write", 0);
 
-  /* "isisants.pyx":98
- *     k_i2c_terminate(<int *>fp)
- * def py_k_i2c_write(i2c, addr, ptr, len):
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)             # <<<<<<<<<<<<<<
- * def py_k_i2c_read( i2c, addr, ptr, int len):
- *     return k_i2c_read(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
+  /* "isisants.pyx":291
+ * 
+ * def py_k_i2c_write(int i2c, uint16_t addr, bytes data):
+ *     cdef int length = len(data)             # <<<<<<<<<<<<<<
+ *     cdef uint8_t * ptr = <uint8_t *><char *>data
+ *     cdef KI2CStatus status
+ */
+  if (unlikely(__pyx_v_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 291, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyBytes_GET_SIZE(__pyx_v_data); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 291, __pyx_L1_error)
+  __pyx_v_length = __pyx_t_1;
+
+  /* "isisants.pyx":292
+ * def py_k_i2c_write(int i2c, uint16_t addr, bytes data):
+ *     cdef int length = len(data)
+ *     cdef uint8_t * ptr = <uint8_t *><char *>data             # <<<<<<<<<<<<<<
+ *     cdef KI2CStatus status
+ *     with nogil:
+ */
+  if (unlikely(__pyx_v_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+    __PYX_ERR(0, 292, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyBytes_AsWritableString(__pyx_v_data); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 292, __pyx_L1_error)
+  __pyx_v_ptr = ((uint8_t *)((char *)__pyx_t_2));
+
+  /* "isisants.pyx":294
+ *     cdef uint8_t * ptr = <uint8_t *><char *>data
+ *     cdef KI2CStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_i2c_write(i2c, addr, ptr, length)
+ *     return status
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":295
+ *     cdef KI2CStatus status
+ *     with nogil:
+ *         status = k_i2c_write(i2c, addr, ptr, length)             # <<<<<<<<<<<<<<
+ *     return status
+ * 
+ */
+        __pyx_v_status = k_i2c_write(__pyx_v_i2c, __pyx_v_addr, __pyx_v_ptr, __pyx_v_length);
+      }
+
+      /* "isisants.pyx":294
+ *     cdef uint8_t * ptr = <uint8_t *><char *>data
+ *     cdef KI2CStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_i2c_write(i2c, addr, ptr, length)
+ *     return status
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":296
+ *     with nogil:
+ *         status = k_i2c_write(i2c, addr, ptr, length)
+ *     return status             # <<<<<<<<<<<<<<
+ * 
+ * def py_k_i2c_read(int i2c, uint16_t addr, int length):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_i2c); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 98, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyInt_As_uint16_t(__pyx_v_addr); if (unlikely((__pyx_t_2 == ((uint16_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 98, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyObject_AsWritableUString(__pyx_v_ptr); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 98, __pyx_L1_error)
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_len); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 98, __pyx_L1_error)
-  __pyx_t_5 = __Pyx_PyInt_From_KI2CStatus(k_i2c_write(((int)__pyx_t_1), ((uint16_t)__pyx_t_2), ((uint8_t *)__pyx_t_3), ((int)__pyx_t_4))); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 98, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_r = __pyx_t_5;
-  __pyx_t_5 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_KI2CStatus(__pyx_v_status); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":97
- * def py_k_i2c_terminate(int fp):
- *     k_i2c_terminate(<int *>fp)
- * def py_k_i2c_write(i2c, addr, ptr, len):             # <<<<<<<<<<<<<<
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- * def py_k_i2c_read( i2c, addr, ptr, int len):
+  /* "isisants.pyx":290
+ *         k_i2c_terminate(&fp)
+ * 
+ * def py_k_i2c_write(int i2c, uint16_t addr, bytes data):             # <<<<<<<<<<<<<<
+ *     cdef int length = len(data)
+ *     cdef uint8_t * ptr = <uint8_t *><char *>data
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_AddTraceback("isisants.py_k_i2c_write", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -2980,33 +5468,35 @@ static PyObject *__pyx_pf_8isisants_40py_k_i2c_write(CYTHON_UNUSED PyObject *__p
   return __pyx_r;
 }
 
-/* "isisants.pyx":99
- * def py_k_i2c_write(i2c, addr, ptr, len):
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- * def py_k_i2c_read( i2c, addr, ptr, int len):             # <<<<<<<<<<<<<<
- *     return k_i2c_read(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
+/* "isisants.pyx":298
+ *     return status
+ * 
+ * def py_k_i2c_read(int i2c, uint16_t addr, int length):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: length bytes read from addr
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_8isisants_43py_k_i2c_read(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_8isisants_43py_k_i2c_read = {"py_k_i2c_read", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_43py_k_i2c_read, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_8isisants_43py_k_i2c_read(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_i2c = 0;
-  PyObject *__pyx_v_addr = 0;
-  PyObject *__pyx_v_ptr = 0;
-  int __pyx_v_len;
+static PyObject *__pyx_pw_8isisants_45py_k_i2c_read(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8isisants_44py_k_i2c_read[] = "\n    :return: length bytes read from addr\n    ";
+static PyMethodDef __pyx_mdef_8isisants_45py_k_i2c_read = {"py_k_i2c_read", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8isisants_45py_k_i2c_read, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8isisants_44py_k_i2c_read};
+static PyObject *__pyx_pw_8isisants_45py_k_i2c_read(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_i2c;
+  uint16_t __pyx_v_addr;
+  int __pyx_v_length;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("py_k_i2c_read (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i2c,&__pyx_n_s_addr,&__pyx_n_s_ptr,&__pyx_n_s_len,0};
-    PyObject* values[4] = {0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_i2c,&__pyx_n_s_addr,&__pyx_n_s_length,0};
+    PyObject* values[3] = {0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
@@ -3025,89 +5515,163 @@ static PyObject *__pyx_pw_8isisants_43py_k_i2c_read(PyObject *__pyx_self, PyObje
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_addr)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("py_k_i2c_read", 1, 4, 4, 1); __PYX_ERR(0, 99, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("py_k_i2c_read", 1, 3, 3, 1); __PYX_ERR(0, 298, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ptr)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("py_k_i2c_read", 1, 4, 4, 2); __PYX_ERR(0, 99, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_len)) != 0)) kw_args--;
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_length)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("py_k_i2c_read", 1, 4, 4, 3); __PYX_ERR(0, 99, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("py_k_i2c_read", 1, 3, 3, 2); __PYX_ERR(0, 298, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_i2c_read") < 0)) __PYX_ERR(0, 99, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "py_k_i2c_read") < 0)) __PYX_ERR(0, 298, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_i2c = values[0];
-    __pyx_v_addr = values[1];
-    __pyx_v_ptr = values[2];
-    __pyx_v_len = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_len == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 99, __pyx_L3_error)
+    __pyx_v_i2c = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_i2c == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 298, __pyx_L3_error)
+    __pyx_v_addr = __Pyx_PyInt_As_uint16_t(values[1]); if (unlikely((__pyx_v_addr == ((uint16_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 298, __pyx_L3_error)
+    __pyx_v_length = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_length == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 298, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("py_k_i2c_read", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 99, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("py_k_i2c_read", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 298, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("isisants.py_k_i2c_read", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_8isisants_42py_k_i2c_read(__pyx_self, __pyx_v_i2c, __pyx_v_addr, __pyx_v_ptr, __pyx_v_len);
+  __pyx_r = __pyx_pf_8isisants_44py_k_i2c_read(__pyx_self, __pyx_v_i2c, __pyx_v_addr, __pyx_v_length);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_8isisants_42py_k_i2c_read(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_i2c, PyObject *__pyx_v_addr, PyObject *__pyx_v_ptr, int __pyx_v_len) {
+static PyObject *__pyx_pf_8isisants_44py_k_i2c_read(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_i2c, uint16_t __pyx_v_addr, int __pyx_v_length) {
+  PyObject *__pyx_v_data = 0;
+  uint8_t *__pyx_v_ptr;
+  KI2CStatus __pyx_v_status;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  uint16_t __pyx_t_2;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
   uint8_t *__pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("py_k_i2c_read", 0);
 
-  /* "isisants.pyx":100
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- * def py_k_i2c_read( i2c, addr, ptr, int len):
- *     return k_i2c_read(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)             # <<<<<<<<<<<<<<
+  /* "isisants.pyx":302
+ *     :return: length bytes read from addr
+ *     """
+ *     cdef bytearray data = bytearray(length)             # <<<<<<<<<<<<<<
+ *     cdef uint8_t * ptr = data
+ *     cdef KI2CStatus status
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_data = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "isisants.pyx":303
+ *     """
+ *     cdef bytearray data = bytearray(length)
+ *     cdef uint8_t * ptr = data             # <<<<<<<<<<<<<<
+ *     cdef KI2CStatus status
+ *     with nogil:
+ */
+  __pyx_t_3 = __Pyx_PyObject_AsWritableUString(__pyx_v_data); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 303, __pyx_L1_error)
+  __pyx_v_ptr = __pyx_t_3;
+
+  /* "isisants.pyx":305
+ *     cdef uint8_t * ptr = data
+ *     cdef KI2CStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_i2c_read(i2c, addr, ptr, length)
+ *     check("k_i2c_read", status)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "isisants.pyx":306
+ *     cdef KI2CStatus status
+ *     with nogil:
+ *         status = k_i2c_read(i2c, addr, ptr, length)             # <<<<<<<<<<<<<<
+ *     check("k_i2c_read", status)
+ *     return bytes(data)
+ */
+        __pyx_v_status = k_i2c_read(__pyx_v_i2c, __pyx_v_addr, __pyx_v_ptr, __pyx_v_length);
+      }
+
+      /* "isisants.pyx":305
+ *     cdef uint8_t * ptr = data
+ *     cdef KI2CStatus status
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         status = k_i2c_read(i2c, addr, ptr, length)
+ *     check("k_i2c_read", status)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "isisants.pyx":307
+ *     with nogil:
+ *         status = k_i2c_read(i2c, addr, ptr, length)
+ *     check("k_i2c_read", status)             # <<<<<<<<<<<<<<
+ *     return bytes(data)
+ */
+  __pyx_f_8isisants_check(__pyx_n_u_k_i2c_read, __pyx_v_status); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 307, __pyx_L1_error)
+
+  /* "isisants.pyx":308
+ *         status = k_i2c_read(i2c, addr, ptr, length)
+ *     check("k_i2c_read", status)
+ *     return bytes(data)             # <<<<<<<<<<<<<<
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_i2c); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 100, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyInt_As_uint16_t(__pyx_v_addr); if (unlikely((__pyx_t_2 == ((uint16_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 100, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyObject_AsWritableUString(__pyx_v_ptr); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 100, __pyx_L1_error)
-  __pyx_t_4 = __Pyx_PyInt_From_KI2CStatus(k_i2c_read(((int)__pyx_t_1), ((uint16_t)__pyx_t_2), ((uint8_t *)__pyx_t_3), ((int)__pyx_v_len))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 100, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_v_data); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "isisants.pyx":99
- * def py_k_i2c_write(i2c, addr, ptr, len):
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- * def py_k_i2c_read( i2c, addr, ptr, int len):             # <<<<<<<<<<<<<<
- *     return k_i2c_read(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
+  /* "isisants.pyx":298
+ *     return status
+ * 
+ * def py_k_i2c_read(int i2c, uint16_t addr, int length):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: length bytes read from addr
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_AddTraceback("isisants.py_k_i2c_read", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -3131,7 +5695,7 @@ static PyModuleDef_Slot __pyx_moduledef_slots[] = {
 static struct PyModuleDef __pyx_moduledef = {
     PyModuleDef_HEAD_INIT,
     "isisants",
-    0, /* m_doc */
+    __pyx_k_Binding_for_the_Kubos_ISIS_ante, /* m_doc */
   #if CYTHON_PEP489_MULTI_PHASE_INIT
     0, /* m_size */
   #else
@@ -3159,22 +5723,53 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_ANT_COUNT, __pyx_k_ANT_COUNT, sizeof(__pyx_k_ANT_COUNT), 0, 0, 1, 1},
+  {&__pyx_n_s_AntsError, __pyx_k_AntsError, sizeof(__pyx_k_AntsError), 0, 0, 1, 1},
+  {&__pyx_n_s_AntsError___init, __pyx_k_AntsError___init, sizeof(__pyx_k_AntsError___init), 0, 0, 1, 1},
+  {&__pyx_n_s_OSError, __pyx_k_OSError, sizeof(__pyx_k_OSError), 0, 0, 1, 1},
+  {&__pyx_kp_s_Raised_by_a_getter_when_the_ant, __pyx_k_Raised_by_a_getter_when_the_ant, sizeof(__pyx_k_Raised_by_a_getter_when_the_ant), 0, 0, 1, 0},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_n_u_activation_counts, __pyx_k_activation_counts, sizeof(__pyx_k_activation_counts), 0, 1, 0, 1},
+  {&__pyx_n_u_activation_times, __pyx_k_activation_times, sizeof(__pyx_k_activation_times), 0, 1, 0, 1},
   {&__pyx_n_s_addr, __pyx_k_addr, sizeof(__pyx_k_addr), 0, 0, 1, 1},
   {&__pyx_n_s_ant_count, __pyx_k_ant_count, sizeof(__pyx_k_ant_count), 0, 0, 1, 1},
   {&__pyx_n_s_antenna, __pyx_k_antenna, sizeof(__pyx_k_antenna), 0, 0, 1, 1},
+  {&__pyx_kp_u_at_most_4_antennas, __pyx_k_at_most_4_antennas, sizeof(__pyx_k_at_most_4_antennas), 0, 1, 0, 0},
   {&__pyx_n_s_bus, __pyx_k_bus, sizeof(__pyx_k_bus), 0, 0, 1, 1},
+  {&__pyx_n_s_c_antenna, __pyx_k_c_antenna, sizeof(__pyx_k_c_antenna), 0, 0, 1, 1},
+  {&__pyx_n_s_c_override, __pyx_k_c_override, sizeof(__pyx_k_c_override), 0, 0, 1, 1},
+  {&__pyx_n_s_c_timeout, __pyx_k_c_timeout, sizeof(__pyx_k_c_timeout), 0, 0, 1, 1},
+  {&__pyx_n_s_call, __pyx_k_call, sizeof(__pyx_k_call), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_config, __pyx_k_config, sizeof(__pyx_k_config), 0, 0, 1, 1},
   {&__pyx_n_s_count, __pyx_k_count, sizeof(__pyx_k_count), 0, 0, 1, 1},
+  {&__pyx_n_s_counts, __pyx_k_counts, sizeof(__pyx_k_counts), 0, 0, 1, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_u_deploy_status, __pyx_k_deploy_status, sizeof(__pyx_k_deploy_status), 0, 1, 0, 1},
   {&__pyx_n_s_device, __pyx_k_device, sizeof(__pyx_k_device), 0, 0, 1, 1},
+  {&__pyx_n_s_doc, __pyx_k_doc, sizeof(__pyx_k_doc), 0, 0, 1, 1},
+  {&__pyx_n_s_failed, __pyx_k_failed, sizeof(__pyx_k_failed), 0, 0, 1, 1},
   {&__pyx_n_s_fp, __pyx_k_fp, sizeof(__pyx_k_fp), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_s_i2c, __pyx_k_i2c, sizeof(__pyx_k_i2c), 0, 0, 1, 1},
+  {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
   {&__pyx_n_s_isisants, __pyx_k_isisants, sizeof(__pyx_k_isisants), 0, 0, 1, 1},
   {&__pyx_kp_s_isisants_pyx, __pyx_k_isisants_pyx, sizeof(__pyx_k_isisants_pyx), 0, 0, 1, 0},
-  {&__pyx_n_s_len, __pyx_k_len, sizeof(__pyx_k_len), 0, 0, 1, 1},
+  {&__pyx_n_u_k_ants_get_activation_count, __pyx_k_k_ants_get_activation_count, sizeof(__pyx_k_k_ants_get_activation_count), 0, 1, 0, 1},
+  {&__pyx_n_u_k_ants_get_activation_time, __pyx_k_k_ants_get_activation_time, sizeof(__pyx_k_k_ants_get_activation_time), 0, 1, 0, 1},
+  {&__pyx_n_u_k_ants_get_deploy_status, __pyx_k_k_ants_get_deploy_status, sizeof(__pyx_k_k_ants_get_deploy_status), 0, 1, 0, 1},
+  {&__pyx_n_u_k_ants_get_system_telemetry, __pyx_k_k_ants_get_system_telemetry, sizeof(__pyx_k_k_ants_get_system_telemetry), 0, 1, 0, 1},
+  {&__pyx_n_u_k_ants_get_uptime, __pyx_k_k_ants_get_uptime, sizeof(__pyx_k_k_ants_get_uptime), 0, 1, 0, 1},
+  {&__pyx_n_u_k_ants_passthrough, __pyx_k_k_ants_passthrough, sizeof(__pyx_k_k_ants_passthrough), 0, 1, 0, 1},
+  {&__pyx_n_u_k_i2c_init, __pyx_k_k_i2c_init, sizeof(__pyx_k_k_i2c_init), 0, 1, 0, 1},
+  {&__pyx_n_u_k_i2c_read, __pyx_k_k_i2c_read, sizeof(__pyx_k_k_i2c_read), 0, 1, 0, 1},
+  {&__pyx_n_s_length, __pyx_k_length, sizeof(__pyx_k_length), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_metaclass, __pyx_k_metaclass, sizeof(__pyx_k_metaclass), 0, 0, 1, 1},
+  {&__pyx_n_s_module, __pyx_k_module, sizeof(__pyx_k_module), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_override, __pyx_k_override, sizeof(__pyx_k_override), 0, 0, 1, 1},
+  {&__pyx_n_s_prepare, __pyx_k_prepare, sizeof(__pyx_k_prepare), 0, 0, 1, 1},
   {&__pyx_n_s_primary, __pyx_k_primary, sizeof(__pyx_k_primary), 0, 0, 1, 1},
   {&__pyx_n_s_ptr, __pyx_k_ptr, sizeof(__pyx_k_ptr), 0, 0, 1, 1},
   {&__pyx_n_s_py_k_ants_arm, __pyx_k_py_k_ants_arm, sizeof(__pyx_k_py_k_ants_arm), 0, 0, 1, 1},
@@ -3190,6 +5785,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_py_k_ants_get_uptime, __pyx_k_py_k_ants_get_uptime, sizeof(__pyx_k_py_k_ants_get_uptime), 0, 0, 1, 1},
   {&__pyx_n_s_py_k_ants_init, __pyx_k_py_k_ants_init, sizeof(__pyx_k_py_k_ants_init), 0, 0, 1, 1},
   {&__pyx_n_s_py_k_ants_passthrough, __pyx_k_py_k_ants_passthrough, sizeof(__pyx_k_py_k_ants_passthrough), 0, 0, 1, 1},
+  {&__pyx_n_s_py_k_ants_read_all_telemetry, __pyx_k_py_k_ants_read_all_telemetry, sizeof(__pyx_k_py_k_ants_read_all_telemetry), 0, 0, 1, 1},
   {&__pyx_n_s_py_k_ants_reset, __pyx_k_py_k_ants_reset, sizeof(__pyx_k_py_k_ants_reset), 0, 0, 1, 1},
   {&__pyx_n_s_py_k_ants_terminate, __pyx_k_py_k_ants_terminate, sizeof(__pyx_k_py_k_ants_terminate), 0, 0, 1, 1},
   {&__pyx_n_s_py_k_ants_watchdog_kick, __pyx_k_py_k_ants_watchdog_kick, sizeof(__pyx_k_py_k_ants_watchdog_kick), 0, 0, 1, 1},
@@ -3199,265 +5795,359 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_py_k_i2c_read, __pyx_k_py_k_i2c_read, sizeof(__pyx_k_py_k_i2c_read), 0, 0, 1, 1},
   {&__pyx_n_s_py_k_i2c_terminate, __pyx_k_py_k_i2c_terminate, sizeof(__pyx_k_py_k_i2c_terminate), 0, 0, 1, 1},
   {&__pyx_n_s_py_k_i2c_write, __pyx_k_py_k_i2c_write, sizeof(__pyx_k_py_k_i2c_write), 0, 0, 1, 1},
+  {&__pyx_n_s_qualname, __pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_u_raw_temp, __pyx_k_raw_temp, sizeof(__pyx_k_raw_temp), 0, 1, 0, 1},
   {&__pyx_n_s_resp, __pyx_k_resp, sizeof(__pyx_k_resp), 0, 0, 1, 1},
+  {&__pyx_kp_u_returned_status, __pyx_k_returned_status, sizeof(__pyx_k_returned_status), 0, 1, 0, 0},
   {&__pyx_n_s_rx, __pyx_k_rx, sizeof(__pyx_k_rx), 0, 0, 1, 1},
   {&__pyx_n_s_rx_len, __pyx_k_rx_len, sizeof(__pyx_k_rx_len), 0, 0, 1, 1},
+  {&__pyx_n_s_rx_ptr, __pyx_k_rx_ptr, sizeof(__pyx_k_rx_ptr), 0, 0, 1, 1},
   {&__pyx_n_s_secondary, __pyx_k_secondary, sizeof(__pyx_k_secondary), 0, 0, 1, 1},
+  {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
+  {&__pyx_n_s_status, __pyx_k_status, sizeof(__pyx_k_status), 0, 0, 1, 1},
   {&__pyx_n_s_telem, __pyx_k_telem, sizeof(__pyx_k_telem), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_time, __pyx_k_time, sizeof(__pyx_k_time), 0, 0, 1, 1},
   {&__pyx_n_s_timeout, __pyx_k_timeout, sizeof(__pyx_k_timeout), 0, 0, 1, 1},
+  {&__pyx_n_s_times, __pyx_k_times, sizeof(__pyx_k_times), 0, 0, 1, 1},
   {&__pyx_n_s_tx, __pyx_k_tx, sizeof(__pyx_k_tx), 0, 0, 1, 1},
   {&__pyx_n_s_tx_len, __pyx_k_tx_len, sizeof(__pyx_k_tx_len), 0, 0, 1, 1},
+  {&__pyx_n_s_tx_ptr, __pyx_k_tx_ptr, sizeof(__pyx_k_tx_ptr), 0, 0, 1, 1},
   {&__pyx_n_s_uptime, __pyx_k_uptime, sizeof(__pyx_k_uptime), 0, 0, 1, 1},
+  {&__pyx_n_u_uptime, __pyx_k_uptime, sizeof(__pyx_k_uptime), 0, 1, 0, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_OSError = __Pyx_GetBuiltinName(__pyx_n_s_OSError); if (!__pyx_builtin_OSError) __PYX_ERR(0, 74, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 215, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 221, __pyx_L1_error)
   return 0;
+  __pyx_L1_error:;
+  return -1;
 }
 
 static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "isisants.pyx":57
+  /* "isisants.pyx":215
+ *     cdef int failed = -1  # index of the failing call: 0 telemetry, 1 + 2 * antenna count, 2 + 2 * antenna time
+ *     if ant_count > 4:
+ *         raise ValueError("at most 4 antennas")             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         status = k_ants_get_system_telemetry(&telem)
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_at_most_4_antennas); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "isisants.pyx":233
+ *         check("k_ants_get_system_telemetry", status)
+ *     elif failed > 0:
+ *         check(("k_ants_get_activation_count", "k_ants_get_activation_time")[(failed - 1) % 2], status)             # <<<<<<<<<<<<<<
+ *     return {
+ *         "raw_temp": telem.raw_temp,
+ */
+  __pyx_tuple__3 = PyTuple_Pack(2, __pyx_n_u_k_ants_get_activation_count, __pyx_n_u_k_ants_get_activation_time); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "isisants.pyx":74
+ * 
+ * 
+ * class AntsError(OSError):             # <<<<<<<<<<<<<<
+ *     """
+ *     Raised by a getter when the antenna controller or I2C bus returns a status other than OK
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_builtin_OSError); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "isisants.pyx":79
+ *     """
+ * 
+ *     def __init__(self, call, status):             # <<<<<<<<<<<<<<
+ *         OSError.__init__(self, f"{call} returned status {status}")
+ *         self.call = call
+ */
+  __pyx_tuple__5 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_call, __pyx_n_s_status); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_init, 79, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 79, __pyx_L1_error)
+
+  /* "isisants.pyx":90
  * 
  * 
  * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)
- * def py_k_ants_terminate():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_tuple_ = PyTuple_Pack(5, __pyx_n_s_bus, __pyx_n_s_primary, __pyx_n_s_secondary, __pyx_n_s_ant_count, __pyx_n_s_timeout); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 57, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple_);
-  __Pyx_GIVEREF(__pyx_tuple_);
-  __pyx_codeobj__2 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple_, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_init, 57, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__2)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __pyx_tuple__7 = PyTuple_Pack(6, __pyx_n_s_bus, __pyx_n_s_primary, __pyx_n_s_secondary, __pyx_n_s_ant_count, __pyx_n_s_timeout, __pyx_n_s_status); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(5, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_init, 90, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 90, __pyx_L1_error)
 
-  /* "isisants.pyx":59
- * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)
+  /* "isisants.pyx":96
+ *     return status
+ * 
  * def py_k_ants_terminate():             # <<<<<<<<<<<<<<
- *     k_ants_terminate()
- * def py_k_ants_configure(KANTSController config):
+ *     with nogil:
+ *         k_ants_terminate()
  */
-  __pyx_codeobj__3 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_terminate, 59, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__3)) __PYX_ERR(0, 59, __pyx_L1_error)
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_terminate, 96, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 96, __pyx_L1_error)
 
-  /* "isisants.pyx":61
- * def py_k_ants_terminate():
- *     k_ants_terminate()
+  /* "isisants.pyx":100
+ *         k_ants_terminate()
+ * 
  * def py_k_ants_configure(KANTSController config):             # <<<<<<<<<<<<<<
- *     return k_ants_configure(config)
- * def py_k_ants_reset():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_tuple__4 = PyTuple_Pack(2, __pyx_n_s_config, __pyx_n_s_config); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 61, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
-  __pyx_codeobj__5 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_configure, 61, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__5)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_tuple__10 = PyTuple_Pack(3, __pyx_n_s_config, __pyx_n_s_config, __pyx_n_s_status); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_configure, 100, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 100, __pyx_L1_error)
 
-  /* "isisants.pyx":63
- * def py_k_ants_configure(KANTSController config):
- *     return k_ants_configure(config)
+  /* "isisants.pyx":106
+ *     return status
+ * 
  * def py_k_ants_reset():             # <<<<<<<<<<<<<<
- *     return k_ants_reset()
- * def py_k_ants_arm():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_reset, 63, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_n_s_status); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_reset, 106, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 106, __pyx_L1_error)
 
-  /* "isisants.pyx":65
- * def py_k_ants_reset():
- *     return k_ants_reset()
+  /* "isisants.pyx":112
+ *     return status
+ * 
  * def py_k_ants_arm():             # <<<<<<<<<<<<<<
- *     return k_ants_arm()
- * def py_k_ants_disarm():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_arm, 65, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_n_s_status); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_arm, 112, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 112, __pyx_L1_error)
 
-  /* "isisants.pyx":67
- * def py_k_ants_arm():
- *     return k_ants_arm()
+  /* "isisants.pyx":118
+ *     return status
+ * 
  * def py_k_ants_disarm():             # <<<<<<<<<<<<<<
- *     return k_ants_disarm()
- * def py_k_ants_deploy(antenna, override, timeout):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_disarm, 67, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_n_s_status); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 118, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_disarm, 118, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 118, __pyx_L1_error)
 
-  /* "isisants.pyx":69
- * def py_k_ants_disarm():
- *     return k_ants_disarm()
+  /* "isisants.pyx":124
+ *     return status
+ * 
  * def py_k_ants_deploy(antenna, override, timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
- * def py_k_ants_auto_deploy(timeout):
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+ *     cdef bool c_override = <bool>override
  */
-  __pyx_tuple__9 = PyTuple_Pack(3, __pyx_n_s_antenna, __pyx_n_s_override, __pyx_n_s_timeout); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 69, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
-  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_deploy, 69, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 69, __pyx_L1_error)
+  __pyx_tuple__18 = PyTuple_Pack(7, __pyx_n_s_antenna, __pyx_n_s_override, __pyx_n_s_timeout, __pyx_n_s_c_antenna, __pyx_n_s_c_override, __pyx_n_s_c_timeout, __pyx_n_s_status); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(3, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_deploy, 124, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 124, __pyx_L1_error)
 
-  /* "isisants.pyx":71
- * def py_k_ants_deploy(antenna, override, timeout):
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
+  /* "isisants.pyx":133
+ *     return status
+ * 
  * def py_k_ants_auto_deploy(timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_auto_deploy(<uint8_t>timeout)
- * def py_k_ants_cancel_deploy():
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ *     cdef KANTSStatus status
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_n_s_timeout); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
-  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_auto_deploy, 71, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __pyx_tuple__20 = PyTuple_Pack(3, __pyx_n_s_timeout, __pyx_n_s_c_timeout, __pyx_n_s_status); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_auto_deploy, 133, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 133, __pyx_L1_error)
 
-  /* "isisants.pyx":73
- * def py_k_ants_auto_deploy(timeout):
- *     return k_ants_auto_deploy(<uint8_t>timeout)
+  /* "isisants.pyx":140
+ *     return status
+ * 
  * def py_k_ants_cancel_deploy():             # <<<<<<<<<<<<<<
- *     return k_ants_cancel_deploy()
- * def py_k_ants_get_deploy_status(int resp):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_cancel_deploy, 73, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 73, __pyx_L1_error)
-
-  /* "isisants.pyx":75
- * def py_k_ants_cancel_deploy():
- *     return k_ants_cancel_deploy()
- * def py_k_ants_get_deploy_status(int resp):             # <<<<<<<<<<<<<<
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
- * def py_k_ants_get_uptime( int uptime):
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_n_s_status); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_cancel_deploy, 140, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 140, __pyx_L1_error)
+
+  /* "isisants.pyx":146
+ *     return status
+ * 
+ * def py_k_ants_get_deploy_status():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: deployment status register bits
  */
-  __pyx_tuple__14 = PyTuple_Pack(2, __pyx_n_s_resp, __pyx_n_s_resp); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
-  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_deploy_status, 75, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __pyx_tuple__24 = PyTuple_Pack(2, __pyx_n_s_resp, __pyx_n_s_status); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_deploy_status, 146, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 146, __pyx_L1_error)
 
-  /* "isisants.pyx":77
- * def py_k_ants_get_deploy_status(int resp):
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
- * def py_k_ants_get_uptime( int uptime):             # <<<<<<<<<<<<<<
- *     return k_ants_get_uptime(<uint32_t *>uptime)
- * def py_k_ants_get_system_telemetry(telem):
+  /* "isisants.pyx":157
+ *     return resp
+ * 
+ * def py_k_ants_get_uptime():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: controller uptime in seconds
  */
-  __pyx_tuple__16 = PyTuple_Pack(2, __pyx_n_s_uptime, __pyx_n_s_uptime); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 77, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
-  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_uptime, 77, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_tuple__26 = PyTuple_Pack(2, __pyx_n_s_uptime, __pyx_n_s_status); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_uptime, 157, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 157, __pyx_L1_error)
 
-  /* "isisants.pyx":79
- * def py_k_ants_get_uptime( int uptime):
- *     return k_ants_get_uptime(<uint32_t *>uptime)
- * def py_k_ants_get_system_telemetry(telem):             # <<<<<<<<<<<<<<
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
- * def py_k_ants_get_activation_count(antenna, count):
+  /* "isisants.pyx":168
+ *     return uptime
+ * 
+ * def py_k_ants_get_system_telemetry():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: {"raw_temp", "deploy_status", "uptime"}
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_n_s_telem); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 79, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_system_telemetry, 79, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __pyx_tuple__28 = PyTuple_Pack(2, __pyx_n_s_telem, __pyx_n_s_status); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_system_telemetry, 168, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 168, __pyx_L1_error)
 
-  /* "isisants.pyx":81
- * def py_k_ants_get_system_telemetry(telem):
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
- * def py_k_ants_get_activation_count(antenna, count):             # <<<<<<<<<<<<<<
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
- * def py_k_ants_get_activation_time(antenna, int time):
+  /* "isisants.pyx":179
+ *     return {"raw_temp": telem.raw_temp, "deploy_status": telem.deploy_status, "uptime": telem.uptime}
+ * 
+ * def py_k_ants_get_activation_count(antenna):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: number of deployment attempts made on antenna
  */
-  __pyx_tuple__20 = PyTuple_Pack(2, __pyx_n_s_antenna, __pyx_n_s_count); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 81, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_activation_count, 81, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_tuple__30 = PyTuple_Pack(4, __pyx_n_s_antenna, __pyx_n_s_c_antenna, __pyx_n_s_count, __pyx_n_s_status); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(1, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_activation_count, 179, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 179, __pyx_L1_error)
 
-  /* "isisants.pyx":83
- * def py_k_ants_get_activation_count(antenna, count):
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
- * def py_k_ants_get_activation_time(antenna, int time):             # <<<<<<<<<<<<<<
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
- * def py_k_ants_watchdog_kick():
+  /* "isisants.pyx":191
+ *     return count
+ * 
+ * def py_k_ants_get_activation_time(antenna):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: cumulative deployment time of antenna in seconds
  */
-  __pyx_tuple__22 = PyTuple_Pack(2, __pyx_n_s_antenna, __pyx_n_s_time); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 83, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_activation_time, 83, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __pyx_tuple__32 = PyTuple_Pack(4, __pyx_n_s_antenna, __pyx_n_s_c_antenna, __pyx_n_s_time, __pyx_n_s_status); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 191, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(1, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_get_activation_time, 191, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 191, __pyx_L1_error)
 
-  /* "isisants.pyx":85
- * def py_k_ants_get_activation_time(antenna, int time):
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
+  /* "isisants.pyx":203
+ *     return time
+ * 
+ * def py_k_ants_read_all_telemetry(uint8_t ant_count=ANT_COUNT):             # <<<<<<<<<<<<<<
+ *     """
+ *     Reads the system telemetry and every antenna's activation count and time in a single GIL release
+ */
+  __pyx_tuple__34 = PyTuple_Pack(9, __pyx_n_s_ant_count, __pyx_n_s_telem, __pyx_n_s_counts, __pyx_n_s_times, __pyx_n_s_status, __pyx_n_s_i, __pyx_n_s_failed, __pyx_n_s_i, __pyx_n_s_i); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(1, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_read_all_telemetry, 203, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 203, __pyx_L1_error)
+
+  /* "isisants.pyx":242
+ *     }
+ * 
  * def py_k_ants_watchdog_kick():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_kick()
- * def py_k_ants_watchdog_start():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_watchdog_kick, 85, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_tuple__36 = PyTuple_Pack(1, __pyx_n_s_status); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 242, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_watchdog_kick, 242, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 242, __pyx_L1_error)
 
-  /* "isisants.pyx":87
- * def py_k_ants_watchdog_kick():
- *     return k_ants_watchdog_kick()
+  /* "isisants.pyx":248
+ *     return status
+ * 
  * def py_k_ants_watchdog_start():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_start()
- * def py_k_ants_watchdog_stop():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_watchdog_start, 87, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_tuple__38 = PyTuple_Pack(1, __pyx_n_s_status); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_watchdog_start, 248, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 248, __pyx_L1_error)
 
-  /* "isisants.pyx":89
- * def py_k_ants_watchdog_start():
- *     return k_ants_watchdog_start()
+  /* "isisants.pyx":254
+ *     return status
+ * 
  * def py_k_ants_watchdog_stop():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_stop()
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_watchdog_stop, 89, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_tuple__40 = PyTuple_Pack(1, __pyx_n_s_status); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 254, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_watchdog_stop, 254, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 254, __pyx_L1_error)
 
-  /* "isisants.pyx":91
- * def py_k_ants_watchdog_stop():
- *     return k_ants_watchdog_stop()
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):             # <<<<<<<<<<<<<<
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
- * def py_k_i2c_init(device, int fp):
- */
-  __pyx_tuple__27 = PyTuple_Pack(4, __pyx_n_s_tx, __pyx_n_s_tx_len, __pyx_n_s_rx, __pyx_n_s_rx_len); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 91, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(4, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_passthrough, 91, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 91, __pyx_L1_error)
-
-  /* "isisants.pyx":93
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
- * def py_k_i2c_init(device, int fp):             # <<<<<<<<<<<<<<
- *     return k_i2c_init(<char *>device, <int *>fp)
- * def py_k_i2c_terminate(int fp):
+  /* "isisants.pyx":260
+ *     return status
+ * 
+ * def py_k_ants_passthrough(bytes tx, int rx_len):             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends raw bytes to the controller and reads its reply
  */
-  __pyx_tuple__29 = PyTuple_Pack(2, __pyx_n_s_device, __pyx_n_s_fp); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 93, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
-  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_i2c_init, 93, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __pyx_tuple__42 = PyTuple_Pack(7, __pyx_n_s_tx, __pyx_n_s_rx_len, __pyx_n_s_rx, __pyx_n_s_rx_ptr, __pyx_n_s_tx_len, __pyx_n_s_tx_ptr, __pyx_n_s_status); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
+  __pyx_codeobj__43 = (PyObject*)__Pyx_PyCode_New(2, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__42, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_ants_passthrough, 260, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__43)) __PYX_ERR(0, 260, __pyx_L1_error)
 
-  /* "isisants.pyx":95
- * def py_k_i2c_init(device, int fp):
- *     return k_i2c_init(<char *>device, <int *>fp)
+  /* "isisants.pyx":275
+ *     return bytes(rx)
+ * 
+ * def py_k_i2c_init(char * device):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: file descriptor of the opened bus
+ */
+  __pyx_tuple__44 = PyTuple_Pack(4, __pyx_n_s_device, __pyx_n_s_device, __pyx_n_s_fp, __pyx_n_s_status); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(0, 275, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
+  __pyx_codeobj__45 = (PyObject*)__Pyx_PyCode_New(1, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__44, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_i2c_init, 275, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__45)) __PYX_ERR(0, 275, __pyx_L1_error)
+
+  /* "isisants.pyx":286
+ *     return fp
+ * 
  * def py_k_i2c_terminate(int fp):             # <<<<<<<<<<<<<<
- *     k_i2c_terminate(<int *>fp)
- * def py_k_i2c_write(i2c, addr, ptr, len):
+ *     with nogil:
+ *         k_i2c_terminate(&fp)
  */
-  __pyx_tuple__31 = PyTuple_Pack(2, __pyx_n_s_fp, __pyx_n_s_fp); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 95, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__31);
-  __Pyx_GIVEREF(__pyx_tuple__31);
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_i2c_terminate, 95, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_tuple__46 = PyTuple_Pack(2, __pyx_n_s_fp, __pyx_n_s_fp); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+  __pyx_codeobj__47 = (PyObject*)__Pyx_PyCode_New(1, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__46, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_i2c_terminate, 286, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__47)) __PYX_ERR(0, 286, __pyx_L1_error)
 
-  /* "isisants.pyx":97
- * def py_k_i2c_terminate(int fp):
- *     k_i2c_terminate(<int *>fp)
- * def py_k_i2c_write(i2c, addr, ptr, len):             # <<<<<<<<<<<<<<
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- * def py_k_i2c_read( i2c, addr, ptr, int len):
- */
-  __pyx_tuple__33 = PyTuple_Pack(4, __pyx_n_s_i2c, __pyx_n_s_addr, __pyx_n_s_ptr, __pyx_n_s_len); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 97, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__33);
-  __Pyx_GIVEREF(__pyx_tuple__33);
-  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(4, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_i2c_write, 97, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 97, __pyx_L1_error)
-
-  /* "isisants.pyx":99
- * def py_k_i2c_write(i2c, addr, ptr, len):
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- * def py_k_i2c_read( i2c, addr, ptr, int len):             # <<<<<<<<<<<<<<
- *     return k_i2c_read(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- */
-  __pyx_tuple__35 = PyTuple_Pack(4, __pyx_n_s_i2c, __pyx_n_s_addr, __pyx_n_s_ptr, __pyx_n_s_len); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 99, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__35);
-  __Pyx_GIVEREF(__pyx_tuple__35);
-  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(4, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_i2c_read, 99, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) __PYX_ERR(0, 99, __pyx_L1_error)
+  /* "isisants.pyx":290
+ *         k_i2c_terminate(&fp)
+ * 
+ * def py_k_i2c_write(int i2c, uint16_t addr, bytes data):             # <<<<<<<<<<<<<<
+ *     cdef int length = len(data)
+ *     cdef uint8_t * ptr = <uint8_t *><char *>data
+ */
+  __pyx_tuple__48 = PyTuple_Pack(6, __pyx_n_s_i2c, __pyx_n_s_addr, __pyx_n_s_data, __pyx_n_s_length, __pyx_n_s_ptr, __pyx_n_s_status); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+  __pyx_codeobj__49 = (PyObject*)__Pyx_PyCode_New(3, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__48, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_i2c_write, 290, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__49)) __PYX_ERR(0, 290, __pyx_L1_error)
+
+  /* "isisants.pyx":298
+ *     return status
+ * 
+ * def py_k_i2c_read(int i2c, uint16_t addr, int length):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: length bytes read from addr
+ */
+  __pyx_tuple__50 = PyTuple_Pack(6, __pyx_n_s_i2c, __pyx_n_s_addr, __pyx_n_s_length, __pyx_n_s_data, __pyx_n_s_ptr, __pyx_n_s_status); if (unlikely(!__pyx_tuple__50)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__50);
+  __Pyx_GIVEREF(__pyx_tuple__50);
+  __pyx_codeobj__51 = (PyObject*)__Pyx_PyCode_New(3, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isisants_pyx, __pyx_n_s_py_k_i2c_read, 298, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__51)) __PYX_ERR(0, 298, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -3466,7 +6156,8 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 }
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -3537,17 +6228,19 @@ static int __Pyx_modinit_function_import_code(void) {
 }
 
 
-#if PY_MAJOR_VERSION < 3
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC void
-#else
+#ifndef CYTHON_NO_PYINIT_EXPORT
 #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
 #endif
 #else
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC PyObject *
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
 #else
-#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#define __Pyx_PyMODINIT_FUNC PyObject *
 #endif
 #endif
 
@@ -3629,6 +6322,12 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_isisants(PyObject *__pyx_pyinit_mo
 #endif
 {
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  uint8_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   if (__pyx_m) {
@@ -3676,18 +6375,16 @@ if (!__Pyx_RefNanny) {
   #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
   PyEval_InitThreads();
   #endif
-  #endif
   /*--- Module creation code ---*/
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __pyx_m = __pyx_pyinit_module;
   Py_INCREF(__pyx_m);
   #else
   #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("isisants", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  __pyx_m = Py_InitModule4("isisants", __pyx_methods, __pyx_k_Binding_for_the_Kubos_ISIS_ante, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
   #endif
@@ -3699,7 +6396,7 @@ if (!__Pyx_RefNanny) {
   Py_INCREF(__pyx_b);
   __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_cython_runtime);
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Initialize various global constants etc. ---*/
   if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
@@ -3733,273 +6430,338 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "isisants.pyx":57
+  /* "isisants.pyx":71
+ *     KANTSStatus k_ants_passthrough(const uint8_t * tx, int tx_len, uint8_t * rx, int rx_len)
+ * 
+ * ANT_COUNT = 4             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ANT_COUNT, __pyx_int_4) < 0) __PYX_ERR(0, 71, __pyx_L1_error)
+
+  /* "isisants.pyx":74
+ * 
+ * 
+ * class AntsError(OSError):             # <<<<<<<<<<<<<<
+ *     """
+ *     Raised by a getter when the antenna controller or I2C bus returns a status other than OK
+ */
+  __pyx_t_1 = __Pyx_CalculateMetaclass(NULL, __pyx_tuple__4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare(__pyx_t_1, __pyx_tuple__4, __pyx_n_s_AntsError, __pyx_n_s_AntsError, (PyObject *) NULL, __pyx_n_s_isisants, __pyx_kp_s_Raised_by_a_getter_when_the_ant); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  /* "isisants.pyx":79
+ *     """
+ * 
+ *     def __init__(self, call, status):             # <<<<<<<<<<<<<<
+ *         OSError.__init__(self, f"{call} returned status {status}")
+ *         self.call = call
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_8isisants_9AntsError_1__init__, 0, __pyx_n_s_AntsError___init, NULL, __pyx_n_s_isisants, __pyx_d, ((PyObject *)__pyx_codeobj__6)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_init, __pyx_t_3) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "isisants.pyx":74
+ * 
+ * 
+ * class AntsError(OSError):             # <<<<<<<<<<<<<<
+ *     """
+ *     Raised by a getter when the antenna controller or I2C bus returns a status other than OK
+ */
+  __pyx_t_3 = __Pyx_Py3ClassCreate(__pyx_t_1, __pyx_n_s_AntsError, __pyx_tuple__4, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_AntsError, __pyx_t_3) < 0) __PYX_ERR(0, 74, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "isisants.pyx":90
  * 
  * 
  * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)
- * def py_k_ants_terminate():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_1py_k_ants_init, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_1py_k_ants_init, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_init, __pyx_t_1) < 0) __PYX_ERR(0, 57, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_init, __pyx_t_1) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":59
- * def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):
- *     return k_ants_init(bus,primary,secondary,ant_count,timeout)
+  /* "isisants.pyx":96
+ *     return status
+ * 
  * def py_k_ants_terminate():             # <<<<<<<<<<<<<<
- *     k_ants_terminate()
- * def py_k_ants_configure(KANTSController config):
+ *     with nogil:
+ *         k_ants_terminate()
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_3py_k_ants_terminate, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_3py_k_ants_terminate, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_terminate, __pyx_t_1) < 0) __PYX_ERR(0, 59, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_terminate, __pyx_t_1) < 0) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":61
- * def py_k_ants_terminate():
- *     k_ants_terminate()
+  /* "isisants.pyx":100
+ *         k_ants_terminate()
+ * 
  * def py_k_ants_configure(KANTSController config):             # <<<<<<<<<<<<<<
- *     return k_ants_configure(config)
- * def py_k_ants_reset():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_5py_k_ants_configure, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_5py_k_ants_configure, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_configure, __pyx_t_1) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_configure, __pyx_t_1) < 0) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":63
- * def py_k_ants_configure(KANTSController config):
- *     return k_ants_configure(config)
+  /* "isisants.pyx":106
+ *     return status
+ * 
  * def py_k_ants_reset():             # <<<<<<<<<<<<<<
- *     return k_ants_reset()
- * def py_k_ants_arm():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_7py_k_ants_reset, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_7py_k_ants_reset, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_reset, __pyx_t_1) < 0) __PYX_ERR(0, 63, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_reset, __pyx_t_1) < 0) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":65
- * def py_k_ants_reset():
- *     return k_ants_reset()
+  /* "isisants.pyx":112
+ *     return status
+ * 
  * def py_k_ants_arm():             # <<<<<<<<<<<<<<
- *     return k_ants_arm()
- * def py_k_ants_disarm():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_9py_k_ants_arm, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_9py_k_ants_arm, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 112, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_arm, __pyx_t_1) < 0) __PYX_ERR(0, 65, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_arm, __pyx_t_1) < 0) __PYX_ERR(0, 112, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":67
- * def py_k_ants_arm():
- *     return k_ants_arm()
+  /* "isisants.pyx":118
+ *     return status
+ * 
  * def py_k_ants_disarm():             # <<<<<<<<<<<<<<
- *     return k_ants_disarm()
- * def py_k_ants_deploy(antenna, override, timeout):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_11py_k_ants_disarm, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_11py_k_ants_disarm, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 118, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_disarm, __pyx_t_1) < 0) __PYX_ERR(0, 67, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_disarm, __pyx_t_1) < 0) __PYX_ERR(0, 118, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":69
- * def py_k_ants_disarm():
- *     return k_ants_disarm()
+  /* "isisants.pyx":124
+ *     return status
+ * 
  * def py_k_ants_deploy(antenna, override, timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
- * def py_k_ants_auto_deploy(timeout):
+ *     cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+ *     cdef bool c_override = <bool>override
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_13py_k_ants_deploy, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_13py_k_ants_deploy, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 124, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_deploy, __pyx_t_1) < 0) __PYX_ERR(0, 69, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_deploy, __pyx_t_1) < 0) __PYX_ERR(0, 124, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":71
- * def py_k_ants_deploy(antenna, override, timeout):
- *     return k_ants_deploy(<KANTSAnt>antenna,<bool>override,<uint8_t>timeout)
+  /* "isisants.pyx":133
+ *     return status
+ * 
  * def py_k_ants_auto_deploy(timeout):             # <<<<<<<<<<<<<<
- *     return k_ants_auto_deploy(<uint8_t>timeout)
- * def py_k_ants_cancel_deploy():
+ *     cdef uint8_t c_timeout = <uint8_t>timeout
+ *     cdef KANTSStatus status
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_15py_k_ants_auto_deploy, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_15py_k_ants_auto_deploy, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_auto_deploy, __pyx_t_1) < 0) __PYX_ERR(0, 71, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_auto_deploy, __pyx_t_1) < 0) __PYX_ERR(0, 133, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":73
- * def py_k_ants_auto_deploy(timeout):
- *     return k_ants_auto_deploy(<uint8_t>timeout)
+  /* "isisants.pyx":140
+ *     return status
+ * 
  * def py_k_ants_cancel_deploy():             # <<<<<<<<<<<<<<
- *     return k_ants_cancel_deploy()
- * def py_k_ants_get_deploy_status(int resp):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_17py_k_ants_cancel_deploy, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_17py_k_ants_cancel_deploy, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_cancel_deploy, __pyx_t_1) < 0) __PYX_ERR(0, 73, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_cancel_deploy, __pyx_t_1) < 0) __PYX_ERR(0, 140, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":75
- * def py_k_ants_cancel_deploy():
- *     return k_ants_cancel_deploy()
- * def py_k_ants_get_deploy_status(int resp):             # <<<<<<<<<<<<<<
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
- * def py_k_ants_get_uptime( int uptime):
+  /* "isisants.pyx":146
+ *     return status
+ * 
+ * def py_k_ants_get_deploy_status():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: deployment status register bits
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_19py_k_ants_get_deploy_status, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_19py_k_ants_get_deploy_status, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 146, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_deploy_status, __pyx_t_1) < 0) __PYX_ERR(0, 75, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_deploy_status, __pyx_t_1) < 0) __PYX_ERR(0, 146, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":77
- * def py_k_ants_get_deploy_status(int resp):
- *     return k_ants_get_deploy_status(<uint16_t *>resp)
- * def py_k_ants_get_uptime( int uptime):             # <<<<<<<<<<<<<<
- *     return k_ants_get_uptime(<uint32_t *>uptime)
- * def py_k_ants_get_system_telemetry(telem):
+  /* "isisants.pyx":157
+ *     return resp
+ * 
+ * def py_k_ants_get_uptime():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: controller uptime in seconds
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_21py_k_ants_get_uptime, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_21py_k_ants_get_uptime, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_uptime, __pyx_t_1) < 0) __PYX_ERR(0, 77, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_uptime, __pyx_t_1) < 0) __PYX_ERR(0, 157, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":79
- * def py_k_ants_get_uptime( int uptime):
- *     return k_ants_get_uptime(<uint32_t *>uptime)
- * def py_k_ants_get_system_telemetry(telem):             # <<<<<<<<<<<<<<
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
- * def py_k_ants_get_activation_count(antenna, count):
+  /* "isisants.pyx":168
+ *     return uptime
+ * 
+ * def py_k_ants_get_system_telemetry():             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: {"raw_temp", "deploy_status", "uptime"}
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_23py_k_ants_get_system_telemetry, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_23py_k_ants_get_system_telemetry, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_system_telemetry, __pyx_t_1) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_system_telemetry, __pyx_t_1) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":81
- * def py_k_ants_get_system_telemetry(telem):
- *     return k_ants_get_system_telemetry(<ants_telemetry *>telem)
- * def py_k_ants_get_activation_count(antenna, count):             # <<<<<<<<<<<<<<
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
- * def py_k_ants_get_activation_time(antenna, int time):
+  /* "isisants.pyx":179
+ *     return {"raw_temp": telem.raw_temp, "deploy_status": telem.deploy_status, "uptime": telem.uptime}
+ * 
+ * def py_k_ants_get_activation_count(antenna):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: number of deployment attempts made on antenna
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_25py_k_ants_get_activation_count, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_25py_k_ants_get_activation_count, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_activation_count, __pyx_t_1) < 0) __PYX_ERR(0, 81, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_activation_count, __pyx_t_1) < 0) __PYX_ERR(0, 179, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":83
- * def py_k_ants_get_activation_count(antenna, count):
- *     return k_ants_get_activation_count(<KANTSAnt>antenna,<uint8_t *>count)
- * def py_k_ants_get_activation_time(antenna, int time):             # <<<<<<<<<<<<<<
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
- * def py_k_ants_watchdog_kick():
+  /* "isisants.pyx":191
+ *     return count
+ * 
+ * def py_k_ants_get_activation_time(antenna):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: cumulative deployment time of antenna in seconds
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_27py_k_ants_get_activation_time, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_27py_k_ants_get_activation_time, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_activation_time, __pyx_t_1) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_get_activation_time, __pyx_t_1) < 0) __PYX_ERR(0, 191, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":85
- * def py_k_ants_get_activation_time(antenna, int time):
- *     return k_ants_get_activation_time(<KANTSAnt>antenna,<uint16_t *>time)
+  /* "isisants.pyx":203
+ *     return time
+ * 
+ * def py_k_ants_read_all_telemetry(uint8_t ant_count=ANT_COUNT):             # <<<<<<<<<<<<<<
+ *     """
+ *     Reads the system telemetry and every antenna's activation count and time in a single GIL release
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_ANT_COUNT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_PyInt_As_uint8_t(__pyx_t_1); if (unlikely((__pyx_t_4 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_k_ = __pyx_t_4;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_29py_k_ants_read_all_telemetry, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_read_all_telemetry, __pyx_t_1) < 0) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "isisants.pyx":242
+ *     }
+ * 
  * def py_k_ants_watchdog_kick():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_kick()
- * def py_k_ants_watchdog_start():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_29py_k_ants_watchdog_kick, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_31py_k_ants_watchdog_kick, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 242, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_watchdog_kick, __pyx_t_1) < 0) __PYX_ERR(0, 85, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_watchdog_kick, __pyx_t_1) < 0) __PYX_ERR(0, 242, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":87
- * def py_k_ants_watchdog_kick():
- *     return k_ants_watchdog_kick()
+  /* "isisants.pyx":248
+ *     return status
+ * 
  * def py_k_ants_watchdog_start():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_start()
- * def py_k_ants_watchdog_stop():
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_31py_k_ants_watchdog_start, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_33py_k_ants_watchdog_start, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_watchdog_start, __pyx_t_1) < 0) __PYX_ERR(0, 87, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_watchdog_start, __pyx_t_1) < 0) __PYX_ERR(0, 248, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":89
- * def py_k_ants_watchdog_start():
- *     return k_ants_watchdog_start()
+  /* "isisants.pyx":254
+ *     return status
+ * 
  * def py_k_ants_watchdog_stop():             # <<<<<<<<<<<<<<
- *     return k_ants_watchdog_stop()
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
+ *     cdef KANTSStatus status
+ *     with nogil:
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_33py_k_ants_watchdog_stop, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_35py_k_ants_watchdog_stop, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_watchdog_stop, __pyx_t_1) < 0) __PYX_ERR(0, 89, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_watchdog_stop, __pyx_t_1) < 0) __PYX_ERR(0, 254, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":91
- * def py_k_ants_watchdog_stop():
- *     return k_ants_watchdog_stop()
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):             # <<<<<<<<<<<<<<
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
- * def py_k_i2c_init(device, int fp):
+  /* "isisants.pyx":260
+ *     return status
+ * 
+ * def py_k_ants_passthrough(bytes tx, int rx_len):             # <<<<<<<<<<<<<<
+ *     """
+ *     Sends raw bytes to the controller and reads its reply
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_35py_k_ants_passthrough, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_37py_k_ants_passthrough, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_passthrough, __pyx_t_1) < 0) __PYX_ERR(0, 91, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_ants_passthrough, __pyx_t_1) < 0) __PYX_ERR(0, 260, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":93
- * def py_k_ants_passthrough(tx, tx_len,rx,rx_len):
- *     return k_ants_passthrough(<const uint8_t *>tx,<int>tx_len,<uint8_t *>rx,<int>rx_len)
- * def py_k_i2c_init(device, int fp):             # <<<<<<<<<<<<<<
- *     return k_i2c_init(<char *>device, <int *>fp)
- * def py_k_i2c_terminate(int fp):
+  /* "isisants.pyx":275
+ *     return bytes(rx)
+ * 
+ * def py_k_i2c_init(char * device):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: file descriptor of the opened bus
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_37py_k_i2c_init, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_39py_k_i2c_init, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 275, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_i2c_init, __pyx_t_1) < 0) __PYX_ERR(0, 93, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_i2c_init, __pyx_t_1) < 0) __PYX_ERR(0, 275, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":95
- * def py_k_i2c_init(device, int fp):
- *     return k_i2c_init(<char *>device, <int *>fp)
+  /* "isisants.pyx":286
+ *     return fp
+ * 
  * def py_k_i2c_terminate(int fp):             # <<<<<<<<<<<<<<
- *     k_i2c_terminate(<int *>fp)
- * def py_k_i2c_write(i2c, addr, ptr, len):
+ *     with nogil:
+ *         k_i2c_terminate(&fp)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_39py_k_i2c_terminate, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_41py_k_i2c_terminate, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 286, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_i2c_terminate, __pyx_t_1) < 0) __PYX_ERR(0, 95, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_i2c_terminate, __pyx_t_1) < 0) __PYX_ERR(0, 286, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":97
- * def py_k_i2c_terminate(int fp):
- *     k_i2c_terminate(<int *>fp)
- * def py_k_i2c_write(i2c, addr, ptr, len):             # <<<<<<<<<<<<<<
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- * def py_k_i2c_read( i2c, addr, ptr, int len):
+  /* "isisants.pyx":290
+ *         k_i2c_terminate(&fp)
+ * 
+ * def py_k_i2c_write(int i2c, uint16_t addr, bytes data):             # <<<<<<<<<<<<<<
+ *     cdef int length = len(data)
+ *     cdef uint8_t * ptr = <uint8_t *><char *>data
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_41py_k_i2c_write, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_43py_k_i2c_write, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 290, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_i2c_write, __pyx_t_1) < 0) __PYX_ERR(0, 97, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_i2c_write, __pyx_t_1) < 0) __PYX_ERR(0, 290, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "isisants.pyx":99
- * def py_k_i2c_write(i2c, addr, ptr, len):
- *     return k_i2c_write(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
- * def py_k_i2c_read( i2c, addr, ptr, int len):             # <<<<<<<<<<<<<<
- *     return k_i2c_read(<int>i2c, <uint16_t>addr, <uint8_t *>ptr, <int>len)
+  /* "isisants.pyx":298
+ *     return status
+ * 
+ * def py_k_i2c_read(int i2c, uint16_t addr, int length):             # <<<<<<<<<<<<<<
+ *     """
+ *     :return: length bytes read from addr
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_43py_k_i2c_read, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8isisants_45py_k_i2c_read, NULL, __pyx_n_s_isisants); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_i2c_read, __pyx_t_1) < 0) __PYX_ERR(0, 99, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_py_k_i2c_read, __pyx_t_1) < 0) __PYX_ERR(0, 298, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "isisants.pyx":1
- * from libc.stdint cimport uint8_t, uint16_t, uint32_t             # <<<<<<<<<<<<<<
- * from libcpp cimport bool
- * cdef extern from "i2c.h":
+ * # cython: language_level=3             # <<<<<<<<<<<<<<
+ * """
+ * Binding for the Kubos ISIS antenna system API (ants-api.h) and its I2C helpers (i2c.h).
  */
   __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -4011,6 +6773,8 @@ if (!__Pyx_RefNanny) {
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   if (__pyx_m) {
     if (__pyx_d) {
       __Pyx_AddTraceback("init isisants", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -4046,217 +6810,1615 @@ end:
     Py_XDECREF(m);
     return (__Pyx_RefNannyAPIStruct *)r;
 }
-#endif
-
-/* RaiseArgTupleInvalid */
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      CYTHON_UNUSED Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+#if CYTHON_PEP393_ENABLED
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    result_udata = PyUnicode_DATA(result_uval);
+#else
+    result_uval = PyUnicode_FromUnicode(NULL, result_ulength);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = sizeof(Py_UNICODE);
+    result_udata = PyUnicode_AS_UNICODE(result_uval);
+#endif
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = PyTuple_GET_ITEM(value_tuple, i);
+        if (unlikely(__Pyx_PyUnicode_READY(uval)))
+            goto bad;
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely(char_pos + ulength < 0))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (!CYTHON_PEP393_ENABLED || ukind == result_ukind) {
+            memcpy((char *)result_udata + char_pos * result_ukind, udata, (size_t) (ulength * result_ukind));
+        } else {
+            #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030300F0 || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
+            }
+            #endif
+        }
+        char_pos += ulength;
+    }
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
+#else
+    result_ulength++;
+    value_count++;
+    return PyUnicode_Join(__pyx_empty_unicode, value_tuple);
+#endif
+}
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectSetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_setattro))
+        return tp->tp_setattro(obj, attr_name, value);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_setattr))
+        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
+#endif
+    return PyObject_SetAttr(obj, attr_name, value);
+}
+#endif
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* ModInt[long] */
+static CYTHON_INLINE long __Pyx_mod_long(long a, long b) {
+    long r = a % b;
+    r += ((r != 0) & ((r ^ b) < 0)) * b;
+    return r;
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* CalculateMetaclass */
+static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
+    Py_ssize_t i, nbases = PyTuple_GET_SIZE(bases);
+    for (i=0; i < nbases; i++) {
+        PyTypeObject *tmptype;
+        PyObject *tmp = PyTuple_GET_ITEM(bases, i);
+        tmptype = Py_TYPE(tmp);
+#if PY_MAJOR_VERSION < 3
+        if (tmptype == &PyClass_Type)
+            continue;
+#endif
+        if (!metaclass) {
+            metaclass = tmptype;
+            continue;
+        }
+        if (PyType_IsSubtype(metaclass, tmptype))
+            continue;
+        if (PyType_IsSubtype(tmptype, metaclass)) {
+            metaclass = tmptype;
+            continue;
+        }
+        PyErr_SetString(PyExc_TypeError,
+                        "metaclass conflict: "
+                        "the metaclass of a derived class "
+                        "must be a (non-strict) subclass "
+                        "of the metaclasses of all its bases");
+        return NULL;
+    }
+    if (!metaclass) {
+#if PY_MAJOR_VERSION < 3
+        metaclass = &PyClass_Type;
+#else
+        metaclass = &PyType_Type;
+#endif
+    }
+    Py_INCREF((PyObject*) metaclass);
+    return (PyObject*) metaclass;
+}
+
+/* FetchCommonType */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    PyObject* fake_module;
+    PyTypeObject* cached_type = NULL;
+    fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
+    if (!fake_module) return NULL;
+    Py_INCREF(fake_module);
+    cached_type = (PyTypeObject*) PyObject_GetAttrString(fake_module, type->tp_name);
+    if (cached_type) {
+        if (!PyType_Check((PyObject*)cached_type)) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s is not a type object",
+                type->tp_name);
+            goto bad;
+        }
+        if (cached_type->tp_basicsize != type->tp_basicsize) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s has the wrong size, try recompiling",
+                type->tp_name);
+            goto bad;
+        }
+    } else {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+        PyErr_Clear();
+        if (PyType_Ready(type) < 0) goto bad;
+        if (PyObject_SetAttrString(fake_module, type->tp_name, (PyObject*) type) < 0)
+            goto bad;
+        Py_INCREF(type);
+        cached_type = type;
+    }
+done:
+    Py_DECREF(fake_module);
+    return cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+
+/* CythonFunctionShared */
+#include <structmember.h>
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *closure)
+{
+    if (unlikely(op->func_doc == NULL)) {
+        if (op->func.m_ml->ml_doc) {
+#if PY_MAJOR_VERSION >= 3
+            op->func_doc = PyUnicode_FromString(op->func.m_ml->ml_doc);
+#else
+            op->func_doc = PyString_FromString(op->func.m_ml->ml_doc);
+#endif
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp = op->func_doc;
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    op->func_doc = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if PY_MAJOR_VERSION >= 3
+        op->func_name = PyUnicode_InternFromString(op->func.m_ml->ml_name);
+#else
+        op->func_name = PyString_InternFromString(op->func.m_ml->ml_name);
+#endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_name;
+    Py_INCREF(value);
+    op->func_name = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_qualname);
+    return op->func_qualname;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_qualname;
+    Py_INCREF(value);
+    op->func_qualname = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_self(__pyx_CyFunctionObject *m, CYTHON_UNUSED void *closure)
+{
+    PyObject *self;
+    self = m->func_closure;
+    if (self == NULL)
+        self = Py_None;
+    Py_INCREF(self);
+    return self;
+}
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+static int
+__Pyx_CyFunction_set_dict(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+    if (unlikely(value == NULL)) {
+        PyErr_SetString(PyExc_TypeError,
+               "function's dictionary may not be deleted");
+        return -1;
+    }
+    if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+               "setting function's dictionary to a non-dict");
+        return -1;
+    }
+    tmp = op->func_dict;
+    Py_INCREF(value);
+    op->func_dict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(CYTHON_UNUSED __pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyTuple_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_tuple;
+    op->defaults_tuple = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_kwdict;
+    op->defaults_kwdict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (!PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    Py_XINCREF(value);
+    tmp = op->func_annotations;
+    op->func_annotations = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {(char *) "func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+    {(char *) "__self__", (getter)__Pyx_CyFunction_get_self, 0, 0, 0},
+    {(char *) "func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {(char *) "__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+    {(char *) "__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), PY_WRITE_RESTRICTED, 0},
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, CYTHON_UNUSED PyObject *args)
+{
+#if PY_MAJOR_VERSION >= 3
+    Py_INCREF(m->func_qualname);
+    return m->func_qualname;
+#else
+    return PyString_FromString(m->func.m_ml->ml_name);
+#endif
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if PY_VERSION_HEX < 0x030500A0
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func.m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    if (unlikely(op == NULL))
+        return NULL;
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+    op->func.m_ml = ml;
+    op->func.m_self = (PyObject *) op;
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+    Py_XINCREF(module);
+    op->func.m_module = module;
+    op->func_dict = NULL;
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+    op->func_classobj = NULL;
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults_pyobjects = 0;
+    op->defaults_size = 0;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
 {
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
+    Py_CLEAR(m->func_closure);
+    Py_CLEAR(m->func.m_module);
+    Py_CLEAR(m->func_dict);
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+    Py_CLEAR(m->func_classobj);
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_XDECREF(pydefaults[i]);
+        PyObject_Free(m->defaults);
+        m->defaults = NULL;
     }
-    if (exact) {
-        more_or_less = "exactly";
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    PyObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    Py_VISIT(m->func_closure);
+    Py_VISIT(m->func.m_module);
+    Py_VISIT(m->func_dict);
+    Py_VISIT(m->func_name);
+    Py_VISIT(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    Py_VISIT(m->func_code);
+    Py_VISIT(m->func_classobj);
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_VISIT(pydefaults[i]);
     }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
+    return 0;
 }
-
-/* RaiseDoubleKeywords */
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
+static PyObject *__Pyx_CyFunction_descr_get(PyObject *func, PyObject *obj, PyObject *type)
 {
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AsString(kw_name));
-        #endif
+#if PY_MAJOR_VERSION < 3
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    if (m->flags & __Pyx_CYFUNCTION_STATICMETHOD) {
+        Py_INCREF(func);
+        return func;
+    }
+    if (m->flags & __Pyx_CYFUNCTION_CLASSMETHOD) {
+        if (type == NULL)
+            type = (PyObject *)(Py_TYPE(obj));
+        return __Pyx_PyMethod_New(func, type, (PyObject *)(Py_TYPE(type)));
+    }
+    if (obj == Py_None)
+        obj = NULL;
+#endif
+    return __Pyx_PyMethod_New(func, obj, type);
 }
-
-/* ParseKeywords */
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
 {
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-            continue;
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+#else
+    return PyString_FromFormat("<cyfunction %s at %p>",
+                               PyString_AsString(op->func_qualname), (void *)op);
+#endif
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    Py_ssize_t size;
+    switch (f->m_ml->ml_flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void*)meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
         }
-        name = first_kw_arg;
-        #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
-            while (*name) {
-                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
-                        && _PyString_Eq(**name, key)) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    if ((**argname == key) || (
-                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
-                             && _PyString_Eq(**argname, key))) {
-                        goto arg_passed_twice;
-                    }
-                    argname++;
-                }
-            }
-        } else
-        #endif
-        if (likely(PyUnicode_Check(key))) {
-            while (*name) {
-                int cmp = (**name == key) ? 0 :
-                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
                 #endif
-                    PyUnicode_Compare(**name, key);
-                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                if (cmp == 0) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    int cmp = (**argname == key) ? 0 :
-                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
-                    #endif
-                        PyUnicode_Compare(**argname, key);
-                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                    if (cmp == 0) goto arg_passed_twice;
-                    argname++;
-                }
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
             }
-        } else
-            goto invalid_keyword_type;
-        if (kwds2) {
-            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-        } else {
-            goto invalid_keyword;
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
         }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags in "
+                        "__Pyx_CyFunction_Call. METH_OLDARGS is no "
+                        "longer supported!");
+        return NULL;
     }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
+    PyErr_Format(PyExc_TypeError, "%.200s() takes no keyword arguments",
+                 f->m_ml->ml_name);
+    return NULL;
 }
-
-/* PyDictVersioning */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    return __Pyx_CyFunction_CallMethod(func, ((PyCFunctionObject*)func)->m_self, arg, kw);
 }
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
-    PyObject **dictptr = NULL;
-    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
-    if (offset) {
-#if CYTHON_COMPILING_IN_CPYTHON
-        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+        argc = PyTuple_GET_SIZE(args);
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+#if PY_MAJOR_VERSION > 2
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
 #else
-        dictptr = _PyObject_GetDictPtr(obj);
+            PyErr_SetString(PyExc_TypeError,
+                            "unbound method needs an argument");
 #endif
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
     }
-    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
-}
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
-        return 0;
-    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+    return result;
 }
-#endif
-
-/* PyObjectGetAttrStr */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
+static PyTypeObject __pyx_CyFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+    (destructor) __Pyx_CyFunction_dealloc,
+    0,
+    0,
+    0,
 #if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_getattr))
-        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+    0,
+#else
+    0,
+#endif
+    (reprfunc) __Pyx_CyFunction_repr,
+    0,
+    0,
+    0,
+    0,
+    __Pyx_CyFunction_CallAsMethod,
+    0,
+    0,
+    0,
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    0,
+    (traverseproc) __Pyx_CyFunction_traverse,
+    (inquiry) __Pyx_CyFunction_clear,
+    0,
+#if PY_VERSION_HEX < 0x030500A0
+    offsetof(__pyx_CyFunctionObject, func_weakreflist),
+#else
+    offsetof(PyCFunctionObject, m_weakreflist),
+#endif
+    0,
+    0,
+    __pyx_CyFunction_methods,
+    __pyx_CyFunction_members,
+    __pyx_CyFunction_getsets,
+    0,
+    0,
+    __Pyx_CyFunction_descr_get,
+    0,
+    offsetof(__pyx_CyFunctionObject, func_dict),
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
 #endif
-    return PyObject_GetAttr(obj, attr_name);
+};
+static int __pyx_CyFunction_init(void) {
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    m->defaults_size = size;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
 }
-#endif
 
-/* PyErrFetchRestore */
-#if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
 }
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
+
+/* Py3ClassCreate */
+static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name,
+                                           PyObject *qualname, PyObject *mkw, PyObject *modname, PyObject *doc) {
+    PyObject *ns;
+    if (metaclass) {
+        PyObject *prep = __Pyx_PyObject_GetAttrStr(metaclass, __pyx_n_s_prepare);
+        if (prep) {
+            PyObject *pargs = PyTuple_Pack(2, name, bases);
+            if (unlikely(!pargs)) {
+                Py_DECREF(prep);
+                return NULL;
+            }
+            ns = PyObject_Call(prep, pargs, mkw);
+            Py_DECREF(prep);
+            Py_DECREF(pargs);
+        } else {
+            if (unlikely(!PyErr_ExceptionMatches(PyExc_AttributeError)))
+                return NULL;
+            PyErr_Clear();
+            ns = PyDict_New();
+        }
+    } else {
+        ns = PyDict_New();
+    }
+    if (unlikely(!ns))
+        return NULL;
+    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_module, modname) < 0)) goto bad;
+    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_qualname, qualname) < 0)) goto bad;
+    if (unlikely(doc && PyObject_SetItem(ns, __pyx_n_s_doc, doc) < 0)) goto bad;
+    return ns;
+bad:
+    Py_DECREF(ns);
+    return NULL;
+}
+static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases,
+                                      PyObject *dict, PyObject *mkw,
+                                      int calculate_metaclass, int allow_py2_metaclass) {
+    PyObject *result, *margs;
+    PyObject *owned_metaclass = NULL;
+    if (allow_py2_metaclass) {
+        owned_metaclass = PyObject_GetItem(dict, __pyx_n_s_metaclass);
+        if (owned_metaclass) {
+            metaclass = owned_metaclass;
+        } else if (likely(PyErr_ExceptionMatches(PyExc_KeyError))) {
+            PyErr_Clear();
+        } else {
+            return NULL;
+        }
+    }
+    if (calculate_metaclass && (!metaclass || PyType_Check(metaclass))) {
+        metaclass = __Pyx_CalculateMetaclass((PyTypeObject*) metaclass, bases);
+        Py_XDECREF(owned_metaclass);
+        if (unlikely(!metaclass))
+            return NULL;
+        owned_metaclass = metaclass;
+    }
+    margs = PyTuple_Pack(3, name, bases, dict);
+    if (unlikely(!margs)) {
+        result = NULL;
+    } else {
+        result = PyObject_Call(metaclass, margs, mkw);
+        Py_DECREF(margs);
+    }
+    Py_XDECREF(owned_metaclass);
+    return result;
 }
-#endif
 
 /* CLineInTraceback */
 #ifndef CYTHON_CLINE_IN_TRACEBACK
-static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
 #if CYTHON_COMPILING_IN_CPYTHON
@@ -4286,7 +8448,7 @@ static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
     }
     if (!use_cline) {
         c_line = 0;
-        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
     else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
         c_line = 0;
@@ -4360,7 +8522,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
     if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
         int new_max = __pyx_code_cache.max_count + 64;
         entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
         if (unlikely(!entries)) {
             return;
         }
@@ -4380,33 +8542,40 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
     py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
     if (!py_srcfile) goto bad;
+    #endif
     if (c_line) {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
         #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
         #endif
     }
     else {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
+        if (!py_funcname) goto bad;
         #endif
     }
-    if (!py_funcname) goto bad;
+    #if PY_MAJOR_VERSION < 3
     py_code = __Pyx_PyCode_New(
         0,
         0,
@@ -4425,11 +8594,16 @@ static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
         __pyx_empty_bytes  /*PyObject *lnotab*/
     );
     Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
@@ -4437,14 +8611,24 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
     py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
@@ -4483,71 +8667,16 @@ bad:
         return (target_type) value;\
     }
 
-/* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_KANTSStatus(KANTSStatus value) {
-    const KANTSStatus neg_one = (KANTSStatus) ((KANTSStatus) 0 - (KANTSStatus) 1), const_zero = (KANTSStatus) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(KANTSStatus) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(KANTSStatus) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(KANTSStatus) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(KANTSStatus) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(KANTSStatus) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(KANTSStatus),
-                                     little, !is_unsigned);
-    }
-}
-
-/* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_KI2CStatus(KI2CStatus value) {
-    const KI2CStatus neg_one = (KI2CStatus) ((KI2CStatus) 0 - (KI2CStatus) 1), const_zero = (KI2CStatus) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(KI2CStatus) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(KI2CStatus) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(KI2CStatus) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(KI2CStatus) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(KI2CStatus) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(KI2CStatus),
-                                     little, !is_unsigned);
-    }
-}
-
 /* CIntFromPy */
 static CYTHON_INLINE uint8_t __Pyx_PyInt_As_uint8_t(PyObject *x) {
-    const uint8_t neg_one = (uint8_t) ((uint8_t) 0 - (uint8_t) 1), const_zero = (uint8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint8_t neg_one = (uint8_t) -1, const_zero = (uint8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -4598,7 +8727,7 @@ static CYTHON_INLINE uint8_t __Pyx_PyInt_As_uint8_t(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -4736,7 +8865,14 @@ raise_neg_overflow:
 
 /* CIntFromPy */
 static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *x) {
-    const uint32_t neg_one = (uint32_t) ((uint32_t) 0 - (uint32_t) 1), const_zero = (uint32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint32_t neg_one = (uint32_t) -1, const_zero = (uint32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -4787,7 +8923,7 @@ static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -4925,7 +9061,14 @@ raise_neg_overflow:
 
 /* CIntFromPy */
 static CYTHON_INLINE KANTSController __Pyx_PyInt_As_KANTSController(PyObject *x) {
-    const KANTSController neg_one = (KANTSController) ((KANTSController) 0 - (KANTSController) 1), const_zero = (KANTSController) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const KANTSController neg_one = (KANTSController) -1, const_zero = (KANTSController) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -4976,7 +9119,7 @@ static CYTHON_INLINE KANTSController __Pyx_PyInt_As_KANTSController(PyObject *x)
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -5114,7 +9257,14 @@ raise_neg_overflow:
 
 /* CIntFromPy */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -5165,7 +9315,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -5302,19 +9452,26 @@ raise_neg_overflow:
 }
 
 /* CIntFromPy */
-static CYTHON_INLINE KANTSAnt __Pyx_PyInt_As_KANTSAnt(PyObject *x) {
-    const KANTSAnt neg_one = (KANTSAnt) ((KANTSAnt) 0 - (KANTSAnt) 1), const_zero = (KANTSAnt) 0;
+static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint16_t neg_one = (uint16_t) -1, const_zero = (uint16_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(KANTSAnt) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(KANTSAnt, long, PyInt_AS_LONG(x))
+        if (sizeof(uint16_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(uint16_t, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (KANTSAnt) val;
+            return (uint16_t) val;
         }
     } else
 #endif
@@ -5323,38 +9480,38 @@ static CYTHON_INLINE KANTSAnt __Pyx_PyInt_As_KANTSAnt(PyObject *x) {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (KANTSAnt) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(KANTSAnt, digit, digits[0])
+                case  0: return (uint16_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(uint16_t, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(KANTSAnt) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(uint16_t) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(KANTSAnt) >= 2 * PyLong_SHIFT) {
-                            return (KANTSAnt) (((((KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) >= 2 * PyLong_SHIFT) {
+                            return (uint16_t) (((((uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(KANTSAnt) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(uint16_t) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(KANTSAnt) >= 3 * PyLong_SHIFT) {
-                            return (KANTSAnt) (((((((KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) >= 3 * PyLong_SHIFT) {
+                            return (uint16_t) (((((((uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(KANTSAnt) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(uint16_t) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(KANTSAnt) >= 4 * PyLong_SHIFT) {
-                            return (KANTSAnt) (((((((((KANTSAnt)digits[3]) << PyLong_SHIFT) | (KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) >= 4 * PyLong_SHIFT) {
+                            return (uint16_t) (((((((((uint16_t)digits[3]) << PyLong_SHIFT) | (uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0]));
                         }
                     }
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -5362,86 +9519,86 @@ static CYTHON_INLINE KANTSAnt __Pyx_PyInt_As_KANTSAnt(PyObject *x) {
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (KANTSAnt) -1;
+                    return (uint16_t) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(KANTSAnt) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(KANTSAnt, unsigned long, PyLong_AsUnsignedLong(x))
+            if (sizeof(uint16_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(KANTSAnt) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(KANTSAnt, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            } else if (sizeof(uint16_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (KANTSAnt) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(KANTSAnt, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(KANTSAnt,  digit, +digits[0])
+                case  0: return (uint16_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(uint16_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(uint16_t,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(KANTSAnt) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(uint16_t) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(KANTSAnt, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(KANTSAnt) - 1 > 2 * PyLong_SHIFT) {
-                            return (KANTSAnt) (((KANTSAnt)-1)*(((((KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(uint16_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint16_t) (((uint16_t)-1)*(((((uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(KANTSAnt) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(uint16_t) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(KANTSAnt) - 1 > 2 * PyLong_SHIFT) {
-                            return (KANTSAnt) ((((((KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint16_t) ((((((uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(KANTSAnt) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(uint16_t) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(KANTSAnt, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(KANTSAnt) - 1 > 3 * PyLong_SHIFT) {
-                            return (KANTSAnt) (((KANTSAnt)-1)*(((((((KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(uint16_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint16_t) (((uint16_t)-1)*(((((((uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(KANTSAnt) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(uint16_t) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(KANTSAnt) - 1 > 3 * PyLong_SHIFT) {
-                            return (KANTSAnt) ((((((((KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint16_t) ((((((((uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(KANTSAnt) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(uint16_t) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(KANTSAnt, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(KANTSAnt) - 1 > 4 * PyLong_SHIFT) {
-                            return (KANTSAnt) (((KANTSAnt)-1)*(((((((((KANTSAnt)digits[3]) << PyLong_SHIFT) | (KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(uint16_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint16_t) (((uint16_t)-1)*(((((((((uint16_t)digits[3]) << PyLong_SHIFT) | (uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(KANTSAnt) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(uint16_t) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(KANTSAnt) - 1 > 4 * PyLong_SHIFT) {
-                            return (KANTSAnt) ((((((((((KANTSAnt)digits[3]) << PyLong_SHIFT) | (KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint16_t) ((((((((((uint16_t)digits[3]) << PyLong_SHIFT) | (uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(KANTSAnt) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(KANTSAnt, long, PyLong_AsLong(x))
+            if (sizeof(uint16_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(KANTSAnt) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(KANTSAnt, PY_LONG_LONG, PyLong_AsLongLong(x))
+            } else if (sizeof(uint16_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
             }
         }
@@ -5450,7 +9607,7 @@ static CYTHON_INLINE KANTSAnt __Pyx_PyInt_As_KANTSAnt(PyObject *x) {
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            KANTSAnt val;
+            uint16_t val;
             PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -5470,40 +9627,123 @@ static CYTHON_INLINE KANTSAnt __Pyx_PyInt_As_KANTSAnt(PyObject *x) {
                     return val;
             }
 #endif
-            return (KANTSAnt) -1;
+            return (uint16_t) -1;
         }
     } else {
-        KANTSAnt val;
+        uint16_t val;
         PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (KANTSAnt) -1;
-        val = __Pyx_PyInt_As_KANTSAnt(tmp);
+        if (!tmp) return (uint16_t) -1;
+        val = __Pyx_PyInt_As_uint16_t(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to KANTSAnt");
-    return (KANTSAnt) -1;
+        "value too large to convert to uint16_t");
+    return (uint16_t) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to KANTSAnt");
-    return (KANTSAnt) -1;
+        "can't convert negative value to uint16_t");
+    return (uint16_t) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_KANTSStatus(KANTSStatus value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const KANTSStatus neg_one = (KANTSStatus) -1, const_zero = (KANTSStatus) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(KANTSStatus) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(KANTSStatus) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(KANTSStatus) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(KANTSStatus) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(KANTSStatus) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(KANTSStatus),
+                                     little, !is_unsigned);
+    }
 }
 
 /* CIntFromPy */
-static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *x) {
-    const uint16_t neg_one = (uint16_t) ((uint16_t) 0 - (uint16_t) 1), const_zero = (uint16_t) 0;
+static CYTHON_INLINE KANTSAnt __Pyx_PyInt_As_KANTSAnt(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const KANTSAnt neg_one = (KANTSAnt) -1, const_zero = (KANTSAnt) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(uint16_t) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(uint16_t, long, PyInt_AS_LONG(x))
+        if (sizeof(KANTSAnt) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(KANTSAnt, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (uint16_t) val;
+            return (KANTSAnt) val;
         }
     } else
 #endif
@@ -5512,38 +9752,38 @@ static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *x) {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (uint16_t) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(uint16_t, digit, digits[0])
+                case  0: return (KANTSAnt) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(KANTSAnt, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(uint16_t) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(KANTSAnt) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(uint16_t) >= 2 * PyLong_SHIFT) {
-                            return (uint16_t) (((((uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(KANTSAnt) >= 2 * PyLong_SHIFT) {
+                            return (KANTSAnt) (((((KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(uint16_t) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(KANTSAnt) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(uint16_t) >= 3 * PyLong_SHIFT) {
-                            return (uint16_t) (((((((uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(KANTSAnt) >= 3 * PyLong_SHIFT) {
+                            return (KANTSAnt) (((((((KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(uint16_t) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(KANTSAnt) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(uint16_t) >= 4 * PyLong_SHIFT) {
-                            return (uint16_t) (((((((((uint16_t)digits[3]) << PyLong_SHIFT) | (uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(KANTSAnt) >= 4 * PyLong_SHIFT) {
+                            return (KANTSAnt) (((((((((KANTSAnt)digits[3]) << PyLong_SHIFT) | (KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0]));
                         }
                     }
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -5551,86 +9791,86 @@ static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *x) {
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (uint16_t) -1;
+                    return (KANTSAnt) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(uint16_t) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, unsigned long, PyLong_AsUnsignedLong(x))
+            if (sizeof(KANTSAnt) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(KANTSAnt, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(uint16_t) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            } else if (sizeof(KANTSAnt) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(KANTSAnt, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (uint16_t) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(uint16_t, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(uint16_t,  digit, +digits[0])
+                case  0: return (KANTSAnt) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(KANTSAnt, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(KANTSAnt,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(uint16_t) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(KANTSAnt) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(uint16_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(uint16_t) - 1 > 2 * PyLong_SHIFT) {
-                            return (uint16_t) (((uint16_t)-1)*(((((uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(KANTSAnt, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(KANTSAnt) - 1 > 2 * PyLong_SHIFT) {
+                            return (KANTSAnt) (((KANTSAnt)-1)*(((((KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(uint16_t) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(KANTSAnt) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(uint16_t) - 1 > 2 * PyLong_SHIFT) {
-                            return (uint16_t) ((((((uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(KANTSAnt) - 1 > 2 * PyLong_SHIFT) {
+                            return (KANTSAnt) ((((((KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(uint16_t) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(KANTSAnt) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(uint16_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(uint16_t) - 1 > 3 * PyLong_SHIFT) {
-                            return (uint16_t) (((uint16_t)-1)*(((((((uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(KANTSAnt, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(KANTSAnt) - 1 > 3 * PyLong_SHIFT) {
+                            return (KANTSAnt) (((KANTSAnt)-1)*(((((((KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(uint16_t) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(KANTSAnt) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(uint16_t) - 1 > 3 * PyLong_SHIFT) {
-                            return (uint16_t) ((((((((uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(KANTSAnt) - 1 > 3 * PyLong_SHIFT) {
+                            return (KANTSAnt) ((((((((KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(uint16_t) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(KANTSAnt) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(uint16_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(uint16_t) - 1 > 4 * PyLong_SHIFT) {
-                            return (uint16_t) (((uint16_t)-1)*(((((((((uint16_t)digits[3]) << PyLong_SHIFT) | (uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(KANTSAnt, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(KANTSAnt) - 1 > 4 * PyLong_SHIFT) {
+                            return (KANTSAnt) (((KANTSAnt)-1)*(((((((((KANTSAnt)digits[3]) << PyLong_SHIFT) | (KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(uint16_t) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(KANTSAnt) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(uint16_t) - 1 > 4 * PyLong_SHIFT) {
-                            return (uint16_t) ((((((((((uint16_t)digits[3]) << PyLong_SHIFT) | (uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(KANTSAnt, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(KANTSAnt) - 1 > 4 * PyLong_SHIFT) {
+                            return (KANTSAnt) ((((((((((KANTSAnt)digits[3]) << PyLong_SHIFT) | (KANTSAnt)digits[2]) << PyLong_SHIFT) | (KANTSAnt)digits[1]) << PyLong_SHIFT) | (KANTSAnt)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(uint16_t) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, long, PyLong_AsLong(x))
+            if (sizeof(KANTSAnt) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(KANTSAnt, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-            } else if (sizeof(uint16_t) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+            } else if (sizeof(KANTSAnt) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(KANTSAnt, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
             }
         }
@@ -5639,7 +9879,7 @@ static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *x) {
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            uint16_t val;
+            KANTSAnt val;
             PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -5659,29 +9899,150 @@ static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *x) {
                     return val;
             }
 #endif
-            return (uint16_t) -1;
+            return (KANTSAnt) -1;
         }
     } else {
-        uint16_t val;
+        KANTSAnt val;
         PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (uint16_t) -1;
-        val = __Pyx_PyInt_As_uint16_t(tmp);
+        if (!tmp) return (KANTSAnt) -1;
+        val = __Pyx_PyInt_As_KANTSAnt(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to uint16_t");
-    return (uint16_t) -1;
+        "value too large to convert to KANTSAnt");
+    return (KANTSAnt) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to uint16_t");
-    return (uint16_t) -1;
+        "can't convert negative value to KANTSAnt");
+    return (KANTSAnt) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint16_t(uint16_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint16_t neg_one = (uint16_t) -1, const_zero = (uint16_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint16_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(uint16_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint16_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(uint16_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint16_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(uint16_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint32_t(uint32_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint32_t neg_one = (uint32_t) -1, const_zero = (uint32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint32_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(uint32_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(uint32_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint32_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(uint32_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint8_t(uint8_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint8_t neg_one = (uint8_t) -1, const_zero = (uint8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint8_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(uint8_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint8_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(uint8_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint8_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(uint8_t),
+                                     little, !is_unsigned);
+    }
 }
 
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(long) < sizeof(long)) {
@@ -5710,9 +10071,54 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
     }
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_KI2CStatus(KI2CStatus value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const KI2CStatus neg_one = (KI2CStatus) -1, const_zero = (KI2CStatus) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(KI2CStatus) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(KI2CStatus) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(KI2CStatus) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(KI2CStatus) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(KI2CStatus) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(KI2CStatus),
+                                     little, !is_unsigned);
+    }
+}
+
 /* CIntFromPy */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -5763,7 +10169,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6001,11 +10407,33 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 
 /* CheckBinaryVersion */
 static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
         char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
         PyOS_snprintf(message, sizeof(message),
                       "compiletime version %s of module '%.100s' "
                       "does not match runtime version %s",
@@ -6263,6 +10691,23 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_DECREF(x);
   return ival;
 }
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
   return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
 }
@@ -0,0 +1,308 @@
+# cython: language_level=3
+"""
+Binding for the Kubos ISIS antenna system API (ants-api.h) and its I2C helpers (i2c.h).
+
+Every C call runs with the GIL released, so a multi-second deploy or a slow I2C transaction does not stall other
+Python threads. Commands return their KANTSStatus; getters return their value and raise AntsError if the
+controller does not answer with ANTS_OK.
+"""
+from libc.stdint cimport uint8_t, uint16_t, uint32_t
+from libcpp cimport bool
+
+cdef extern from "i2c.h" nogil:
+    ctypedef enum KI2CStatus:
+        I2C_OK
+        I2C_ERROR
+        I2C_ERROR_AF
+        I2C_ERROR_ADDR_TIMEOUT
+        I2C_ERROR_TIMEOUT
+        I2C_ERROR_NACK
+        I2C_ERROR_TXE_TIMEOUT
+        I2C_ERROR_BTF_TIMEOUT
+        I2C_ERROR_NULL_HANDLE
+        I2C_ERROR_CONFIG
+
+    KI2CStatus k_i2c_init(char * device, int * fp)
+    void k_i2c_terminate(int * fp)
+    KI2CStatus k_i2c_write(int i2c, uint16_t addr, uint8_t * ptr, int len)
+    KI2CStatus k_i2c_read(int i2c, uint16_t addr, uint8_t * ptr, int len)
+
+cdef extern from "ants-api.h" nogil:
+    ctypedef enum KANTSStatus:
+        ANTS_OK
+        ANTS_ERROR
+        ANTS_ERROR_CONFIG
+        ANTS_ERROR_NOT_IMPLEMENTED
+
+    ctypedef enum KANTSAnt:
+        ANT_1
+        ANT_2
+        ANT_3
+        ANT_4
+
+    ctypedef enum KANTSController:
+        PRIMARY
+        SECONDARY
+
+    ctypedef struct ants_telemetry:
+        uint16_t raw_temp
+        uint16_t deploy_status
+        uint32_t uptime
+
+    KANTSStatus k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout)
+    void k_ants_terminate()
+    KANTSStatus k_ants_configure(KANTSController config)
+    KANTSStatus k_ants_reset()
+    KANTSStatus k_ants_arm()
+    KANTSStatus k_ants_disarm()
+    KANTSStatus k_ants_deploy(KANTSAnt antenna, bool override, uint8_t timeout)
+    KANTSStatus k_ants_auto_deploy(uint8_t timeout)
+    KANTSStatus k_ants_cancel_deploy()
+    KANTSStatus k_ants_get_deploy_status(uint16_t * resp)
+    KANTSStatus k_ants_get_uptime(uint32_t * uptime)
+    KANTSStatus k_ants_get_system_telemetry(ants_telemetry * telem)
+    KANTSStatus k_ants_get_activation_count(KANTSAnt antenna, uint8_t * count)
+    KANTSStatus k_ants_get_activation_time(KANTSAnt antenna, uint16_t * time)
+    KANTSStatus k_ants_watchdog_kick()
+    KANTSStatus k_ants_watchdog_start()
+    KANTSStatus k_ants_watchdog_stop()
+    KANTSStatus k_ants_passthrough(const uint8_t * tx, int tx_len, uint8_t * rx, int rx_len)
+
+ANT_COUNT = 4
+
+
+class AntsError(OSError):
+    """
+    Raised by a getter when the antenna controller or I2C bus returns a status other than OK
+    """
+
+    def __init__(self, call, status):
+        OSError.__init__(self, f"{call} returned status {status}")
+        self.call = call
+        self.status = status
+
+
+cdef inline void check(str call, int status) except *:
+    if status != ANTS_OK:
+        raise AntsError(call, status)
+
+
+def py_k_ants_init(char * bus, uint8_t primary, uint8_t secondary, uint8_t ant_count, uint32_t timeout):
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_init(bus, primary, secondary, ant_count, timeout)
+    return status
+
+def py_k_ants_terminate():
+    with nogil:
+        k_ants_terminate()
+
+def py_k_ants_configure(KANTSController config):
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_configure(config)
+    return status
+
+def py_k_ants_reset():
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_reset()
+    return status
+
+def py_k_ants_arm():
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_arm()
+    return status
+
+def py_k_ants_disarm():
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_disarm()
+    return status
+
+def py_k_ants_deploy(antenna, override, timeout):
+    cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+    cdef bool c_override = <bool>override
+    cdef uint8_t c_timeout = <uint8_t>timeout
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_deploy(c_antenna, c_override, c_timeout)
+    return status
+
+def py_k_ants_auto_deploy(timeout):
+    cdef uint8_t c_timeout = <uint8_t>timeout
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_auto_deploy(c_timeout)
+    return status
+
+def py_k_ants_cancel_deploy():
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_cancel_deploy()
+    return status
+
+def py_k_ants_get_deploy_status():
+    """
+    :return: deployment status register bits
+    """
+    cdef uint16_t resp = 0
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_get_deploy_status(&resp)
+    check("k_ants_get_deploy_status", status)
+    return resp
+
+def py_k_ants_get_uptime():
+    """
+    :return: controller uptime in seconds
+    """
+    cdef uint32_t uptime = 0
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_get_uptime(&uptime)
+    check("k_ants_get_uptime", status)
+    return uptime
+
+def py_k_ants_get_system_telemetry():
+    """
+    :return: {"raw_temp", "deploy_status", "uptime"}
+    """
+    cdef ants_telemetry telem
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_get_system_telemetry(&telem)
+    check("k_ants_get_system_telemetry", status)
+    return {"raw_temp": telem.raw_temp, "deploy_status": telem.deploy_status, "uptime": telem.uptime}
+
+def py_k_ants_get_activation_count(antenna):
+    """
+    :return: number of deployment attempts made on antenna
+    """
+    cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+    cdef uint8_t count = 0
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_get_activation_count(c_antenna, &count)
+    check("k_ants_get_activation_count", status)
+    return count
+
+def py_k_ants_get_activation_time(antenna):
+    """
+    :return: cumulative deployment time of antenna in seconds
+    """
+    cdef KANTSAnt c_antenna = <KANTSAnt>antenna
+    cdef uint16_t time = 0
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_get_activation_time(c_antenna, &time)
+    check("k_ants_get_activation_time", status)
+    return time
+
+def py_k_ants_read_all_telemetry(uint8_t ant_count=ANT_COUNT):
+    """
+    Reads the system telemetry and every antenna's activation count and time in a single GIL release
+    :return: {"raw_temp", "deploy_status", "uptime", "activation_counts": [...], "activation_times": [...]}
+    """
+    cdef ants_telemetry telem
+    cdef uint8_t counts[4]
+    cdef uint16_t times[4]
+    cdef KANTSStatus status
+    cdef uint8_t i
+    cdef int failed = -1  # index of the failing call: 0 telemetry, 1 + 2 * antenna count, 2 + 2 * antenna time
+    if ant_count > 4:
+        raise ValueError("at most 4 antennas")
+    with nogil:
+        status = k_ants_get_system_telemetry(&telem)
+        if status != ANTS_OK:
+            failed = 0
+        else:
+            for i in range(ant_count):
+                status = k_ants_get_activation_count(<KANTSAnt>i, &counts[i])
+                if status != ANTS_OK:
+                    failed = 1 + 2 * i
+                    break
+                status = k_ants_get_activation_time(<KANTSAnt>i, &times[i])
+                if status != ANTS_OK:
+                    failed = 2 + 2 * i
+                    break
+    if failed == 0:
+        check("k_ants_get_system_telemetry", status)
+    elif failed > 0:
+        check(("k_ants_get_activation_count", "k_ants_get_activation_time")[(failed - 1) % 2], status)
+    return {
+        "raw_temp": telem.raw_temp,
+        "deploy_status": telem.deploy_status,
+        "uptime": telem.uptime,
+        "activation_counts": [counts[i] for i in range(ant_count)],
+        "activation_times": [times[i] for i in range(ant_count)],
+    }
+
+def py_k_ants_watchdog_kick():
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_watchdog_kick()
+    return status
+
+def py_k_ants_watchdog_start():
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_watchdog_start()
+    return status
+
+def py_k_ants_watchdog_stop():
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_watchdog_stop()
+    return status
+
+def py_k_ants_passthrough(bytes tx, int rx_len):
+    """
+    Sends raw bytes to the controller and reads its reply
+    :return: rx_len bytes read back
+    """
+    cdef bytearray rx = bytearray(rx_len)
+    cdef uint8_t * rx_ptr = rx
+    cdef int tx_len = len(tx)
+    cdef const uint8_t * tx_ptr = <const uint8_t *><char *>tx
+    cdef KANTSStatus status
+    with nogil:
+        status = k_ants_passthrough(tx_ptr, tx_len, rx_ptr, rx_len)
+    check("k_ants_passthrough", status)
+    return bytes(rx)
+
+def py_k_i2c_init(char * device):
+    """
+    :return: file descriptor of the opened bus
+    """
+    cdef int fp = 0
+    cdef KI2CStatus status
+    with nogil:
+        status = k_i2c_init(device, &fp)
+    check("k_i2c_init", status)
+    return fp
+
+def py_k_i2c_terminate(int fp):
+    with nogil:
+        k_i2c_terminate(&fp)
+
+def py_k_i2c_write(int i2c, uint16_t addr, bytes data):
+    cdef int length = len(data)
+    cdef uint8_t * ptr = <uint8_t *><char *>data
+    cdef KI2CStatus status
+    with nogil:
+        status = k_i2c_write(i2c, addr, ptr, length)
+    return status
+
+def py_k_i2c_read(int i2c, uint16_t addr, int length):
+    """
+    :return: length bytes read from addr
+    """
+    cdef bytearray data = bytearray(length)
+    cdef uint8_t * ptr = data
+    cdef KI2CStatus status
+    with nogil:
+        status = k_i2c_read(i2c, addr, ptr, length)
+    check("k_i2c_read", status)
+    return bytes(data)
@@ -1,8 +1,18 @@
 from submodules.submodule import Submodule
+from core.bus import BLOCK, COMMANDS, CONFIG, Command
+from core.config import ConfigPatch
+from helpers import metrics
+from helpers.profiler import span
 from helpers.threadhandler import ThreadHandler
+from submodules.command_ingest import acks
+
+import base64
+import time
 
 from collections import deque as queue
 from functools import partial
+from threading import Lock
+from yaml import safe_load
 
 
 class CommandIngest(Submodule):
@@ -16,6 +26,18 @@ class CommandIngest(Submodule):
         """
         Submodule.__init__(self, "command_ingest", config)
         self.general_queue = queue()
+        self.commands = None  # bus subscription, replacing general_queue once the bus is set
+        self.pending_acks = dict()  # link -> deque of packed result records
+        self.ack_due = dict()  # link -> monotonic time its pending records are sent
+        self.ack_lock = Lock()
+        self.executed = {
+            status: metrics.counter("pfs_commands_total", "Commands executed", {"status": name.replace(" ", "_")})
+            for status, name in acks.STATUS_NAMES.items()
+        }
+        metrics.gauge("pfs_command_queue_depth", "Commands waiting for dispatch",
+                      fn=lambda: len(self.commands) if self.commands is not None else len(self.general_queue))
+        metrics.gauge("pfs_command_acks_pending", "Acknowledgement records waiting to be sent",
+                      fn=lambda: sum(len(records) for records in list(self.pending_acks.values())))
 
         self.processes = {
             "dispatch": ThreadHandler(
@@ -28,43 +50,197 @@ class CommandIngest(Submodule):
     def dispatch(self) -> None:
         """
         Continuously pop from the general queue, parse the message as a command, and, if valid, execute
-        the command as such
+        the command as such. Commands have the form CMD$module;function;[argument;...] and arguments are
+        passed to the function as strings. Results are acknowledged in batches, see acknowledge().
         :return: None
         """
         while True:
-            body = self.general_queue.pop()
-            if "CMD$" in body:
-                cmd = [part for part in body[body.find("$") + 1:].split(";") if part]
+            wait = self.ack_wait()
+            if self.commands is not None:
+                body = self.commands.get(timeout=wait)
+            elif self.general_queue:
+                body = self.general_queue.pop()
+            else:
+                time.sleep(1 if wait is None else min(wait, 1))
+                body = None
+            if body is not None and "CMD$" in body:
+                self.execute(body)
+            self.flush_acks()
+
+    def execute(self, body: str) -> None:
+        """
+        Runs one command and records its result for acknowledgement
+        :param body: Command text, a core.bus.Command if the uplink link is known
+        :return: None
+        """
+        start = time.monotonic()
+        cmd = [part for part in body[body.find("$") + 1:].split(";") if part]
+        if len(cmd) < 2:
+            self.logger.error(f"Unable to parse command {cmd}")
+            status = acks.PARSE_ERROR
+        else:
+            module, func, args = cmd[0], cmd[1], cmd[2:]
+            status = self.validate_func(module, func)
+            if status == acks.OK:
                 try:
-                    module, func = cmd[0], cmd[1]
-                except IndexError:
-                    self.send_through_aprs(f"CMDERR: Unable to parse Commnd {cmd}")
-                    continue
-                if self.validate_func(module, func):
-                    try:
-                        getattr(self.modules[module], func)()
-                        self.send_through_aprs(f"CMDSUC: Command {cmd} executed successfully")
-                    except Exception as e:
-                        self.send_through_aprs(f"CMDERR: Command {cmd} failed with {e}")
+                    with span(f"command.{module}.{func}"):
+                        getattr(self.resolve(module), func)(*args)
+                except Exception as e:
+                    self.logger.error(f"Command {cmd} failed with {e}")
+                    status = acks.FAILED
+        self.executed[status].inc()
+        self.acknowledge(body, status, time.monotonic() - start)
+
+    def acknowledge(self, body: str, status: int, duration: float) -> None:
+        """
+        Queues the result record of a command for the link the command arrived on. Records are sent together
+        once the first of them has waited ack_deadline seconds, so a batch of uplinked commands is acknowledged
+        in one frame.
+        :param body: Command text
+        :param status: command_ingest.acks status code
+        :param duration: Seconds the command took
+        :return: None
+        """
+        link = getattr(body, "link", None) or self.config["command_ingest"]["ack_link"]
+        self.queue_acks(link, [acks.encode_record(body, status, duration)])
+        self.logger.debug(f"Command {body} {acks.STATUS_NAMES[status]} in {duration:.3f} s")
+
+    def ack_wait(self) -> float:
+        """
+        :return: Seconds until pending acknowledgements are due, None if there are none
+        """
+        with self.ack_lock:
+            if not self.ack_due:
+                return None
+            return max(0.0, min(self.ack_due.values()) - time.monotonic())
+
+    def flush_acks(self) -> None:
+        """
+        Sends the acknowledgements that are due through telemetry's downlink budget. Records that could not
+        be sent are retried after another ack_deadline.
+        :return: None
+        """
+        now = time.monotonic()
+        with self.ack_lock:
+            due = [link for link, deadline in self.ack_due.items() if deadline <= now]
+            batches = {link: list(self.pending_acks.pop(link)) for link in due}
+            for link in due:
+                del self.ack_due[link]
+        for link, records in batches.items():
+            sent = 0
+            for frame in acks.encode_frames(records, self.config["telemetry"]["max_packet_size"]):
+                try:
+                    if not self.get_module_or_raise_error("telemetry").send_frame(frame, link, self.name):
+                        break
+                except RuntimeError:  # telemetry or the radio is not loaded
+                    break
+                sent += acks.records_per_frame(self.config["telemetry"]["max_packet_size"])
+            if sent < len(records):
+                self.logger.debug(f"Deferring {len(records) - sent} acknowledgements on {link}")
+                self.queue_acks(link, records[sent:], deferred=True)
+
+    def queue_acks(self, link: str, records: list, deferred: bool = False) -> None:
+        """
+        Queues records on a link, starting its deadline if none is running. The oldest records are dropped
+        beyond ack_capacity.
+        :param link: Radio to acknowledge through
+        :param records: Packed records, oldest first
+        :param deferred: Whether the records are older than those pending, having failed to send
+        :return: None
+        """
+        with self.ack_lock:
+            pending = list(self.pending_acks.get(link, ()))
+            self.pending_acks[link] = queue(list(records) + pending if deferred else pending + list(records),
+                                            maxlen=self.config["command_ingest"]["ack_capacity"])
+            self.ack_due.setdefault(link, time.monotonic() + self.config["command_ingest"]["ack_deadline"])
+
+    def set_bus(self, bus) -> None:
+        """
+        Subscribes to commands. Commands are never dropped for lack of room: publishers wait for dispatch instead.
+        :param bus: core.bus.Bus
+        :return: None
+        """
+        Submodule.set_bus(self, bus)
+        self.commands = bus.subscribe(COMMANDS, self.name, maxsize=32, policy=BLOCK, timeout=30)
 
     def enqueue(self, cmd) -> None:
         """
-        Enqueue a new message to the CommandIngest general queue
+        Enqueue a new message to the CommandIngest general queue, or publish it on the bus once it is set
         :param cmd: message to be enqueued
         :return: None
         """
-        self.general_queue.append(cmd)
+        if self.commands is not None:
+            self.publish(COMMANDS, cmd)
+        else:
+            self.general_queue.append(cmd)
 
-    def validate_func(self, module, func) -> bool:
-        if module not in self.modules:
-            self.send_through_aprs(f"CMDERR: Module not found")
-            return False
-        if not self.has_module(module):
+    def get_checkpoint(self) -> dict:
+        """
+        :return: The commands waiting for dispatch, with the link each arrived on, and the pending
+        acknowledgements, for a warm restart. The command being executed is not included, so a command that
+        crashes the process is not run again.
+        """
+        waiting = list(self.general_queue)
+        if self.commands is not None:
+            waiting += self.commands.snapshot()
+        with self.ack_lock:
+            pending = {link: base64.b64encode(b"".join(records)).decode("ascii")
+                       for link, records in self.pending_acks.items()}
+        return {
+            "commands": [[str(body), getattr(body, "link", None)] for body in waiting],
+            "acks": pending,
+        }
+
+    def restore_checkpoint(self, state: dict) -> None:
+        """
+        Queues the commands and acknowledgements of a checkpoint
+        :param state: Output of get_checkpoint()
+        :return: None
+        """
+        for link, records in state.get("acks", {}).items():
+            data = base64.b64decode(records)
+            self.queue_acks(link, [data[i:i + acks.RECORD.size] for i in range(0, len(data), acks.RECORD.size)])
+        for body, link in state.get("commands", ()):
+            self.enqueue(Command(body, link))
+
+    def resolve(self, module: str):
+        """
+        :return: The submodule a command addresses: a dependency, or command_ingest itself
+        """
+        return self if module == self.name else self.modules[module]
+
+    def validate_func(self, module, func) -> int:
+        """
+        :return: command_ingest.acks status code, OK if module.func can be run
+        """
+        if module != self.name and module not in self.modules:
+            self.logger.error(f"Module {module} not found")
+            return acks.MODULE_NOT_FOUND
+        if module != self.name and not self.has_module(module):
             raise RuntimeError(f"[{self.name}]:[{module}] not found")
-        if hasattr(module, func):
-            self.send_through_aprs(f"CMDERR: Function {func} not found in {module}")
-            return False
-        return True
+        if not hasattr(self.resolve(module), func):
+            self.logger.error(f"Function {func} not found in {module}")
+            return acks.FUNCTION_NOT_FOUND
+        return acks.OK
+
+    def patch_config(self, *assignments) -> None:
+        """
+        Command: changes settings of the running configuration, e.g. CMD$command_ingest;patch_config;
+        telemetry.max_packet_size=120;aprs.message_spacing=2; Values are parsed as YAML. Core validates and applies
+        all of them or none; the command fails if it rejects them.
+        :param assignments: "<dotted path>=<value>" strings
+        :return: None
+        """
+        changes = dict()
+        for assignment in assignments:
+            path, separator, value = assignment.partition("=")
+            if not separator:
+                raise ValueError(f"{assignment} is not <setting>=<value>")
+            changes[path.strip()] = safe_load(value)
+        patch = ConfigPatch(changes, "uplink")
+        if not self.publish(CONFIG, patch):
+            raise RuntimeError("Nothing applies configuration patches")
+        patch.wait(self.config["command_ingest"].get("patch_timeout", 10))
 
     def send_through_aprs(self, message) -> None:
         """
@@ -85,6 +261,13 @@ class CommandIngest(Submodule):
         except:
             return False
 
+    def enter_emergency_mode(self) -> bool:
+        """
+        Places command_ingest in EMERGENCY_MODE.
+        Returns True if successful, False if any errors are encountered.
+        """
+        return self.enter_low_power_mode()
+
     def enter_normal_mode(self) -> bool:
         """
         Places command_ingest in NORMAL_MODE.
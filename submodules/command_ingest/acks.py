@@ -0,0 +1,69 @@
+"""
+Compact command acknowledgements. Each executed command becomes a 5 byte record of its id, status code and
+duration; records are packed into "ACK$" + base64 frames, as many as fit in a packet.
+
+The id of a command is the CRC-16 (CCITT, initial value 0xFFFF) of its text as uplinked, e.g. "CMD$eps;reboot;",
+so the ground can match records to the commands it sent without the satellite echoing them.
+"""
+import base64
+import binascii
+import struct
+
+OK = 0
+PARSE_ERROR = 1
+MODULE_NOT_FOUND = 2
+FUNCTION_NOT_FOUND = 3
+FAILED = 4  # the command raised; the exception is logged as an error
+STATUS_NAMES = {OK: "ok", PARSE_ERROR: "parse error", MODULE_NOT_FOUND: "module not found",
+                FUNCTION_NOT_FOUND: "function not found", FAILED: "failed"}
+
+PREFIX = "ACK$"
+RECORD = struct.Struct(">HBH")  # command id, status, duration in milliseconds
+
+
+def command_id(body: str) -> int:
+    """
+    :param body: Command text as uplinked
+    :return: 16 bit id of the command
+    """
+    return binascii.crc_hqx(body.encode("utf-8"), 0xFFFF)
+
+
+def encode_record(body: str, status: int, duration: float) -> bytes:
+    """
+    :param body: Command text as uplinked
+    :param status: Status code
+    :param duration: Seconds the command took, capped at 65.535
+    :return: Packed record
+    """
+    return RECORD.pack(command_id(body), status, min(int(duration * 1000), 0xFFFF))
+
+
+def records_per_frame(max_packet_size: int) -> int:
+    return (max_packet_size - len(PREFIX)) // 4 * 3 // RECORD.size
+
+
+def encode_frames(records: list, max_packet_size: int) -> list:
+    """
+    :param records: Packed records
+    :param max_packet_size: Characters per frame at most
+    :return: As few frames as hold every record, in order
+    """
+    per_frame = records_per_frame(max_packet_size)
+    return [PREFIX + base64.b64encode(b"".join(records[i:i + per_frame])).decode("ascii")
+            for i in range(0, len(records), per_frame)]
+
+
+def decode_frame(frame: str) -> list:
+    """
+    Ground side decoder
+    :param frame: Received frame
+    :return: [(command id, status, duration in seconds)]
+    :raises ValueError: if the frame is not an acknowledgement frame
+    """
+    if not frame.startswith(PREFIX):
+        raise ValueError("Not an acknowledgement frame")
+    data = base64.b64decode(frame[len(PREFIX):])
+    if len(data) % RECORD.size:
+        raise ValueError("Truncated acknowledgement frame")
+    return [(cid, status, milliseconds / 1000) for cid, status, milliseconds in RECORD.iter_unpack(data)]
@@ -1,16 +1,14 @@
-import logging
+import math
 import time
-import smbus
-import yaml
 
 from functools import partial
 
-from smbus2 import SMBusWrapper
-from submodules import telemetry
-
+from core.bus import ANOMALIES, ERRORS, HOUSEKEEPING
 from submodules.submodule import Submodule
-from helpers.log import Log
-from helpers.error import Error
+from submodules.eps.anomaly import AnomalyDetector
+from submodules.eps.housekeeping import ANALOG_CHANNELS, HousekeepingStore
+from helpers.devices import i2c_bus
+from helpers.profiler import span
 from helpers.threadhandler import ThreadHandler
 
 class EPS(Submodule):
@@ -19,67 +17,81 @@ class EPS(Submodule):
         Submodule.__init__(self, name="eps", config=config)
         self.address = 0x57
         self.eps_dict = {'a':1, 'i2c':2, 'c':3, 'antenna':4, 'pi':5, 'iridium':6, 'aprs':7, 'h':8}
+        self.housekeeping = HousekeepingStore(
+            channels=ANALOG_CHANNELS + tuple(f"pdm_{device_name}" for device_name in self.eps_dict),
+            capacity=self.config['eps']['housekeeping_capacity']
+        )
+        self.last_housekeeping_dump = None
+        self.shed = []  # PDMs emergency mode switched off, in order, until normal mode switches them back on
+        self.anomalies = None
+        if self.config['eps'].get('anomaly') is not None:
+            self.anomalies = AnomalyDetector(self.config['eps']['anomaly'], self.config['eps']['looptime'])
+        self.processes = {
+            "housekeeping": ThreadHandler(
+                target=partial(self.sample_housekeeping),
+                name="eps-housekeeping",
+                parent_logger=self.logger,
+            )
+        }
 
     def pin_on(self, device_name) -> bool:
-        with SMBusWrapper(1) as bus:
+        with i2c_bus(1) as bus:
             if device_name in self.eps_dict:
                 PDM_val = self.eps_dict[device_name]
             else:
                 message = "Device name \"{}\" INVALID. Aborting command.".format(device_name)
                 self.logger.error(message)
-                self.get_module_or_raise_error("telemetry").enqueue(Error(sys_name=self.name, msg=message))
                 return False
 
             if self.get_PDM_status(device_name) == 1:
                 message = "Pin {} ({}) is already ON.".format(self.eps_dict[device_name], device_name)
-                self.logger.debug(message)  # Log to console for debugging
-                self.get_module_or_raise_error("telemetry").enqueue(Log(sys_name=self.name, lvl="INFO", msg=message))  # Push to telemetry stack
+                self.logger.info(message)
                 return True
             else:
-                bus.write_byte_data(self.address, 0x12, PDM_val)  # Attempt to execute pin on
+                if self.anomalies is not None:
+                    self.anomalies.switched(f"pdm_{device_name}", 1)
+                with span("eps.i2c.pdm_switch"):
+                    bus.write_byte_data(self.address, 0x12, PDM_val)  # Attempt to execute pin on
 
                 if self.get_PDM_status(device_name) == 1:  # PDM is ON
                     message = "Pin {} ({}) communication successful. Pin is now ON.".format(
                         self.eps_dict[device_name], device_name)
-                    self.logger.debug(message)
-                    self.get_module_or_raise_error("telemetry").enqueue(Log(sys_name=self.name, lvl="INFO", msg=message))
+                    self.logger.info(message)
                     return True
                 else:  # Something is big broken
                     message = "Pin {} ({}) communication NOT successful. Pin is still OFF.".format(
                         self.eps_dict[device_name], device_name)
                     self.logger.error(message)
-                    self.get_module_or_raise_error("telemetry").enqueue(Error(sys_name=self.name, msg=message))
                     return False
 
     def pin_off(self, device_name) -> bool:
-        with SMBusWrapper(1) as bus:
+        with i2c_bus(1) as bus:
             if device_name in self.eps_dict:
                 PDM_val = self.eps_dict[device_name]
             else:
                 message = "Device name \"{}\" INVALID. Aborting command.".format(device_name)
                 self.logger.error(message)
-                self.get_module_or_raise_error("telemetry").enqueue(Error(sys_name=self.name, msg=message))
                 return False
 
             if self.get_PDM_status(device_name) == 0:
                 message = "Pin {} ({}) is already OFF.".format(self.eps_dict[device_name], device_name)
-                self.logger.debug(message)  # Log to console for debugging
-                self.get_module_or_raise_error("telemetry").enqueue(Log(sys_name=self.name, lvl="INFO", msg=message))  # Push to telemetry stack
+                self.logger.info(message)
                 return True
             else:
-                bus.write_byte_data(self.address, 0x13, PDM_val)  # Attempt to execute pin off
+                if self.anomalies is not None:
+                    self.anomalies.switched(f"pdm_{device_name}", 0)
+                with span("eps.i2c.pdm_switch"):
+                    bus.write_byte_data(self.address, 0x13, PDM_val)  # Attempt to execute pin off
 
                 if self.get_PDM_status(device_name) == 0:  # PDM is OFF
                     message = "Pin {} ({}) communication successful. Pin is now OFF.".format(
                         self.eps_dict[device_name], device_name)
-                    self.logger.debug(message)
-                    self.get_module_or_raise_error("telemetry").enqueue(Log(sys_name=self.name, lvl="INFO", msg=message))
+                    self.logger.info(message)
                     return True
                 else:
                     message = "Pin {} ({}) communication NOT successful. Pin is still ON.".format(
                         self.eps_dict[device_name], device_name)
                     self.logger.error(message)
-                    self.get_module_or_raise_error("telemetry").enqueue(Error(sys_name=self.name, msg=message))
                     return False
 
     def reboot_device(self, device_name, wait_after_off=10, wait_after_on=30):
@@ -95,32 +107,29 @@ class EPS(Submodule):
         # TODO: All code below is unconverted
         message = "From Pin {} ({}) reboot: sleeping {} second(s) after turn off.".format(
             self.eps_dict[device_name], device_name, wait_after_off)
-        self.logger.debug(message)
-        self.get_module_or_raise_error("telemetry").enqueue(Log(sys_name=self.name, lvl="INFO", msg=message))
+        self.logger.info(message)
         time.sleep(wait_after_off)  # Wait for specified time
 
         if not self.pin_on(device_name):
             return False
         message = "From Pin {} ({}) reboot: sleeping {} second(s) after turn on.".format(
             self.eps_dict[device_name], device_name, wait_after_off)
-        self.logger.debug(message)
-        self.get_module_or_raise_error("telemetry").enqueue(Log(sys_name=self.name, lvl="INFO", msg=message))
+        self.logger.info(message)
         time.sleep(wait_after_off)
 
         if self.get_PDM_status(device_name) == 1:
             message = "Pin {} ({}) reboot successful.".format(self.eps_dict[device_name], device_name)
-            self.logger.debug(message)
-            self.get_module_or_raise_error("telemetry").enqueue(Log(sys_name=self.name, lvl="INFO", msg=message))
+            self.logger.info(message)
             return True
         else:
             message = "Pin {} ({}) reboot NOT successful. Recommend PDM status check in {} second(s).".format(
                 self.eps_dict[device_name], device_name, wait_after_off)
             self.logger.error(message)
-            self.get_module_or_raise_error("telemetry").enqueue(Error(sys_name=self.name, msg=message))
             return False
 
+    @span("eps.i2c.pdm_status")
     def get_PDM_status(self, device_name):
-        with SMBusWrapper(1) as bus:
+        with i2c_bus(1) as bus:
             PDM_val = self.eps_dict[device_name]
             bus.write_byte_data(self.address, 0x0E, PDM_val)
             return bus.read_byte(self.address)
@@ -130,36 +139,233 @@ class EPS(Submodule):
             return False
         return True
 
+    @span("eps.i2c.board_status")
     def get_board_status(self):
-        with SMBusWrapper(1) as bus:
+        with i2c_bus(1) as bus:
             return bus.read_byte_data(self.address, 0x01)
 
     def get_device_statuses(self) -> dict:
         temp_dict = dict()
         for device_name in self.eps_dict.keys():
-            temp_dict.update({device_name, self.get_PDM_status(device_name)})
+            temp_dict.update({device_name: self.get_PDM_status(device_name)})
         return temp_dict
 
     # TODO: The following are semi-extraneous, need to test
+    @span("eps.i2c.adc")
     def get_bcr1_volts(self):
-        with SMBusWrapper(1) as bus:
-            bus.write_i2c_block_data(self.address, 0x10, 0x00)
+        with i2c_bus(1) as bus:
+            bus.write_i2c_block_data(self.address, 0x10, [0x00])
             return bus.read_byte(self.address)
 
+    @span("eps.i2c.adc")
     def get_bcr1_amps_a(self):
-        with SMBusWrapper(1) as bus:
-            bus.write_i2c_block_data(self.address, 0x10, 0x01)
+        with i2c_bus(1) as bus:
+            bus.write_i2c_block_data(self.address, 0x10, [0x01])
             return bus.read_byte(self.address)
 
+    @span("eps.i2c.adc")
     def get_bcr1_amps_b(self):
-        with SMBusWrapper(1) as bus:
-            bus.write_i2c_block_data(self.address, 0x10, 0x02)
+        with i2c_bus(1) as bus:
+            bus.write_i2c_block_data(self.address, 0x10, [0x02])
             return bus.read_byte(self.address)
 
+    @span("eps.i2c.adc")
     def get_battery_bus_volts(self):
-        with SMBusWrapper(1) as bus:
-            bus.write_i2c_block_data(self.address, 0x10, 0x23)
+        with i2c_bus(1) as bus:
+            bus.write_i2c_block_data(self.address, 0x10, [0x23])
             return bus.read_byte(self.address)
 
+    def calibrate(self, channel: str, raw):
+        """
+        Converts raw register values of a channel to engineering units with its eps.calibration coefficients
+        [a, b, c], value = a * x^2 + b * x + c; channels without calibration are returned raw
+        :param channel: Housekeeping channel, e.g. "battery_bus_volts"
+        :param raw: Register value, or NumPy array of them
+        :return: Value(s) in engineering units
+        """
+        a, b, c = (self.config['eps'].get('calibration') or {}).get(channel, (0, 1, 0))
+        return a * raw * raw + b * raw + c
+
+    def get_battery_volts(self) -> float:
+        """
+        :return: Battery bus voltage in volts, for comparison with helpers.power.Power
+        """
+        return self.calibrate("battery_bus_volts", self.get_battery_bus_volts())
+
+    def read_housekeeping(self) -> dict:
+        """
+        Reads every housekeeping register once. Registers that fail to read, for whatever reason, are left out.
+        :return: channel name -> raw register value
+        """
+        getters = {
+            "bcr1_volts": self.get_bcr1_volts,
+            "bcr1_amps_a": self.get_bcr1_amps_a,
+            "bcr1_amps_b": self.get_bcr1_amps_b,
+            "battery_bus_volts": self.get_battery_bus_volts,
+            "board_status": self.get_board_status,
+        }
+        getters.update({f"pdm_{device_name}": partial(self.get_PDM_status, device_name)
+                        for device_name in self.eps_dict})
+        sample = dict()
+        for channel, getter in getters.items():
+            try:
+                sample[channel] = getter()
+            except OSError as e:
+                self.logger.debug(f"Housekeeping read of {channel} failed: {e}")
+            except Exception:
+                self.logger.exception(f"Housekeeping read of {channel} failed")
+        return sample
+
+    def sample_housekeeping(self) -> None:
+        """
+        Appends a housekeeping sample to self.housekeeping every eps.looptime seconds and publishes it on the bus.
+        Each sample is checked for anomalies before the next is taken; confirmed anomalies are published as
+        diagnostic records on ANOMALIES, which puts core into emergency mode, and sent to telemetry.
+        Run via ThreadHandler process['housekeeping']
+        :return: None
+        """
+        while True:
+            start = time.monotonic()
+            now, sample = time.time(), self.read_housekeeping()
+            self.housekeeping.append(now, sample)
+            self.publish(HOUSEKEEPING, dict(sample, time=now))
+            anomalies = self.anomalies  # replaced as a whole by reconfigure()
+            if anomalies is not None:
+                for record in anomalies.update(now, sample):
+                    self.logger.debug(record.message)
+                    self.publish(ANOMALIES, record)
+                    if not self.publish(ERRORS, record) and self.has_module("telemetry"):
+                        self.modules["telemetry"].enqueue(record)
+            time.sleep(max(0.0, self.config['eps']['looptime'] - (time.monotonic() - start)))
+
+    def reset_anomalies(self) -> None:
+        """
+        Command: clears the anomaly detector's window, e.g. once the ground has diagnosed an anomaly, so that
+        checks start over from the next min_samples samples
+        :return: None
+        """
+        if self.anomalies is not None:
+            self.anomalies.reset()
+
+    def reconfigure(self, changed: list) -> None:
+        """
+        Starts a new anomaly detector if its settings or the sampling interval changed; it keeps the PDM states
+        EPS switched, but learns the channels' statistics from scratch
+        :param changed: Dotted paths of the settings that changed
+        :return: None
+        """
+        if not any(path.startswith("eps.anomaly") or path == "eps.looptime" for path in changed):
+            return
+        anomalies = None
+        if self.config['eps'].get('anomaly') is not None:
+            anomalies = AnomalyDetector(self.config['eps']['anomaly'], self.config['eps']['looptime'])
+            if self.anomalies is not None:
+                anomalies.expected = dict(self.anomalies.expected)
+        self.anomalies = anomalies
+
+    def dump_housekeeping(self) -> bool:
+        """
+        Downlinks the housekeeping samples taken since the last dump, encoded with helpers.tscodec, as consecutive
+        windows that each fit the downlink budget left at the time. The cursor advances past every window sent, so
+        a dump cut short by the budget resumes where it stopped at the next one.
+        :return: True if every sample taken until now was sent
+        """
+        telemetry = self.get_module_or_raise_error("telemetry")
+        end = time.time()
+        times, _ = self.housekeeping.ordered(self.last_housekeeping_dump, end)
+        while len(times):
+            start = self.last_housekeeping_dump
+            capacity = telemetry.binary_capacity("HK")
+            # the most samples whose encoding fits, found by bisection; encoding grows with the sample count
+            lo, hi = 0, len(times)
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if len(self.housekeeping.encode(start, end if mid == len(times) else times[mid])) <= capacity:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            if lo == 0:
+                return False
+            window_end = end if lo == len(times) else float(times[lo])
+            if not telemetry.send_binary("HK", self.housekeeping.encode(start, window_end), subsystem=self.name):
+                return False
+            self.last_housekeeping_dump = window_end
+            times = times[lo:]
+        self.last_housekeeping_dump = end
+        return True
+
+    def report_housekeeping(self, minutes=10) -> bool:
+        """
+        Command: sends one "HA$<minutes>$<channels>" frame with the min, mean, max and last raw value of every
+        analog channel over the last minutes, "min,mean,max,last" per channel in ANALOG_CHANNELS order separated
+        by ";", empty for a channel without samples
+        :param minutes: Length of the window
+        :return: True if the frame was sent
+        """
+        minutes = float(minutes)
+        aggregate = self.housekeeping.aggregate(time.time() - minutes * 60)
+        fields = []
+        for channel in ANALOG_CHANNELS:
+            stats = aggregate.get(channel)
+            fields.append("" if stats is None or math.isnan(stats["mean"]) else
+                          "{min:g},{mean:.1f},{max:g},{last:g}".format(**stats))
+        return self.get_module_or_raise_error("telemetry").send_frame(
+            f"HA${minutes:g}$" + ";".join(fields), subsystem=self.name)
+
+    def summarize_housekeeping(self, hours=24, bucket_minutes=60) -> bool:
+        """
+        Command: downlinks the min, max, mean and last value of every analog channel per bucket_minutes over the
+        last hours as "HS" frames, encoded by HousekeepingStore.encode_summary; a coarse look at a longer span than
+        dump_housekeeping can afford
+        :param hours: Length of the window
+        :param bucket_minutes: Bucket width
+        :return: True if every frame was sent
+        """
+        end = time.time()
+        payload = self.housekeeping.encode_summary(float(bucket_minutes) * 60, end - float(hours) * 3600, end)
+        return self.get_module_or_raise_error("telemetry").send_binary("HS", payload, subsystem=self.name)
+
+    def enter_normal_mode(self) -> None:
+        """
+        Switches the PDMs shed in emergency mode back on, in reverse order. Outside emergency mode, the radio PDMs
+        belong to the energy planner, which switches them as it plans from the next step.
+        :return: None
+        """
+        while self.shed:
+            if not self.pin_on(self.shed[-1]):
+                break
+            self.shed.pop()
+
+    def enter_low_power_mode(self) -> None:
+        """
+        Empty because the energy planner switches the radio PDMs in low power; PDMs shed in emergency mode stay off
+        until normal mode
+        :return: None
+        """
+        pass
+
+    def enter_emergency_mode(self) -> None:
+        """
+        Switches off the PDMs listed in config['eps']['emergency_shed'], in order, remembering those that were on
+        :return: None
+        """
+        for device_name in self.config['eps'].get('emergency_shed') or []:
+            was_on = device_name in self.eps_dict and self.get_PDM_status(device_name) == 1
+            if self.pin_off(device_name) and was_on and device_name not in self.shed:
+                self.shed.append(device_name)
+
+    def get_checkpoint(self) -> dict:
+        """
+        :return: The PDMs shed in emergency mode, so that normal mode switches them back on after a warm restart
+        """
+        return {"shed": list(self.shed)}
+
+    def restore_checkpoint(self, state: dict) -> None:
+        """
+        :param state: Output of get_checkpoint()
+        :return: None
+        """
+        self.shed = list(state.get("shed") or ())
+
     def start(self):
-        self.bus = smbus.SMBus(1)
+        Submodule.start(self)
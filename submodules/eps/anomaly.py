@@ -0,0 +1,161 @@
+import numpy as np
+
+from helpers.error import Error
+
+
+class AnomalyDetector:
+    """
+    Sliding window anomaly detection over EPS housekeeping. Running sums of x, x^2 and j*x (j the position in the
+    window) give every channel's mean, variance and least squares slope in O(1) per sample, vectorized over the
+    analog channels. A new sample is checked against the statistics of the window before it:
+        z:     |x - mean| / max(std, min_std) above z_limit, a spike
+        slope: window slope in units per second outside [slope_min, slope_max], a runaway trend
+        mean:  window mean outside [mean_min, mean_max], a level shift
+        std:   window standard deviation above max_std, an oscillation
+    and every PDM reading against the state EPS last switched it to. A check that fails on confirm consecutive
+    samples is confirmed once, and reported again only after it has passed. Values and limits are in the units of
+    the samples, raw register bytes for EPS housekeeping.
+    """
+
+    CHECKS = ("z", "slope", "mean", "std")
+
+    def __init__(self, config: dict, looptime: float):
+        """
+        :param config: config['eps']['anomaly']
+        :param looptime: Seconds between samples, to express slopes per second
+        """
+        self.channels = tuple(config['channels'])
+        self.window = config['window']
+        self.min_samples = config['min_samples']
+        self.confirm = config['confirm']
+        self.z_limit = config['z_limit']
+        self.looptime = looptime
+        limits = [config['channels'][channel] or {} for channel in self.channels]
+
+        def limit(key, default):
+            return np.array([channel.get(key, default) for channel in limits], dtype=np.float64)
+
+        self.min_std = limit('min_std', 0.0)
+        self.max_std = limit('max_std', np.inf)
+        self.mean_min = limit('mean_min', -np.inf)
+        self.mean_max = limit('mean_max', np.inf)
+        self.slope_min = limit('slope_min', -np.inf)
+        self.slope_max = limit('slope_max', np.inf)
+
+        self.expected = dict()  # PDM channel -> state it was last switched to, learned from the first reading
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forgets the window and every pending or confirmed anomaly
+        :return: None
+        """
+        self.buffer = np.zeros((len(self.channels), self.window))
+        self.head = 0  # slot the next sample goes into, the oldest sample once the window is full
+        self.count = 0
+        self.sum = np.zeros(len(self.channels))
+        self.sum_sq = np.zeros(len(self.channels))
+        self.sum_jx = np.zeros(len(self.channels))  # sum of j * x, j = 0 for the oldest sample
+        self.last = np.full(len(self.channels), np.nan)
+        self.streaks = np.zeros((len(self.CHECKS), len(self.channels)), dtype=np.int64)
+        self.pdm_streaks = dict()
+
+    def statistics(self) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        :return: (mean, std, slope per second) of every channel over the window
+        """
+        n = self.count
+        mean = self.sum / n
+        variance = np.maximum(self.sum_sq / n - mean * mean, 0.0)
+        if n < 2:
+            return mean, np.sqrt(variance), np.zeros(len(self.channels))
+        sum_j = n * (n - 1) / 2
+        sum_jj = (n - 1) * n * (2 * n - 1) / 6
+        slope = (n * self.sum_jx - sum_j * self.sum) / (n * sum_jj - sum_j * sum_j)
+        return mean, np.sqrt(variance), slope / self.looptime
+
+    def push(self, values: np.ndarray) -> None:
+        """
+        Slides the window over one sample of the analog channels
+        :param values: One value per channel, no NaN
+        :return: None
+        """
+        if self.count == self.window:
+            oldest = self.buffer[:, self.head]
+            self.sum_jx -= self.sum - oldest  # every remaining sample moves one position towards the oldest
+            self.sum -= oldest
+            self.sum_sq -= oldest * oldest
+            self.count -= 1
+        self.buffer[:, self.head] = values
+        self.sum_jx += self.count * values
+        self.sum += values
+        self.sum_sq += values * values
+        self.count += 1
+        self.head = (self.head + 1) % self.window
+        if self.head == 0:  # recompute once per lap so rounding errors do not accumulate
+            ordered = np.concatenate((self.buffer[:, self.head:], self.buffer[:, :self.head]), axis=1)[:, -self.count:]
+            self.sum = ordered.sum(axis=1)
+            self.sum_sq = (ordered * ordered).sum(axis=1)
+            self.sum_jx = ordered @ np.arange(self.count, dtype=np.float64)
+
+    def switched(self, channel: str, state: int) -> None:
+        """
+        Records the state a PDM was switched to
+        :param channel: PDM channel, e.g. "pdm_iridium"
+        :param state: 1 for on, 0 for off
+        :return: None
+        """
+        self.expected[channel] = state
+        self.pdm_streaks[channel] = 0
+
+    def update(self, timestamp: float, sample: dict) -> list:
+        """
+        Checks a housekeeping sample and adds it to the window
+        :param timestamp: Wall clock time of the sample in seconds
+        :param sample: channel name -> value, as read by EPS.read_housekeeping()
+        :return: Error diagnostic records of the anomalies confirmed by this sample
+        """
+        values = np.array([sample.get(channel, np.nan) for channel in self.channels], dtype=np.float64)
+        missing = np.isnan(values)
+        values = np.where(missing, self.last, values)  # hold the last reading of a channel that failed to read
+        if np.isnan(values).any():  # no reading of some channel yet
+            return []
+        self.last = values
+
+        confirmed = []
+        if self.count >= self.min_samples:
+            mean, std, slope = self.statistics()
+            z = np.abs(values - mean) / np.maximum(std, self.min_std)
+            failed = np.array([
+                z > self.z_limit,
+                (slope < self.slope_min) | (slope > self.slope_max),
+                (mean < self.mean_min) | (mean > self.mean_max),
+                std > self.max_std,
+            ]) & ~missing
+            self.streaks = np.where(failed, self.streaks + 1, 0)
+            measures = (z, slope, mean, std)
+            for check, channel in zip(*np.nonzero(self.streaks == self.confirm)):
+                confirmed.append(self.diagnostic(
+                    timestamp, self.channels[channel], self.CHECKS[check],
+                    f"x={values[channel]:.3g} {self.CHECKS[check]}={measures[check][channel]:.3g} "
+                    f"mean={mean[channel]:.3g} sd={std[channel]:.3g} slope={slope[channel]:.3g}/s"))
+        self.push(values)
+
+        for channel, value in sample.items():
+            if not channel.startswith("pdm_") or value is None:
+                continue
+            state = int(value != 0)
+            expected = self.expected.setdefault(channel, state)
+            self.pdm_streaks[channel] = self.pdm_streaks.get(channel, 0) + 1 if state != expected else 0
+            if self.pdm_streaks[channel] == self.confirm:
+                confirmed.append(self.diagnostic(timestamp, channel, "pdm", f"read {state} expected {expected}"))
+        return confirmed
+
+    @staticmethod
+    def diagnostic(timestamp: float, channel: str, check: str, detail: str) -> Error:
+        """
+        :return: Compact telemetry record of one confirmed anomaly
+        """
+        record = Error(sys_name="eps", msg=f"ANOM {channel} {check} {detail}")
+        record.wall_ns = record.first_wall_ns = int(timestamp * 1000000000)
+        return record
@@ -0,0 +1,161 @@
+import struct
+
+from threading import Lock
+
+import numpy as np
+
+from helpers import tscodec
+
+ANALOG_CHANNELS = ("bcr1_volts", "bcr1_amps_a", "bcr1_amps_b", "battery_bus_volts", "board_status")
+SUMMARY = struct.Struct(">BBHdf")  # version, channels, buckets, first bucket start, bucket seconds
+
+
+class HousekeepingStore:
+    """
+    Fixed size history of EPS housekeeping samples, one preallocated NumPy ring buffer per channel.
+    Once full, every new sample overwrites the oldest one, so memory does not grow with mission length.
+    """
+
+    def __init__(self, channels: tuple, capacity: int):
+        """
+        :param channels: Channel names, one per EPS register
+        :param capacity: Number of samples kept per channel
+        """
+        self.channels = tuple(channels)
+        self.index = {channel: i for i, channel in enumerate(self.channels)}
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)  # wall clock seconds
+        self.values = np.zeros((len(self.channels), capacity), dtype=np.float32)
+        self.head = 0  # slot the next sample goes into
+        self.count = 0
+        self.lock = Lock()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, timestamp: float, sample: dict) -> None:
+        """
+        Stores one sample; channels missing from sample are stored as NaN
+        :param timestamp: Wall clock time of the sample in seconds
+        :param sample: channel name -> value
+        """
+        with self.lock:
+            self.times[self.head] = timestamp
+            column = self.values[:, self.head]
+            column.fill(np.nan)
+            for channel, value in sample.items():
+                column[self.index[channel]] = value
+            self.head = (self.head + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def ordered(self, start: float = None, end: float = None) -> (np.ndarray, np.ndarray):
+        """
+        Copies the samples with start <= time < end out of the ring, oldest first
+        :param start: Window start in seconds; defaults to the oldest sample
+        :param end: Window end in seconds; defaults to after the newest sample
+        :return: (times, values) with values shaped (channels, samples)
+        """
+        with self.lock:
+            if self.count < self.capacity:
+                times, values = self.times[:self.count].copy(), self.values[:, :self.count].copy()
+            else:
+                times = np.concatenate((self.times[self.head:], self.times[:self.head]))
+                values = np.concatenate((self.values[:, self.head:], self.values[:, :self.head]), axis=1)
+        lo = 0 if start is None else np.searchsorted(times, start, side='left')
+        hi = len(times) if end is None else np.searchsorted(times, end, side='left')
+        return times[lo:hi], values[:, lo:hi]
+
+    def aggregate(self, start: float = None, end: float = None) -> dict:
+        """
+        Min, max, mean and last value of every channel over a window, ignoring missing values
+        :param start: Window start in seconds
+        :param end: Window end in seconds
+        :return: channel -> {"min", "max", "mean", "last"}; empty if the window holds no samples
+        """
+        times, values = self.ordered(start, end)
+        if len(times) == 0:
+            return dict()
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=1)
+        filled = np.where(valid, values, 0)
+        means = np.divide(filled.sum(axis=1), counts, out=np.full(len(self.channels), np.nan), where=counts > 0)
+        mins = np.where(valid, values, np.inf).min(axis=1)
+        maxs = np.where(valid, values, -np.inf).max(axis=1)
+        # index of the last valid sample per channel
+        last_index = values.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+        lasts = values[np.arange(len(self.channels)), last_index]
+        return {
+            channel: {
+                "min": float(mins[i]) if counts[i] else np.nan,
+                "max": float(maxs[i]) if counts[i] else np.nan,
+                "mean": float(means[i]),
+                "last": float(lasts[i]) if counts[i] else np.nan,
+            }
+            for i, channel in enumerate(self.channels)
+        }
+
+    def summarize(self, bucket_seconds: float, start: float = None, end: float = None) -> dict:
+        """
+        Downsamples a window into fixed width buckets
+        :param bucket_seconds: Bucket width in seconds
+        :param start: Window start in seconds
+        :param end: Window end in seconds
+        :return: {"times": bucket start times, "min"/"max"/"mean"/"last": arrays shaped (channels, buckets)}
+            Buckets without samples are left out.
+        """
+        times, values = self.ordered(start, end)
+        if len(times) == 0:
+            empty = np.empty((len(self.channels), 0), dtype=np.float32)
+            return {"times": np.empty(0), "min": empty, "max": empty, "mean": empty, "last": empty}
+        origin = times[0] if start is None else start
+        buckets = np.floor((times - origin) / bucket_seconds).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(times)]
+
+        valid = ~np.isnan(values)
+        counts = np.add.reduceat(valid, starts, axis=1)
+        sums = np.add.reduceat(np.where(valid, values, 0), starts, axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+            mins = np.minimum.reduceat(np.where(valid, values, np.inf), starts, axis=1)
+            maxs = np.maximum.reduceat(np.where(valid, values, -np.inf), starts, axis=1)
+        mins[counts == 0] = np.nan
+        maxs[counts == 0] = np.nan
+        return {
+            "times": origin + buckets[starts] * bucket_seconds,
+            "min": mins,
+            "max": maxs,
+            "mean": means,
+            "last": values[:, ends - 1],
+        }
+
+    def encode_summary(self, bucket_seconds: float, start: float = None, end: float = None,
+                       channels: tuple = ANALOG_CHANNELS) -> bytes:
+        """
+        Encodes summarize() of a window: SUMMARY (version 1, channel count, bucket count, start time of the first
+        bucket and bucket width), the index of every bucket from the first as uint16, then the min, max, mean and
+        last arrays as float16 shaped (channels, buckets), all big endian
+        :param bucket_seconds: Bucket width in seconds
+        :param start: Window start in seconds
+        :param end: Window end in seconds
+        :param channels: Channels to include, in order
+        :return: encoded bytes
+        """
+        summary = self.summarize(bucket_seconds, start, end)
+        rows = [self.index[channel] for channel in channels]
+        origin = float(summary["times"][0]) if len(summary["times"]) else start or 0.0
+        indices = np.round((summary["times"] - origin) / bucket_seconds).astype(">u2")
+        return SUMMARY.pack(1, len(rows), len(indices), origin, bucket_seconds) + indices.tobytes() + \
+            b"".join(summary[key][rows].astype(">f2").tobytes() for key in ("min", "max", "mean", "last"))
+
+    def encode(self, start: float = None, end: float = None) -> bytes:
+        """
+        Encodes a window with helpers.tscodec. Channels named pdm_* are sent as flags (on if non zero),
+        all others as analog channels, each in the order of self.channels.
+        :param start: Window start in seconds
+        :param end: Window end in seconds
+        :return: encoded bytes
+        """
+        times, values = self.ordered(start, end)
+        is_flag = np.array([channel.startswith("pdm_") for channel in self.channels])
+        return tscodec.encode(times, values[~is_flag], np.nan_to_num(values[is_flag]) > 0)
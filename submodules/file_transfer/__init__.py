@@ -0,0 +1,249 @@
+import os
+import time
+
+from functools import partial
+from threading import Event, Lock
+
+from helpers import error, log
+from helpers.persist import dump_json, load_json
+from helpers.threadhandler import ThreadHandler
+from submodules.submodule import Submodule
+from submodules.file_transfer.transfer import Transfer, chunk_size
+
+
+class FileTransfer(Submodule):
+    """
+    Submodule class that downlinks files as sequence numbered, CRC'd chunks with selective retransmission.
+    Each round sends the chunks the ground has not confirmed, followed by an end frame; the ground uplinks a NACK
+    bitmap through command_ingest and only the chunks it lists are sent again. Transfers are persisted, so they
+    resume across passes and reboots.
+    """
+
+    def __init__(self, config: dict):
+        """
+        Instantiates a new FileTransfer instance
+        :param config: dictionary of configuration data
+        """
+        Submodule.__init__(self, name="file_transfer", config=config)
+        self.transfers = dict()  # transfer id -> Transfer
+        self.lock = Lock()
+        self.active = Event()  # cleared outside normal mode
+        self.active.set()
+        self.processes = {
+            "transmit": ThreadHandler(
+                target=partial(self.transmit),
+                name="file-transfer",
+                parent_logger=self.logger,
+                daemon=True,
+            )
+        }
+
+    def start(self) -> None:
+        """
+        Loads the transfers interrupted by a reboot and starts transmitting
+        :return: None
+        """
+        directory = self.config['file_transfer']['manifest_dir']
+        if os.path.isdir(directory):
+            for name in sorted(os.listdir(directory)):
+                manifest = load_json(os.path.join(directory, name)) if name.endswith(".json") else None
+                if manifest is None:
+                    continue
+                try:
+                    transfer = Transfer(**manifest)
+                except (OSError, TypeError, ValueError) as e:
+                    self.logger.error(f"Dropping unreadable transfer manifest {name}: {e}")
+                    os.remove(os.path.join(directory, name))
+                    continue
+                self.transfers[transfer.id] = transfer
+                self.logger.info(f"Resuming {transfer}")
+        Submodule.start(self)
+
+    def manifest_path(self, transfer_id: int) -> str:
+        return os.path.join(self.config['file_transfer']['manifest_dir'], f"{transfer_id}.json")
+
+    def save(self, transfer: Transfer) -> None:
+        dump_json(self.manifest_path(transfer.id), transfer.to_dict())
+
+    def remove(self, transfer: Transfer) -> None:
+        """
+        Forgets a transfer and deletes its manifest. Must be called with lock held.
+        """
+        self.transfers.pop(transfer.id, None)
+        try:
+            os.remove(self.manifest_path(transfer.id))
+        except FileNotFoundError:
+            pass
+
+    def get_transfer(self, transfer_id) -> Transfer:
+        transfer = self.transfers.get(int(transfer_id))
+        if transfer is None:
+            raise KeyError(f"No transfer {transfer_id}")
+        return transfer
+
+    def send_file(self, path: str, link: str = 'aprs') -> int:
+        """
+        Command: queues a file for downlink
+        :param path: file to send
+        :param link: radio to send through, either "aprs" or "iridium"
+        :return: id of the new transfer
+        """
+        mtu = self.config['file_transfer']['mtu'][link]  # KeyError for a link without an MTU
+        with self.lock:
+            transfer_id = next(i for i in range(1 << 16) if i not in self.transfers)
+            transfer = Transfer(transfer_id, path, link, chunk_size(mtu))
+            self.transfers[transfer_id] = transfer
+            self.save(transfer)
+        self.report(f"Started {transfer}, {transfer.size} bytes, CRC-32 {transfer.crc:08x}")
+        return transfer_id
+
+    def nack(self, transfer_id, base, bitmap: str = "") -> None:
+        """
+        Command: reports the chunks the ground is missing; they are sent again in the next round
+        :param transfer_id: id of the transfer
+        :param base: every chunk before base was received
+        :param bitmap: hex bitmap, most significant bit first, of the chunks from base on that are missing;
+        empty when nothing from base on is missing
+        :return: None
+        """
+        with self.lock:
+            transfer = self.get_transfer(transfer_id)
+            transfer.apply_nack(int(base), bytes.fromhex(bitmap))
+            if transfer.done:
+                self.remove(transfer)
+            else:
+                self.save(transfer)
+        if transfer.done:
+            self.report(f"Completed {transfer}")
+        else:
+            self.logger.info(f"NACK for {transfer}")
+
+    def ack(self, transfer_id) -> None:
+        """
+        Command: confirms that the ground received every chunk of a transfer
+        :param transfer_id: id of the transfer
+        :return: None
+        """
+        self.nack(transfer_id, self.get_transfer(transfer_id).total)
+
+    def cancel(self, transfer_id) -> None:
+        """
+        Command: abandons a transfer
+        :param transfer_id: id of the transfer
+        :return: None
+        """
+        with self.lock:
+            transfer = self.get_transfer(transfer_id)
+            self.remove(transfer)
+        self.report(f"Cancelled {transfer}")
+
+    def transmit(self) -> None:
+        """
+        Sends queued chunks of every transfer, oldest first, while the links' downlink budgets allow, and an end
+        frame once a transfer's round is complete, repeated every end_interval until the ground answers.
+        Transfers older than expire seconds are dropped. Run via ThreadHandler process['transmit'].
+        :return: None
+        """
+        config = self.config['file_transfer']
+        telemetry = self.get_module_or_raise_error("telemetry")
+        while True:
+            self.active.wait()
+            with self.lock:
+                transfers = sorted(self.transfers.values(), key=lambda t: t.created)
+            blocked = set()  # links whose budget ran out this cycle
+            for transfer in transfers:
+                if transfer.link in blocked:
+                    continue
+                if time.time() - transfer.created > config['expire']:
+                    with self.lock:
+                        self.remove(transfer)
+                    self.report(f"Expired {transfer}", failed=True)
+                    continue
+                reserve = config['reserve'].get(transfer.link, 0)
+                unsaved = 0
+                while self.active.is_set():
+                    with self.lock:
+                        if transfer.id not in self.transfers:
+                            break
+                        try:
+                            frame = transfer.next_frame()
+                        except OSError as e:
+                            self.remove(transfer)
+                            self.report(f"Abandoned {transfer}: {e}", failed=True)
+                            break
+                        if frame is None:
+                            break
+                        sequence = transfer.queue[0]
+                    try:
+                        sent = telemetry.send_frame(frame, transfer.link, self.name, reserve=reserve)
+                    except RuntimeError:  # radio not loaded yet
+                        sent = False
+                    if not sent:
+                        blocked.add(transfer.link)
+                        break
+                    with self.lock:
+                        if transfer.queue and transfer.queue[0] == sequence:  # unless a NACK replaced the round
+                            transfer.pop()
+                        unsaved += 1
+                        if unsaved >= config['save_every']:
+                            self.save(transfer)
+                            unsaved = 0
+                with self.lock:
+                    if transfer.id not in self.transfers:
+                        continue
+                    if unsaved:
+                        self.save(transfer)
+                    if transfer.queue or transfer.link in blocked or not self.active.is_set() or \
+                            time.time() - transfer.last_end < config['end_interval']:
+                        continue
+                    frame = transfer.end_frame()
+                try:
+                    sent = telemetry.send_frame(frame, transfer.link, self.name, reserve=reserve)
+                except RuntimeError:
+                    sent = False
+                if sent:
+                    with self.lock:
+                        transfer.last_end = time.time()
+                        if transfer.id in self.transfers:
+                            self.save(transfer)
+                else:
+                    blocked.add(transfer.link)
+            time.sleep(config['interval'])
+
+    def report(self, message: str, failed: bool = False) -> None:
+        """
+        Logs a transfer event and sends it to telemetry
+        :param message: text of the report
+        :param failed: Whether to report it as an Error
+        :return: None
+        """
+        if failed:
+            self.logger.error(message)
+        else:
+            self.logger.info(message)
+        if self.has_module("telemetry"):
+            if failed:
+                self.modules["telemetry"].enqueue(error.Error(sys_name="file_transfer", msg=message))
+            else:
+                self.modules["telemetry"].enqueue(log.Log(sys_name="file_transfer", lvl='INFO', msg=message))
+
+    def enter_low_power_mode(self) -> None:
+        """
+        Stops transmitting; transfers resume where they stopped in normal mode
+        :return: None
+        """
+        self.active.clear()
+
+    def enter_normal_mode(self) -> None:
+        """
+        Resumes transmitting
+        :return: None
+        """
+        self.active.set()
+
+    def enter_emergency_mode(self) -> None:
+        """
+        Stops transmitting
+        :return: None
+        """
+        self.active.clear()
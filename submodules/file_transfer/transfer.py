@@ -0,0 +1,217 @@
+import base64
+import binascii
+import os
+import struct
+import time
+import zlib
+
+PREFIX = "FT"  # chunk frames
+END_PREFIX = "FTE"  # end of round frames, asking the ground for a NACK
+HEADER = struct.Struct(">HHH")  # transfer id, sequence number, chunk count
+CRC = struct.Struct(">H")  # CRC-16/CCITT of header and data
+END = struct.Struct(">HHII")  # transfer id, chunk count, file size, file CRC-32
+
+
+def chunk_size(mtu: int) -> int:
+    """
+    :param mtu: Largest frame, in characters, the link carries
+    :return: File bytes per chunk so that a chunk frame, padding included, is below mtu
+    """
+    size = (mtu - len(PREFIX + "$") - 1) // 4 * 3 - HEADER.size - CRC.size
+    if size < 1:
+        raise ValueError(f"MTU {mtu} too small for a file transfer chunk")
+    return size
+
+
+def encode_chunk(transfer_id: int, sequence: int, total: int, data: bytes) -> str:
+    body = HEADER.pack(transfer_id, sequence, total) + data
+    return f"{PREFIX}${base64.b64encode(body + CRC.pack(binascii.crc_hqx(body, 0xFFFF))).decode('ascii')}"
+
+
+def decode_chunk(frame: str):
+    """
+    :return: (transfer id, sequence number, chunk count, data), or None if the frame is not a chunk or fails its CRC
+    """
+    if not frame.startswith(PREFIX + "$"):
+        return None
+    try:
+        raw = base64.b64decode(frame[len(PREFIX) + 1:], validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    if len(raw) < HEADER.size + CRC.size:
+        return None
+    body, (crc,) = raw[:-CRC.size], CRC.unpack(raw[-CRC.size:])
+    if binascii.crc_hqx(body, 0xFFFF) != crc:
+        return None
+    return HEADER.unpack(body[:HEADER.size]) + (body[HEADER.size:],)
+
+
+def encode_end(transfer_id: int, total: int, size: int, crc: int) -> str:
+    return f"{END_PREFIX}${base64.b64encode(END.pack(transfer_id, total, size, crc)).decode('ascii')}"
+
+
+def decode_end(frame: str):
+    """
+    :return: (transfer id, chunk count, file size, file CRC-32), or None if the frame is not an end frame
+    """
+    if not frame.startswith(END_PREFIX + "$"):
+        return None
+    try:
+        return END.unpack(base64.b64decode(frame[len(END_PREFIX) + 1:], validate=True))
+    except (binascii.Error, ValueError, struct.error):
+        return None
+
+
+def file_crc(path: str) -> int:
+    crc = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            crc = zlib.crc32(block, crc)
+    return crc
+
+
+class Transfer:
+    """
+    State of one file downlink: which chunks the ground is still missing and which are queued for this round.
+    A round sends every queued chunk, then an end frame; the ground answers with a NACK bitmap of the chunks it
+    did not receive, which become the next round's queue.
+    """
+
+    def __init__(self, transfer_id: int, path: str, link: str, chunk_size: int, size: int = None, crc: int = None,
+                 missing: str = None, queue: list = None, rounds: int = 0, chunks_sent: int = 0,
+                 created: float = None, last_end: float = 0.0, done: bool = False):
+        """
+        :param transfer_id: 16 bit id, unique among stored transfers
+        :param path: file to send; must not change while the transfer runs
+        :param link: radio the transfer uses
+        :param chunk_size: file bytes per chunk
+        :param size: file size; read from the file when None
+        :param crc: CRC-32 of the file; computed when None
+        :param missing: hex bitmap of the chunks the ground has not confirmed; all when None
+        :param queue: chunks still to send this round; all missing ones when None
+        """
+        self.id = transfer_id
+        self.path = path
+        self.link = link
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(path) if size is None else size
+        self.crc = file_crc(path) if crc is None else crc
+        self.total = max(1, -(-self.size // chunk_size))
+        if self.total > 0xFFFF:
+            raise ValueError(f"{path} needs {self.total} chunks, more than a transfer can carry")
+        if missing is None:
+            self.missing = bytearray(b"\xff" * (self.total // 8) + (bytes((0xff << (8 - self.total % 8) & 0xff,))
+                                                                     if self.total % 8 else b""))
+        else:
+            self.missing = bytearray.fromhex(missing)
+        self.queue = self.missing_chunks() if queue is None else list(queue)
+        self.rounds = rounds
+        self.chunks_sent = chunks_sent
+        self.created = time.time() if created is None else created
+        self.last_end = last_end
+        self.done = done
+
+    def is_missing(self, sequence: int) -> bool:
+        return bool(self.missing[sequence >> 3] & (0x80 >> (sequence & 7)))
+
+    def missing_chunks(self) -> list:
+        return [sequence for sequence in range(self.total) if self.is_missing(sequence)]
+
+    def read_chunk(self, sequence: int) -> bytes:
+        with open(self.path, "rb") as f:
+            f.seek(sequence * self.chunk_size)
+            return f.read(self.chunk_size)
+
+    def next_frame(self):
+        """
+        :return: The frame of the next queued chunk, or None once the round's queue is empty
+        """
+        if not self.queue:
+            return None
+        return encode_chunk(self.id, self.queue[0], self.total, self.read_chunk(self.queue[0]))
+
+    def pop(self) -> None:
+        """
+        Marks the next queued chunk as sent
+        """
+        self.queue.pop(0)
+        self.chunks_sent += 1
+
+    def end_frame(self) -> str:
+        return encode_end(self.id, self.total, self.size, self.crc)
+
+    def apply_nack(self, base: int, bitmap: bytes) -> None:
+        """
+        Applies a NACK from the ground: every chunk before base was received, and bit i of bitmap (most significant
+        bit first) set means chunk base + i is missing. Chunks past the bitmap keep their state.
+        Queues the missing chunks for a new round.
+        """
+        for sequence in range(min(base, self.total)):
+            self.missing[sequence >> 3] &= ~(0x80 >> (sequence & 7)) & 0xff
+        for i in range(min(len(bitmap) * 8, self.total - base)):
+            sequence = base + i
+            if bitmap[i >> 3] & (0x80 >> (i & 7)):
+                self.missing[sequence >> 3] |= 0x80 >> (sequence & 7)
+            else:
+                self.missing[sequence >> 3] &= ~(0x80 >> (sequence & 7)) & 0xff
+        self.queue = self.missing_chunks()
+        self.done = not self.queue
+        self.rounds += 1
+        self.last_end = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "transfer_id": self.id, "path": self.path, "link": self.link, "chunk_size": self.chunk_size,
+            "size": self.size, "crc": self.crc, "missing": self.missing.hex(), "queue": self.queue,
+            "rounds": self.rounds, "chunks_sent": self.chunks_sent, "created": self.created,
+            "last_end": self.last_end, "done": self.done,
+        }
+
+    def __str__(self) -> str:
+        remaining = len(self.missing_chunks())
+        return (f"transfer {self.id} {os.path.basename(self.path)} over {self.link}: {self.total - remaining}/"
+                f"{self.total} chunks confirmed, round {self.rounds}, {self.chunks_sent} chunks sent")
+
+
+class Reassembler:
+    """
+    Ground side of a transfer: collects chunk frames and produces NACKs and the file
+    """
+
+    def __init__(self):
+        self.chunks = dict()  # transfer id -> {sequence: data}
+        self.totals = dict()  # transfer id -> chunk count
+
+    def receive(self, frame: str) -> bool:
+        """
+        :return: True if the frame was a valid chunk
+        """
+        chunk = decode_chunk(frame)
+        if chunk is None:
+            return False
+        transfer_id, sequence, total, data = chunk
+        self.totals[transfer_id] = total
+        self.chunks.setdefault(transfer_id, dict())[sequence] = data
+        return True
+
+    def nack(self, transfer_id: int, total: int, max_bytes: int = 64) -> (int, bytes):
+        """
+        :param max_bytes: Longest bitmap to produce, bounding the uplinked command; chunks past it are reported in
+        a later round
+        :return: (base, bitmap) as expected by Transfer.apply_nack; an empty bitmap once every chunk arrived
+        """
+        received = self.chunks.get(transfer_id, dict())
+        base = 0
+        while base < total and base in received:
+            base += 1
+        if base == total:
+            return total, b""
+        bitmap = bytearray(min(-(-(total - base) // 8), max_bytes))
+        for i in range(min(total - base, len(bitmap) * 8)):
+            if base + i not in received:
+                bitmap[i >> 3] |= 0x80 >> (i & 7)
+        return base, bytes(bitmap)
+
+    def data(self, transfer_id: int) -> bytes:
+        chunks = self.chunks.get(transfer_id, dict())
+        return b"".join(chunks[sequence] for sequence in range(self.totals[transfer_id]))
@@ -0,0 +1,147 @@
+import os
+import time
+
+import numpy as np
+
+from threading import Lock
+
+from pyorbital.orbital import Orbital
+from pyorbital.tlefile import ChecksumError
+
+from helpers.persist import atomic_write
+from submodules.submodule import Submodule
+from submodules.orbit.eclipse import sunlit
+from submodules.orbit.passes import find_passes
+
+
+class Orbit(Submodule):
+    """
+    Submodule class that propagates the satellite's orbit from an uplinkable TLE and predicts ground station passes
+    """
+
+    def __init__(self, config: dict):
+        """
+        Instantiates a new Orbit instance
+        :param config: dictionary of configuration data
+        """
+        Submodule.__init__(self, name="orbit", config=config)
+        self.orbital = None
+        self.passes = []
+        self.passes_until = 0  # end of the window the cached passes were computed for
+        self.lock = Lock()
+
+    def start(self) -> None:
+        """
+        Loads the last uplinked TLE, if any
+        :return: None
+        """
+        path = self.config['orbit']['tle_path']
+        if os.path.exists(path):
+            with open(path) as f:
+                lines = [line.strip() for line in f if line.strip()]
+            try:
+                self.load_tle(lines[-2], lines[-1])
+            except (ChecksumError, IndexError, ValueError) as e:
+                self.logger.error(f"Stored TLE is invalid: {e}")
+        Submodule.start(self)
+
+    def load_tle(self, line1: str, line2: str) -> None:
+        """
+        Replaces the orbit with one propagated from a TLE and invalidates cached passes
+        :param line1: first line of the TLE
+        :param line2: second line of the TLE
+        :return: None
+        """
+        orbital = Orbital("pfs", line1=line1.strip(), line2=line2.strip())
+        with self.lock:
+            self.orbital = orbital
+            self.passes = []
+            self.passes_until = 0
+        self.logger.info(f"Loaded TLE with epoch {orbital.tle.epoch}")
+
+    def update_tle(self, line1: str, line2: str) -> None:
+        """
+        Command: validates, stores and loads an uplinked TLE
+        :param line1: first line of the TLE
+        :param line2: second line of the TLE
+        :return: None
+        """
+        self.load_tle(line1, line2)  # raises if the checksum is wrong, before the stored TLE is replaced
+        atomic_write(self.config['orbit']['tle_path'], f"{line1.strip()}\n{line2.strip()}\n".encode("ascii"))
+
+    def has_tle(self) -> bool:
+        return self.orbital is not None
+
+    def get_passes(self, now: float = None) -> list:
+        """
+        Returns upcoming passes over every configured station, recomputing them once less than half of the
+        prediction horizon is left
+        :param now: UNIX seconds; defaults to the current time
+        :return: list of Pass sorted by AOS, excluding passes that already ended
+        """
+        now = time.time() if now is None else now
+        with self.lock:
+            if self.orbital is None:
+                return []
+            horizon = self.config['orbit']['horizon']
+            if self.passes_until - now < horizon / 2:
+                start = time.perf_counter()
+                passes = []
+                for station in self.config['orbit']['stations']:
+                    passes += find_passes(self.orbital, station, now, horizon,
+                                          step=self.config['orbit']['step'],
+                                          min_elevation=station.get('min_elevation',
+                                                                    self.config['orbit']['min_elevation']))
+                self.passes = sorted(passes, key=lambda p: p.aos)
+                self.passes_until = now + horizon
+                self.logger.debug(f"Predicted {len(passes)} passes in {(time.perf_counter() - start) * 1000:.0f} ms")
+            return [p for p in self.passes if p.los > now]
+
+    def next_pass(self, now: float = None):
+        """
+        :param now: UNIX seconds; defaults to the current time
+        :return: The pass in progress or the next one, or None if there is no TLE or no pass within the horizon
+        """
+        passes = self.get_passes(now)
+        return passes[0] if passes else None
+
+    def in_pass(self, now: float = None) -> bool:
+        """
+        :param now: UNIX seconds; defaults to the current time
+        :return: True if a ground station is in view
+        """
+        now = time.time() if now is None else now
+        current = self.next_pass(now)
+        return current is not None and current.aos <= now
+
+    def sunlit(self, seconds: np.ndarray) -> np.ndarray:
+        """
+        :param seconds: UNIX seconds
+        :return: boolean array, True where the satellite is in sunlight; all True without a TLE
+        """
+        with self.lock:
+            orbital = self.orbital
+        if orbital is None:
+            return np.ones(len(seconds), dtype=bool)
+        return sunlit(orbital, seconds)
+
+    def enter_low_power_mode(self) -> None:
+        """
+        Empty because Orbit does not react to changes in Modes
+        :return: None
+        """
+        pass
+
+    def enter_normal_mode(self) -> None:
+        """
+        Empty because Orbit does not react to changes in Modes
+        :return: None
+        """
+        pass
+
+    def enter_emergency_mode(self) -> None:
+        """
+        Empty because Orbit does not react to changes in Modes
+        :return: None
+        """
+        pass
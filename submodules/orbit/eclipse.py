@@ -0,0 +1,43 @@
+import numpy as np
+
+from pyorbital import astronomy
+
+from submodules.orbit.passes import to_datetime64
+
+EARTH_RADIUS = 6378.137  # km
+
+
+def sun_direction(seconds: np.ndarray) -> np.ndarray:
+    """
+    Unit vector towards the sun in the equatorial inertial frame, vectorized over time
+    :param seconds: UNIX seconds
+    :return: array shaped (3, len(seconds))
+    """
+    ra, dec = astronomy.sun_ra_dec(to_datetime64(seconds))
+    return np.vstack((np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)))
+
+
+def sunlit(orbital, seconds: np.ndarray) -> np.ndarray:
+    """
+    Cylindrical shadow model: the satellite is eclipsed when it is behind the earth and closer to the earth-sun
+    axis than the earth's radius
+    :param orbital: pyorbital.orbital.Orbital
+    :param seconds: UNIX seconds
+    :return: boolean array, True where the satellite is in sunlight
+    """
+    seconds = np.asarray(seconds, dtype=np.float64)
+    position, _ = orbital.get_position(to_datetime64(seconds), normalize=False)
+    sun = sun_direction(seconds)
+    along = np.sum(position * sun, axis=0)
+    across = np.linalg.norm(position - along * sun, axis=0)
+    return (along > 0) | (across > EARTH_RADIUS)
+
+
+def intervals(seconds: np.ndarray, mask: np.ndarray) -> list:
+    """
+    :param seconds: sample times
+    :param mask: boolean samples
+    :return: list of (start, end) times of the runs where mask is True
+    """
+    edges = np.flatnonzero(np.diff(np.r_[False, mask, False].astype(np.int8)))
+    return [(float(seconds[start]), float(seconds[end - 1])) for start, end in zip(edges[0::2], edges[1::2])]
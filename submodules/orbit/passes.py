@@ -0,0 +1,100 @@
+import numpy as np
+
+SECOND = np.timedelta64(1, 's')
+
+
+class Pass:
+    """
+    A ground station pass: acquisition and loss of signal and the maximum elevation in between.
+    Times are UNIX seconds.
+    """
+    __slots__ = ("station", "aos", "los", "max_elevation", "max_time")
+
+    def __init__(self, station: str, aos: float, los: float, max_elevation: float, max_time: float):
+        self.station = station
+        self.aos = aos
+        self.los = los
+        self.max_elevation = max_elevation
+        self.max_time = max_time
+
+    @property
+    def duration(self) -> float:
+        return self.los - self.aos
+
+    def __repr__(self) -> str:
+        return f"Pass({self.station}, aos={self.aos:.0f}, los={self.los:.0f}, max_el={self.max_elevation:.1f})"
+
+
+def to_datetime64(seconds: np.ndarray) -> np.ndarray:
+    """
+    Converts UNIX seconds to numpy datetime64 with millisecond resolution, as expected by pyorbital
+    """
+    return (np.asarray(seconds, dtype=np.float64) * 1000).astype(np.int64).astype('datetime64[ms]')
+
+
+def elevation(orbital, station: dict, seconds: np.ndarray) -> np.ndarray:
+    """
+    Elevation of the satellite in degrees seen from a station, vectorized over time
+    :param orbital: pyorbital.orbital.Orbital
+    :param station: {"lat", "lon"} in degrees and "alt" in km
+    :param seconds: UNIX seconds
+    """
+    _, el = orbital.get_observer_look(to_datetime64(seconds), station["lon"], station["lat"], station.get("alt", 0))
+    return el
+
+
+def refine(orbital, station: dict, lo: np.ndarray, hi: np.ndarray, min_elevation: float,
+           rising: bool, tolerance: float = 1.0) -> np.ndarray:
+    """
+    Bisects every horizon crossing at once until each is bracketed to within tolerance seconds
+    :param lo: times before the crossings
+    :param hi: times after the crossings
+    :param rising: True for AOS (below -> above), False for LOS
+    :return: crossing times
+    """
+    lo, hi = lo.astype(np.float64), hi.astype(np.float64)
+    while len(lo) and np.max(hi - lo) > tolerance:
+        mid = (lo + hi) / 2
+        above = elevation(orbital, station, mid) >= min_elevation
+        after = above if rising else ~above  # True where the crossing lies before mid
+        hi = np.where(after, mid, hi)
+        lo = np.where(after, lo, mid)
+    return (lo + hi) / 2
+
+
+def find_passes(orbital, station: dict, start: float, duration: float, step: float = 30.0,
+                min_elevation: float = 0.0) -> list:
+    """
+    Propagates the orbit over [start, start + duration) in one vectorized batch and extracts the passes over a station.
+    Passes in progress at start or end are clipped to the window.
+    :param orbital: pyorbital.orbital.Orbital
+    :param station: {"name", "lat", "lon", "alt"}
+    :param start: UNIX seconds
+    :param duration: seconds to look ahead
+    :param step: sample spacing in seconds; passes shorter than this may be missed
+    :param min_elevation: elevation mask in degrees
+    :return: list of Pass, in time order
+    """
+    times = start + np.arange(0, duration, step, dtype=np.float64)
+    el = elevation(orbital, station, times)
+    above = el >= min_elevation
+    changes = np.flatnonzero(above[1:] != above[:-1])
+    rises = changes[above[changes + 1]]
+    sets = changes[~above[changes + 1]]
+
+    aos = refine(orbital, station, times[rises], times[rises + 1], min_elevation, rising=True)
+    los = refine(orbital, station, times[sets], times[sets + 1], min_elevation, rising=False)
+    if above[0]:
+        aos = np.r_[times[0], aos]
+    if above[-1]:
+        los = np.r_[los, times[-1]]
+
+    passes = []
+    for a, l in zip(aos, los):
+        inside = (times >= a) & (times <= l)
+        if inside.any():
+            peak = np.flatnonzero(inside)[np.argmax(el[inside])]
+            passes.append(Pass(station["name"], float(a), float(l), float(el[peak]), float(times[peak])))
+        else:  # shorter than one step
+            passes.append(Pass(station["name"], float(a), float(l), min_elevation, float((a + l) / 2)))
+    return passes
@@ -1,13 +1,15 @@
 from functools import partial
+from threading import Event
 from time import time, sleep
 
+from core.bus import COALESCE, COMMANDS, HOUSEKEEPING, Command
 from submodules.radios import Radio
+from submodules.radios.beacon import TelemetryBeacon
+from helpers import devices
+from helpers.profiler import span
 from helpers.threadhandler import ThreadHandler
 
 
-from serial import Serial
-
-
 class APRS(Radio):
     def __init__(self, config):
         """
@@ -21,6 +23,11 @@ class APRS(Radio):
         self.last_message_time = time()
 
         self.serial = None
+        self.max_line = self.config["aprs"].get("max_line", 512)  # bytes a line may reach before it is discarded
+        self.beacon = None
+        self.housekeeping = None  # bus subscription holding the latest housekeeping sample
+        self.beaconing = Event()  # cleared outside normal mode
+        self.beaconing.set()
         self.processes = {
             "listen_thread": ThreadHandler(
                 target=partial(self.listen),
@@ -28,13 +35,22 @@ class APRS(Radio):
                 parent_logger=self.logger,
             )
         }
+        if self.config["aprs"].get("beacon") is not None:
+            self.beacon = TelemetryBeacon(self.config["aprs"]["beacon"])
+            self.processes["beacon"] = ThreadHandler(
+                target=partial(self.send_beacons),
+                name="aprs-beacon",
+                parent_logger=self.logger,
+                daemon=True,
+            )
 
     def start(self):
         """
         Opens the APRS serial port and starts the listening thread.
         Assumes enough power is present therefore the tty port exists.
         """
-        self.serial = Serial(self.config["aprs"]["serial_port"], 19200)
+        self.serial = devices.open_serial("aprs", self.config["aprs"]["serial_port"],
+                                          worker=self.config.get("radio_workers"), baudrate=19200)
         for i in self.processes:
             self.processes[i].start()
 
@@ -45,7 +61,19 @@ class APRS(Radio):
         Assumes APRS is in normal mode
         """
         self.processes["listen_thread"].pause()
-        self.serial.close()
+        self.beaconing.clear()
+        if self.serial.is_open:
+            self.serial.close()
+
+    def enter_emergency_mode(self):
+        """
+        Enters the APRS into emergency mode.
+        Pauses the listening thread and closes the serial port if it is still open.
+        """
+        self.processes["listen_thread"].pause()
+        self.beaconing.clear()
+        if self.serial is not None and self.serial.is_open:
+            self.serial.close()
 
     def enter_normal_mode(self):
         """
@@ -54,15 +82,79 @@ class APRS(Radio):
         Assumes APRS is in low power mode.
         """
 
-        self.serial.open()
+        if not self.serial.is_open:
+            self.serial.open()
         self.processes["listen_thread"].resume()
+        self.beaconing.set()
 
-    def set_modules(self, modules):
-        self.modules = modules
+    def reconfigure(self, changed: list) -> None:
+        """
+        Applies a new line limit and beacon settings; the beacon keeps its sequence number
+        :param changed: Dotted paths of the settings that changed
+        :return: None
+        """
+        self.max_line = self.config["aprs"].get("max_line", 512)
+        if any(path.startswith("aprs.beacon") for path in changed) and self.beacon is not None and \
+                self.config["aprs"].get("beacon") is not None:
+            self.beacon = TelemetryBeacon(self.config["aprs"]["beacon"], self.beacon.sequence)
+
+    def set_bus(self, bus) -> None:
+        """
+        Subscribes to housekeeping for the telemetry beacon, keeping only the latest sample
+        :param bus: core.bus.Bus
+        :return: None
+        """
+        Radio.set_bus(self, bus)
+        if self.beacon is not None:
+            self.housekeeping = bus.subscribe(HOUSEKEEPING, self.name, maxsize=1, policy=COALESCE)
+
+    def send_beacons(self) -> None:
+        """
+        Sends an APRS telemetry report of the latest housekeeping sample every aprs.beacon.interval seconds,
+        preceded by the PARM/UNIT/EQNS/BITS definitions on the first report and every definitions_every reports.
+        Runs on its own schedule, independent of telemetry dumps; reports are charged to the downlink budget
+        like any other frame. Skips a report when no new sample arrived. Run via ThreadHandler process['beacon']
+        :return: None
+        """
+        config = self.config["aprs"]["beacon"]
+        reports = 0
+        while True:
+            self.beaconing.wait()
+            sample = self.housekeeping.get(timeout=0) if self.housekeeping is not None else None
+            if sample is not None and self.serial is not None and self.serial.is_open:
+                frames = [self.beacon.report(sample)]
+                if reports % config["definitions_every"] == 0:
+                    frames = self.beacon.definitions() + frames
+                for frame in frames:
+                    try:
+                        sent = self.get_module_or_raise_error("telemetry").send_frame(frame, self.name, self.name)
+                    except RuntimeError:  # telemetry not loaded yet
+                        sent = False
+                    if not sent:
+                        self.logger.debug("Beacon deferred")
+                        break
+                else:
+                    reports += 1
+            sleep(config["interval"])
 
     def has_modules(self):
         return len(self.modules) != 0
 
+    def get_checkpoint(self) -> dict:
+        """
+        :return: The last contact times and the beacon sequence number, for a warm restart
+        """
+        state = {"last_telem_time": self.last_telem_time, "last_message_time": self.last_message_time}
+        if self.beacon is not None:
+            state["beacon_sequence"] = self.beacon.sequence
+        return state
+
+    def restore_checkpoint(self, state: dict) -> None:
+        self.last_telem_time = state.get("last_telem_time", self.last_telem_time)
+        self.last_message_time = state.get("last_message_time", self.last_message_time)
+        if self.beacon is not None:
+            self.beacon.sequence = state.get("beacon_sequence", self.beacon.sequence)
+
     def parse_aprs_packet(self, packet: str) -> str:
         """
         Given a raw radio packet, strip the APRS junk off of it and make it into pure data.
@@ -96,7 +188,8 @@ class APRS(Radio):
 
     def listen(self):
         """
-        Read messages from serial. If a command is received, send it to `telemetry`
+        Read messages from serial. If a command is received, publish it on the bus, or send it to `telemetry`
+        before the bus is set
         Run via ThreadHandler process['listen_thread']
         """
         while True:
@@ -108,14 +201,18 @@ class APRS(Radio):
                 # Low power mode
                 continue
 
-            line = b""
+            line = bytearray()
             port_closed = False
             while not line.endswith(b"\n"):  # While EOL hasn't been sent
                 if not self.serial.is_open:
                     port_closed = True
                     break
-                result = self.serial.read()
+                with span("aprs.serial.read"):
+                    result = self.serial.read()
                 line += result
+                if len(line) > self.max_line:  # noise without an EOL; drop it instead of growing without bound
+                    self.logger.debug(f"Discarding {len(line)} bytes without an EOL")
+                    line.clear()
 
             if port_closed:
                 self.logger.debug("PORT GOT CLOSED WHILE READING LINE")
@@ -123,7 +220,7 @@ class APRS(Radio):
 
             self.logger.debug("GOT SOMETHING")
 
-            line = line.decode("utf-8")
+            line = line.decode("utf-8").strip()  # without the EOL, which would fail the command check
             self.last_message_time = time()
             if "T#" in line:
                 self.last_telem_time = time()
@@ -132,7 +229,12 @@ class APRS(Radio):
             parsed_message = self.parse_aprs_packet(line)
 
             if parsed_message:
-                if "telemetry" in self.modules:
+                if self.bus is not None:
+                    if COMMANDS.accepts(parsed_message):
+                        self.publish(COMMANDS, Command(parsed_message, self.name))
+                    else:
+                        self.logger.warning(f"Ignoring non-command message {parsed_message!r}")
+                elif "telemetry" in self.modules:
                     telemetry = self.modules["telemetry"]
                     telemetry.enqueue(parsed_message)
 
@@ -143,5 +245,6 @@ class APRS(Radio):
         """
 
         self.last_message_time = time()
-        self.serial.write((message + "\n").encode("utf-8"))  # Send the message
-        sleep(1)
+        with span("aprs.serial.write"):
+            self.serial.write((message + "\n").encode("utf-8"))  # Send the message
+        sleep(self.config["aprs"]["message_spacing"])
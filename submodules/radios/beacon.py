@@ -0,0 +1,87 @@
+"""
+Standard APRS telemetry (APRS 1.0.1, chapter 13) for EPS housekeeping, decodable by any APRS station or website
+without pFS tooling.
+
+A report carries a sequence number, five analog values and eight digital bits:
+    T#005,199,008,000,255,073,01101001
+Analog values are bytes; stations turn them back into engineering units with the coefficients of the EQNS message,
+value = a * x^2 + b * x + c, and label them from the PARM and UNIT messages. These, and BITS, are APRS messages
+addressed to the beacon's own callsign.
+"""
+import math
+
+ANALOG = 5
+DIGITAL = 8
+
+
+def message(callsign: str, text: str) -> str:
+    """
+    :return: The information field of an APRS message to callsign
+    """
+    return f":{callsign:<9}:{text}"
+
+
+def coefficient(value: float) -> str:
+    """
+    :return: value as briefly as APRS EQNS allows, e.g. "0.05", "-12", "0"
+    """
+    return f"{value:.6g}"
+
+
+class TelemetryBeacon:
+    """
+    Encodes housekeeping samples into T# reports and produces the definition messages describing them
+    """
+
+    def __init__(self, config: dict, sequence: int = 0):
+        """
+        :param config: config['aprs']['beacon']
+        :param sequence: Sequence number of the next report
+        """
+        self.callsign = config['callsign']
+        self.title = config.get('title', '')
+        self.analog = config['analog']
+        self.digital = config['digital']
+        if len(self.analog) != ANALOG or len(self.digital) != DIGITAL:
+            raise ValueError(f"An APRS telemetry report has {ANALOG} analog and {DIGITAL} digital channels")
+        if any(channel['eqns'][0] != 0 or channel['eqns'][1] == 0 for channel in self.analog):
+            raise ValueError("Analog channels must have linear equations, 0 * x^2 + b * x + c with b != 0")
+        self.sequence = sequence % 1000
+        self.last = [0] * ANALOG  # last encoded value of each analog channel, repeated when a read fails
+
+    def encode_analog(self, index: int, value) -> int:
+        """
+        Inverts the linear equation of an analog channel
+        :return: The byte that decodes closest to value
+        """
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return self.last[index]
+        _, b, c = self.analog[index]['eqns']
+        self.last[index] = min(255, max(0, round((value - c) / b)))
+        return self.last[index]
+
+    def report(self, sample: dict) -> str:
+        """
+        Encodes a housekeeping sample and advances the sequence number
+        :param sample: channel name -> value, as published on core.bus.HOUSEKEEPING
+        :return: The T# report
+        """
+        values = ",".join(f"{self.encode_analog(i, sample.get(channel['channel'])):03d}"
+                          for i, channel in enumerate(self.analog))
+        bits = "".join("1" if sample.get(channel['channel']) else "0" for channel in self.digital)
+        report = f"T#{self.sequence:03d},{values},{bits}"
+        self.sequence = (self.sequence + 1) % 1000
+        return report
+
+    def definitions(self) -> list:
+        """
+        :return: The PARM, UNIT, EQNS and BITS messages
+        """
+        channels = self.analog + self.digital
+        eqns = ",".join(coefficient(k) for channel in self.analog for k in channel['eqns'])
+        return [
+            message(self.callsign, "PARM." + ",".join(channel['name'] for channel in channels)),
+            message(self.callsign, "UNIT." + ",".join(channel.get('unit', '') for channel in channels)),
+            message(self.callsign, "EQNS." + eqns),
+            message(self.callsign, "BITS." + "".join("1" for _ in self.digital) + "," + self.title),
+        ]
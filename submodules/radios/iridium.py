@@ -1,10 +1,32 @@
+import re
+
+from collections import namedtuple
 from threading import Lock
 from functools import partial
+from time import time
 
+from core.bus import COMMANDS, Command
 from submodules.radios import Radio
+from helpers import devices
+from helpers.profiler import span
 from helpers.threadhandler import ThreadHandler
 
-from serial import Serial
+# +SBDIX: <MO status>, <MOMSN>, <MT status>, <MTMSN>, <MT length>, <MT queued>
+SBDIX = namedtuple("SBDIX", ["mo_status", "momsn", "mt_status", "mtmsn", "mt_length", "mt_queued"])
+MO_SUCCESS = 4  # MO statuses 0-4 are successful sessions, 5-36 failures
+SBDIX_PATTERN = re.compile(r"\+SBDIX:\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)")
+
+
+def parse_sbdix(response: str) -> SBDIX:
+    """
+    Parses the response to AT+SBDIX or AT+SBDIXA
+    :param response: Response text, which may include the echoed command
+    :return: SBDIX of the six status fields, None if the response holds none
+    """
+    match = SBDIX_PATTERN.search(response)
+    if match is None:
+        return None
+    return SBDIX(*(int(field) for field in match.groups()))
 
 
 class Iridium(Radio):
@@ -15,6 +37,8 @@ class Iridium(Radio):
         """
         Radio.__init__(self, "iridium", config)
         self.read_lock = Lock()
+        self.last_message_time = None  # wall clock time of the last MT message
+        self.checked_time = None  # wall clock time the Iridium last passed check()
 
         self.serial = None
         self.processes = {
@@ -29,15 +53,22 @@ class Iridium(Radio):
         """
            Opens the Iridium serial port and starts the listening thread.
            Assumes enough power is present therefore the tty port exists.
-           If the Iridium check fails, it raises an error
+           If the Iridium check fails, it raises an error. After a warm restart within iridium.check_valid
+           seconds of the last successful check, only checks that the modem answers.
         """
 
-        self.serial = Serial(
-            self.config["iridium"]["serial_port"], baudrate=19200, timeout=30
+        self.serial = devices.open_serial(
+            "iridium", self.config["iridium"]["serial_port"], worker=self.config.get("radio_workers"),
+            baudrate=19200, timeout=30
         )
         self.serial.flush()
 
-        if self.check(5):
+        if self.checked_time is not None and \
+                time() - self.checked_time <= self.config["iridium"].get("check_valid", 0) and \
+                self.write_to_serial("AT")[1]:
+            self.logger.debug("Iridium answered; skipping check after warm restart")
+        elif self.check(5):
+            self.checked_time = time()
             self.logger.debug("Iridium Check Successful")
         else:
             raise RuntimeError("Iridium Check Failed")
@@ -52,7 +83,17 @@ class Iridium(Radio):
         Assumes Iridium is in normal mode
         """
         self.processes["listen_thread"].pause()
-        self.serial.close()
+        if self.serial.is_open:
+            self.serial.close()
+
+    def enter_emergency_mode(self):
+        """
+        Enters the Iridium into emergency mode.
+        Pauses the listening thread and closes the serial port if it is still open.
+        """
+        self.processes["listen_thread"].pause()
+        if self.serial is not None and self.serial.is_open:
+            self.serial.close()
 
     def enter_normal_mode(self):
         """
@@ -61,9 +102,20 @@ class Iridium(Radio):
         Assumes Iridium is in low power mode.
         """
 
-        self.serial.open()
+        if not self.serial.is_open:
+            self.serial.open()
         self.processes["listen_thread"].resume()
 
+    def get_checkpoint(self) -> dict:
+        """
+        :return: The last contact and check times, for a warm restart
+        """
+        return {"last_message_time": self.last_message_time, "checked_time": self.checked_time}
+
+    def restore_checkpoint(self, state: dict) -> None:
+        self.last_message_time = state.get("last_message_time")
+        self.checked_time = state.get("checked_time")
+
     def set_modules(self, modules):
         self.modules = modules
 
@@ -87,17 +139,16 @@ class Iridium(Radio):
         command = command + "\r\n"
 
         # Encode the message with utf-8, write to serial
-        self.serial.write(command.encode("UTF-8"))
+        with span("iridium.serial.write"):
+            self.serial.write(command.encode("UTF-8"))
 
         response = ""  # Received response
-        self.read_lock.acquire()
-        while (
-            "OK" or "ERROR"
-        ) not in response:  # Wait to get the 'OK' or 'ERROR' from Iridium
-            if not self.serial.is_open:
-                return "ERROR", False
-            response += self.serial.read().decode("UTF-8")  # Append contents of serial
-        self.read_lock.release()
+        with self.read_lock:
+            while "OK" not in response and "ERROR" not in response:  # Wait to get the 'OK' or 'ERROR' from Iridium
+                if not self.serial.is_open:
+                    return "ERROR", False
+                with span("iridium.serial.read"):
+                    response += self.serial.read().decode("UTF-8")  # Append contents of serial
 
         # Determine if an "OK" or an "ERROR" was received
         if "OK" in response:  # "OK"
@@ -143,34 +194,71 @@ class Iridium(Radio):
                 num_checks -= 1
         return False  # Check failed all times, return False
 
-    def retrieve(self) -> str:
+    def sync(self, answer: bool = False) -> SBDIX:
         """
-        Retrieve the content of a message that is Mobile Terminated (MT).
-        :return: Text content of the message, empty string if failed or no message to retrieve
+        Runs an SBD session with the gateway, sending the MO buffer and receiving a queued MT message, if any.
+        :param answer: Whether the session answers an SBDRING, which must use AT+SBDIXA rather than AT+SBDIX
+        :return: The parsed +SBDIX response, None if the session failed or the response could not be parsed
         """
+        response, ok = self.write_to_serial("AT+SBDIXA" if answer else "AT+SBDIX")
+        if not ok:
+            return None
+        return parse_sbdix(response)
 
+    def retrieve(self) -> list:
+        """
+        Drains the gateway's Mobile Terminated (MT) queue: answers the ring, then keeps syncing in the same signal
+        window while the gateway reports queued messages, up to max_mt_per_session sessions.
+        The MO buffer is cleared first so the extra sessions do not resend the last MO message.
+        :return: Text content of every message received, in gateway order; empty if there was none or retrieval failed
+        """
         self.wait_for_signal()
-
-        # "Sync" with the GSS, retrieving and sending messages
-        sync = self.write_to_serial("AT+SBDIXA")
-        if not sync[1]:
-            return ""
-
-        sync_resp = sync[0]
-        sync_resp_list = sync_resp.strip(",")
-
-        if sync_resp_list[2] == 1:  # Message successfully received
-            message = self.write_to_serial("AT+SBDRT")
-            if not message[1]:
-                return ""
-            return message[0]  # Return the actual message content
+        self.write_to_serial("AT+SBDD0")
+
+        messages = []
+        answer = True
+        status = None
+        for _ in range(self.config["iridium"].get("max_mt_per_session", 16)):
+            status = self.sync(answer)
+            answer = False
+            if status is None or status.mo_status > MO_SUCCESS:  # gateway error, no network service, ...
+                self.logger.debug(f"SBD session failed: {status}")
+                break
+            if status.mt_status == 1:  # Message successfully received
+                message, ok = self.write_to_serial("AT+SBDRT")
+                if ok and "+SBDRT:" in message:
+                    messages.append(message[message.find("+SBDRT:") + len("+SBDRT:"):].strip())
+                else:
+                    self.logger.error(f"Could not read MT message {status.mtmsn}")
+            elif status.mt_status == 2:  # Error checking the mailbox
+                break
+            if status.mt_queued == 0:
+                break
         else:
-            return ""  # Return nothing; either there was no message or retrieval failed
+            if status is not None:  # max_mt_per_session may be 0
+                self.logger.info(f"Gateway still holds {status.mt_queued} MT messages after "
+                                 f"{len(messages)} this session")
+        return messages
+
+    def ingest(self, message: str) -> None:
+        """
+        Hands a received message to command ingest: published on the bus, or enqueued directly before the bus is set
+        :param message: Text content of the message
+        :return: None
+        """
+        if not COMMANDS.accepts(message):
+            self.logger.debug(f"Ignoring non-command message {message!r}")
+        elif self.bus is not None:
+            self.publish(COMMANDS, Command(message, self.name))
+        elif "command_ingest" in self.modules:
+            self.modules["command_ingest"].enqueue(Command(message, self.name))
+        elif "telemetry" in self.modules:
+            self.modules["telemetry"].enqueue(message)
 
     def listen(self):
         """
         Listen for an SBD ring.
-        If a ring is present, retrieve the message, and dispatch it to telemetry
+        If a ring is present, drain the gateway's MT queue and hand every message to command ingest
         Run via ThreadHandler process['listen_thread']
         """
 
@@ -198,7 +286,8 @@ class Iridium(Radio):
                         port_closed = True
                         break
 
-                    result = self.serial.read()
+                    with span("iridium.serial.read"):
+                        result = self.serial.read()
                     ring += result
 
                 if port_closed:
@@ -211,14 +300,14 @@ class Iridium(Radio):
                 self.logger.debug("Got SBDRING")
 
                 if "SBDRING" in ring:
-                    message = self.retrieve()
-                    self.logger.debug(f"Message was {message}")
-
-                    if message:  # Evaluates to True if message not empty
-                        self.logger.debug(message)
-                        if "telemetry" in self.modules:
-                            telemetry = self.modules["telemetry"]
-                            telemetry.enqueue(message)
+                    messages = self.retrieve()
+                    self.logger.info(f"Fetched {len(messages)} MT messages this session")
+                    if messages:
+                        self.last_message_time = time()
+
+                    for message in messages:
+                        self.logger.debug(f"Message was {message}")
+                        self.ingest(message)
 
     def send(self, message):
         """
@@ -16,6 +16,7 @@ class Submodule:
         self.logger = logging.getLogger(self.name)
         self.modules = dict()
         self.processes = dict()
+        self.bus = None
 
     def start(self) -> None:
         """
@@ -41,6 +42,13 @@ class Submodule:
         """
         raise NotImplementedError
 
+    def enter_emergency_mode(self) -> None:
+        """
+        Immediately sheds the submodule's load for an emergency power state. Different for each submodule.
+        May be called from any previous state and must return within the submodule's transition_timeout.
+        """
+        raise NotImplementedError
+
     def set_modules(self, dependencies: dict) -> None:
         """
         Accessor method for self.modules. self.modules shall be populated will any dependencies a submodule needs
@@ -49,6 +57,33 @@ class Submodule:
         """
         self.modules = dependencies
 
+    def set_bus(self, bus) -> None:
+        """
+        Accessor method for self.bus, the core.bus.Bus shared by every submodule. Submodules that subscribe to
+        topics override it to subscribe once the bus is known; it may be called more than once.
+        :param bus: The bus
+        :return: None
+        """
+        self.bus = bus
+
+    def reconfigure(self, changed: list) -> None:
+        """
+        Called by core after a configuration reload changed settings in the submodule's section; self.config
+        already holds the new configuration. Submodules that derive state from their settings at construction
+        override it to derive it again.
+        :param changed: Dotted paths of the settings that changed, e.g. ["aprs.message_spacing"]
+        :return: None
+        """
+
+    def publish(self, topic, message) -> bool:
+        """
+        Publishes a message on the bus
+        :param topic: core.bus Topic
+        :param message: message of the topic's type
+        :return: True if a subscriber queued it, False if none did or there is no bus
+        """
+        return self.bus is not None and self.bus.publish(topic, message)
+
     def has_module(self, module_name: str) -> bool:
         """
         Returns True if module_name is in self.modules and its value is not None
@@ -7,9 +7,14 @@ from threading import Lock      # packet locks
 from time import sleep          # decide method
 from collections import deque   # general, error, log queues
 
+from core.bus import COMMANDS, DROP_OLDEST, ERRORS, LOGS
 from submodules.submodule import Submodule
 from helpers.threadhandler import ThreadHandler    # threads
 from helpers import error, log     # Log and error classes
+from helpers import metrics
+from helpers.fec import FrameCoder
+from submodules.telemetry.budget import ACCOUNTING_SIZE, DownlinkBudget
+from submodules.telemetry.handler import TelemetryHandler
 
 
 class Telemetry(Submodule):
@@ -24,6 +29,16 @@ class Telemetry(Submodule):
         self.log_stack = deque()
         self.err_stack = deque()
         self.packet_lock = Lock()
+        self.send_lock = Lock()  # keeps the frames of one dump together, without holding packet_lock
+        self.log_handler = None
+        self.logs = None  # bus subscriptions, replacing general_queue once the bus is set
+        self.errors = None
+        self.budget = DownlinkBudget(self.config["telemetry"].get("budget") or {})
+        self.coders = self.frame_coders()  # radio -> FrameCoder for radios whose dumps are FEC encoded
+        for queue, depth in (("general", lambda: len(self.general_queue)), ("logs", lambda: len(self.log_stack)),
+                             ("errors", lambda: len(self.err_stack))):
+            metrics.gauge("pfs_telemetry_queue_depth", "Records waiting for a telemetry dump", {"queue": queue},
+                          fn=depth)
         self.processes = {
             "telemetry-decide": ThreadHandler(
                 target=partial(self.decide), 
@@ -33,9 +48,51 @@ class Telemetry(Submodule):
                 )
         }
 
+    def start(self) -> None:
+        """
+        Installs the logging bridge on the root logger, if configured, and starts the decide thread.
+        :return: None
+        """
+        if self.config["telemetry"].get("log_bridge") is not None:
+            self.log_handler = TelemetryHandler(self, self.config["telemetry"]["log_bridge"])
+            logging.getLogger().addHandler(self.log_handler)
+        Submodule.start(self)
+
+    def frame_coders(self) -> dict:
+        """
+        :return: radio -> FrameCoder, for the radios whose dumps are FEC encoded
+        """
+        return {
+            radio: FrameCoder(self.config["telemetry"]["max_packet_size"], fec.get("rate", 0.75),
+                              fec.get("interleave", 1))
+            for radio, fec in (self.config["telemetry"].get("fec") or {}).items() if fec
+        }
+
+    def reconfigure(self, changed: list) -> None:
+        """
+        Rebuilds the FEC coders and applies new downlink budget limits. Usage and counters carry over.
+        :param changed: Dotted paths of the settings that changed
+        :return: None
+        """
+        with self.packet_lock:
+            self.coders = self.frame_coders()
+            self.budget.configure(self.config["telemetry"].get("budget") or {})
+
+    def set_bus(self, bus) -> None:
+        """
+        Subscribes to logs and errors, which then reach the stacks through the bus instead of general_queue
+        :param bus: core.bus.Bus
+        :return: None
+        """
+        Submodule.set_bus(self, bus)
+        size = self.config["telemetry"]["buffer_size"]
+        self.logs = bus.subscribe(LOGS, self.name, maxsize=size, policy=DROP_OLDEST)
+        self.errors = bus.subscribe(ERRORS, self.name, maxsize=size, policy=DROP_OLDEST)
+
     def enqueue(self, message) -> bool:
         """
-        Enqueue a message onto the general queue, to be processed later by thread decide()
+        Enqueue a message onto the general queue, to be processed later by thread decide(). Once the bus is set,
+        the message is published on its topic instead; this method remains for producers that predate the bus.
         :param message: The message to push onto general queue. Must be a log/error class
         or command (string - must begin with semicolon, see command_ingest's readme)
         :return True if a valid message was enqueued, false otherwise
@@ -45,39 +102,205 @@ class Telemetry(Submodule):
          or type(message) is log.Log):   # message is Log
             self.logger.error("Attempted to enqueue invalid message")
             return False
+        if self.bus is not None:
+            return self.publish(COMMANDS if type(message) is str else
+                                ERRORS if type(message) is error.Error else LOGS, message)
         with self.packet_lock:
             self.general_queue.append(message)  # append to general queue
             return True
 
+    @staticmethod
+    def encoded_size(size: int) -> int:
+        """
+        :param size: Number of raw bytes
+        :return: Length of their base64 encoding
+        """
+        return 4 * -(-size // 3)
+
     def dump(self, radio='aprs') -> bool:
         """
         Concatenates packets to fit in max_packet_size (defined in config) and send through the radio, removing the
-        packets from the error and log stacks in the process
+        packets from the error and log stacks in the process. What is sent is bounded by the radio's downlink budget,
+        which is split between subsystems by their weighted quotas; errors are preferred over logs and newer records
+        over older ones. Records that do not fit stay buffered for the next dump. An accounting frame is sent last,
+        if the counters changed since the last one and budget.accounting_interval seconds passed. If telemetry.fec
+        configures the radio, the packets are Reed-Solomon encoded into FEC frames before sending. The frames are
+        taken and charged to the budget under packet_lock, and sent after releasing it, so that records can be
+        buffered while the radio is busy.
         :param radio: Radio to send telemetry through, either "aprs" or "iridium"
         :return True if anything was sent, false otherwise
         """
-        squishedpackets = ""
-        retVal = False
-
         if not self.has_module(radio):
             raise RuntimeError(f"[{self.name}]:[{radio}] module not found")
+        module = self.get_module_or_raise_error(radio)
+        max_packet_size = self.config["telemetry"]["max_packet_size"]
+        coder = self.coders.get(radio)
+        retVal = False
 
         with self.packet_lock:
-            while len(self.log_stack) + len(self.err_stack) > 0:    # while there's stuff to pop off
-                next_packet = (str(self.err_stack[-1]) if len(self.err_stack) > 0 else str(self.log_stack[-1]))   # for the purposes of determining packet length
-                while len(base64.b64encode((squishedpackets + next_packet).encode('ascii'))) < self.config["telemetry"]["max_packet_size"] and len(self.log_stack) + len(self.err_stack) > 0:
-                    if len(self.err_stack) > 0: # prefer error messages over log messages
-                        squishedpackets += str(self.err_stack.pop())
-                    else:
-                        squishedpackets += str(self.log_stack.pop())
-                squishedpackets = base64.b64encode(squishedpackets.encode('ascii'))
-                # print(squishedpackets)
-                self.get_module_or_raise_error(radio).send(str(squishedpackets))
+            link_bytes, link_frames = self.budget.remaining(radio)
+            if coder is not None:
+                # FEC frames have a fixed size and carry k bytes of separated packets each, so that the budget only
+                # limits the bytes of packets, which are sent as record text rather than base64
+                link_bytes = min(link_frames, link_bytes // coder.frame_size) * coder.k
+                link_frames = float('inf')
+            accounting = self.budget.accounting_due()
+            if accounting:  # reserve room for the accounting frame, which is always the same length
+                link_bytes -= ACCOUNTING_SIZE + (0 if coder is None else 1)
+                link_frames -= 1
+            candidates = [(self.err_stack, record) for record in reversed(self.err_stack)] + \
+                         [(self.log_stack, record) for record in reversed(self.log_stack)]
+            pending = dict()
+            for stack, record in candidates:
+                if self.encoded_size(len(str(record))) >= max_packet_size:  # can never be sent
+                    stack.remove(record)
+                    self.budget.dropped(record.system, len(str(record)))
+                    continue
+                pending[record.system] = pending.get(record.system, 0) + len(str(record))
+            candidates = [(stack, record) for stack, record in candidates
+                          if self.encoded_size(len(str(record))) < max_packet_size]
+            if coder is None:  # records are sent in base64
+                quotas = self.budget.quotas(pending, min(link_bytes, link_frames * max_packet_size) * 3 / 4)
+            else:
+                quotas = self.budget.quotas(pending, link_bytes)
+
+            frames = [[]]
+            frame_size = 0
+            for stack, record in candidates:
+                size = len(str(record))
+                if record.system not in pending or quotas[record.system] < size:
+                    continue
+                quotas[record.system] -= size
+                if self.encoded_size(frame_size + size) >= max_packet_size:
+                    frames.append([])
+                    frame_size = 0
+                frames[-1].append((stack, record))
+                frame_size += size
+
+            packets = []
+            for frame in frames:
+                if not frame:
+                    continue
+                text = "".join(str(record) for _, record in frame).encode('ascii')
+                packet = base64.b64encode(text).decode('ascii') if coder is None else text
+                size = len(packet) if coder is None else len(packet) + 1  # plus the packet separator
+                if link_frames < 1 or size > link_bytes:
+                    break
+                packets.append((packet, frame))
+                link_bytes -= size
+                link_frames -= 1
+
+            out = [packet for packet, _ in packets]
+            for _, frame in packets:
+                for stack, record in frame:
+                    stack.remove(record)
+                    self.budget.sent(record.system, len(str(record)))
                 retVal = True
-                squishedpackets = ""
+            if accounting and link_frames >= 0 and link_bytes >= 0:
+                frame = self.budget.accounting_frame()
+                out.append(frame if coder is None else frame.encode('ascii'))
+            if coder is not None:
+                out = coder.encode(out)
+            for packet in out:
+                self.budget.use(radio, len(packet))
 
+        with self.send_lock:
+            for packet in out:
+                module.send(packet)
         return retVal
 
+    def dump_metrics(self, radio='aprs') -> bool:
+        """
+        Command: downlinks a binary snapshot of every metric, see helpers.metrics
+        :param radio: Radio to send through, either "aprs" or "iridium"
+        :return: True if every frame was sent
+        """
+        return self.send_binary("MT", metrics.REGISTRY.snapshot(), radio=radio)
+
+    def binary_chunks(self, prefix: str, payload: bytes) -> list:
+        """
+        Splits a payload into chunks that, base64 encoded behind a "<prefix>$<index>/<total>$" header sized for the
+        number of chunks, make frames below max_packet_size
+        :return: list of chunks, at least one
+        """
+        digits = 1
+        while True:
+            chunk_size = self.binary_chunk_size(prefix, digits)
+            chunks = [payload[i:i + chunk_size] for i in range(0, len(payload), chunk_size)] or [b""]
+            if len(str(len(chunks))) <= digits:
+                return chunks
+            digits += 1
+
+    def binary_chunk_size(self, prefix: str, digits: int) -> int:
+        """
+        :param digits: Digits of the frame index and total
+        :return: Payload bytes per send_binary() frame
+        """
+        header_size = len(f"{prefix}$/$") + 2 * digits
+        return (self.config["telemetry"]["max_packet_size"] - header_size - 1) // 4 * 3
+
+    def binary_capacity(self, prefix: str, radio='aprs', reserve: int = 0) -> float:
+        """
+        :param prefix: Frame type, e.g. "HK"
+        :param radio: Radio to send through, either "aprs" or "iridium"
+        :param reserve: Bytes of the radio's budget to leave unused
+        :return: Payload bytes send_binary() can send through the radio right now without running out of budget;
+            infinite if the radio has no budget
+        """
+        with self.packet_lock:
+            link_bytes, link_frames = self.budget.remaining(radio)
+        frames = min(link_frames, (link_bytes - reserve) // self.config["telemetry"]["max_packet_size"])
+        if frames == float('inf'):
+            return frames
+        frames = max(0, int(frames))
+        return frames * self.binary_chunk_size(prefix, len(str(frames)))
+
+    def send_binary(self, prefix: str, payload: bytes, radio='aprs', subsystem: str = 'telemetry') -> bool:
+        """
+        Sends a binary payload as "<prefix>$<index>/<total>$<base64 chunk>" frames below max_packet_size,
+        charged against the radio's downlink budget and the subsystem's counters. Nothing is sent if the payload
+        is over binary_capacity(), so that the budget is not spent on a payload that cannot be completed.
+        :param prefix: Frame type, e.g. "HK"
+        :param payload: Bytes to send
+        :param radio: Radio to send through, either "aprs" or "iridium"
+        :param subsystem: Subsystem the bytes are accounted to
+        :return: True if every frame was sent, False if the budget ran out first
+        """
+        chunks = self.binary_chunks(prefix, payload)
+        self.budget.queued(subsystem, len(payload))
+        if len(payload) > self.binary_capacity(prefix, radio):
+            self.budget.dropped(subsystem, len(payload))
+            return False
+        for index, chunk in enumerate(chunks):
+            frame = f"{prefix}${index}/{len(chunks)}${base64.b64encode(chunk).decode('ascii')}"
+            if not self.send_frame(frame, radio, subsystem, len(chunk)):
+                self.budget.dropped(subsystem, sum(len(rest) for rest in chunks[index:]))
+                return False
+        return True
+
+    def send_frame(self, frame: str, radio='aprs', subsystem: str = 'telemetry', size: int = None,
+                   reserve: int = 0) -> bool:
+        """
+        Sends one ready-made frame if the radio's downlink budget allows it, charging the budget and the subsystem's
+        sent counter
+        :param frame: Frame to send, at most max_packet_size characters
+        :param radio: Radio to send through, either "aprs" or "iridium"
+        :param subsystem: Subsystem the bytes are accounted to
+        :param size: Payload bytes carried by the frame, for the subsystem's counter; defaults to the frame length
+        :param reserve: Bytes of the radio's budget to leave unused, e.g. for housekeeping dumps
+        :return: True if the frame was sent, False if the budget does not allow it
+        """
+        module = self.get_module_or_raise_error(radio)
+        with self.packet_lock:
+            link_bytes, link_frames = self.budget.remaining(radio)
+            if link_frames < 1 or len(frame) > link_bytes - reserve:
+                return False
+            self.budget.use(radio, len(frame))
+            self.budget.sent(subsystem, len(frame) if size is None else size)
+        with self.send_lock:
+            module.send(frame)
+        return True
+
     def clear_buffers(self) -> None:
         """
         Clear the telemetry buffers - clearing general_queue, the log, and error stacks.
@@ -88,26 +311,87 @@ class Telemetry(Submodule):
             self.log_stack.clear()
             self.err_stack.clear()
 
+    def shed_memory(self) -> int:
+        """
+        Drops the older half of the buffered logs, and of the errors once no logs are left, counting them as
+        dropped. Called by core's memory governor while pFS is over its soft memory budget.
+        :return: Number of records dropped
+        """
+        with self.packet_lock:
+            stack = self.log_stack if self.log_stack else self.err_stack
+            count = (len(stack) + 1) // 2
+            for _ in range(count):
+                oldest = stack.popleft()
+                self.budget.dropped(oldest.system, len(str(oldest)))
+        return count
+
+    def buffer(self, stack: deque, record) -> None:
+        """
+        Pushes a record onto a stack, dropping the oldest record once the stack holds buffer_size records.
+        Must be called with packet_lock held.
+        :param stack: log_stack or err_stack
+        :param record: Log or Error to push
+        :return: None
+        """
+        if len(stack) >= self.config["telemetry"]["buffer_size"]:
+            oldest = stack.popleft()
+            self.budget.dropped(oldest.system, len(str(oldest)))
+        stack.append(record)
+        self.budget.queued(record.system, len(str(record)))
+
     def decide(self) -> None:
         """
-        A thread method to constantly check general_queue for messages and process them if there are any.
+        A thread method to constantly check general_queue, or the log and error subscriptions once the bus is set,
+        for messages and process them if there are any.
         :return: None
         """
         while True:
-            if len(self.general_queue) != 0:
+            if self.bus is not None:
+                for subscription, stack in ((self.errors, self.err_stack), (self.logs, self.log_stack)):
+                    while len(subscription):
+                        record = subscription.get(timeout=0)
+                        with self.packet_lock:
+                            self.buffer(stack, record)
+            elif len(self.general_queue) != 0:
                 with self.packet_lock:
                     message = self.general_queue.popleft()
                     if type(message) is str and message[0:4] == 'CMD$' and message[-1] == ';':
                         self.get_module_or_raise_error("command_ingest").enqueue(message)
                         # print("Running command_ingest.enqueue(" + message + ")")
                     elif type(message) is error.Error:
-                        self.err_stack.append(message)
+                        self.buffer(self.err_stack, message)
                     elif type(message) is log.Log:
-                        self.log_stack.append(message)
+                        self.buffer(self.log_stack, message)
                     else:  # Shouldn't execute (enqueue() should catch it) but here just in case
                         self.logger.error("Message prefix invalid.")
+            if self.log_handler is not None:
+                self.log_handler.flush()
             sleep(1)
 
+    def get_checkpoint(self) -> dict:
+        """
+        :return: The buffered logs and errors, oldest first, followed by those still waiting on the bus, for a
+        warm restart
+        """
+        with self.packet_lock:
+            pending = {"logs": self.logs.snapshot() if self.logs is not None else [],
+                       "errors": self.errors.snapshot() if self.errors is not None else []}
+            return {
+                "logs": [record.to_state() for record in list(self.log_stack) + pending["logs"]],
+                "errors": [record.to_state() for record in list(self.err_stack) + pending["errors"]],
+            }
+
+    def restore_checkpoint(self, state: dict) -> None:
+        """
+        Buffers the logs and errors of a checkpoint. Called before start(), so they precede any new records.
+        :param state: Output of get_checkpoint()
+        :return: None
+        """
+        with self.packet_lock:
+            for key, stack, record_type in (("logs", self.log_stack, log.Log), ("errors", self.err_stack, error.Error)):
+                for record in state.get(key, ()):
+                    self.buffer(stack, record_type.from_state(record))
+
     def heartbeat(self) -> None:
         """
         Send a heartbeat through Iridium.
@@ -128,4 +412,11 @@ class Telemetry(Submodule):
         :return: None
         """
         pass
+
+    def enter_emergency_mode(self) -> None:
+        """
+        Enter emergency mode. Buffers are kept so that they can be dumped once power recovers.
+        :return: None
+        """
+        pass
     
\ No newline at end of file
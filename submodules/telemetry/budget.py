@@ -0,0 +1,181 @@
+import base64
+import struct
+import time
+
+from collections import deque
+from threading import Lock
+
+# Order of the accounting frame entries, followed by one for all other subsystems; only ever append to it
+SUBSYSTEMS = ("core", "eps", "aprs", "iridium", "antenna_deployer", "command_ingest", "telemetry", "file_transfer")
+ACCOUNTING_SIZE = len("ACC$") + 4 * -(-(2 + 12 * (len(SUBSYSTEMS) + 1)) // 3)  # characters
+
+
+class LinkBudget:
+    """
+    Bytes and frames a link may carry within a sliding time window.
+    """
+    __slots__ = ("bytes", "frames", "window", "sent")
+
+    def __init__(self, bytes: int, frames: int, window: float):
+        """
+        :param bytes: Bytes allowed per window
+        :param frames: Frames allowed per window
+        :param window: Window length in seconds
+        """
+        self.bytes = bytes
+        self.frames = frames
+        self.window = window
+        self.sent = deque()  # (monotonic time, bytes) per frame sent
+
+    def remaining(self) -> (int, int):
+        """
+        :return: (bytes, frames) still available in the current window
+        """
+        now = time.monotonic()
+        while self.sent and now - self.sent[0][0] >= self.window:
+            self.sent.popleft()
+        return self.bytes - sum(size for _, size in self.sent), self.frames - len(self.sent)
+
+    def use(self, size: int) -> None:
+        """
+        Records a frame of size bytes as sent
+        """
+        self.sent.append((time.monotonic(), size))
+
+
+class DownlinkBudget:
+    """
+    Per link byte/frame budgets, weighted per subsystem quotas and per subsystem counters of bytes queued,
+    sent and dropped.
+    """
+
+    def __init__(self, config: dict):
+        """
+        :param config: config['telemetry']['budget']
+        """
+        self.links = {
+            link: LinkBudget(limits['bytes'], limits['frames'], limits['window'])
+            for link, limits in (config.get('links') or {}).items()
+        }
+        self.weights = config.get('weights') or {}
+        self.subsystems = list(SUBSYSTEMS) + [s for s in self.weights if s not in SUBSYSTEMS]
+        self.counters = {subsystem: [0, 0, 0] for subsystem in self.subsystems}  # queued, sent, dropped
+        self.accounting_interval = config.get('accounting_interval', 600)
+        self.accounted = None  # entries of the last accounting frame sent
+        self.accounted_at = None  # monotonic time it was sent
+        self.lock = Lock()
+
+    def configure(self, config: dict) -> None:
+        """
+        Applies new link limits and weights; frames sent within a link's window still count against it, and the
+        counters carry over
+        :param config: config['telemetry']['budget']
+        """
+        with self.lock:
+            links = dict()
+            for link, limits in (config.get('links') or {}).items():
+                links[link] = self.links.get(link) or LinkBudget(limits['bytes'], limits['frames'], limits['window'])
+                links[link].bytes, links[link].frames = limits['bytes'], limits['frames']
+                links[link].window = limits['window']
+            self.links = links
+            self.weights = config.get('weights') or {}
+            self.accounting_interval = config.get('accounting_interval', 600)
+            for subsystem in self.weights:
+                self.counter(subsystem)
+
+    def counter(self, subsystem: str) -> list:
+        """
+        :return: The [queued, sent, dropped] byte counters of a subsystem, created on first use
+        """
+        subsystem = subsystem.lower()
+        if subsystem not in self.counters:
+            self.subsystems.append(subsystem)
+            self.counters[subsystem] = [0, 0, 0]
+        return self.counters[subsystem]
+
+    def queued(self, subsystem: str, size: int) -> None:
+        with self.lock:
+            self.counter(subsystem)[0] += size
+
+    def sent(self, subsystem: str, size: int) -> None:
+        with self.lock:
+            self.counter(subsystem)[1] += size
+
+    def dropped(self, subsystem: str, size: int) -> None:
+        with self.lock:
+            self.counter(subsystem)[2] += size
+
+    def remaining(self, link: str) -> (int, int):
+        """
+        :param link: Radio name
+        :return: (bytes, frames) the link may still send in its window; unlimited if the link has no budget
+        """
+        if link not in self.links:
+            return float('inf'), float('inf')
+        return self.links[link].remaining()
+
+    def use(self, link: str, size: int) -> None:
+        """
+        Charges a frame of size bytes against a link's budget
+        """
+        if link in self.links:
+            self.links[link].use(size)
+
+    def quotas(self, pending: dict, capacity: float) -> dict:
+        """
+        Splits capacity bytes between subsystems in proportion to their weights. A subsystem never gets more than
+        it has pending; capacity it leaves unused is shared again between the others.
+        :param pending: subsystem -> bytes waiting to be sent
+        :param capacity: bytes available
+        :return: subsystem -> bytes the subsystem may send
+        """
+        quotas = {subsystem: 0 for subsystem in pending}
+        active = {subsystem for subsystem, size in pending.items() if size > 0}
+        while active and capacity >= 1:
+            total = sum(self.weights.get(subsystem.lower(), 1) for subsystem in active)
+            used = 0
+            for subsystem in list(active):
+                share = min(capacity * self.weights.get(subsystem.lower(), 1) / total,
+                            pending[subsystem] - quotas[subsystem])
+                quotas[subsystem] += share
+                used += share
+                if quotas[subsystem] >= pending[subsystem]:
+                    active.remove(subsystem)
+            capacity -= used
+            if used < 1:
+                break
+        return quotas
+
+    def accounting_entries(self) -> list:
+        """
+        Must be called with lock held
+        :return: (queued, sent, dropped) for every subsystem in SUBSYSTEMS, then summed over all other subsystems
+        """
+        other = [0, 0, 0]
+        for subsystem, counter in self.counters.items():
+            if subsystem not in SUBSYSTEMS:
+                other = [total + value for total, value in zip(other, counter)]
+        counters = [self.counters.get(subsystem, [0, 0, 0]) for subsystem in SUBSYSTEMS] + [other]
+        return [tuple(min(value, 0xFFFFFFFF) for value in counter) for counter in counters]
+
+    def accounting_due(self) -> bool:
+        """
+        :return: Whether the counters changed since the last accounting frame sent, and accounting_interval seconds
+            have passed since
+        """
+        with self.lock:
+            if self.accounted is not None and time.monotonic() - self.accounted_at < self.accounting_interval:
+                return False
+            return self.accounting_entries() != self.accounted
+
+    def accounting_frame(self) -> str:
+        """
+        Records the counters it carries as the last accounted; it is always the same length
+        :return: "ACC$" followed by base64 of a version byte, the entry count and, per subsystem in SUBSYSTEMS order
+            and then for all others, the queued, sent and dropped byte counters as big endian uint32
+        """
+        with self.lock:
+            entries = self.accounting_entries()
+            self.accounted, self.accounted_at = entries, time.monotonic()
+        payload = struct.pack(">BB", 2, len(entries)) + b"".join(struct.pack(">III", *entry) for entry in entries)
+        return "ACC$" + base64.b64encode(payload).decode('ascii')
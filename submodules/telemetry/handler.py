@@ -0,0 +1,130 @@
+import logging
+import threading
+import time
+
+from collections import Counter
+
+from helpers.error import Error
+from helpers.log import Log
+from helpers.ratelimit import TokenBucket
+
+
+class Repeat:
+    """
+    Occurrences of one message seen inside the deduplication window.
+    """
+    __slots__ = ("record", "first", "last", "count")
+
+    def __init__(self, record: logging.LogRecord):
+        self.record = record
+        self.first = record.created
+        self.last = record.created
+        self.count = 0  # repeats after the first, which is forwarded as soon as it is seen
+
+
+class TelemetryHandler(logging.Handler):
+    """
+    logging.Handler that forwards records from the standard logging module into Telemetry as Log/Error records.
+    Identical messages within a window collapse into one record carrying a count and first/last timestamps,
+    and every subsystem is rate limited by its own token bucket.
+    """
+
+    def __init__(self, telemetry, config: dict):
+        """
+        :param telemetry: Telemetry submodule to enqueue records on
+        :param config: config['telemetry']['log_bridge']
+        """
+        logging.Handler.__init__(self)
+        self.telemetry = telemetry
+        self.default_level = logging.getLevelName(config.get('level', 'WARNING'))
+        self.levels = {name: logging.getLevelName(level) for name, level in (config.get('levels') or {}).items()}
+        self.window = config.get('dedup_window', 300)
+        self.rate = config.get('rate', 0.1)
+        self.burst = config.get('burst', 10)
+        self.rates = config.get('rates') or {}
+        self.buckets = dict()
+        self.repeats = dict()
+        self.dropped = Counter()
+        self.local = threading.local()
+        self.repeat_lock = threading.Lock()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """
+        Same as logging.Handler.handle, but without holding the handler lock around emit(): enqueueing takes
+        Telemetry's packet lock, and Telemetry logs while holding it.
+        """
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    @staticmethod
+    def subsystem(record: logging.LogRecord) -> str:
+        """
+        :return: The top level logger name, which is the submodule name for submodule loggers
+        """
+        return record.name.split('.', 1)[0]
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Forwards record if it is at or above its subsystem's level and is not a repeat inside the window.
+        """
+        if getattr(self.local, 'busy', False):  # Telemetry logging about its own enqueue
+            return
+        if record.levelno < self.levels.get(self.subsystem(record), self.default_level):
+            return
+        key = (record.name, record.levelno, record.getMessage())
+        with self.repeat_lock:
+            repeat = self.repeats.get(key)
+            if repeat is not None and record.created - repeat.first < self.window:
+                repeat.count += 1
+                repeat.last = record.created
+                return
+            self.repeats[key] = Repeat(record)
+        if repeat is not None:
+            self.summarize(repeat)
+        self.forward(record)
+
+    def flush(self) -> None:
+        """
+        Forwards a summary for every repeated message whose window has closed.
+        """
+        now = time.time()
+        with self.repeat_lock:
+            closed = [self.repeats.pop(key) for key, repeat in list(self.repeats.items())
+                      if now - repeat.first >= self.window]
+        for repeat in closed:
+            self.summarize(repeat)
+
+    def summarize(self, repeat: Repeat) -> None:
+        """
+        Forwards the summary of a closed window if the message repeated within it. The summary counts every
+        occurrence in the window, including the first one that was forwarded on its own.
+        """
+        if repeat.count:
+            self.forward(repeat.record, repeat.count + 1, repeat.first, repeat.last)
+
+    def forward(self, record: logging.LogRecord, count: int = 1, first: float = None, last: float = None) -> None:
+        """
+        Converts record into a Log or Error and enqueues it on telemetry, subject to the subsystem's rate limit.
+        """
+        subsystem = self.subsystem(record)
+        with self.repeat_lock:
+            bucket = self.buckets.get(subsystem)
+            if bucket is None:
+                bucket = self.buckets[subsystem] = TokenBucket(self.rates.get(subsystem, self.rate), self.burst)
+            if not bucket.consume():
+                self.dropped[subsystem] += count
+                return
+
+        if record.levelno >= logging.ERROR:
+            message = Error(sys_name=subsystem, msg=record.getMessage())
+        else:
+            message = Log(sys_name=subsystem, lvl=record.levelname, msg=record.getMessage())
+        message.collapse(count, int((first or record.created) * 1e9), int((last or record.created) * 1e9))
+
+        self.local.busy = True
+        try:
+            self.telemetry.enqueue(message)
+        finally:
+            self.local.busy = False
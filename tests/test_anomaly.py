@@ -0,0 +1,29 @@
+import numpy as np
+
+from benchmarks.tscodec import simulate
+from core.config import read, DEFAULT_PATH
+from submodules.eps.anomaly import AnomalyDetector
+from submodules.eps.housekeeping import ANALOG_CHANNELS
+
+
+def anomalies(times, analog):
+    config = read(DEFAULT_PATH)['eps']
+    detector = AnomalyDetector(config['anomaly'], config['looptime'])
+    found = []
+    for i, timestamp in enumerate(times):
+        sample = {channel: analog[j, i] for j, channel in enumerate(ANALOG_CHANNELS) if not np.isnan(analog[j, i])}
+        found += [record.message for record in detector.update(timestamp, sample)]
+    return found
+
+
+def test_default_limits_quiet_on_nominal_registers():
+    times, analog, _ = simulate(samples=10000)
+    assert anomalies(times, analog) == []
+
+
+def test_default_limits_catch_battery_drain():
+    times, analog, _ = simulate(samples=10000)
+    battery = ANALOG_CHANNELS.index("battery_bus_volts")
+    analog[battery, 5000:5100] -= 1.5 * np.arange(100)
+    found = anomalies(times, analog)
+    assert found and all(message.startswith("ANOM battery_bus_volts") for message in found)
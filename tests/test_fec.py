@@ -0,0 +1,21 @@
+from helpers.fec import FrameCoder
+
+
+def test_round_trip_with_errors():
+    coder = FrameCoder(170, rate=0.75, interleave=4)
+    packets = [b"LOG:eps:INFO:2026-10-19 07:45:13:hello %d\tworld\r\n" % i for i in range(10)]
+    frames = coder.encode(packets)
+    frames[5] = frames[5][:20] + "x" * 10 + frames[5][30:]
+    del frames[2]
+    decoded, corrected, failed = FrameCoder.decode(frames)
+    assert decoded == packets
+    assert corrected > 0
+    assert failed == 0
+
+
+def test_rejects_control_bytes():
+    coder = FrameCoder(170)
+    frames = coder.encode([b"text", b"\x01\x02 not text"])
+    decoded, _, failed = FrameCoder.decode(frames)
+    assert decoded == []
+    assert failed == 1
@@ -0,0 +1,17 @@
+import pytest
+
+from submodules.file_transfer.transfer import chunk_size, decode_chunk, encode_chunk
+
+
+@pytest.mark.parametrize("mtu", range(16, 400))
+def test_chunk_frame_below_mtu(mtu):
+    size = chunk_size(mtu)
+    for data in (b"\xff" * size, b"\x00" * (size - 1)):
+        frame = encode_chunk(0xFFFF, 0xFFFF, 0xFFFF, data)
+        assert len(frame) < mtu
+        assert decode_chunk(frame) == (0xFFFF, 0xFFFF, 0xFFFF, data)
+
+
+def test_mtu_too_small():
+    with pytest.raises(ValueError):
+        chunk_size(15)
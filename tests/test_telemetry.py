@@ -0,0 +1,39 @@
+import pytest
+
+from core.config import read, DEFAULT_PATH
+from helpers.error import Error
+from helpers.fec import FrameCoder
+from submodules.telemetry import Telemetry
+
+
+class Radio:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+def telemetry(fec: bool) -> (Telemetry, Radio):
+    config = read(DEFAULT_PATH)
+    if not fec:
+        config['telemetry']['fec'] = {}
+    radio = Radio()
+    module = Telemetry(config)
+    module.set_modules({'aprs': radio})
+    return module, radio
+
+
+@pytest.mark.parametrize("fec", (False, True))
+def test_dump_drops_oversized_record_next_to_small_ones(fec):
+    module, radio = telemetry(fec)
+    for i in range(20):
+        module.buffer(module.err_stack, Error(sys_name="eps", msg=f"small {i}"))
+    module.buffer(module.err_stack, Error(sys_name="eps", msg="x" * 200))
+    assert module.dump('aprs')
+    assert radio.sent
+    assert not any("x" * 200 in str(record) for record in module.err_stack)
+    if fec:
+        packets, _, failed = FrameCoder.decode(radio.sent)
+        assert failed == 0
+        assert not any(b"x" * 200 in packet for packet in packets)
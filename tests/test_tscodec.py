@@ -0,0 +1,55 @@
+import numpy as np
+
+from helpers import tscodec
+from submodules.eps.housekeeping import HousekeepingStore
+
+
+def round_trip(times, analog, flags):
+    return tscodec.decode(tscodec.encode(times, analog, flags))
+
+
+def assert_round_trip(times, analog, flags):
+    decoded_times, decoded_analog, decoded_flags = round_trip(times, analog, flags)
+    assert np.array_equal(decoded_times, np.round(times))
+    assert np.allclose(decoded_analog, np.round(analog), equal_nan=True)
+    assert np.array_equal(decoded_flags, flags)
+
+
+def test_empty_series():
+    times, analog, flags = round_trip(np.empty(0), np.empty((3, 0)), np.empty((2, 0), dtype=bool))
+    assert times.shape == (0,)
+    assert analog.shape == (3, 0)
+    assert flags.shape == (2, 0)
+
+
+def test_constant_series():
+    times = 1.6e9 + 20.0 * np.arange(500)
+    analog = np.full((2, 500), 42.0)
+    flags = np.ones((3, 500), dtype=bool)
+    assert_round_trip(times, analog, flags)
+    assert len(tscodec.encode(times, analog, flags)) < 64  # run-length encoded
+
+
+def test_missing_values():
+    times = 1.6e9 + 20.0 * np.arange(100)
+    analog = np.vstack([np.arange(100.0), np.full(100, np.nan), np.full(100, 7.0)])
+    analog[0, [0, 1, 50, 99]] = np.nan
+    analog[2, 10:20] = np.nan
+    assert_round_trip(times, analog, np.zeros((1, 100), dtype=bool))
+
+
+def test_large_and_negative_jumps():
+    times = np.array([0.0, 1.0, 2.0 ** 40, 2.0 ** 40 + 1, 2.0 ** 41])
+    analog = np.array([[0.0, 255.0, -(2.0 ** 40), 2.0 ** 40, 0.0]])
+    assert_round_trip(times, analog, np.array([[True, False, True, False, True]]))
+
+
+def test_store_wraparound():
+    store = HousekeepingStore(("bcr1_volts", "pdm_aprs"), capacity=64)
+    for i in range(150):
+        store.append(1.6e9 + 20 * i, {"bcr1_volts": i % 7, "pdm_aprs": i % 3 == 0})
+    times, analog, flags = tscodec.decode(store.encode())
+    expected = np.arange(86, 150)
+    assert np.array_equal(times, 1.6e9 + 20 * expected)
+    assert np.array_equal(analog[0], expected % 7)
+    assert np.array_equal(flags[0], expected % 3 == 0)
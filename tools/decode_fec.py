@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Ground side decoder for telemetry dumps sent with FEC (telemetry.fec).
+
+Reads received frames, one per line, from a file or stdin, corrects and reassembles the "FEC$" frames of every
+dump and prints the packets they carry, one per line: record text, or the dump's "ACC$" accounting frame.
+Other frames are printed unchanged. Correction statistics go to stderr.
+
+$ python -m tools.decode_fec frames.txt > packets.txt
+"""
+import sys
+
+from helpers.fec import FrameCoder
+
+
+def main(path: str = None) -> None:
+    with (open(path, encoding="latin-1") if path else sys.stdin) as f:
+        lines = [line.rstrip("\r\n") for line in f]
+    frames = [line for line in lines if FrameCoder.parse(line) is not None]
+    packets, corrected, failed = FrameCoder.decode(frames)
+    for line in lines:
+        if line and FrameCoder.parse(line) is None:
+            print(line)
+    for packet in packets:
+        print(packet.decode("ascii"))
+    print(f"{len(frames)} FEC frames, {len(packets)} packets, {corrected} symbols corrected, "
+          f"{failed} codewords lost", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Ground side decoder for EPS housekeeping downlinked by EPS.dump_housekeeping.
+
+Reads received frames ("HK$<index>/<total>$<base64>", one per line) from a file or stdin, reassembles each
+dump and prints its samples as CSV.
+
+$ python -m tools.decode_housekeeping frames.txt > housekeeping.csv
+"""
+import base64
+import csv
+import sys
+
+from helpers import tscodec
+from submodules.eps.housekeeping import ANALOG_CHANNELS
+
+PDM_CHANNELS = tuple(f"pdm_{device_name}" for device_name in ('a', 'i2c', 'c', 'antenna', 'pi', 'iridium', 'aprs', 'h'))
+
+
+def reassemble(lines) -> list:
+    """
+    :param lines: received frames; lines that are not HK frames are ignored
+    :return: payload bytes of every complete dump, in order of reception
+    """
+    payloads, chunks = [], dict()
+    for line in lines:
+        line = line.strip()
+        if not line.startswith("HK$"):
+            continue
+        _, position, data = line.split("$", 2)
+        index, total = (int(part) for part in position.split("/"))
+        if index == 0:
+            chunks = dict()
+        chunks[index] = base64.b64decode(data)
+        if len(chunks) == total:
+            payloads.append(b"".join(chunks[i] for i in range(total)))
+            chunks = dict()
+    return payloads
+
+
+def main(path: str = None) -> None:
+    with (open(path) if path else sys.stdin) as f:
+        payloads = reassemble(f)
+    writer = csv.writer(sys.stdout)
+    writer.writerow(("time",) + ANALOG_CHANNELS + PDM_CHANNELS)
+    for payload in payloads:
+        times, analog, flags = tscodec.decode(payload)
+        for i, timestamp in enumerate(times):
+            writer.writerow([f"{timestamp:.0f}"] + [f"{value:g}" for value in analog[:, i]] +
+                            [int(flag) for flag in flags[:, i]])
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Replays a week of orbit through the energy planner against a simulated battery, and compares it with the purely
+reactive power_watchdog behaviour.
+
+The simulated battery follows core.energy.BatteryModel with "true" coefficients that differ from the configured
+prior, plus measurement noise, so the planner has to learn them from its own housekeeping.
+
+$ python -m tools.energy_sim [--days 7] [--tle tle.txt]
+"""
+import argparse
+import time
+
+import numpy as np
+from pyorbital.orbital import Orbital
+from yaml import safe_load
+
+from core.energy import BatteryModel, EnergyPlanner
+from helpers.power import Power
+from submodules.orbit.eclipse import sunlit
+from submodules.orbit.passes import find_passes
+
+TLE = ("1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9009",
+       "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.49815324432707")
+
+
+def simulate(config: dict, orbital: Orbital, start: float, days: float, planned: bool, seed: int = 0) -> dict:
+    """
+    :param config: full configuration; uses the energy and orbit sections and eps.looptime
+    :param planned: True to drive the PDMs and low power from EnergyPlanner, False to keep every device on its
+        policy and only react to the measured voltage like power_watchdog
+    :return: summary statistics
+    """
+    energy = config['energy']
+    rng = np.random.default_rng(seed)
+    prior = BatteryModel.from_config(energy['model'])
+    truth = BatteryModel(prior.charge * 0.8, prior.base * 1.3,
+                         {device: load * 1.2 for device, load in prior.loads.items()}, prior.max_volts)
+    devices = list(energy['devices'])
+
+    step = config['eps']['looptime']
+    times = start + np.arange(0, days * 86400 + energy['horizon'], step, dtype=np.float64)
+    light = sunlit(orbital, times)
+    passes = []
+    for station in config['orbit']['stations']:
+        passes += find_passes(orbital, station, start, days * 86400 + energy['horizon'],
+                              config['orbit']['step'], config['orbit']['min_elevation'])
+    passes.sort(key=lambda p: p.aos)
+    in_pass = EnergyPlanner(energy, prior).windows(times, light, passes)
+    wanted_by_policy = {device: in_pass[device] for device in devices}
+
+    samples = int(days * 86400 / step)
+    volts = np.empty(samples)
+    states = {device: np.zeros(samples, dtype=bool) for device in devices}
+    low_power = np.zeros(samples, dtype=bool)
+    volts[0] = prior.max_volts
+    powered = {device: True for device in devices}
+    is_low_power = False
+    replan_every = int(energy['interval'] / step)
+    grid_every = int(energy['step'] / step)
+    horizon = int(energy['horizon'] / step)
+    fit_samples = int(energy['fit_window'] / step)
+    replans = 0
+
+    for i in range(samples):
+        if planned and i % replan_every == 0:
+            model = prior
+            lo = max(0, i - fit_samples)
+            if i - lo >= energy['min_fit_samples']:
+                model = BatteryModel.fit(times[lo:i], volts[lo:i], light[lo:i],
+                                         {device: states[device][lo:i] for device in devices},
+                                         prior.max_volts, prior=prior)
+            grid = slice(i, i + horizon, grid_every)
+            current = volts[i - 1] if i else volts[0]
+            plan = EnergyPlanner(energy, model).plan(times[i], current, times[grid], light[grid], passes,
+                                                     Power.NORMAL.value)
+            is_low_power = plan.low_power or (is_low_power and current < Power.NORMAL.value)
+            replans += 1
+        if planned:
+            powered = {device: plan.wanted(device, times[i]) for device in devices}
+        else:
+            powered = {device: bool(wanted_by_policy[device][i]) for device in devices}
+            current = volts[i - 1] if i else volts[0]
+            is_low_power = current < Power.NORMAL.value
+
+        for device in devices:  # radios are closed in low power and drawing no payload current
+            states[device][i] = powered[device] and not is_low_power
+        low_power[i] = is_low_power
+        if i + 1 < samples:
+            volts[i + 1] = truth.simulate(
+                volts[i], times[i:i + 2], light[i:i + 2],
+                {device: states[device][i:i + 2] for device in devices})[-1] + rng.normal(0, 0.005)
+
+    pass_time = wanted_by_policy[devices[-1]][:samples]
+    return {
+        "min_volts": float(volts.min()),
+        "below_floor_s": float((volts < energy['floor']).sum() * step),
+        "low_power_h": float(low_power.sum() * step / 3600),
+        "on_h": {device: float(states[device].sum() * step / 3600) for device in devices},
+        "pass_coverage": float(states[devices[-1]][pass_time].mean()) if pass_time.any() else float('nan'),
+        "replans": replans,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=float, default=7)
+    parser.add_argument("--tle", help="file whose last two lines are a TLE; defaults to an ISS TLE")
+    parser.add_argument("--config", default="config/config_default.yml")
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        config = safe_load(f)
+    tle = TLE
+    if args.tle:
+        with open(args.tle) as f:
+            tle = [line.strip() for line in f if line.strip()][-2:]
+    orbital = Orbital("sim", line1=tle[0], line2=tle[1])
+    start = float(orbital.tle.epoch.astype('datetime64[s]').astype(np.int64))
+
+    for name, planned in (("reactive", False), ("planned", True)):
+        wall = time.perf_counter()
+        result = simulate(config, orbital, start, args.days, planned)
+        print(f"{name:9} {args.days:g} days in {time.perf_counter() - wall:.1f} s: "
+              f"min {result['min_volts']:.2f} V, {result['below_floor_s'] / 60:.0f} min below floor, "
+              f"{result['low_power_h']:.1f} h low power, on " +
+              ", ".join(f"{device} {hours:.1f} h" for device, hours in result['on_h'].items()) +
+              f", pass coverage {result['pass_coverage'] * 100:.0f}%, {result['replans']} replans")
+
+
+if __name__ == '__main__':
+    main()
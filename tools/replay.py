@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Replays a capture log (main.py --capture) through unmodified pFS and reports how it went.
+
+Core starts as on the flight computer, except that serial ports and I2C buses are served from the log by
+helpers.devices and the first boot sleep is skipped. Once every record has been consumed, or --timeout passes,
+prints the replay throughput and the number of transactions where pFS diverged from the capture, then exits.
+
+$ python -m tools.replay capture.bin [--fast] [--timeout 600]
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+
+from collections import Counter
+
+from core.core import Core
+from helpers import devices
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log", help="capture log written by main.py --capture")
+    parser.add_argument("--fast", action="store_true", help="serve reads as fast as possible")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds to wait for the replay to finish")
+    parser.add_argument("-d", "--debug", action="store_true")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.DEBUG if args.debug else logging.WARNING)
+
+    records = devices.read_log(args.log)
+    channels = Counter(name for _, name, _, _ in records)
+    duration = records[-1][0] / 1e6 if records else 0.0
+    print(f"{args.log}: {len(records)} records over {duration:.1f} s recorded, " +
+          ", ".join(f"{name} {count}" for name, count in sorted(channels.items())))
+
+    devices.configure(replay=args.log, realtime=not args.fast)
+    replay = devices.get_replay()
+    core = Core()
+    core.config['core']['sleep_interval'] = 0
+
+    def report():
+        start = time.perf_counter()
+        finished = replay.finished.wait(args.timeout)
+        elapsed = time.perf_counter() - start
+        print(f"{'finished' if finished else 'timed out'} after {elapsed:.2f} s: {replay.replayed}/{replay.total} "
+              f"records, {replay.replayed / max(elapsed, 1e-9):.0f} records/s, {replay.mismatches} mismatches, "
+              f"mode {core.state}")
+        logging.shutdown()
+        os._exit(0 if finished and not replay.mismatches else 1)  # submodule threads never return on their own
+
+    threading.Thread(target=report, name="replay-report", daemon=True).start()
+    core.start()  # in the main thread, as in main.py, so its I2C channel has the same name as in the capture
+
+
+if __name__ == '__main__':
+    main()